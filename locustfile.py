@@ -1,73 +1,458 @@
 import os
-from locust import HttpUser, task, between, events
-
-# Importar módulos refactorizados
-from tasks.ambiente import get_espacios_verdes, get_campanas_pet, get_recoleccion_residuos_diferenciada
-from tasks.domicilio import get_barrios_por_localidad, get_calles_por_localidad, get_departamentos_por_provincia, get_domicilio_cpc_by_id, get_localidades_por_departamento, get_paises, get_provincias_por_pais, insert_domicilio, insert_domicilio_ampliado, insert_domicilio_geo, get_domicilio_geo, get_domicilio_by_id, insert_incidente
-from tasks.educacion import get_escuelas_municipales, get_jardines_municipales, get_parques_educativos
-from tasks.habilitacion import get_comercios, get_geriatricos_privados, get_jardines_maternales_privados
-from tasks.infraestructura import get_obra_publica, get_puntos_wifi
-from tasks.parametricas import get_actividades, get_banco_by_id, get_bancos, get_cfiscal, get_dispositivos_pagos, get_fjuridica, get_medios_pagos, get_profesion_by_id, get_profesiones, put_medios_pagos
-from tasks.persona_fisica import get_comunicaciones_personas, get_personas_fisicas, insert_comunicaciones_personas, insert_domicilio_persona_fisica, insert_or_update_persona_fisica, insert_or_update_persona_fisica_by_dni, insert_or_update_persona_fisica_simplificada
-from tasks.persona_juridica import get_persona_juridica, get_sedes_pj, insert_domicilio_sede, insert_domicilio_sede_pj, insert_persona_juridica
-from tasks.proveedor import alta_cbu_banco_proveedor, alta_proveedor, buscar_personas_por_cuils_cuits, buscar_proveedores_minimizado, buscar_proveedores_minimizado_casos_multiples, buscar_proveedores_por_ids, buscar_proveedores_por_parametros, get_proveedor_by_cuit_cuil, get_proveedores_por_actividad, insert_or_update_proveedor
-from tasks.salud import get_centros_salud
-from tasks.transporte import get_centrales_agencias, get_chapas, get_chapas_por_cuil, get_ciclovias, get_condiciones, get_empresas, get_estacionamiento_bicicletas, get_estados_licencias, get_leasing, get_licencias_por_parametros, get_paradas_linea, get_permisionarios_por_parametros, get_persona_fisica_por_chapa, get_personal, get_recorridos_lineas, get_situaciones_chapas, get_tipos_servicios, get_vehiculos, get_zona_semm
-from tasks.tributario import get_deuda_inmueble, get_deuda_rodado
-from tasks.turismo import get_anfitriones_turisticos, get_guias_turisticos
-from utils.config import detect_environment, load_data_for_environment, reset_log_for_new_test, setup_logger, get_credentials_for_environment
-from utils.auth import authenticate
-from tasks.cerrojo_institucional import get_all_cpc, get_barrios_cpc, get_centros_operativos, get_centros_vecinales, get_dependencia_mas_alta, get_dependencias_directas, get_dependencias_por_parametros, get_dependencias_ruta, get_fechas_no_habiles, get_limites_administrativos, get_organigrama_completo, get_organigrama_por_dependencia, get_organigrama_por_nivel, get_organigrama_por_niveles, get_organizaciones_sociales, get_tipos_organizaciones_sociales, get_unidades_judiciales, post_dependencias_por_ids, update_dependencias_visibility
-
-# Inicializar el logger
+import random
+import sys
+from locust import task, between, events
+
+# Registro declarativo de endpoints (tasks/registry.py)
+from tasks.registry import MIX_PROFILES, filter_endpoints, get_endpoints, get_paginated_endpoints
+from tasks.journeys import pick_journey, run_journey
+from utils.config import LOG_VERBOSITY_LEVELS, close_logger_handlers, detect_environment, load_data_for_environment, reset_log_for_new_test, setup_logger, get_credentials_for_environment, get_option, use_worker_log
+from utils import metrics
+from utils.auth import authenticate, current_token, get_token, stop_token_refresh
+from utils.context import UserDataContext
+from utils.http import HarnessClient
+from utils import connections, distributed, journal, knee, naming, page_size, paging, profiling, shapes, synthetic, teardown, transport, validation
+from utils.arrivals import PROCESO_POISSON, PROCESOS_ARRIBO, ArrivalScheduler, run_arrival
+from utils.scheduler import PERFIL_ABIERTO, PERFIL_CARGA, PERFIL_ESCRITURA, PERFIL_FUNCIONAL, PERFIL_TAMANO_PAGINA, PERFILES_CON_MEZCLA, PERFILES_EJECUCION, build_schedule, selected_profile
+
+# Inicializar el logger; en modo distribuido cada worker escribe su propio archivo
+if distributed.worker_mode(sys.argv[1:]):
+    use_worker_log(distributed.worker_id())
 logger = setup_logger()
 
+# Forma de carga opcional (utils/shapes.py): Locust usa la clase de forma
+# que encuentra en el locustfile, así que solo se define si se eligió una
+LoadShape = shapes.selected_shape(sys.argv[1:])
+
+# El perfil "write" usa su propia clase de usuario (WriteHeavyUser), que
+# también se elige al iniciar: en modo distribuido los workers necesitan el
+# mismo --test-profile (o LOCUST_TEST_PROFILE)
+WRITE_PROFILE_SELECTED = selected_profile(sys.argv[1:]) == PERFIL_ESCRITURA
+
+# Transporte HTTP de los usuarios (utils/transport.py): requests (HttpUser) o geventhttpclient (FastHttpUser)
+TRANSPORT = transport.selected_transport(sys.argv[1:])
+
 # Variables globales para host y ambiente
 current_host = None
 environment_name = None
 data_module = None
+schedule = None
+arrivals = None
+test_profile = PERFIL_FUNCIONAL
+# Modo producción decidido por el master (solo en los workers)
+production_from_master = None
+# Bodies de escritura sintéticos (--synthetic-data): generadores por nombre de atributo
+synthetic_generators = None
+# Perfil "write": proporción de iteraciones que ejecutan un recorrido de escritura
+write_ratio = 0.0
+
+@events.init_command_line_parser.add_listener
+def on_init_command_line_parser(parser):
+    parser.add_argument(
+        "--test-profile",
+        type=str,
+        env_var="LOCUST_TEST_PROFILE",
+        default=PERFIL_FUNCIONAL,
+        choices=PERFILES_EJECUCION,
+        help="Perfil de ejecución: 'functional' (barrido único), 'load' (mezcla ponderada continua), 'open' (arribos a tasa fija), 'page-size' (barrido de tamaños de página) o 'write' (recorridos de escritura encadenados)",
+    )
+    parser.add_argument(
+        "--transport",
+        type=str,
+        env_var="LOCUST_TRANSPORT",
+        default=transport.TRANSPORTE_REQUESTS,
+        choices=list(transport.TRANSPORTES),
+        help="Transporte HTTP: 'requests' (HttpUser) o 'fast' (FastHttpUser, geventhttpclient, menos CPU por request); se elige al iniciar",
+    )
+    parser.add_argument(
+        "--connection-strategy",
+        type=str,
+        env_var="LOCUST_CONNECTION_STRATEGY",
+        default=connections.ESTRATEGIA_PERSISTENTE,
+        choices=connections.ESTRATEGIAS,
+        help="Conexiones de los usuarios: 'pooled' (keep-alive), 'reconnect' (conexión nueva en cada iteración) o 'handshake' (conexión y handshake TLS en cada request)",
+    )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        env_var="LOCUST_POOL_SIZE",
+        default=connections.POOL_SIZE,
+        help="Conexiones persistentes por host de cada usuario",
+    )
+    parser.add_argument(
+        "--mix",
+        type=str,
+        env_var="LOCUST_MIX",
+        default="balanceado",
+        choices=list(MIX_PROFILES),
+        help="Perfil de mezcla de dominios para los perfiles 'load' y 'open'",
+    )
+    parser.add_argument(
+        "--route-group",
+        type=str,
+        env_var="LOCUST_ROUTE_GROUP",
+        default="",
+        help="Expresión regular sobre el nombre de los endpoints de la mezcla (p. ej. 'organigrama' o 'buscar_proveedores')",
+    )
+    parser.add_argument(
+        "--write-ratio",
+        type=float,
+        env_var="LOCUST_WRITE_RATIO",
+        default=0.8,
+        help="Perfil 'write': proporción de iteraciones con un recorrido de escritura; el resto son lecturas de la mezcla",
+    )
+    parser.add_argument(
+        "--arrival-rate",
+        type=float,
+        env_var="LOCUST_ARRIVAL_RATE",
+        default=10.0,
+        help="Perfil 'open': arribos por segundo (por proceso), repartidos entre los endpoints según --mix",
+    )
+    parser.add_argument(
+        "--arrival-process",
+        type=str,
+        env_var="LOCUST_ARRIVAL_PROCESS",
+        default=PROCESO_POISSON,
+        choices=PROCESOS_ARRIBO,
+        help="Perfil 'open': intervalos entre arribos 'poisson' (exponenciales) o 'constant' (fijos)",
+    )
+    parser.add_argument(
+        "--load-shape",
+        type=str,
+        env_var="LOCUST_LOAD_SHAPE",
+        default=None,
+        choices=list(shapes.SHAPES),
+        help="Forma de carga: 'step', 'spike', 'soak', 'diurnal' o 'knee' (parámetros por ambiente, ver utils/shapes.py)",
+    )
+    parser.add_argument(
+        "--synthetic-data",
+        action="store_true",
+        env_var="LOCUST_SYNTHETIC_DATA",
+        default=False,
+        help="Bodies de escritura con CUIL/CUIT, DNI, nombres y domicilios sintéticos únicos (solo fuera de producción)",
+    )
+    parser.add_argument(
+        "--synthetic-seed",
+        type=int,
+        env_var="SYNTHETIC_SEED",
+        default=None,
+        help="Semilla de los datos sintéticos, para repetir los mismos datos (por defecto al azar, se informa en el log)",
+    )
+    parser.add_argument(
+        "--teardown",
+        action="store_true",
+        env_var="LOCUST_TEARDOWN",
+        default=False,
+        help="Al terminar, da de baja los registros creados durante la prueba (ver utils/teardown.py)",
+    )
+    parser.add_argument(
+        "--teardown-concurrency",
+        type=int,
+        env_var="TEARDOWN_CONCURRENCY",
+        default=teardown.TEARDOWN_CONCURRENCY,
+        help="Requests de baja concurrentes de --teardown",
+    )
+    parser.add_argument(
+        "--log-verbosity",
+        type=str,
+        env_var="LOG_VERBOSITY",
+        default=None,
+        choices=list(LOG_VERBOSITY_LEVELS),
+        help="Verbosidad del log de pruebas: 'debug', 'full' o 'load' (por defecto según el perfil)",
+    )
+    parser.add_argument(
+        "--sampling-profiler",
+        action="store_true",
+        env_var="LOCUST_SAMPLING_PROFILER",
+        default=False,
+        help="Muestrea la pila del generador durante toda la prueba y escribe logs/profile.collapsed (ver utils/profiling.py)",
+    )
+    parser.add_argument(
+        "--sampling-interval",
+        type=int,
+        env_var="LOCUST_SAMPLING_INTERVAL",
+        default=profiling.SAMPLING_INTERVAL_MS,
+        help="Milisegundos entre muestras del profiler (también al iniciarlo desde la interfaz web)",
+    )
+    parser.add_argument(
+        "--param-breakdown",
+        action="store_true",
+        env_var="LOCUST_PARAM_BREAKDOWN",
+        default=False,
+        help="Desglosa el tiempo de respuesta por valor de parámetro (acotado, en la pestaña 'Harness')",
+    )
+    parser.add_argument(
+        "--paging",
+        type=str,
+        env_var="LOCUST_PAGING",
+        default=paging.ESTRATEGIA_PRIMERA,
+        choices=paging.ESTRATEGIAS,
+        help="Página de los endpoints paginados: 'first', 'crawl', 'random', 'last' o 'mixed' (tiempos por profundidad en 'Harness')",
+    )
+    parser.add_argument(
+        "--page-sizes",
+        type=str,
+        env_var="PAGE_SIZE_LADDER",
+        default=page_size.PAGE_SIZE_LADDER,
+        help="Escalera de p_page_size para el perfil 'page-size', separada por comas",
+    )
+
+@events.init.add_listener
+def on_locust_init(environment, **kwargs):
+    # Métricas propias del harness (pestaña "Harness" en la interfaz web)
+    metrics.register_listeners(environment, logger)
+    # Desglose opcional por valor de parámetro; los nombres de request ya llegan normalizados
+    naming.register_breakdown(environment, get_option(environment, "param_breakdown", "LOCUST_PARAM_BREAKDOWN", False))
+    # Estrategia de paginación y tiempos por profundidad de página
+    paging.register(environment, get_option(environment, "paging", "LOCUST_PAGING", paging.ESTRATEGIA_PRIMERA))
+    # Requests del barrido de tamaños de página (perfil "page-size")
+    page_size.register(environment)
+    # Configuración y datos del master a los workers; tasa de arribos de la forma "knee"
+    distributed.register(environment, logger, knee.set_arrival_rate)
+    # Tiempos de conexión, primer byte y descarga de cada request
+    connections.register(environment)
+    # Profiler por muestreo: con --sampling-profiler o desde la interfaz web
+    profiling.register(
+        environment, logger,
+        get_option(environment, "sampling_profiler", "LOCUST_SAMPLING_PROFILER", False) not in (False, "false", "0", ""),
+        int(get_option(environment, "sampling_interval", "LOCUST_SAMPLING_INTERVAL", profiling.SAMPLING_INTERVAL_MS)),
+    )
+
+@events.quitting.add_listener
+def on_quitting(environment, **kwargs):
+    # Escribir los registros pendientes en la cola de logging antes de salir
+    close_logger_handlers()
 
 @events.test_start.add_listener
 def on_test_start(environment, **kwargs):
-    global current_host, environment_name, data_module, logger
+    global current_host, environment_name, data_module, schedule, arrivals, logger, test_profile, production_from_master, synthetic_generators, write_ratio
     
-    # Reiniciar el log para una nueva prueba
-    logger = reset_log_for_new_test()
+    # Reiniciar el log para una nueva prueba; el perfil de carga usa por
+    # defecto la verbosidad reducida para que el log no limite el throughput
+    perfil = test_profile = get_option(environment, "test_profile", "LOCUST_TEST_PROFILE", PERFIL_FUNCIONAL)
+    if LoadShape is not None and perfil == PERFIL_FUNCIONAL:
+        # El barrido funcional se detiene después de una pasada: con una forma de carga se usa la mezcla continua
+        perfil = test_profile = PERFIL_CARGA
+    escritura_no_elegida = perfil == PERFIL_ESCRITURA and not WRITE_PROFILE_SELECTED
+    if escritura_no_elegida:
+        # Perfil cambiado desde la interfaz web: la clase de usuario ya se eligió al iniciar
+        perfil = test_profile = PERFIL_CARGA
+    verbosity = get_option(environment, "log_verbosity", "LOG_VERBOSITY")
+    if verbosity is None:
+        verbosity = "load" if perfil in PERFILES_CON_MEZCLA else "full"
+    logger = reset_log_for_new_test(verbosity)
     logger.info("🔄 NUEVA PRUEBA INICIADA - LOG REINICIADO 🔄")
+    if escritura_no_elegida:
+        logger.warning("El perfil 'write' se elige al iniciar Locust (--test-profile o LOCUST_TEST_PROFILE): se usa 'load'")
+    if LoadShape is not None:
+        logger.info(f"Forma de carga: {LoadShape.nombre} (perfil {perfil})")
+    
+    configuracion = distributed.received_config() if distributed.is_worker(environment) else None
+    if configuracion is not None:
+        # Worker: host, ambiente y datos resueltos por el master
+        current_host = configuracion["host"]
+        environment_name = configuracion["environment_name"]
+        production_from_master = configuracion["produccion"]
+        data_module = distributed.data_from_config(configuracion)
+        semilla = configuracion["semilla_sintetica"]
+        logger.info(f"Ambiente {environment_name} y datos recibidos del master (host {current_host})")
+    else:
+        if distributed.is_worker(environment):
+            logger.warning("No se recibió la configuración del master: se resuelve el ambiente en el worker")
+
+        # Capturar el host definido en la línea de comandos o en la interfaz web
+        current_host = environment.host
+        logger.info(f"Host capturado: {current_host}")
+        
+        # Detectar el ambiente basado en el host
+        environment_name = detect_environment(current_host)
+        logger.info(f"Ambiente detectado para el host {current_host}: {environment_name}")
+        
+        # Cargar datos correspondientes al ambiente
+        data_module = load_data_for_environment(environment_name, logger)
+
+        # Semilla de los datos sintéticos: la elige el master para que los workers compartan la permutación de DNIs
+        semilla = get_option(environment, "synthetic_seed", "SYNTHETIC_SEED")
+        semilla = int(semilla) if semilla is not None else random.randrange(2**31)
+
+        # Master: enviar la configuración y los datos a los workers antes del spawn
+        if distributed.is_master(environment):
+            distributed.publish(environment, current_host, environment_name, is_production_environment(), data_module, semilla)
+
+    # Datos sintéticos para las escrituras: pool pregenerado por proceso (no en el master, que no ejecuta usuarios);
+    # el perfil "write" los usa siempre para que cada recorrido cree registros nuevos
+    synthetic_generators = None
+    if perfil == PERFIL_ESCRITURA or get_option(environment, "synthetic_data", "LOCUST_SYNTHETIC_DATA", False) not in (False, "false", "0", ""):
+        if is_production_environment():
+            logger.warning("Datos sintéticos desactivados en producción")
+        elif not distributed.is_master(environment):
+            pool = synthetic.SyntheticPool(semilla=semilla, bloque=max(0, environment.runner.worker_index))
+            synthetic_generators = synthetic.generators(pool)
+            logger.warning(f"Datos sintéticos: semilla {semilla}, {len(pool)} identidades pregeneradas")
+
+    # Registro de los IDs creados por las escrituras (no en producción ni en el master, que no ejecuta usuarios)
+    journal.stop()
+    if not is_production_environment() and not distributed.is_master(environment):
+        journal.start(environment_name, current_host, distributed.worker_id())
+
+    # Validación completa en el perfil funcional; muestreada en el de carga
+    validation.set_mode(validation.MODO_MUESTREO if perfil in PERFILES_CON_MEZCLA else validation.MODO_COMPLETO)
+
+    # Preparar la mezcla ponderada si se ejecuta el perfil de carga o el abierto
+    schedule = None
+    if arrivals is not None:
+        arrivals.stop()
+        arrivals = None
+        knee.attach_arrivals(None)
+    if perfil in PERFILES_CON_MEZCLA:
+        nombre_mix = get_option(environment, "mix", "LOCUST_MIX", "balanceado")
+        # La mezcla del perfil "write" aporta las lecturas; las escrituras son los recorridos
+        solo_lectura = is_production_environment() or perfil == PERFIL_ESCRITURA
+        grupo = get_option(environment, "route_group", "LOCUST_ROUTE_GROUP", "")
+        mezcla = build_schedule(filter_endpoints(get_endpoints(solo_lectura, sinteticos=synthetic_generators is not None, mezcla=True), grupo), MIX_PROFILES, nombre_mix)
+        logger.info(f"Perfil {perfil} con mezcla '{nombre_mix}' ({len(mezcla.entradas)} endpoints, solo lectura: {solo_lectura})")
+        if grupo:
+            logger.info(f"Grupo de rutas: '{grupo}'")
+        if perfil == PERFIL_ABIERTO:
+            # Modelo abierto: los arribos no dependen de cuánto tarden las respuestas
+            tasa = float(get_option(environment, "arrival_rate", "LOCUST_ARRIVAL_RATE", 10.0))
+            proceso = get_option(environment, "arrival_process", "LOCUST_ARRIVAL_PROCESS", PROCESO_POISSON)
+            if distributed.is_master(environment):
+                # Los arribos se generan en cada worker; la forma "knee" les envía la tasa
+                knee.attach_arrivals(distributed.RemoteArrivals(environment, tasa))
+            else:
+                arrivals = ArrivalScheduler(mezcla, tasa, proceso, environment=environment)
+                logger.info(f"Arribos {proceso} a {tasa:g}/s; tasa objetivo por endpoint:")
+                for nombre, tasa_endpoint in arrivals.target_rates():
+                    logger.info(f"  {nombre}: {tasa_endpoint:.3f}/s")
+                arrivals.start()
+                # La forma "knee" sube la tasa de este generador en cada escalón
+                knee.attach_arrivals(arrivals)
+        else:
+            schedule = mezcla
+            for nombre, proporcion in schedule.resumen():
+                logger.info(f"  {nombre}: {proporcion:.1%}")
+        if perfil == PERFIL_ESCRITURA:
+            write_ratio = min(max(float(get_option(environment, "write_ratio", "LOCUST_WRITE_RATIO", 0.8)), 0.0), 1.0)
+            if is_production_environment():
+                logger.warning("🚨 AMBIENTE DE PRODUCCIÓN DETECTADO - PERFIL 'write' SOLO CON LECTURAS 🚨")
+                write_ratio = 0.0
+            logger.info(f"Perfil write: {write_ratio:.0%} recorridos de escritura, {1 - write_ratio:.0%} lecturas")
+
+    # Barrido de tamaños de página: resultados nuevos en cada prueba
+    page_size.reset()
+
+def is_production_environment():
+    """Determina si estamos en ambiente de producción"""
+    # En los workers decide el master (modo distribuido)
+    if production_from_master is not None:
+        return production_from_master
+
+    # Opción 1: Basado en el nombre del ambiente detectado
+    if environment_name and environment_name.lower() in ['produccion', 'prod', 'production']:
+        return True
     
-    # Capturar el host definido en la línea de comandos o en la interfaz web
-    current_host = environment.host
-    logger.info(f"Host capturado: {current_host}")
+    # Opción 2: Basado en el host
+    if current_host and any(prod_indicator in current_host.lower() for prod_indicator in ['prod', 'production']):
+        return True
     
-    # Detectar el ambiente basado en el host
-    environment_name = detect_environment(current_host)
-    logger.info(f"Ambiente detectado para el host {current_host}: {environment_name}")
+    # Opción 3: Variable de entorno específica
+    if os.getenv("LOCUST_PRODUCTION_MODE", "false").lower() == "true":
+        return True
     
-    # Cargar datos correspondientes al ambiente
-    data_module = load_data_for_environment(environment_name, logger)
-
-class BaseUnicaUser(HttpUser):
+    # Opción 4: Basado en patrones de URL de producción
+    production_patterns = [
+        'api.cordoba.gob.ar',
+        'produccion.',
+        'prod.',
+        # Agregar más patrones según sea necesario
+    ]
+    
+    if current_host and any(pattern in current_host.lower() for pattern in production_patterns):
+        return True
+    
+    return False
+
+@events.test_stop.add_listener
+def on_test_stop(environment, **kwargs):
+    # Detener la renovación de tokens en segundo plano
+    stop_token_refresh()
+    # Detener el generador de arribos del perfil abierto
+    if arrivals is not None:
+        arrivals.stop()
+    # Tabla del barrido de tamaños de página (solo si se ejecutó el perfil)
+    if test_profile == PERFIL_TAMANO_PAGINA:
+        page_size.report(logger, page_size.csv_path(distributed.worker_id() if distributed.is_worker(environment) else None))
+    # Registro de los IDs creados y baja opcional
+    creados = journal.count()
+    ruta_journal = journal.stop()
+    if ruta_journal is not None:
+        logger.warning(f"Registros creados durante la prueba: {creados} en {ruta_journal}")
+        if get_option(environment, "teardown", "LOCUST_TEARDOWN", False) not in (False, "false", "0", ""):
+            run_teardown(environment, ruta_journal)
+
+def run_teardown(environment, ruta_journal):
+    """Da de baja los registros del archivo de registro de este proceso"""
+    concurrencia = int(get_option(environment, "teardown_concurrency", "TEARDOWN_CONCURRENCY", teardown.TEARDOWN_CONCURRENCY))
+    credentials = get_credentials_for_environment(environment_name)
+    session = teardown.new_session(current_host)
+    token = current_token(environment_name, credentials) or authenticate(session, logger, credentials)
+    if not token:
+        logger.error(f"Baja cancelada: no se pudo autenticar. Ejecutar después: python -m utils.teardown {ruta_journal}")
+        return
+    session.headers.update({"Authorization": f"Bearer {token}", "Content-Type": "application/json"})
+    logger.warning(f"Baja de los registros creados ({concurrencia} requests concurrentes)")
+    for tipo, resultado in teardown.run(session, logger, ruta_journal, concurrencia).items():
+        logger.warning(f"  {tipo}: {dict(resultado)}")
+
+class BaseUnicaUser(transport.user_base(TRANSPORT)):
+    # Con el perfil "write" se usa WriteHeavyUser en su lugar
+    abstract = WRITE_PROFILE_SELECTED
     wait_time = between(1, 3)
+    # Estrategia de conexión y tamaño del pool de la clase (None: --connection-strategy y --pool-size)
+    connection_strategy = None
+    pool_size = None
    
     # Variables para autenticación
     token = None
+    credentials = None
     task_executed = False
+    data = None
+    http = None
    
     def on_start(self):
+        # Con el transporte "fast", cliente con la interfaz de la sesión de requests (utils/transport.py)
+        self.client = transport.adapt(self.client)
+        # Keep-alive, reconexión por iteración o handshake por request (utils/connections.py)
+        if self.connection_strategy is None:
+            self.connection_strategy = get_option(self.environment, "connection_strategy", "LOCUST_CONNECTION_STRATEGY", connections.ESTRATEGIA_PERSISTENTE)
+        if self.pool_size is None:
+            self.pool_size = int(get_option(self.environment, "pool_size", "LOCUST_POOL_SIZE", connections.POOL_SIZE))
+        connections.configure(self.client, self.connection_strategy, self.pool_size)
+        # Datos propios del usuario sobre los datos del ambiente (utils/context.py)
+        self.data = UserDataContext(data_module, sinteticos=synthetic_generators)
+        # Cliente de los task functions: nombres de request normalizados (utils/http.py)
+        self.http = HarnessClient(self.client)
+        # Perfil abierto: el ritmo lo marca la cola de arribos, no la espera entre tasks
+        if arrivals is not None:
+            self.wait_time = lambda: 0
+
         try:
             # Usar el host capturado de la sesión
             self.host = current_host or os.getenv("BASE_URL")
             logger.info(f"Usando host: {self.host}")
             
             # Cargar lista de CUITs de muestra
-            self.sample_cuits = data_module.p_cuit
+            self.sample_cuits = self.data.p_cuit
             
             # Obtener credenciales específicas para el ambiente detectado
             credentials = get_credentials_for_environment(environment_name)
             logger.info(f"Usando credenciales para ambiente: {environment_name}")
             
-            # Autenticar usuario con las credenciales específicas
-            self.token = authenticate(self.client, logger, credentials)
+            self.credentials = credentials
+
+            # Obtener el token de la caché compartida (un solo login por ambiente y credenciales)
+            self.token = get_token(self.client, logger, environment_name, credentials)
             
             if not self.token and self.environment.parsed_options.headless:
                 # En modo headless, terminamos la ejecución
@@ -86,306 +471,78 @@ class BaseUnicaUser(HttpUser):
             # Capturar cualquier error en la configuración general
             logger.critical(f"ERROR CRÍTICO en on_start: {str(e)}")
 
+    def sync_token(self):
+        """Actualiza el encabezado si el token compartido fue renovado en segundo plano"""
+        token = current_token(environment_name, self.credentials)
+        if token and token != self.token:
+            self.token = token
+            self.client.headers["Authorization"] = f"Bearer {token}"
+
     def on_stop(self):
-        logger.info("Test finalizado. Se ejecutó una sola vez.")
+        if schedule is not None or arrivals is not None:
+            logger.info(f"Test finalizado. Perfil {test_profile} detenido.")
+        else:
+            logger.info("Test finalizado. Se ejecutó una sola vez.")
 
     def is_production_environment(self):
         """Determina si estamos en ambiente de producción"""
-        # Opción 1: Basado en el nombre del ambiente detectado
-        if environment_name and environment_name.lower() in ['produccion', 'prod', 'production']:
-            return True
-        
-        # Opción 2: Basado en el host
-        if current_host and any(prod_indicator in current_host.lower() for prod_indicator in ['prod', 'production']):
-            return True
-        
-        # Opción 3: Variable de entorno específica
-        if os.getenv("LOCUST_PRODUCTION_MODE", "false").lower() == "true":
-            return True
-        
-        # Opción 4: Basado en patrones de URL de producción
-        production_patterns = [
-            'api.cordoba.gob.ar',
-            'produccion.',
-            'prod.',
-            # Agregar más patrones según sea necesario
-        ]
-        
-        if current_host and any(pattern in current_host.lower() for pattern in production_patterns):
-            return True
-        
-        return False
+        return is_production_environment()
+
+    def run_endpoints(self, entradas):
+        """Ejecuta en secuencia las entradas del registro indicadas"""
+        for entrada in entradas:
+            self.http.run_task(entrada.funcion, logger, self.environment, self.data)
 
     def execute_get_endpoints_only(self):
         """Ejecuta solo endpoints GET (modo producción)"""
         logger.info("=== MODO PRODUCCIÓN: EJECUTANDO SOLO ENDPOINTS GET ===")
-        
-        # -------CERROJO(INSTITUCIONAL)----------- (Solo GET)
-
-        get_centros_operativos(self.client, logger, self.environment, data_module)
-        get_dependencias_por_parametros(self.client, logger, self.environment, data_module)
-        post_dependencias_por_ids(self.client, logger, self.environment, data_module)  # POST
-        get_fechas_no_habiles(self.client, logger, self.environment, data_module)
-        get_limites_administrativos(self.client, logger, self.environment, data_module)
-        get_organigrama_completo(self.client, logger, self.environment, data_module)
-        get_dependencias_directas(self.client, logger, self.environment, data_module)
-        get_dependencias_ruta(self.client, logger, self.environment, data_module)
-        get_organigrama_por_nivel(self.client, logger, self.environment, data_module) 
-        get_organigrama_por_niveles(self.client, logger, self.environment, data_module)   
-        get_dependencia_mas_alta(self.client, logger, self.environment, data_module)
-        get_organigrama_por_dependencia(self.client, logger, self.environment, data_module)
-        get_centros_vecinales(self.client, logger, self.environment, data_module)
-        get_all_cpc(self.client, logger, self.environment, data_module)   
-        get_barrios_cpc(self.client, logger, self.environment, data_module)
-        get_organizaciones_sociales(self.client, logger, self.environment, data_module)
-        get_tipos_organizaciones_sociales(self.client, logger, self.environment, data_module)
-        get_unidades_judiciales(self.client, logger, self.environment, data_module)
-
-        # --------PERSONA FISICA------------ (Solo GET)
-        get_personas_fisicas(self.client, logger, self.environment, data_module)
-        get_comunicaciones_personas(self.client, logger, self.environment, data_module)
-
-        # --------PERSONA JURIDICA----------- (Solo GET)
-        get_persona_juridica(self.client, logger, self.environment, self.sample_cuits)
-        get_sedes_pj(self.client, logger, self.environment, data_module)
-
-        # --------PROVEEDOR------------ (Solo GET)
-        get_proveedor_by_cuit_cuil(self.client, logger, self.environment, data_module)
-        buscar_personas_por_cuils_cuits(self.client, logger, self.environment, data_module)
-        get_proveedores_por_actividad(self.client, logger, self.environment, data_module)
-        buscar_proveedores_por_parametros(self.client, logger, self.environment, data_module)
-        buscar_proveedores_por_ids(self.client, logger, self.environment, data_module)
-        buscar_proveedores_minimizado(self.client, logger, self.environment, data_module)
-        # # # Prueba varias casos donde en los datos se tiene descomentar los multiples casos dependiendo del ambiente
-        # buscar_proveedores_minimizado_casos_multiples(self.client, logger, self.environment, data_module)
-
-        # --------DOMICILIO------------ (Solo GET)
-        get_barrios_por_localidad(self.client, logger, self.environment, data_module)
-        get_calles_por_localidad(self.client, logger, self.environment, data_module)
-        get_paises(self.client, logger, self.environment, data_module)
-        get_provincias_por_pais(self.client, logger, self.environment, data_module)
-        get_departamentos_por_provincia(self.client, logger, self.environment, data_module)
-        get_localidades_por_departamento(self.client, logger, self.environment, data_module)
-        get_domicilio_geo(self.client, logger, self.environment, data_module)
-        get_domicilio_by_id(self.client, logger, self.environment, data_module)
-        get_domicilio_cpc_by_id(self.client, logger, self.environment, data_module)
-
-        # --------AMBIENTE------------ (Solo GET)
-        get_espacios_verdes(self.client, logger, self.environment, data_module)
-        get_campanas_pet(self.client, logger, self.environment, data_module)
-        get_recoleccion_residuos_diferenciada(self.client, logger, self.environment, data_module)
-
-        # --------EDUCACION------------ (Solo GET)
-
-        get_parques_educativos(self.client, logger, self.environment, data_module)
-        get_escuelas_municipales(self.client, logger, self.environment, data_module)
-        get_jardines_municipales(self.client, logger, self.environment, data_module)
-
-        # --------HABILITACION------------ (Solo GET por ahora)
-
-        get_comercios(self.client, logger, self.environment, data_module)
-        get_geriatricos_privados(self.client, logger, self.environment, data_module)
-        get_jardines_maternales_privados(self.client, logger, self.environment, data_module)
-
-        # --------INFRAESTRUCTURA------------ (Solo GET por ahora)
-
-        get_puntos_wifi(self.client, logger, self.environment, data_module)
-        get_obra_publica(self.client, logger, self.environment, data_module)
-
-        # --------SALUD------------ (Solo GET por ahora)
-
-        get_centros_salud(self.client, logger, self.environment, data_module)
-
-        # --------TURISMO------------ (Solo GET por ahora)
-
-        get_guias_turisticos(self.client, logger, self.environment, data_module)
-        get_anfitriones_turisticos(self.client, logger, self.environment, data_module)
-
-        # --------TRANSPORTE------------ (Solo GET)
-        get_condiciones(self.client, logger, self.environment, data_module)
-        get_estacionamiento_bicicletas(self.client, logger, self.environment, data_module)
-        get_estados_licencias(self.client, logger, self.environment, data_module)
-        get_situaciones_chapas(self.client, logger, self.environment, data_module)
-        get_tipos_servicios(self.client, logger, self.environment, data_module)
-        get_zona_semm(self.client, logger, self.environment, data_module)
-        get_chapas(self.client, logger, self.environment, data_module)
-        get_leasing(self.client, logger, self.environment, data_module)
-        get_centrales_agencias(self.client, logger, self.environment, data_module)
-        get_persona_fisica_por_chapa(self.client, logger, self.environment, data_module)
-        get_chapas_por_cuil(self.client, logger, self.environment, data_module)
-        get_permisionarios_por_parametros(self.client, logger, self.environment, data_module)
-        get_licencias_por_parametros(self.client, logger, self.environment, data_module)
-        get_ciclovias(self.client, logger, self.environment, data_module)
-        get_personal(self.client, logger, self.environment, data_module)
-        get_empresas(self.client, logger, self.environment, data_module)
-        get_recorridos_lineas(self.client, logger, self.environment, data_module)
-        get_paradas_linea(self.client, logger, self.environment, data_module)
-        get_vehiculos(self.client, logger, self.environment, data_module)
-
-
-        # --------PARAMETRICAS------------ (Solo GET)
-
-        get_medios_pagos(self.client, logger, self.environment, data_module)
-        get_cfiscal(self.client, logger, self.environment, data_module)
-        get_fjuridica(self.client, logger, self.environment, data_module)
-        get_bancos(self.client, logger, self.environment, data_module)
-        get_banco_by_id(self.client, logger, self.environment, data_module)
-        get_profesiones(self.client, logger, self.environment, data_module)
-        get_profesion_by_id(self.client, logger, self.environment, data_module)
-        get_dispositivos_pagos(self.client, logger, self.environment, data_module)
-        get_actividades(self.client, logger, self.environment, data_module)
-
-        # # --------TRIBUTARIO------------ (Solo GET)
-        get_deuda_inmueble(self.client, logger, self.environment, data_module)
-        get_deuda_rodado(self.client, logger, self.environment, data_module)
+        self.run_endpoints(get_endpoints(solo_lectura=True))
 
     def execute_all_endpoints(self):
         """Ejecuta todos los endpoints (modo desarrollo/testing)"""
         logger.info("=== MODO DESARROLLO: EJECUTANDO TODOS LOS ENDPOINTS ===")
-        
-        # -------PERSONA JURIDICA----------- 
-        get_persona_juridica(self.client, logger, self.environment, self.sample_cuits)
-        get_sedes_pj(self.client, logger, self.environment, data_module)
-        insert_persona_juridica(self.client, logger, self.environment, data_module.body_insertar_persona_juridica)
-        insert_domicilio_sede_pj(self.client, logger, self.environment, data_module.body_insertar_sede)
-        insert_domicilio_sede(self.client, logger, self.environment, data_module.body_insertar_domicilio_sede)
-
-        # -------CERROJO(INSTITUCIONAL)----------- 
-                
-        get_centros_operativos(self.client, logger, self.environment, data_module)
-        get_dependencias_por_parametros(self.client, logger, self.environment, data_module)
-        post_dependencias_por_ids(self.client, logger, self.environment, data_module)  # POST
-        update_dependencias_visibility(self.client, logger, self.environment, data_module)  # POST
-        get_fechas_no_habiles(self.client, logger, self.environment, data_module)
-        get_limites_administrativos(self.client, logger, self.environment, data_module)
-        get_organigrama_completo(self.client, logger, self.environment, data_module)
-        get_dependencias_directas(self.client, logger, self.environment, data_module)
-        get_dependencias_ruta(self.client, logger, self.environment, data_module)
-        get_organigrama_por_nivel(self.client, logger, self.environment, data_module) 
-        get_organigrama_por_niveles(self.client, logger, self.environment, data_module)   
-        get_dependencia_mas_alta(self.client, logger, self.environment, data_module)
-        get_organigrama_por_dependencia(self.client, logger, self.environment, data_module)
-        get_centros_vecinales(self.client, logger, self.environment, data_module)
-        get_all_cpc(self.client, logger, self.environment, data_module)   
-        get_barrios_cpc(self.client, logger, self.environment, data_module)
-        get_organizaciones_sociales(self.client, logger, self.environment, data_module)
-        get_tipos_organizaciones_sociales(self.client, logger, self.environment, data_module)
-        get_unidades_judiciales(self.client, logger, self.environment, data_module)
-
-
-
-        # --------PERSONA FISICA------------ 
-        insert_or_update_persona_fisica(self.client, logger, self.environment, data_module)  # POST
-
-        # Este endpoint queda excluido por la causa de que no se puede insertar una persona física con el mismo DNI
-        # insert_or_update_persona_fisica_by_dni(self.client, logger, self.environment, data_module)  # POST
-
-        insert_or_update_persona_fisica_simplificada(self.client, logger, self.environment, data_module)  # POST
-        get_personas_fisicas(self.client, logger, self.environment, data_module)
-        insert_domicilio_persona_fisica(self.client, logger, self.environment, data_module)  # POST
-        get_comunicaciones_personas(self.client, logger, self.environment, data_module)
-        insert_comunicaciones_personas(self.client, logger, self.environment, data_module)  # POST
-
-        # --------PROVEEDOR------------ 
-        get_proveedor_by_cuit_cuil(self.client, logger, self.environment, data_module)
-        insert_or_update_proveedor(self.client, logger, self.environment, data_module)  # POST
-        buscar_personas_por_cuils_cuits(self.client, logger, self.environment, data_module)
-        alta_proveedor(self.client, logger, self.environment, data_module)  # POST
-        alta_cbu_banco_proveedor(self.client, logger, self.environment, data_module)  # POST
-        get_proveedores_por_actividad(self.client, logger, self.environment, data_module)
-        buscar_proveedores_por_parametros(self.client, logger, self.environment, data_module)
-        buscar_proveedores_por_ids(self.client, logger, self.environment, data_module)
-        buscar_proveedores_minimizado(self.client, logger, self.environment, data_module)
-        # # # Prueba varias casos donde en los datos se tiene descomentar los multiples casos dependiendo del ambiente
-        # buscar_proveedores_minimizado_casos_multiples(self.client, logger, self.environment, data_module)
-
-        # --------DOMICILIO------------ 
-        get_barrios_por_localidad(self.client, logger, self.environment, data_module)
-        get_calles_por_localidad(self.client, logger, self.environment, data_module)
-        get_paises(self.client, logger, self.environment, data_module)
-        get_provincias_por_pais(self.client, logger, self.environment, data_module)
-        get_departamentos_por_provincia(self.client, logger, self.environment, data_module)
-        get_localidades_por_departamento(self.client, logger, self.environment, data_module)
-        insert_domicilio(self.client, logger, self.environment, data_module)  # POST
-        insert_domicilio_ampliado(self.client, logger, self.environment, data_module)  # POST
-        insert_domicilio_geo(self.client, logger, self.environment, data_module)  # POST
-        get_domicilio_geo(self.client, logger, self.environment, data_module)
-        get_domicilio_by_id(self.client, logger, self.environment, data_module)
-        insert_incidente(self.client, logger, self.environment, data_module)  # POST
-        get_domicilio_cpc_by_id(self.client, logger, self.environment, data_module)
-
-        # --------AMBIENTE------------
-        get_espacios_verdes(self.client, logger, self.environment, data_module)
-        get_campanas_pet(self.client, logger, self.environment, data_module)
-        get_recoleccion_residuos_diferenciada(self.client, logger, self.environment, data_module)
-
-        # --------EDUCACION------------ 
-
-        get_parques_educativos(self.client, logger, self.environment, data_module)
-        get_escuelas_municipales(self.client, logger, self.environment, data_module)
-        get_jardines_municipales(self.client, logger, self.environment, data_module)
-
-        # --------HABILITACION------------ 
-
-        get_comercios(self.client, logger, self.environment, data_module)
-        get_geriatricos_privados(self.client, logger, self.environment, data_module)
-        get_jardines_maternales_privados(self.client, logger, self.environment, data_module)
-
-        # --------INFRAESTRUCTURA------------ 
-
-        get_puntos_wifi(self.client, logger, self.environment, data_module)
-        get_obra_publica(self.client, logger, self.environment, data_module)
-
-        # --------SALUD------------ 
-
-        get_centros_salud(self.client, logger, self.environment, data_module)
-
-        # --------TURISMO------------ 
-
-        get_guias_turisticos(self.client, logger, self.environment, data_module)
-        get_anfitriones_turisticos(self.client, logger, self.environment, data_module)
-
-        # --------TRANSPORTE------------ 
-
-        get_condiciones(self.client, logger, self.environment, data_module)   
-        get_estacionamiento_bicicletas(self.client, logger, self.environment, data_module)  
-        get_estados_licencias(self.client, logger, self.environment, data_module)
-        get_situaciones_chapas(self.client, logger, self.environment, data_module)
-        get_tipos_servicios(self.client, logger, self.environment, data_module)
-        get_zona_semm(self.client, logger, self.environment, data_module)
-        get_chapas(self.client, logger, self.environment, data_module)
-        get_leasing(self.client, logger, self.environment, data_module)
-        get_centrales_agencias(self.client, logger, self.environment, data_module)
-        get_persona_fisica_por_chapa(self.client, logger, self.environment, data_module)
-        get_chapas_por_cuil(self.client, logger, self.environment, data_module)
-        get_permisionarios_por_parametros(self.client, logger, self.environment, data_module)
-        get_licencias_por_parametros(self.client, logger, self.environment, data_module)
-        get_ciclovias(self.client, logger, self.environment, data_module)
-        get_personal(self.client, logger, self.environment, data_module)
-        get_empresas(self.client, logger, self.environment, data_module)
-        get_recorridos_lineas(self.client, logger, self.environment, data_module)
-        get_paradas_linea(self.client, logger, self.environment, data_module)
-        get_vehiculos(self.client, logger, self.environment, data_module)
-
-        # --------PARAMETRICAS------------ 
-
-        get_medios_pagos(self.client, logger, self.environment, data_module)
-        get_cfiscal(self.client, logger, self.environment, data_module)
-        get_fjuridica(self.client, logger, self.environment, data_module)
-        get_bancos(self.client, logger, self.environment, data_module)
-        get_banco_by_id(self.client, logger, self.environment, data_module)
-        get_profesiones(self.client, logger, self.environment, data_module)
-        get_profesion_by_id(self.client, logger, self.environment, data_module)
-        put_medios_pagos(self.client, logger, self.environment, data_module)
-        get_dispositivos_pagos(self.client, logger, self.environment, data_module)
-        get_actividades(self.client, logger, self.environment, data_module)
-
-        # # --------TRIBUTARIO------------ 
-
-        get_deuda_inmueble(self.client, logger, self.environment, data_module)
-        get_deuda_rodado(self.client, logger, self.environment, data_module)
+        self.run_endpoints(get_endpoints(sinteticos=synthetic_generators is not None))
 
     @task
+    def run_profile(self):
+        """Despacha la iteración según el perfil de ejecución"""
+        connections.new_iteration(self.client, self.connection_strategy)
+        if test_profile == PERFIL_ESCRITURA:
+            self.run_write_iteration()
+        elif arrivals is not None:
+            self.run_open_arrival()
+        elif schedule is not None:
+            self.run_load_iteration()
+        elif test_profile == PERFIL_TAMANO_PAGINA:
+            self.run_page_size_sweep()
+        else:
+            self.run_once()
+
+    def run_load_iteration(self):
+        """Perfil de carga: ejecuta un endpoint elegido según la mezcla ponderada"""
+        self.sync_token()
+        entrada = schedule.pick()
+        self.http.run_task(entrada.funcion, logger, self.environment, self.data)
+
+    def run_open_arrival(self):
+        """Perfil abierto: ejecuta el siguiente arribo de la cola y mide desde su momento programado"""
+        arribo = arrivals.next()
+        if arribo is None:
+            return
+        self.sync_token()
+        run_arrival(arribo, lambda entrada: self.http.run_task(entrada.funcion, logger, self.environment, self.data), self.environment)
+
+    def run_page_size_sweep(self):
+        """Perfil page-size: cada endpoint paginado con cada tamaño de la escalera, una sola vez"""
+        if self.task_executed:
+            return
+        tamanos = page_size.parse_ladder(get_option(self.environment, "page_sizes", "PAGE_SIZE_LADDER", page_size.PAGE_SIZE_LADDER))
+        entradas = get_paginated_endpoints(solo_lectura=self.is_production_environment())
+        logger.info(f"Barrido de tamaños de página {tamanos} sobre {len(entradas)} endpoints paginados")
+        page_size.run_sweep(self.http, logger, self.environment, self.data, entradas, tamanos)
+        self.task_executed = True
+        self.environment.runner.quit()
+
     def run_once(self):
         """Esta tarea ejecuta toda la secuencia de pruebas una sola vez"""
         if not self.task_executed:
@@ -407,3 +564,18 @@ class BaseUnicaUser(HttpUser):
             # Detener la ejecución después de completar la tarea
             self.environment.runner.quit()
 
+
+class WriteHeavyUser(BaseUnicaUser):
+    """Usuario del perfil "write": recorridos de escritura encadenados (tasks/journeys.py)
+    y lecturas de la mezcla, en la proporción de --write-ratio"""
+    abstract = not WRITE_PROFILE_SELECTED
+    wait_time = between(0.5, 1.5)
+
+    def run_write_iteration(self):
+        """Perfil write: un recorrido de escritura o una lectura de la mezcla"""
+        self.sync_token()
+        if random.random() < write_ratio:
+            run_journey(pick_journey(), self.http, logger, self.environment, self.data)
+        else:
+            entrada = schedule.pick()
+            self.http.run_task(entrada.funcion, logger, self.environment, self.data)
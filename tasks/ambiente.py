@@ -1,7 +1,10 @@
 import random
 import copy
+import logging
 from typing import Dict, Any
 
+from utils.http import report_failure
+
 def get_espacios_verdes(client, logger, environment, data_module):
     """Prueba el endpoint de obtener espacios verdes de Córdoba"""
     
@@ -14,7 +17,8 @@ def get_espacios_verdes(client, logger, environment, data_module):
             name=" (AMBIENTE) - /ambiente/espacios-verdes [GET]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
                 try:
@@ -28,7 +32,7 @@ def get_espacios_verdes(client, logger, environment, data_module):
                     # Mostrar solo los primeros elementos para no saturar el log
                     if isinstance(response_data, list) and response_data:
                         logger.info(f"Primeros 3 espacios verdes: {response_data[:3]}")
-                    else:
+                    elif logger.isEnabledFor(logging.INFO):
                         logger.info(f"Respuesta completa: {response_data}")
                     
                     # Validar estructura de datos esperada
@@ -61,10 +65,11 @@ def get_espacios_verdes(client, logger, environment, data_module):
                                 
                                 # Mostrar información del primer espacio verde
                                 logger.info("=== INFORMACIÓN DEL PRIMER ESPACIO VERDE ===")
-                                for campo in campos_presentes[:10]:  # Mostrar hasta 10 campos
-                                    valor = primer_elemento.get(campo)
-                                    if valor is not None:
-                                        logger.info(f"- {campo}: {valor}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for campo in campos_presentes[:10]:  # Mostrar hasta 10 campos
+                                        valor = primer_elemento.get(campo)
+                                        if valor is not None:
+                                            logger.info(f"- {campo}: {valor}")
                                 
                                 # Estadísticas adicionales si hay múltiples espacios verdes
                                 if len(response_data) > 1:
@@ -165,12 +170,7 @@ def get_espacios_verdes(client, logger, environment, data_module):
         logger.error(f"Excepción durante consulta de espacios verdes: {str(e)}")
         
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/ambiente/espacios-verdes",
-            catch_response=True,
-            name="(AMBIENTE) - /ambiente/espacios-verdes [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(AMBIENTE) - /ambiente/espacios-verdes [Exception]", e)
 
 def get_campanas_pet(client, logger, environment, data_module):
     """Prueba el endpoint de obtener campanas PET de Córdoba"""
@@ -184,7 +184,8 @@ def get_campanas_pet(client, logger, environment, data_module):
             name="(AMBIENTE) - /ambiente/campanas-pet [GET]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
                 try:
@@ -198,7 +199,7 @@ def get_campanas_pet(client, logger, environment, data_module):
                     # Mostrar solo los primeros elementos para no saturar el log
                     if isinstance(response_data, list) and response_data:
                         logger.info(f"Primeras 3 campanas PET: {response_data[:3]}")
-                    else:
+                    elif logger.isEnabledFor(logging.INFO):
                         logger.info(f"Respuesta completa: {response_data}")
                     
                     # Validar estructura de datos esperada
@@ -232,10 +233,11 @@ def get_campanas_pet(client, logger, environment, data_module):
                                 
                                 # Mostrar información de la primera campana PET
                                 logger.info("=== INFORMACIÓN DE LA PRIMERA CAMPANA PET ===")
-                                for campo in campos_presentes[:10]:  # Mostrar hasta 10 campos
-                                    valor = primer_elemento.get(campo)
-                                    if valor is not None:
-                                        logger.info(f"- {campo}: {valor}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for campo in campos_presentes[:10]:  # Mostrar hasta 10 campos
+                                        valor = primer_elemento.get(campo)
+                                        if valor is not None:
+                                            logger.info(f"- {campo}: {valor}")
                                 
                                 # Estadísticas adicionales si hay múltiples campanas PET
                                 if len(response_data) > 1:
@@ -355,12 +357,7 @@ def get_campanas_pet(client, logger, environment, data_module):
         logger.error(f"Excepción durante consulta de campanas PET: {str(e)}")
         
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/ambiente/campanas-pet",
-            catch_response=True,
-            name="(AMBIENTE) - /ambiente/campanas-pet [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(AMBIENTE) - /ambiente/campanas-pet [Exception]", e)
 
 
 def get_recoleccion_residuos_diferenciada(client, logger, environment, data_module):
@@ -423,7 +420,7 @@ def get_recoleccion_residuos_diferenciada(client, logger, environment, data_modu
                         # Mostrar solo los primeros elementos para no saturar el log
                         if isinstance(response_data, list) and response_data:
                             logger.info(f"Primeros 2 registros: {response_data[:2]}")
-                        else:
+                        elif logger.isEnabledFor(logging.INFO):
                             logger.info(f"Respuesta completa: {response_data}")
                         
                         # Validar estructura de datos esperada
@@ -460,10 +457,11 @@ def get_recoleccion_residuos_diferenciada(client, logger, environment, data_modu
                                     
                                     # Mostrar información del primer registro
                                     logger.info("=== INFORMACIÓN DEL PRIMER REGISTRO ===")
-                                    for campo in campos_presentes[:8]:  # Mostrar hasta 8 campos
-                                        valor = primer_elemento.get(campo)
-                                        if valor is not None:
-                                            logger.info(f"- {campo}: {valor}")
+                                    if logger.isEnabledFor(logging.INFO):
+                                        for campo in campos_presentes[:8]:  # Mostrar hasta 8 campos
+                                            valor = primer_elemento.get(campo)
+                                            if valor is not None:
+                                                logger.info(f"- {campo}: {valor}")
                                     
                                     # Estadísticas adicionales si hay múltiples registros
                                     if len(response_data) > 1:
@@ -638,9 +636,4 @@ def get_recoleccion_residuos_diferenciada(client, logger, environment, data_modu
             resultados["errores"] += 1
             
             # Registrar el error como una respuesta fallida
-            with client.get(
-                url,
-                catch_response=True,
-                name=f"(AMBIENTE) - /ambiente/recoleccion-residuos-diferenciada [Exception {idx+1}]"
-            ) as response:
-                response.failure(f"Excepción: {str(e)}")
+            report_failure(environment, client, "GET", f"(AMBIENTE) - /ambiente/recoleccion-residuos-diferenciada [Exception {idx+1}]", e)
@@ -1,5 +1,10 @@
 import copy
 import random
+import logging
+
+from locust.exception import CatchResponseError
+from tasks.schemas import validar
+from utils.http import report_failure
 
 
 def get_organigrama_por_niveles(client, logger, environment, data_module):
@@ -9,13 +14,8 @@ def get_organigrama_por_niveles(client, logger, environment, data_module):
     if not hasattr(data_module, 'p_nivel') or not data_module.p_nivel:
         logger.error("La lista de niveles está vacía. No se puede continuar con la prueba de organigrama.")
         
-        # Registrar un error explícito usando catch_response
-        with client.get(
-            "/organigrama/dependencias/niveles", 
-            catch_response=True,
-            name="(CERROJO INSTITUCIONAL) - /organigrama/dependencias/niveles [Lista vacía]"
-        ) as response:
-            response.failure("Lista de niveles vacía")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /organigrama/dependencias/niveles [Lista vacía]", CatchResponseError("Lista de niveles vacía"))
         return
     
     # Seleccionar un nivel aleatorio de la lista
@@ -38,7 +38,8 @@ def get_organigrama_por_niveles(client, logger, environment, data_module):
                     # Validar estructura de datos esperada
                     if isinstance(response_data, list):
                         # Verificar que la lista no esté vacía y que contenga los campos esperados
-                        if response_data and all("id_unidad" in item and "unidad" in item and "nivel" in item for item in response_data):
+                        errores = validar("/organigrama/dependencias/niveles/{p_nivel}", response_data)
+                        if response_data and not errores:
                             response.success()
                             logger.info(f"Obtención de organigrama por nivel exitosa para nivel: {p_nivel}")
                             logger.debug(f"Cantidad de elementos recibidos: {len(response_data)}")
@@ -57,12 +58,7 @@ def get_organigrama_por_niveles(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante obtención de organigrama: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name=f"(CERROJO INSTITUCIONAL) - /organigrama/dependencias/niveles/{p_nivel}",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", f"(CERROJO INSTITUCIONAL) - /organigrama/dependencias/niveles/{p_nivel}", e)
 
 def get_organigrama_por_nivel(client, logger, environment, data_module):
     """Prueba el endpoint de obtener dependencias por nivel del organigrama"""
@@ -71,13 +67,8 @@ def get_organigrama_por_nivel(client, logger, environment, data_module):
     if not hasattr(data_module, 'p_nivel') or not data_module.p_nivel:
         logger.error("La lista de niveles está vacía. No se puede continuar con la prueba de dependencias por nivel.")
         
-        # Registrar un error explícito usando catch_response
-        with client.get(
-            "/organigrama/dependencias/nivel", 
-            catch_response=True,
-            name="(CERROJO INSTITUCIONAL) - /organigrama/dependencias/nivel [Lista vacía]"
-        ) as response:
-            response.failure("Lista de niveles vacía")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /organigrama/dependencias/nivel [Lista vacía]", CatchResponseError("Lista de niveles vacía"))
         return
     
     # Seleccionar un nivel aleatorio de la lista
@@ -100,12 +91,9 @@ def get_organigrama_por_nivel(client, logger, environment, data_module):
                     # Validar estructura de datos esperada
                     if isinstance(response_data, list):
                         # Verificar que la lista no esté vacía y que contenga los campos esperados
-                        campos_esperados = ["id_unidad", "unidad", "id_cerrojo", "tipo", "ubicacion", 
-                                           "externa", "mesa", "id_unidad_superior", "unidad_superior", 
-                                           "id_cerrojo_superior", "tipo_superior", "ubicacion_superior", 
-                                           "externa_superior", "mesa_superior", "cod_mesa_entrada", "nivel"]
+                        errores = validar("/organigrama/dependencias/nivel/{p_nivel}", response_data)
                         
-                        if response_data and all(all(campo in item for campo in campos_esperados) for item in response_data):
+                        if response_data and not errores:
                             response.success()
                             logger.info(f"Obtención de dependencias por nivel exitosa para nivel: {p_nivel}")
                             logger.debug(f"Cantidad de elementos recibidos: {len(response_data)}")
@@ -124,12 +112,7 @@ def get_organigrama_por_nivel(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante obtención de dependencias: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name=f"(CERROJO INSTITUCIONAL) - /organigrama/dependencias/nivel/{p_nivel}",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", f"(CERROJO INSTITUCIONAL) - /organigrama/dependencias/nivel/{p_nivel}", e)
 
 def get_organigrama_por_dependencia(client, logger, environment, data_module):
     """Prueba el endpoint de obtener organigrama por ID de dependencia"""
@@ -138,17 +121,12 @@ def get_organigrama_por_dependencia(client, logger, environment, data_module):
     if not hasattr(data_module, 'p_id_dependencia') or not data_module.p_id_dependencia:
         logger.error("La lista de IDs de dependencias está vacía. No se puede continuar con la prueba de organigrama por dependencia.")
         
-        # Registrar un error explícito usando catch_response
-        with client.get(
-            "/organigrama/1", 
-            catch_response=True,
-            name="(CERROJO INSTITUCIONAL) - /organigrama/{id_dependencia} [Lista vacía]"
-        ) as response:
-            response.failure("Lista de IDs de dependencias vacía")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /organigrama/{id_dependencia} [Lista vacía]", CatchResponseError("Lista de IDs de dependencias vacía"))
         return
     
     # Seleccionar un ID de dependencia aleatorio de la lista
-    p_id_dependencia = random.choice(data_module.p_id_dependencia)
+    p_id_dependencia = data_module.p_id_dependencia.draw()
     
     logger.info(f"Ejecutando get_organigrama_por_dependencia con ID: {p_id_dependencia}")
     
@@ -167,12 +145,9 @@ def get_organigrama_por_dependencia(client, logger, environment, data_module):
                     # Validar estructura de datos esperada
                     if isinstance(response_data, list):
                         # Verificar que la lista no esté vacía y que contenga los campos esperados
-                        campos_esperados = ["id_unidad", "unidad", "id_cerrojo", "tipo", "ubicacion", 
-                                           "externa", "mesa", "id_unidad_superior", "unidad_superior", 
-                                           "id_cerrojo_superior", "tipo_superior", "ubicacion_superior", 
-                                           "externa_superior", "mesa_superior", "cod_mesa_entrada"]
+                        errores = validar("/organigrama/{p_id_dependencia}", response_data)
                         
-                        if response_data and all(all(campo in item for campo in campos_esperados) for item in response_data):
+                        if response_data and not errores:
                             response.success()
                             logger.info(f"Obtención de organigrama por dependencia exitosa para ID: {p_id_dependencia}")
                             logger.debug(f"Cantidad de elementos recibidos: {len(response_data)}")
@@ -191,12 +166,7 @@ def get_organigrama_por_dependencia(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante obtención de organigrama por dependencia: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name=f"(CERROJO INSTITUCIONAL) - /organigrama/{p_id_dependencia}",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", f"(CERROJO INSTITUCIONAL) - /organigrama/{p_id_dependencia}", e)
 
 # También probar el caso sin parámetro (organigrama completo)
 def get_organigrama_completo(client, logger, environment, data_module):
@@ -219,12 +189,9 @@ def get_organigrama_completo(client, logger, environment, data_module):
                     # Validar estructura de datos esperada
                     if isinstance(response_data, list):
                         # Verificar que la lista no esté vacía y que contenga los campos esperados
-                        campos_esperados = ["id_unidad", "unidad", "id_cerrojo", "tipo", "ubicacion", 
-                                           "externa", "mesa", "id_unidad_superior", "unidad_superior", 
-                                           "id_cerrojo_superior", "tipo_superior", "ubicacion_superior", 
-                                           "externa_superior", "mesa_superior", "cod_mesa_entrada"]
+                        errores = validar("/organigrama/", response_data)
                         
-                        if response_data and all(all(campo in item for campo in campos_esperados) for item in response_data[:5]):  # Verificar solo los primeros 5 elementos
+                        if response_data and not errores:
                             response.success()
                             logger.info("Obtención de organigrama completo exitosa")
                             logger.debug(f"Cantidad de elementos recibidos: {len(response_data)}")
@@ -243,12 +210,7 @@ def get_organigrama_completo(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante obtención de organigrama completo: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name="(CERROJO INSTITUCIONAL) - /organigrama -Consulta del organigrama de la municipalidad de Córdoba.-",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /organigrama -Consulta del organigrama de la municipalidad de Córdoba.-", e)
 
 def get_dependencia_mas_alta(client, logger, environment, data_module):
     """Prueba el endpoint de obtener la dependencia de mayor nivel para una dependencia determinada"""
@@ -268,7 +230,7 @@ def get_dependencia_mas_alta(client, logger, environment, data_module):
                         # Extraer hasta 5 IDs válidos
                         valid_ids = [item["id_unidad"] for item in org_data[:5] if "id_unidad" in item]
                         if valid_ids:
-                            data_module.p_id_dependencia = valid_ids
+                            data_module.p_id_dependencia.extend(valid_ids)
                             logger.info(f"Se obtuvieron IDs válidos: {valid_ids}")
                         else:
                             logger.error("No se pudieron extraer IDs válidos del organigrama")
@@ -281,17 +243,12 @@ def get_dependencia_mas_alta(client, logger, environment, data_module):
     if not hasattr(data_module, 'p_id_dependencia') or not data_module.p_id_dependencia:
         logger.error("La lista de IDs de dependencias está vacía. No se puede continuar con la prueba de dependencia más alta.")
         
-        # Registrar un error explícito usando catch_response
-        with client.get(
-            "/organigrama/dependencias/1", 
-            catch_response=True,
-            name="(CERROJO INSTITUCIONAL) - /organigrama/dependencias/{id_dependencia} [Lista vacía]"
-        ) as response:
-            response.failure("Lista de IDs de dependencias vacía")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /organigrama/dependencias/{id_dependencia} [Lista vacía]", CatchResponseError("Lista de IDs de dependencias vacía"))
         return
     
     # Seleccionar un ID de dependencia aleatorio de la lista
-    p_id_dependencia = random.choice(data_module.p_id_dependencia)
+    p_id_dependencia = data_module.p_id_dependencia.draw()
     
     logger.info(f"Ejecutando get_dependencia_mas_alta con ID: {p_id_dependencia}")
     
@@ -310,12 +267,9 @@ def get_dependencia_mas_alta(client, logger, environment, data_module):
                     # Validar estructura de datos esperada
                     if isinstance(response_data, dict):
                         # Verificar que el diccionario no esté vacío y que contenga los campos esperados
-                        campos_esperados = ["id_unidad", "unidad", "id_cerrojo", "tipo", "ubicacion", 
-                                           "externa", "mesa", "id_unidad_superior", "unidad_superior", 
-                                           "id_cerrojo_superior", "tipo_superior", "ubicacion_superior", 
-                                           "externa_superior", "mesa_superior", "cod_mesa_entrada"]
+                        errores = validar("/organigrama/dependencias/{p_id_dependencia}", response_data)
                         
-                        if response_data and all(campo in response_data for campo in campos_esperados):
+                        if response_data and not errores:
                             response.success()
                             logger.info(f"Obtención de dependencia más alta exitosa para ID: {p_id_dependencia}")
                         else:
@@ -349,12 +303,7 @@ def get_dependencia_mas_alta(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante obtención de dependencia más alta: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name=f"(CERROJO INSTITUCIONAL) - /organigrama/dependencias/{p_id_dependencia}",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", f"(CERROJO INSTITUCIONAL) - /organigrama/dependencias/{p_id_dependencia}", e)
 
 def get_dependencias_ruta(client, logger, environment, data_module):
     """Prueba el endpoint de obtener la ruta de dependencias hasta la dependencia superior"""
@@ -363,17 +312,12 @@ def get_dependencias_ruta(client, logger, environment, data_module):
     if not hasattr(data_module, 'p_id_dependencia') or not data_module.p_id_dependencia:
         logger.error("La lista de IDs de dependencias está vacía. No se puede continuar con la prueba de ruta de dependencias.")
         
-        # Registrar un error explícito usando catch_response
-        with client.get(
-            "/organigrama/dependencias-ruta", 
-            catch_response=True,
-            name="(CERROJO INSTITUCIONAL) - /organigrama/dependencias-ruta/{id_dependencia} [Lista vacía]"
-        ) as response:
-            response.failure("Lista de IDs de dependencias vacía")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /organigrama/dependencias-ruta/{id_dependencia} [Lista vacía]", CatchResponseError("Lista de IDs de dependencias vacía"))
         return
     
     # Seleccionar un ID de dependencia aleatorio de la lista
-    p_id_dependencia = random.choice(data_module.p_id_dependencia)
+    p_id_dependencia = data_module.p_id_dependencia.draw()
     
     logger.info(f"Ejecutando get_dependencias_ruta con ID: {p_id_dependencia}")
     
@@ -392,12 +336,9 @@ def get_dependencias_ruta(client, logger, environment, data_module):
                     # Validar estructura de datos esperada
                     if isinstance(response_data, list):
                         # Verificar que la lista contenga los campos esperados
-                        campos_esperados = ["id_unidad", "unidad", "id_cerrojo", "tipo", "ubicacion", 
-                                           "externa", "mesa", "id_unidad_superior", "unidad_superior", 
-                                           "id_cerrojo_superior", "tipo_superior", "ubicacion_superior", 
-                                           "externa_superior", "mesa_superior", "cod_mesa_entrada"]
+                        errores = validar("/organigrama/dependencias-ruta/{p_id_dependencia}", response_data)
                         
-                        if response_data and all(all(campo in item for campo in campos_esperados) for item in response_data):
+                        if response_data and not errores:
                             response.success()
                             logger.info(f"Obtención de ruta de dependencias exitosa para ID: {p_id_dependencia}")
                             logger.debug(f"Cantidad de elementos en la ruta: {len(response_data)}")
@@ -440,12 +381,7 @@ def get_dependencias_ruta(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante obtención de ruta de dependencias: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name=f"(CERROJO INSTITUCIONAL) - /organigrama/dependencias-ruta/{p_id_dependencia}",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", f"(CERROJO INSTITUCIONAL) - /organigrama/dependencias-ruta/{p_id_dependencia}", e)
 
 def get_dependencias_por_parametros(client, logger, environment, data_module):
     """Prueba el endpoint de obtener dependencias por nombre, id_dependencia o id_cerrojo"""
@@ -454,17 +390,12 @@ def get_dependencias_por_parametros(client, logger, environment, data_module):
     if not hasattr(data_module, 'p_id_dependencia') or not data_module.p_id_dependencia:
         logger.error("No hay IDs de dependencias disponibles para la prueba.")
         
-        # Registrar un error explícito usando catch_response
-        with client.get(
-            "/dependencias", 
-            catch_response=True,
-            name="(CERROJO INSTITUCIONAL) - /dependencias [Sin datos]"
-        ) as response:
-            response.failure("No hay datos para probar el endpoint")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /dependencias [Sin datos]", CatchResponseError("No hay datos para probar el endpoint"))
         return
     
     # Seleccionar un ID de dependencia aleatorio
-    p_id_dependencia = random.choice(data_module.p_id_dependencia)
+    p_id_dependencia = data_module.p_id_dependencia.draw()
     
     # Probar búsqueda por ID de dependencia
     logger.info(f"Ejecutando get_dependencias_por_parametros con ID: {p_id_dependencia}")
@@ -484,12 +415,9 @@ def get_dependencias_por_parametros(client, logger, environment, data_module):
                     # Validar estructura de datos esperada
                     if isinstance(response_data, list):
                         # Verificar que la lista contenga los campos esperados
-                        campos_esperados = ["id_unidad", "unidad", "id_cerrojo", "tipo", "ubicacion", 
-                                           "externa", "mesa", "id_unidad_superior", "unidad_superior", 
-                                           "id_cerrojo_superior", "tipo_superior", "ubicacion_superior", 
-                                           "externa_superior", "mesa_superior", "cod_mesa_entrada"]
+                        errores = validar("/dependencias", response_data)
                         
-                        if response_data and all(all(campo in item for campo in campos_esperados) for item in response_data):
+                        if response_data and not errores:
                             response.success()
                             logger.info(f"Obtención de dependencias por ID exitosa: {p_id_dependencia}")
                             logger.debug(f"Cantidad de elementos recibidos: {len(response_data)}")
@@ -499,6 +427,11 @@ def get_dependencias_por_parametros(client, logger, environment, data_module):
                                 nombre_dependencia = response_data[0]["unidad"]
                                 data_module.nombre_dependencia = nombre_dependencia
                                 data_module.id_cerrojo = response_data[0]["id_cerrojo"]
+
+                            # Cosechar los IDs de la dependencia y de su superior para las próximas consultas
+                            for item in response_data:
+                                data_module.p_id_dependencia.offer(item["id_unidad"])
+                                data_module.p_id_dependencia.offer(item["id_unidad_superior"])
                         else:
                             # Si es una lista vacía, también es válido
                             if not response_data:
@@ -519,12 +452,7 @@ def get_dependencias_por_parametros(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante obtención de dependencias por ID: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name="(CERROJO INSTITUCIONAL) - /dependencias?p_id_dependencia",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /dependencias?p_id_dependencia", e)
     
     # Probar búsqueda por nombre si está disponible
     if hasattr(data_module, 'nombre_dependencia') and data_module.nombre_dependencia:
@@ -544,12 +472,9 @@ def get_dependencias_por_parametros(client, logger, environment, data_module):
                         # Validar estructura de datos esperada
                         if isinstance(response_data, list):
                             # Verificar que la lista contenga los campos esperados
-                            campos_esperados = ["id_unidad", "unidad", "id_cerrojo", "tipo", "ubicacion", 
-                                               "externa", "mesa", "id_unidad_superior", "unidad_superior", 
-                                               "id_cerrojo_superior", "tipo_superior", "ubicacion_superior", 
-                                               "externa_superior", "mesa_superior", "cod_mesa_entrada"]
+                            errores = validar("/dependencias", response_data)
                             
-                            if response_data and all(all(campo in item for campo in campos_esperados) for item in response_data):
+                            if response_data and not errores:
                                 response.success()
                                 logger.info(f"Obtención de dependencias por nombre exitosa: {nombre_dependencia}")
                                 logger.debug(f"Cantidad de elementos recibidos: {len(response_data)}")
@@ -573,12 +498,7 @@ def get_dependencias_por_parametros(client, logger, environment, data_module):
         except Exception as e:
             logger.error(f"Excepción durante obtención de dependencias por nombre: {str(e)}")
             # Registrar el error como una respuesta fallida
-            environment.events.request_failure.fire(
-                request_type="GET",
-                name="(CERROJO INSTITUCIONAL) - /dependencias?p_nombre",
-                response_time=0,
-                exception=e
-            )
+            report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /dependencias?p_nombre", e)
     
     # Probar búsqueda por ID de cerrojo si está disponible
     if hasattr(data_module, 'id_cerrojo') and data_module.id_cerrojo:
@@ -598,12 +518,9 @@ def get_dependencias_por_parametros(client, logger, environment, data_module):
                         # Validar estructura de datos esperada
                         if isinstance(response_data, list):
                             # Verificar que la lista contenga los campos esperados
-                            campos_esperados = ["id_unidad", "unidad", "id_cerrojo", "tipo", "ubicacion", 
-                                               "externa", "mesa", "id_unidad_superior", "unidad_superior", 
-                                               "id_cerrojo_superior", "tipo_superior", "ubicacion_superior", 
-                                               "externa_superior", "mesa_superior", "cod_mesa_entrada"]
+                            errores = validar("/dependencias", response_data)
                             
-                            if response_data and all(all(campo in item for campo in campos_esperados) for item in response_data):
+                            if response_data and not errores:
                                 response.success()
                                 logger.info(f"Obtención de dependencias por ID de cerrojo exitosa: {id_cerrojo}")
                                 logger.debug(f"Cantidad de elementos recibidos: {len(response_data)}")
@@ -627,12 +544,7 @@ def get_dependencias_por_parametros(client, logger, environment, data_module):
         except Exception as e:
             logger.error(f"Excepción durante obtención de dependencias por ID de cerrojo: {str(e)}")
             # Registrar el error como una respuesta fallida
-            environment.events.request_failure.fire(
-                request_type="GET",
-                name="(CERROJO INSTITUCIONAL) - /dependencias?p_id_cerrojo",
-                response_time=0,
-                exception=e
-            )
+            report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /dependencias?p_id_cerrojo", e)
 
 def post_dependencias_por_ids(client, logger, environment, data_module):
     """Prueba el endpoint de obtener dependencias por una lista de IDs"""
@@ -646,14 +558,8 @@ def post_dependencias_por_ids(client, logger, environment, data_module):
             logger.info("Usando p_id_dependencia como alternativa")
             ids_dependencias = data_module.p_id_dependencia[:3]  # Tomar hasta 3 IDs
         else:
-            # Registrar un error explícito usando catch_response
-            with client.post(
-                "/dependencias/ids", 
-                json={"ids_dependencias": [1]},
-                catch_response=True,
-                name="(CERROJO INSTITUCIONAL) - /dependencias/ids [Sin datos]"
-            ) as response:
-                response.failure("No hay datos para probar el endpoint")
+            # Registrar la falla sin enviar un request a la API
+            report_failure(environment, client, "POST", "(CERROJO INSTITUCIONAL) - /dependencias/ids [Sin datos]", CatchResponseError("No hay datos para probar el endpoint"))
             return
     else:
         # Usar los IDs específicos de body_ids_dependencias
@@ -678,9 +584,9 @@ def post_dependencias_por_ids(client, logger, environment, data_module):
                     if isinstance(response_data, list):
                         # Verificar que la lista contenga los campos esperados
                         # Modificamos los campos esperados para que coincidan con la respuesta real
-                        campos_esperados = ["id_unidad", "unidad"]
+                        errores = validar("/dependencias/ids", response_data)
                         
-                        if all(all(campo in item for campo in campos_esperados) for item in response_data):
+                        if not errores:
                             response.success()
                             logger.info(f"Obtención de dependencias por IDs exitosa: {ids_dependencias}")
                             logger.debug(f"Cantidad de elementos recibidos: {len(response_data)}")
@@ -704,12 +610,7 @@ def post_dependencias_por_ids(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante obtención de dependencias por IDs: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="POST",
-            name="(CERROJO INSTITUCIONAL) - /dependencias/ids",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "POST", "(CERROJO INSTITUCIONAL) - /dependencias/ids", e)
 
 def get_dependencias_directas(client, logger, environment, data_module):
     """Prueba el endpoint de obtener dependencias directas a la dependencia enviada por parámetro"""
@@ -718,17 +619,12 @@ def get_dependencias_directas(client, logger, environment, data_module):
     if not hasattr(data_module, 'p_id_dependencia') or not data_module.p_id_dependencia:
         logger.error("La lista de IDs de dependencias está vacía. No se puede continuar con la prueba de dependencias directas.")
         
-        # Registrar un error explícito usando catch_response
-        with client.get(
-            "/organigrama/dependencias-directas", 
-            catch_response=True,
-            name="(CERROJO INSTITUCIONAL) - /organigrama/dependencias-directas/{id_dependencia} [Lista vacía]"
-        ) as response:
-            response.failure("Lista de IDs de dependencias vacía")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /organigrama/dependencias-directas/{id_dependencia} [Lista vacía]", CatchResponseError("Lista de IDs de dependencias vacía"))
         return
     
     # Seleccionar un ID de dependencia aleatorio de la lista
-    p_id_dependencia = random.choice(data_module.p_id_dependencia)
+    p_id_dependencia = data_module.p_id_dependencia.draw()
     
     logger.info(f"Ejecutando get_dependencias_directas con ID: {p_id_dependencia}")
     
@@ -745,24 +641,25 @@ def get_dependencias_directas(client, logger, environment, data_module):
                     
                     # Guardar los datos completos obtenidos en el log
                     logger.info("=== DATOS COMPLETOS DE LA RESPUESTA (DEPENDENCIAS DIRECTAS) ===")
-                    logger.info(f"Respuesta completa: {response_data}")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"Respuesta completa: {response_data}")
                     
                     # Validar estructura de datos esperada
                     if isinstance(response_data, list):
                         # Verificar que la lista contenga los campos esperados
-                        campos_esperados = ["id_unidad", "unidad", "id_cerrojo", "tipo", "ubicacion", 
-                                           "externa", "mesa", "cod_mesa_entrada"]
+                        errores = validar("/organigrama/dependencias-directas/{p_id_dependencia}", response_data)
                         
-                        if response_data and all(all(campo in item for campo in campos_esperados) for item in response_data):
+                        if response_data and not errores:
                             response.success()
                             logger.info(f"Obtención de dependencias directas exitosa para ID: {p_id_dependencia}")
                             logger.info(f"Cantidad de dependencias directas: {len(response_data)}")
                             
                             # Registrar información detallada de cada dependencia
-                            for i, dependencia in enumerate(response_data):
-                                logger.info(f"Dependencia directa {i+1}:")
-                                for key, value in dependencia.items():
-                                    logger.info(f"  {key}: {value}")
+                            if logger.isEnabledFor(logging.INFO):
+                                for i, dependencia in enumerate(response_data):
+                                    logger.info(f"Dependencia directa {i+1}:")
+                                    for key, value in dependencia.items():
+                                        logger.info(f"  {key}: {value}")
                         else:
                             # Si es una lista vacía, también es válido (no tiene dependencias directas)
                             if not response_data:
@@ -775,7 +672,7 @@ def get_dependencias_directas(client, logger, environment, data_module):
                                     campos_encontrados.update(item.keys())
                                 
                                 logger.warning(f"Campos encontrados: {sorted(list(campos_encontrados))}")
-                                logger.warning(f"Campos esperados: {campos_esperados}")
+                                logger.warning(f"Errores de validación: {errores}")
                                 
                                 # Verificar si al menos tiene los campos mínimos
                                 campos_minimos = ["id_unidad", "unidad"]
@@ -797,12 +694,7 @@ def get_dependencias_directas(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante obtención de dependencias directas: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name=f"(CERROJO INSTITUCIONAL) - /organigrama/dependencias-directas/{p_id_dependencia}",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", f"(CERROJO INSTITUCIONAL) - /organigrama/dependencias-directas/{p_id_dependencia}", e)
 
 def get_all_cpc(client, logger, environment, data_module):
     """Prueba el endpoint de obtener todos los centros de participación comunal (CPC)"""
@@ -822,7 +714,8 @@ def get_all_cpc(client, logger, environment, data_module):
                     
                     # Guardar los datos completos obtenidos en el log
                     logger.info("=== DATOS COMPLETOS DE LA RESPUESTA (CPC) ===")
-                    logger.info(f"Respuesta completa: {response_data}")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"Respuesta completa: {response_data}")
                     
                     # Validar estructura de datos esperada
                     if isinstance(response_data, list):
@@ -833,10 +726,11 @@ def get_all_cpc(client, logger, environment, data_module):
                             logger.info(f"Cantidad de CPCs: {len(response_data)}")
                             
                             # Registrar información detallada de cada CPC
-                            for i, cpc in enumerate(response_data):
-                                logger.info(f"CPC {i+1}:")
-                                for key, value in cpc.items():
-                                    logger.info(f"  {key}: {value}")
+                            if logger.isEnabledFor(logging.INFO):
+                                for i, cpc in enumerate(response_data):
+                                    logger.info(f"CPC {i+1}:")
+                                    for key, value in cpc.items():
+                                        logger.info(f"  {key}: {value}")
                                     
                             # Registrar los campos encontrados
                             if response_data:
@@ -860,12 +754,7 @@ def get_all_cpc(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante obtención de CPCs: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name="(CERROJO INSTITUCIONAL) - /poblacion-y-sociedad/cpc",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /poblacion-y-sociedad/cpc", e)
 
 def get_barrios_cpc(client, logger, environment, data_module):
     """Prueba el endpoint de obtener los barrios de los centros de participación comunal (CPC)"""
@@ -885,7 +774,8 @@ def get_barrios_cpc(client, logger, environment, data_module):
                     
                     # Guardar los datos completos obtenidos en el log
                     logger.info("=== DATOS COMPLETOS DE LA RESPUESTA (BARRIOS CPC) ===")
-                    logger.info(f"Respuesta completa: {response_data}")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"Respuesta completa: {response_data}")
                     
                     # Validar estructura de datos esperada
                     if isinstance(response_data, list):
@@ -896,10 +786,11 @@ def get_barrios_cpc(client, logger, environment, data_module):
                             logger.info(f"Cantidad de barrios: {len(response_data)}")
                             
                             # Registrar información detallada de los primeros 5 barrios (para no saturar el log)
-                            for i, barrio in enumerate(response_data[:5]):
-                                logger.info(f"Barrio {i+1}:")
-                                for key, value in barrio.items():
-                                    logger.info(f"  {key}: {value}")
+                            if logger.isEnabledFor(logging.INFO):
+                                for i, barrio in enumerate(response_data[:5]):
+                                    logger.info(f"Barrio {i+1}:")
+                                    for key, value in barrio.items():
+                                        logger.info(f"  {key}: {value}")
                             
                             # Si hay más de 5 barrios, indicar cuántos más hay
                             if len(response_data) > 5:
@@ -927,12 +818,7 @@ def get_barrios_cpc(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante obtención de barrios CPC: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name="(CERROJO INSTITUCIONAL) - /poblacion-y-sociedad/cpc/barrios",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /poblacion-y-sociedad/cpc/barrios", e)
 
 def get_centros_vecinales(client, logger, environment, data_module):
     """Prueba el endpoint de obtener todos los centros vecinales de Córdoba"""
@@ -952,7 +838,8 @@ def get_centros_vecinales(client, logger, environment, data_module):
                     
                     # Guardar los datos completos obtenidos en el log
                     logger.info("=== DATOS COMPLETOS DE LA RESPUESTA (CENTROS VECINALES) ===")
-                    logger.info(f"Respuesta completa: {response_data}")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"Respuesta completa: {response_data}")
                     
                     # Validar estructura de datos esperada
                     if isinstance(response_data, list):
@@ -963,10 +850,11 @@ def get_centros_vecinales(client, logger, environment, data_module):
                             logger.info(f"Cantidad de centros vecinales: {len(response_data)}")
                             
                             # Registrar información detallada de los primeros 5 centros vecinales (para no saturar el log)
-                            for i, centro in enumerate(response_data[:5]):
-                                logger.info(f"Centro vecinal {i+1}:")
-                                for key, value in centro.items():
-                                    logger.info(f"  {key}: {value}")
+                            if logger.isEnabledFor(logging.INFO):
+                                for i, centro in enumerate(response_data[:5]):
+                                    logger.info(f"Centro vecinal {i+1}:")
+                                    for key, value in centro.items():
+                                        logger.info(f"  {key}: {value}")
                             
                             # Si hay más de 5 centros vecinales, indicar cuántos más hay
                             if len(response_data) > 5:
@@ -994,12 +882,7 @@ def get_centros_vecinales(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante obtención de centros vecinales: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name="(CERROJO INSTITUCIONAL) - /poblacion-y-sociedad/centros-vecinales",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /poblacion-y-sociedad/centros-vecinales", e)
 
 def get_unidades_judiciales(client, logger, environment, data_module):
     """Prueba el endpoint de obtener unidades judiciales de la municipalidad de Córdoba"""
@@ -1036,24 +919,25 @@ def get_unidades_judiciales(client, logger, environment, data_module):
                             logger.info(f"Cantidad de unidades judiciales: {len(response_data)}")
                             
                             # Mostrar información de algunas unidades judiciales (hasta 5)
-                            for idx, unidad in enumerate(response_data[:5]):
-                                # Mostrar información usando los campos reales de la respuesta
-                                if "nombre" in unidad:
-                                    logger.info(f"Unidad Judicial {idx+1}: {unidad.get('nombre')}")
-                                elif "descripcion" in unidad:
-                                    logger.info(f"Unidad Judicial {idx+1}: {unidad.get('descripcion')}")
-                                else:
-                                    # Mostrar el primer campo que contenga información útil
-                                    for key, value in unidad.items():
-                                        if isinstance(value, str) and len(value) > 0:
-                                            logger.info(f"Unidad Judicial {idx+1}: {key}={value}")
-                                            break
+                            if logger.isEnabledFor(logging.INFO):
+                                for idx, unidad in enumerate(response_data[:5]):
+                                    # Mostrar información usando los campos reales de la respuesta
+                                    if "nombre" in unidad:
+                                        logger.info(f"Unidad Judicial {idx+1}: {unidad.get('nombre')}")
+                                    elif "descripcion" in unidad:
+                                        logger.info(f"Unidad Judicial {idx+1}: {unidad.get('descripcion')}")
+                                    else:
+                                        # Mostrar el primer campo que contenga información útil
+                                        for key, value in unidad.items():
+                                            if isinstance(value, str) and len(value) > 0:
+                                                logger.info(f"Unidad Judicial {idx+1}: {key}={value}")
+                                                break
                                 
-                                # Mostrar información adicional disponible
-                                campos_importantes = ["direccion", "telefono", "tipo", "barrio", "cpc", "latitud", "longitud"]
-                                for campo in campos_importantes:
-                                    if campo in unidad and unidad.get(campo) is not None and unidad.get(campo) != "":
-                                        logger.info(f"  {campo.capitalize()}: {unidad.get(campo)}")
+                                    # Mostrar información adicional disponible
+                                    campos_importantes = ["direccion", "telefono", "tipo", "barrio", "cpc", "latitud", "longitud"]
+                                    for campo in campos_importantes:
+                                        if campo in unidad and unidad.get(campo) is not None and unidad.get(campo) != "":
+                                            logger.info(f"  {campo.capitalize()}: {unidad.get(campo)}")
                             
                             # Si hay más de 5 unidades, indicar cuántas más hay
                             if len(response_data) > 5:
@@ -1133,12 +1017,7 @@ def get_unidades_judiciales(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante obtención de unidades judiciales: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name="(CERROJO INSTITUCIONAL) - /poblacion-y-sociedad/unidades-judiciales",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /poblacion-y-sociedad/unidades-judiciales", e)
 
 
 
@@ -1227,24 +1106,25 @@ def get_organizaciones_sociales(client, logger, environment, data_module):
                                 logger.info(f"Cantidad de organizaciones sociales: {len(response_data)}")
                                 
                                 # Mostrar información de algunas organizaciones (hasta 5)
-                                for idx, org in enumerate(response_data[:5]):
-                                    # Mostrar información usando los campos reales de la respuesta
-                                    if "nombre" in org:
-                                        logger.info(f"Organización {idx+1}: {org.get('nombre')}")
-                                    elif "descripcion" in org:
-                                        logger.info(f"Organización {idx+1}: {org.get('descripcion')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in org.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Organización {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, org in enumerate(response_data[:5]):
+                                        # Mostrar información usando los campos reales de la respuesta
+                                        if "nombre" in org:
+                                            logger.info(f"Organización {idx+1}: {org.get('nombre')}")
+                                        elif "descripcion" in org:
+                                            logger.info(f"Organización {idx+1}: {org.get('descripcion')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in org.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Organización {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional disponible
-                                    campos_importantes = ["direccion", "telefono", "email", "tipo_org_social", "barrio", "cpc"]
-                                    for campo in campos_importantes:
-                                        if campo in org and org.get(campo):
-                                            logger.info(f"  {campo.capitalize()}: {org.get(campo)}")
+                                        # Mostrar información adicional disponible
+                                        campos_importantes = ["direccion", "telefono", "email", "tipo_org_social", "barrio", "cpc"]
+                                        for campo in campos_importantes:
+                                            if campo in org and org.get(campo):
+                                                logger.info(f"  {campo.capitalize()}: {org.get(campo)}")
                                 
                                 # Si hay más de 5 organizaciones, indicar cuántas más hay
                                 if len(response_data) > 5:
@@ -1303,12 +1183,7 @@ def get_organizaciones_sociales(client, logger, environment, data_module):
             logger.error(f"Excepción durante obtención de organizaciones sociales para {nombre_escenario}: {str(e)}")
             resultados["errores"] += 1
             # Registrar el error como una respuesta fallida
-            environment.events.request_failure.fire(
-                request_type="GET",
-                name=f"(CERROJO INSTITUCIONAL) - /poblacion-y-sociedad/organizaciones-sociales [{nombre_escenario}]",
-                response_time=0,
-                exception=e
-            )
+            report_failure(environment, client, "GET", f"(CERROJO INSTITUCIONAL) - /poblacion-y-sociedad/organizaciones-sociales [{nombre_escenario}]", e)
     
     # Mostrar resumen de resultados
     logger.info(f"=== RESUMEN DE ORGANIZACIONES SOCIALES ===")
@@ -1396,12 +1271,7 @@ def get_tipos_organizaciones_sociales(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante obtención de tipos de organizaciones sociales: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name="(CERROJO INSTITUCIONAL) - /poblacion-y-sociedad/tipos-organizaciones-sociales",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /poblacion-y-sociedad/tipos-organizaciones-sociales", e)
 
 def get_limites_administrativos(client, logger, environment, data_module):
     """Prueba el endpoint de obtener límites administrativos de Córdoba"""
@@ -1438,23 +1308,24 @@ def get_limites_administrativos(client, logger, environment, data_module):
                             logger.info(f"Cantidad de límites administrativos: {len(response_data)}")
                             
                             # Mostrar información de algunos límites administrativos (hasta 5)
-                            for idx, limite in enumerate(response_data[:5]):
-                                # Mostrar información usando los campos reales de la respuesta
-                                if "nombre" in limite:
-                                    logger.info(f"Límite Administrativo {idx+1}: {limite.get('nombre')}")
-                                elif "descripcion" in limite:
-                                    logger.info(f"Límite Administrativo {idx+1}: {limite.get('descripcion')}")
-                                else:
-                                    # Mostrar el primer campo que contenga información útil
-                                    for key, value in limite.items():
-                                        if isinstance(value, str) and len(value) > 0:
-                                            logger.info(f"Límite Administrativo {idx+1}: {key}={value}")
-                                            break
+                            if logger.isEnabledFor(logging.INFO):
+                                for idx, limite in enumerate(response_data[:5]):
+                                    # Mostrar información usando los campos reales de la respuesta
+                                    if "nombre" in limite:
+                                        logger.info(f"Límite Administrativo {idx+1}: {limite.get('nombre')}")
+                                    elif "descripcion" in limite:
+                                        logger.info(f"Límite Administrativo {idx+1}: {limite.get('descripcion')}")
+                                    else:
+                                        # Mostrar el primer campo que contenga información útil
+                                        for key, value in limite.items():
+                                            if isinstance(value, str) and len(value) > 0:
+                                                logger.info(f"Límite Administrativo {idx+1}: {key}={value}")
+                                                break
                                 
-                                # Mostrar información adicional disponible
-                                for key, value in limite.items():
-                                    if key not in ['nombre', 'descripcion'] and value is not None and value != "":
-                                        logger.info(f"  {key.capitalize()}: {value}")
+                                    # Mostrar información adicional disponible
+                                    for key, value in limite.items():
+                                        if key not in ['nombre', 'descripcion'] and value is not None and value != "":
+                                            logger.info(f"  {key.capitalize()}: {value}")
                             
                             # Si hay más de 5 límites, indicar cuántos más hay
                             if len(response_data) > 5:
@@ -1487,12 +1358,7 @@ def get_limites_administrativos(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante obtención de límites administrativos: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name="(CERROJO INSTITUCIONAL) - /limites-administrativos",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /limites-administrativos", e)
 
 
 def get_centros_operativos(client, logger, environment, data_module):
@@ -1582,9 +1448,10 @@ def get_centros_operativos(client, logger, environment, data_module):
                                 primer_centro = response_data[0]
                                 
                                 # Mostrar todos los campos disponibles
-                                for campo, valor in primer_centro.items():
-                                    if valor is not None and valor != "":
-                                        logger.info(f"{campo.capitalize()}: {valor}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for campo, valor in primer_centro.items():
+                                        if valor is not None and valor != "":
+                                            logger.info(f"{campo.capitalize()}: {valor}")
                                 
                                 # Análisis adicional de tipos de datos
                                 logger.info("=== ANÁLISIS DE ESTRUCTURA DE DATOS ===")
@@ -1603,9 +1470,10 @@ def get_centros_operativos(client, logger, environment, data_module):
                                             campos_con_valores[campo] += 1
                                 
                                 logger.info("=== COMPLETITUD DE DATOS ===")
-                                for campo, cantidad in campos_con_valores.items():
-                                    porcentaje = (cantidad / len(response_data)) * 100
-                                    logger.info(f"{campo}: {cantidad}/{len(response_data)} ({porcentaje:.1f}%)")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for campo, cantidad in campos_con_valores.items():
+                                        porcentaje = (cantidad / len(response_data)) * 100
+                                        logger.info(f"{campo}: {cantidad}/{len(response_data)} ({porcentaje:.1f}%)")
                                 
                             else:
                                 # Si no tiene ni siquiera los campos mínimos
@@ -1655,12 +1523,7 @@ def get_centros_operativos(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante obtención de centros operativos: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name="(CERROJO INSTITUCIONAL) - /centros-operativos",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /centros-operativos", e)
 
 
 def get_fechas_no_habiles(client, logger, environment, data_module):
@@ -1761,12 +1624,7 @@ def get_fechas_no_habiles(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante obtención de fechas no hábiles: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name="(CERROJO INSTITUCIONAL) - /fechas-no-habiles",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", "(CERROJO INSTITUCIONAL) - /fechas-no-habiles", e)
 
 def update_dependencias_visibility(client, logger, environment, data_module):
     """Prueba el endpoint de actualizar visibilidad de dependencias"""
@@ -1776,20 +1634,15 @@ def update_dependencias_visibility(client, logger, environment, data_module):
         # Si no hay parámetros específicos, usar datos por defecto
         if hasattr(data_module, 'p_id_dependencia') and data_module.p_id_dependencia:
             query_params = {
-                "p_id_dependencia": random.choice(data_module.p_id_dependencia),
+                "p_id_dependencia": data_module.p_id_dependencia.draw(),
                 "p_visible": random.choice(['S', 'N']),  # Usar 'S' o 'N' en lugar de booleanos
                 "p_usuario_aplicacion": "PRUEBA KUNAN"
             }
         else:
             logger.error("No hay IDs de dependencias disponibles para actualizar visibilidad.")
             
-            # Registrar un error explícito usando catch_response
-            with client.put(
-                "/dependencias/visibilidad?p_id_dependencia=1&p_visible=S&p_usuario_aplicacion=TEST", 
-                catch_response=True,
-                name="(CERROJO INSTITUCIONAL) - /dependencias/visibilidad [Sin datos]"
-            ) as response:
-                response.failure("No hay datos para probar el endpoint")
+            # Registrar la falla sin enviar un request a la API
+            report_failure(environment, client, "PUT", "(CERROJO INSTITUCIONAL) - /dependencias/visibilidad [Sin datos]", CatchResponseError("No hay datos para probar el endpoint"))
             return
     else:
         # Usar los parámetros definidos en el módulo de datos
@@ -1817,7 +1670,8 @@ def update_dependencias_visibility(client, logger, environment, data_module):
             name="(CERROJO INSTITUCIONAL) - /dependencias/visibilidad [PUT]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
                 try:
@@ -1937,10 +1791,5 @@ def update_dependencias_visibility(client, logger, environment, data_module):
         logger.error(f"Excepción durante actualización de visibilidad de dependencia: {str(e)}")
         
         # Registrar el error como una respuesta fallida usando catch_response
-        with client.put(
-            url,
-            catch_response=True,
-            name="(CERROJO INSTITUCIONAL) - /dependencias/visibilidad [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "PUT", "(CERROJO INSTITUCIONAL) - /dependencias/visibilidad [Exception]", e)
 
@@ -1,6 +1,9 @@
 import random
+import logging
 from typing import Dict, Any
 
+from utils.http import report_failure
+
 def get_parques_educativos(client, logger, environment, data_module):
     """Prueba el endpoint de obtener parques educativos de Córdoba"""
     
@@ -19,7 +22,7 @@ def get_parques_educativos(client, logger, environment, data_module):
                     logger.info(f"Respuesta recibida: {len(response_data)} parques educativos encontrados")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -60,18 +63,19 @@ def get_parques_educativos(client, logger, environment, data_module):
                                 logger.info("Consulta de parques educativos exitosa")
                                 
                                 # Mostrar información de algunos parques (hasta 5)
-                                for idx, parque in enumerate(response_data[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "nombre" in parque:
-                                        logger.info(f"Parque {idx+1}: {parque.get('nombre')}")
-                                    elif "denominacion" in parque:
-                                        logger.info(f"Parque {idx+1}: {parque.get('denominacion')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in parque.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Parque {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, parque in enumerate(response_data[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "nombre" in parque:
+                                            logger.info(f"Parque {idx+1}: {parque.get('nombre')}")
+                                        elif "denominacion" in parque:
+                                            logger.info(f"Parque {idx+1}: {parque.get('denominacion')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in parque.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Parque {idx+1}: {key}={value}")
+                                                    break
                                 
                                 # Si hay más de 5 parques, indicar cuántos más hay
                                 if cantidad_parques > 5:
@@ -106,12 +110,7 @@ def get_parques_educativos(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de parques educativos: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/educacion/parques-educativos",
-            catch_response=True,
-            name="(EDUCACIÓN) - /educacion/parques-educativos [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(EDUCACIÓN) - /educacion/parques-educativos [Exception]", e)
 
 import random
 from typing import Dict, Any
@@ -134,7 +133,7 @@ def get_escuelas_municipales(client, logger, environment, data_module):
                     logger.info(f"Respuesta recibida: {len(response_data)} escuelas municipales encontradas")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -169,20 +168,21 @@ def get_escuelas_municipales(client, logger, environment, data_module):
                                 logger.info("Consulta de escuelas municipales exitosa")
                                 
                                 # Mostrar información de algunas escuelas (hasta 5)
-                                for idx, escuela in enumerate(response_data[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "nombre" in escuela:
-                                        logger.info(f"Escuela {idx+1}: {escuela.get('nombre')}")
-                                    elif "denominacion" in escuela:
-                                        logger.info(f"Escuela {idx+1}: {escuela.get('denominacion')}")
-                                    elif "establecimiento" in escuela:
-                                        logger.info(f"Escuela {idx+1}: {escuela.get('establecimiento')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in escuela.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Escuela {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, escuela in enumerate(response_data[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "nombre" in escuela:
+                                            logger.info(f"Escuela {idx+1}: {escuela.get('nombre')}")
+                                        elif "denominacion" in escuela:
+                                            logger.info(f"Escuela {idx+1}: {escuela.get('denominacion')}")
+                                        elif "establecimiento" in escuela:
+                                            logger.info(f"Escuela {idx+1}: {escuela.get('establecimiento')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in escuela.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Escuela {idx+1}: {key}={value}")
+                                                    break
                                 
                                 # Si hay más de 5 escuelas, indicar cuántas más hay
                                 if cantidad_escuelas > 5:
@@ -217,12 +217,7 @@ def get_escuelas_municipales(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de escuelas municipales: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/educacion/escuelas-municipales",
-            catch_response=True,
-            name="(EDUCACIÓN) - /educacion/escuelas-municipales [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(EDUCACIÓN) - /educacion/escuelas-municipales [Exception]", e)
 
 
 def get_jardines_municipales(client, logger, environment, data_module):
@@ -242,7 +237,7 @@ def get_jardines_municipales(client, logger, environment, data_module):
                     logger.info(f"Respuesta recibida: {len(response_data)} jardines municipales encontrados")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:
@@ -268,13 +263,14 @@ def get_jardines_municipales(client, logger, environment, data_module):
                                 response.success()
                                 logger.info("Consulta de jardines municipales exitosa")
                                 
-                                for idx, jardin in enumerate(response_data[:5]):
-                                    if "nombre" in jardin:
-                                        logger.info(f"Jardín {idx+1}: {jardin.get('nombre')}")
-                                    elif "denominacion" in jardin:
-                                        logger.info(f"Jardín {idx+1}: {jardin.get('denominacion')}")
-                                    elif "establecimiento" in jardin:
-                                        logger.info(f"Jardín {idx+1}: {jardin.get('establecimiento')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, jardin in enumerate(response_data[:5]):
+                                        if "nombre" in jardin:
+                                            logger.info(f"Jardín {idx+1}: {jardin.get('nombre')}")
+                                        elif "denominacion" in jardin:
+                                            logger.info(f"Jardín {idx+1}: {jardin.get('denominacion')}")
+                                        elif "establecimiento" in jardin:
+                                            logger.info(f"Jardín {idx+1}: {jardin.get('establecimiento')}")
                                 
                                 if cantidad_jardines > 5:
                                     logger.info(f"... y {cantidad_jardines - 5} jardines más")
@@ -303,9 +299,4 @@ def get_jardines_municipales(client, logger, environment, data_module):
                 logger.error(f"Error en consulta de jardines municipales: {response.status_code} - {response.text}")
     except Exception as e:
         logger.error(f"Excepción durante consulta de jardines municipales: {str(e)}")
-        with client.get(
-            "/educacion/jardines-municipales",
-            catch_response=True,
-            name="(EDUCACIÓN) - /educacion/jardines-municipales [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(EDUCACIÓN) - /educacion/jardines-municipales [Exception]", e)
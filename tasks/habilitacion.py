@@ -1,6 +1,9 @@
 import random
+import logging
 from typing import Dict, Any
 
+from utils.http import report_failure
+
 def get_comercios(client, logger, environment, data_module):
     """Prueba el endpoint de obtener comercios e industrias de Córdoba"""
     
@@ -33,7 +36,7 @@ def get_comercios(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -77,28 +80,29 @@ def get_comercios(client, logger, environment, data_module):
                                 logger.info("Consulta de comercios exitosa")
                                 
                                 # Mostrar información de algunos comercios (hasta 5)
-                                for idx, comercio in enumerate(items[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "nombre" in comercio:
-                                        logger.info(f"Comercio {idx+1}: {comercio.get('nombre')}")
-                                    elif "razon_social" in comercio:
-                                        logger.info(f"Comercio {idx+1}: {comercio.get('razon_social')}")
-                                    elif "establecimiento" in comercio:
-                                        logger.info(f"Comercio {idx+1}: {comercio.get('establecimiento')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in comercio.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Comercio {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, comercio in enumerate(items[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "nombre" in comercio:
+                                            logger.info(f"Comercio {idx+1}: {comercio.get('nombre')}")
+                                        elif "razon_social" in comercio:
+                                            logger.info(f"Comercio {idx+1}: {comercio.get('razon_social')}")
+                                        elif "establecimiento" in comercio:
+                                            logger.info(f"Comercio {idx+1}: {comercio.get('establecimiento')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in comercio.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Comercio {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional si está disponible
-                                    if "cuit" in comercio and comercio.get("cuit"):
-                                        logger.info(f"  CUIT: {comercio.get('cuit')}")
-                                    if "actividad" in comercio and comercio.get("actividad"):
-                                        logger.info(f"  Actividad: {comercio.get('actividad')}")
-                                    if "direccion" in comercio and comercio.get("direccion"):
-                                        logger.info(f"  Dirección: {comercio.get('direccion')}")
+                                        # Mostrar información adicional si está disponible
+                                        if "cuit" in comercio and comercio.get("cuit"):
+                                            logger.info(f"  CUIT: {comercio.get('cuit')}")
+                                        if "actividad" in comercio and comercio.get("actividad"):
+                                            logger.info(f"  Actividad: {comercio.get('actividad')}")
+                                        if "direccion" in comercio and comercio.get("direccion"):
+                                            logger.info(f"  Dirección: {comercio.get('direccion')}")
                                 
                                 # Si hay más de 5 comercios, indicar cuántos más hay
                                 if len(items) > 5:
@@ -138,11 +142,12 @@ def get_comercios(client, logger, environment, data_module):
                                 logger.info("Consulta de comercios exitosa")
                                 
                                 # Mostrar algunos comercios
-                                for idx, comercio in enumerate(response_data[:5]):
-                                    if "nombre" in comercio:
-                                        logger.info(f"Comercio {idx+1}: {comercio.get('nombre')}")
-                                    elif "razon_social" in comercio:
-                                        logger.info(f"Comercio {idx+1}: {comercio.get('razon_social')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, comercio in enumerate(response_data[:5]):
+                                        if "nombre" in comercio:
+                                            logger.info(f"Comercio {idx+1}: {comercio.get('nombre')}")
+                                        elif "razon_social" in comercio:
+                                            logger.info(f"Comercio {idx+1}: {comercio.get('razon_social')}")
                                 
                                 if cantidad_comercios > 5:
                                     logger.info(f"... y {cantidad_comercios - 5} comercios más")
@@ -211,12 +216,7 @@ def get_comercios(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de comercios: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/habilitaciones/comercios",
-            catch_response=True,
-            name="(HABILITACIONES) - /habilitaciones/comercios [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(HABILITACIONES) - /habilitaciones/comercios [Exception]", e)
 
 def get_geriatricos_privados(client, logger, environment, data_module):
     """Prueba el endpoint de obtener geriátricos privados habilitados de Córdoba"""
@@ -239,7 +239,7 @@ def get_geriatricos_privados(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -272,30 +272,31 @@ def get_geriatricos_privados(client, logger, environment, data_module):
                                 logger.info("Consulta de geriátricos privados exitosa")
                                 
                                 # Mostrar información de algunos geriátricos (hasta 5)
-                                for idx, geriatrico in enumerate(response_data[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "nombre" in geriatrico:
-                                        logger.info(f"Geriátrico {idx+1}: {geriatrico.get('nombre')}")
-                                    elif "razon_social" in geriatrico:
-                                        logger.info(f"Geriátrico {idx+1}: {geriatrico.get('razon_social')}")
-                                    elif "establecimiento" in geriatrico:
-                                        logger.info(f"Geriátrico {idx+1}: {geriatrico.get('establecimiento')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in geriatrico.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Geriátrico {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, geriatrico in enumerate(response_data[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "nombre" in geriatrico:
+                                            logger.info(f"Geriátrico {idx+1}: {geriatrico.get('nombre')}")
+                                        elif "razon_social" in geriatrico:
+                                            logger.info(f"Geriátrico {idx+1}: {geriatrico.get('razon_social')}")
+                                        elif "establecimiento" in geriatrico:
+                                            logger.info(f"Geriátrico {idx+1}: {geriatrico.get('establecimiento')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in geriatrico.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Geriátrico {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional si está disponible
-                                    if "cuit" in geriatrico and geriatrico.get("cuit"):
-                                        logger.info(f"  CUIT: {geriatrico.get('cuit')}")
-                                    if "direccion" in geriatrico and geriatrico.get("direccion"):
-                                        logger.info(f"  Dirección: {geriatrico.get('direccion')}")
-                                    if "telefono" in geriatrico and geriatrico.get("telefono"):
-                                        logger.info(f"  Teléfono: {geriatrico.get('telefono')}")
-                                    if "email" in geriatrico and geriatrico.get("email"):
-                                        logger.info(f"  Email: {geriatrico.get('email')}")
+                                        # Mostrar información adicional si está disponible
+                                        if "cuit" in geriatrico and geriatrico.get("cuit"):
+                                            logger.info(f"  CUIT: {geriatrico.get('cuit')}")
+                                        if "direccion" in geriatrico and geriatrico.get("direccion"):
+                                            logger.info(f"  Dirección: {geriatrico.get('direccion')}")
+                                        if "telefono" in geriatrico and geriatrico.get("telefono"):
+                                            logger.info(f"  Teléfono: {geriatrico.get('telefono')}")
+                                        if "email" in geriatrico and geriatrico.get("email"):
+                                            logger.info(f"  Email: {geriatrico.get('email')}")
                                 
                                 # Si hay más de 5 geriátricos, indicar cuántos más hay
                                 if cantidad_geriatricos > 5:
@@ -328,11 +329,12 @@ def get_geriatricos_privados(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles: {campos_disponibles}")
                                 
                                 # Mostrar algunos geriátricos
-                                for idx, geriatrico in enumerate(items[:5]):
-                                    if "nombre" in geriatrico:
-                                        logger.info(f"Geriátrico {idx+1}: {geriatrico.get('nombre')}")
-                                    elif "razon_social" in geriatrico:
-                                        logger.info(f"Geriátrico {idx+1}: {geriatrico.get('razon_social')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, geriatrico in enumerate(items[:5]):
+                                        if "nombre" in geriatrico:
+                                            logger.info(f"Geriátrico {idx+1}: {geriatrico.get('nombre')}")
+                                        elif "razon_social" in geriatrico:
+                                            logger.info(f"Geriátrico {idx+1}: {geriatrico.get('razon_social')}")
                                 
                                 data_module.geriatricos_privados = response_data
                         
@@ -365,12 +367,7 @@ def get_geriatricos_privados(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de geriátricos privados: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/habilitaciones/geriatricos-privados",
-            catch_response=True,
-            name="(HABILITACIONES) - /habilitaciones/geriatricos-privados [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(HABILITACIONES) - /habilitaciones/geriatricos-privados [Exception]", e)
 
 def get_jardines_maternales_privados(client, logger, environment, data_module):
     """Prueba el endpoint de obtener jardines maternales privados habilitados de Córdoba"""
@@ -393,7 +390,7 @@ def get_jardines_maternales_privados(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -426,32 +423,33 @@ def get_jardines_maternales_privados(client, logger, environment, data_module):
                                 logger.info("Consulta de jardines maternales privados exitosa")
                                 
                                 # Mostrar información de algunos jardines (hasta 5)
-                                for idx, jardin in enumerate(response_data[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "nombre" in jardin:
-                                        logger.info(f"Jardín Maternal {idx+1}: {jardin.get('nombre')}")
-                                    elif "razon_social" in jardin:
-                                        logger.info(f"Jardín Maternal {idx+1}: {jardin.get('razon_social')}")
-                                    elif "establecimiento" in jardin:
-                                        logger.info(f"Jardín Maternal {idx+1}: {jardin.get('establecimiento')}")
-                                    elif "jardin" in jardin:
-                                        logger.info(f"Jardín Maternal {idx+1}: {jardin.get('jardin')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in jardin.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Jardín Maternal {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, jardin in enumerate(response_data[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "nombre" in jardin:
+                                            logger.info(f"Jardín Maternal {idx+1}: {jardin.get('nombre')}")
+                                        elif "razon_social" in jardin:
+                                            logger.info(f"Jardín Maternal {idx+1}: {jardin.get('razon_social')}")
+                                        elif "establecimiento" in jardin:
+                                            logger.info(f"Jardín Maternal {idx+1}: {jardin.get('establecimiento')}")
+                                        elif "jardin" in jardin:
+                                            logger.info(f"Jardín Maternal {idx+1}: {jardin.get('jardin')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in jardin.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Jardín Maternal {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional si está disponible
-                                    if "cuit" in jardin and jardin.get("cuit"):
-                                        logger.info(f"  CUIT: {jardin.get('cuit')}")
-                                    if "direccion" in jardin and jardin.get("direccion"):
-                                        logger.info(f"  Dirección: {jardin.get('direccion')}")
-                                    if "telefono" in jardin and jardin.get("telefono"):
-                                        logger.info(f"  Teléfono: {jardin.get('telefono')}")
-                                    if "email" in jardin and jardin.get("email"):
-                                        logger.info(f"  Email: {jardin.get('email')}")
+                                        # Mostrar información adicional si está disponible
+                                        if "cuit" in jardin and jardin.get("cuit"):
+                                            logger.info(f"  CUIT: {jardin.get('cuit')}")
+                                        if "direccion" in jardin and jardin.get("direccion"):
+                                            logger.info(f"  Dirección: {jardin.get('direccion')}")
+                                        if "telefono" in jardin and jardin.get("telefono"):
+                                            logger.info(f"  Teléfono: {jardin.get('telefono')}")
+                                        if "email" in jardin and jardin.get("email"):
+                                            logger.info(f"  Email: {jardin.get('email')}")
                                 
                                 # Si hay más de 5 jardines, indicar cuántos más hay
                                 if cantidad_jardines > 5:
@@ -484,11 +482,12 @@ def get_jardines_maternales_privados(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles: {campos_disponibles}")
                                 
                                 # Mostrar algunos jardines maternales
-                                for idx, jardin in enumerate(items[:5]):
-                                    if "nombre" in jardin:
-                                        logger.info(f"Jardín Maternal {idx+1}: {jardin.get('nombre')}")
-                                    elif "razon_social" in jardin:
-                                        logger.info(f"Jardín Maternal {idx+1}: {jardin.get('razon_social')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, jardin in enumerate(items[:5]):
+                                        if "nombre" in jardin:
+                                            logger.info(f"Jardín Maternal {idx+1}: {jardin.get('nombre')}")
+                                        elif "razon_social" in jardin:
+                                            logger.info(f"Jardín Maternal {idx+1}: {jardin.get('razon_social')}")
                                 
                                 data_module.jardines_maternales_privados = response_data
                         
@@ -521,9 +520,4 @@ def get_jardines_maternales_privados(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de jardines maternales privados: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/habilitaciones/jardines-maternales-privados",
-            catch_response=True,
-            name="(HABILITACIONES) - /habilitaciones/jardines-maternales-privados [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(HABILITACIONES) - /habilitaciones/jardines-maternales-privados [Exception]", e)
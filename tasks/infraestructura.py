@@ -1,6 +1,9 @@
 import random
+import logging
 from typing import Dict, Any
 
+from utils.http import report_failure
+
 def get_puntos_wifi(client, logger, environment, data_module):
     """Prueba el endpoint de obtener puntos de wifi de la ciudad de Córdoba"""
     
@@ -22,7 +25,7 @@ def get_puntos_wifi(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -49,32 +52,33 @@ def get_puntos_wifi(client, logger, environment, data_module):
                             logger.info("Consulta de puntos wifi exitosa")
                             
                             # Mostrar información de algunos puntos wifi (hasta 5)
-                            for idx, punto in enumerate(response_data[:5]):
-                                # Mostrar información usando los campos reales de la respuesta
-                                if "descripcion" in punto:
-                                    logger.info(f"Punto Wifi {idx+1}: {punto.get('descripcion')}")
-                                elif "categoria" in punto:
-                                    logger.info(f"Punto Wifi {idx+1}: {punto.get('categoria')}")
-                                else:
-                                    # Mostrar el primer campo que contenga información útil
-                                    for key, value in punto.items():
-                                        if isinstance(value, str) and len(value) > 0:
-                                            logger.info(f"Punto Wifi {idx+1}: {key}={value}")
-                                            break
+                            if logger.isEnabledFor(logging.INFO):
+                                for idx, punto in enumerate(response_data[:5]):
+                                    # Mostrar información usando los campos reales de la respuesta
+                                    if "descripcion" in punto:
+                                        logger.info(f"Punto Wifi {idx+1}: {punto.get('descripcion')}")
+                                    elif "categoria" in punto:
+                                        logger.info(f"Punto Wifi {idx+1}: {punto.get('categoria')}")
+                                    else:
+                                        # Mostrar el primer campo que contenga información útil
+                                        for key, value in punto.items():
+                                            if isinstance(value, str) and len(value) > 0:
+                                                logger.info(f"Punto Wifi {idx+1}: {key}={value}")
+                                                break
                                 
-                                # Mostrar información adicional si está disponible
-                                if "domicilio_alt" in punto and punto.get("domicilio_alt"):
-                                    logger.info(f"  Dirección: {punto.get('domicilio_alt')}")
-                                if "barrio_alt" in punto and punto.get("barrio_alt"):
-                                    logger.info(f"  Barrio: {punto.get('barrio_alt')}")
-                                if "cpc" in punto and punto.get("cpc"):
-                                    logger.info(f"  CPC: {punto.get('cpc')}")
-                                if "categoria" in punto and punto.get("categoria"):
-                                    logger.info(f"  Categoría: {punto.get('categoria')}")
-                                if "telefono" in punto and punto.get("telefono"):
-                                    logger.info(f"  Teléfono: {punto.get('telefono')}")
-                                if "lat" in punto and punto.get("lat"):
-                                    logger.info(f"  Coordenadas: {punto.get('lat')}, {punto.get('long', 'N/A')}")
+                                    # Mostrar información adicional si está disponible
+                                    if "domicilio_alt" in punto and punto.get("domicilio_alt"):
+                                        logger.info(f"  Dirección: {punto.get('domicilio_alt')}")
+                                    if "barrio_alt" in punto and punto.get("barrio_alt"):
+                                        logger.info(f"  Barrio: {punto.get('barrio_alt')}")
+                                    if "cpc" in punto and punto.get("cpc"):
+                                        logger.info(f"  CPC: {punto.get('cpc')}")
+                                    if "categoria" in punto and punto.get("categoria"):
+                                        logger.info(f"  Categoría: {punto.get('categoria')}")
+                                    if "telefono" in punto and punto.get("telefono"):
+                                        logger.info(f"  Teléfono: {punto.get('telefono')}")
+                                    if "lat" in punto and punto.get("lat"):
+                                        logger.info(f"  Coordenadas: {punto.get('lat')}, {punto.get('long', 'N/A')}")
                             
                             # Si hay más de 5 puntos, indicar cuántos más hay
                             if cantidad_puntos > 5:
@@ -104,11 +108,12 @@ def get_puntos_wifi(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles: {campos_disponibles}")
                                 
                                 # Mostrar algunos puntos wifi
-                                for idx, punto in enumerate(items[:5]):
-                                    if "descripcion" in punto:
-                                        logger.info(f"Punto Wifi {idx+1}: {punto.get('descripcion')}")
-                                    elif "categoria" in punto:
-                                        logger.info(f"Punto Wifi {idx+1}: {punto.get('categoria')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, punto in enumerate(items[:5]):
+                                        if "descripcion" in punto:
+                                            logger.info(f"Punto Wifi {idx+1}: {punto.get('descripcion')}")
+                                        elif "categoria" in punto:
+                                            logger.info(f"Punto Wifi {idx+1}: {punto.get('categoria')}")
                                 
                                 data_module.puntos_wifi = response_data
                         
@@ -141,12 +146,7 @@ def get_puntos_wifi(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de puntos wifi: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/infraestructura/puntos-wifi",
-            catch_response=True,
-            name="(INFRACUCTURA) - /infraestructura/puntos-wifi [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(INFRACUCTURA) - /infraestructura/puntos-wifi [Exception]", e)
 
 def get_obra_publica(client, logger, environment, data_module):
     """Prueba el endpoint de consulta de obras públicas finalizadas y en ejecución"""
@@ -169,7 +169,7 @@ def get_obra_publica(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -202,38 +202,39 @@ def get_obra_publica(client, logger, environment, data_module):
                                 logger.info("Consulta de obras públicas exitosa")
                                 
                                 # Mostrar información de algunas obras (hasta 5)
-                                for idx, obra in enumerate(response_data[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "nombre" in obra:
-                                        logger.info(f"Obra Pública {idx+1}: {obra.get('nombre')}")
-                                    elif "descripcion" in obra:
-                                        logger.info(f"Obra Pública {idx+1}: {obra.get('descripcion')}")
-                                    elif "tipo_obra" in obra:
-                                        logger.info(f"Obra Pública {idx+1}: {obra.get('tipo_obra')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in obra.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Obra Pública {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, obra in enumerate(response_data[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "nombre" in obra:
+                                            logger.info(f"Obra Pública {idx+1}: {obra.get('nombre')}")
+                                        elif "descripcion" in obra:
+                                            logger.info(f"Obra Pública {idx+1}: {obra.get('descripcion')}")
+                                        elif "tipo_obra" in obra:
+                                            logger.info(f"Obra Pública {idx+1}: {obra.get('tipo_obra')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in obra.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Obra Pública {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional si está disponible
-                                    if "estado" in obra and obra.get("estado"):
-                                        logger.info(f"  Estado: {obra.get('estado')}")
-                                    if "ubicacion" in obra and obra.get("ubicacion"):
-                                        logger.info(f"  Ubicación: {obra.get('ubicacion')}")
-                                    if "barrio" in obra and obra.get("barrio"):
-                                        logger.info(f"  Barrio: {obra.get('barrio')}")
-                                    if "zona" in obra and obra.get("zona"):
-                                        logger.info(f"  Zona: {obra.get('zona')}")
-                                    if "fecha_inicio" in obra and obra.get("fecha_inicio"):
-                                        logger.info(f"  Fecha Inicio: {obra.get('fecha_inicio')}")
-                                    if "fecha_fin" in obra and obra.get("fecha_fin"):
-                                        logger.info(f"  Fecha Fin: {obra.get('fecha_fin')}")
-                                    if "presupuesto" in obra and obra.get("presupuesto"):
-                                        logger.info(f"  Presupuesto: {obra.get('presupuesto')}")
-                                    if "contratista" in obra and obra.get("contratista"):
-                                        logger.info(f"  Contratista: {obra.get('contratista')}")
+                                        # Mostrar información adicional si está disponible
+                                        if "estado" in obra and obra.get("estado"):
+                                            logger.info(f"  Estado: {obra.get('estado')}")
+                                        if "ubicacion" in obra and obra.get("ubicacion"):
+                                            logger.info(f"  Ubicación: {obra.get('ubicacion')}")
+                                        if "barrio" in obra and obra.get("barrio"):
+                                            logger.info(f"  Barrio: {obra.get('barrio')}")
+                                        if "zona" in obra and obra.get("zona"):
+                                            logger.info(f"  Zona: {obra.get('zona')}")
+                                        if "fecha_inicio" in obra and obra.get("fecha_inicio"):
+                                            logger.info(f"  Fecha Inicio: {obra.get('fecha_inicio')}")
+                                        if "fecha_fin" in obra and obra.get("fecha_fin"):
+                                            logger.info(f"  Fecha Fin: {obra.get('fecha_fin')}")
+                                        if "presupuesto" in obra and obra.get("presupuesto"):
+                                            logger.info(f"  Presupuesto: {obra.get('presupuesto')}")
+                                        if "contratista" in obra and obra.get("contratista"):
+                                            logger.info(f"  Contratista: {obra.get('contratista')}")
                                 
                                 # Si hay más de 5 obras, indicar cuántas más hay
                                 if cantidad_obras > 5:
@@ -266,11 +267,12 @@ def get_obra_publica(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles: {campos_disponibles}")
                                 
                                 # Mostrar algunas obras públicas
-                                for idx, obra in enumerate(items[:5]):
-                                    if "nombre" in obra:
-                                        logger.info(f"Obra Pública {idx+1}: {obra.get('nombre')}")
-                                    elif "descripcion" in obra:
-                                        logger.info(f"Obra Pública {idx+1}: {obra.get('descripcion')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, obra in enumerate(items[:5]):
+                                        if "nombre" in obra:
+                                            logger.info(f"Obra Pública {idx+1}: {obra.get('nombre')}")
+                                        elif "descripcion" in obra:
+                                            logger.info(f"Obra Pública {idx+1}: {obra.get('descripcion')}")
                                 
                                 data_module.obras_publicas = response_data
                         
@@ -303,9 +305,4 @@ def get_obra_publica(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de obras públicas: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/infraestructura/obra-publica",
-            catch_response=True,
-            name="(INFRACUCTURA) - /infraestructura/obra-publica [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(INFRACUCTURA) - /infraestructura/obra-publica [Exception]", e)
@@ -0,0 +1,148 @@
+"""Recorridos de escritura encadenados para el perfil "write".
+
+Cada recorrido ejecuta tasks de escritura en orden y cada paso usa lo que
+creó el anterior (por ejemplo, el ID y el CUIL de la persona recién
+creada). Con datos sintéticos (utils/synthetic.py) cada recorrido crea
+registros nuevos.
+
+Se informan dos niveles de latencia:
+- por paso: el request de cada task aparece con su nombre habitual en las
+  estadísticas, y el tiempo de cada paso del recorrido (request y trabajo
+  del cliente) en la pestaña "Harness" como "recorrido: <nombre> [<n>. <task>]"
+- de punta a punta: cada recorrido aparece en las estadísticas como
+  request_type "JOURNEY"; si un paso falla el recorrido se corta y se
+  informa como fallido indicando el paso
+
+Ninguno de los dos incluye las pausas deliberadas entre requests de los
+tasks (HarnessClient.pause, por ejemplo en put_medios_pagos).
+"""
+import random
+import time
+from collections import namedtuple
+
+from tasks.domicilio import insert_domicilio, insert_domicilio_ampliado, insert_domicilio_geo, insert_incidente
+from tasks.parametricas import put_medios_pagos
+from tasks.persona_fisica import insert_comunicaciones_personas, insert_domicilio_persona_fisica, insert_or_update_persona_fisica
+from tasks.proveedor import alta_cbu_banco_proveedor, alta_proveedor
+from utils import metrics
+
+REQUEST_TYPE_JOURNEY = "JOURNEY"
+
+# Un paso: el task, una preparación opcional del contexto antes de ejecutarlo
+# (encadenamiento) y el atributo del contexto que debe dejar cargado para seguir
+Paso = namedtuple("Paso", ["funcion", "antes", "produce"], defaults=(None, None))
+Journey = namedtuple("Journey", ["nombre", "peso", "pasos"])
+
+
+class JourneyStepFailed(Exception):
+    pass
+
+
+def _comunicaciones_de_la_persona(data):
+    """Comunicaciones para el CUIL de la persona creada en el primer paso"""
+    plantilla = random.choice(data.body_insertar_comunicaciones_personas)
+    cuil = data.cuil_persona_fisica
+    body = dict(plantilla)
+    body.update({
+        "p_cuil_cuit": cuil,
+        "p_tipo_persona": "PF",
+        "p_telefono": f"351{random.randrange(10**7):07d}",
+        "p_correo_electronico": f"{cuil}@example.com",
+    })
+    data.body_insertar_comunicaciones_personas = [body]
+
+
+def _como_proveedor(data):
+    """Alta de proveedor (y de su CBU) para la persona creada en el primer paso.
+
+    alta_proveedor y alta_cbu_banco_proveedor eligen al azar entre el body PF
+    y el PJ: ambos se reemplazan por el de la persona del recorrido.
+    """
+    persona = {
+        "p_tipo_persona": "PF",
+        "p_cuit_cuil": data.cuil_persona_fisica,
+        "p_razon_social": None,
+    }
+    alta = dict(data.body_alta_proveedor_pf, **persona)
+    data.body_alta_proveedor_pf = data.body_alta_proveedor_pj = alta
+    cbu = dict(data.body_alta_cbu_banco_proveedor_pf, **persona, p_cbu=f"{random.randrange(10**22):022d}")
+    data.body_alta_cbu_banco_proveedor_pf = data.body_alta_cbu_banco_proveedor_pj = cbu
+
+
+def _olvidar(*atributos):
+    """Preparación que descarta valores de recorridos anteriores del usuario"""
+    def preparar(data):
+        for atributo in atributos:
+            setattr(data, atributo, None)
+    return preparar
+
+
+PASO_PERSONA = Paso(insert_or_update_persona_fisica, _olvidar("id_persona_fisica", "cuil_persona_fisica"), "id_persona_fisica")
+
+
+JOURNEYS = [
+    Journey("persona → domicilio → comunicaciones", 4, (
+        PASO_PERSONA,
+        Paso(insert_domicilio_persona_fisica),
+        Paso(insert_comunicaciones_personas, _comunicaciones_de_la_persona),
+    )),
+    Journey("domicilio → incidente", 2, (
+        Paso(insert_domicilio, _olvidar("ultimo_id_domicilio"), "ultimo_id_domicilio"),
+        Paso(insert_incidente),
+    )),
+    Journey("domicilio ampliado", 1, (Paso(insert_domicilio_ampliado),)),
+    Journey("domicilio geo", 1, (Paso(insert_domicilio_geo),)),
+    Journey("persona → proveedor → cbu", 2, (
+        PASO_PERSONA,
+        Paso(alta_proveedor, _como_proveedor),
+        Paso(alta_cbu_banco_proveedor),
+    )),
+    Journey("medios de pago", 1, (Paso(put_medios_pagos),)),
+]
+
+
+def pick_journey(rng=random):
+    return rng.choices(JOURNEYS, weights=[journey.peso for journey in JOURNEYS])[0]
+
+
+def _paso_fallido(http, funcion, produce, data):
+    """Motivo por el que el paso no permite seguir con el recorrido, o None"""
+    respuesta = http.last_response
+    if respuesta is None:
+        return f"{funcion.__name__} no envió ningún request"
+    excepcion = (getattr(respuesta, "request_meta", None) or {}).get("exception")
+    if excepcion is not None:
+        return f"{funcion.__name__}: {excepcion}"
+    if produce and not getattr(data, produce, None):
+        return f"{funcion.__name__} no devolvió {produce}"
+    return None
+
+
+def run_journey(journey, http, logger, environment, data):
+    """Ejecuta un recorrido e informa su latencia de punta a punta, sin las pausas de los tasks"""
+    inicio, pausas = time.perf_counter(), http.paused
+    excepcion = None
+    for numero, paso in enumerate(journey.pasos, start=1):
+        inicio_paso, pausas_paso = time.perf_counter(), http.paused
+        try:
+            if paso.antes is not None:
+                paso.antes(data)
+            http.run_task(paso.funcion, logger, environment, data)
+            motivo = _paso_fallido(http, paso.funcion, paso.produce, data)
+        except Exception as e:
+            motivo = f"{paso.funcion.__name__}: {e}"
+        duracion_paso = time.perf_counter() - inicio_paso - (http.paused - pausas_paso)
+        metrics.observe(f"recorrido: {journey.nombre} [{numero}. {paso.funcion.__name__}]", duracion_paso * 1000)
+        if motivo is not None:
+            excepcion = JourneyStepFailed(f"paso {numero} ({motivo})")
+            logger.warning(f"Recorrido '{journey.nombre}' cortado en el paso {numero}: {motivo}")
+            break
+    environment.events.request.fire(
+        request_type=REQUEST_TYPE_JOURNEY,
+        name=journey.nombre,
+        response_time=(time.perf_counter() - inicio - (http.paused - pausas)) * 1000,
+        response_length=0,
+        response=None,
+        context={},
+        exception=excepcion,
+    )
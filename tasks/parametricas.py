@@ -1,3 +1,9 @@
+import logging
+
+from tasks.schemas import validar
+from utils.http import report_failure
+
+
 def get_medios_pagos(client, logger, environment, data_module):
     """Prueba el endpoint de consultar medios de pago"""
     
@@ -24,7 +30,7 @@ def get_medios_pagos(client, logger, environment, data_module):
                             logger.info(f"Respuesta recibida: {response.text[:100]}...")
                     except:
                         logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-                else:
+                elif logger.isEnabledFor(logging.INFO):
                     logger.info(f"Respuesta completa: {response.text}")
                 
                 if response.status_code == 200:  # HTTP 200 OK
@@ -53,48 +59,46 @@ def get_medios_pagos(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                                 
                                 # Verificar si al menos tiene algunos campos básicos de medios de pago
-                                tiene_campos_basicos = any(
-                                    campo in primer_elemento 
-                                    for campo in ["id", "id_medio_pago", "nombre", "descripcion", "codigo", "estado", "tipo", "activo"]
-                                )
+                                errores = validar("/medios_pagos", response_data)
                                 
-                                if tiene_campos_basicos:
+                                if not errores:
                                     response.success()
                                     logger.info(f"Consulta de medios de pago exitosa con parametros: {params_a_probar}")
                                     
                                     # Mostrar información de los medios de pago encontrados (hasta 10)
-                                    for idx, medio in enumerate(response_data[:10]):
-                                        # Mostrar información relevante según los campos disponibles
-                                        if "nombre" in medio:
-                                            logger.info(f"Medio de Pago {idx+1}: {medio.get('nombre')}")
-                                        elif "id_medio_pago" in medio:
-                                            logger.info(f"Medio de Pago {idx+1}: ID {medio.get('id_medio_pago')}")
-                                        elif "id" in medio:
-                                            logger.info(f"Medio de Pago {idx+1}: ID {medio.get('id')}")
-                                        else:
-                                            # Mostrar el primer campo que contenga información útil
-                                            for key, value in medio.items():
-                                                if isinstance(value, str) and len(value) > 0:
-                                                    logger.info(f"Medio de Pago {idx+1}: {key}={value}")
-                                                    break
+                                    if logger.isEnabledFor(logging.INFO):
+                                        for idx, medio in enumerate(response_data[:10]):
+                                            # Mostrar información relevante según los campos disponibles
+                                            if "nombre" in medio:
+                                                logger.info(f"Medio de Pago {idx+1}: {medio.get('nombre')}")
+                                            elif "id_medio_pago" in medio:
+                                                logger.info(f"Medio de Pago {idx+1}: ID {medio.get('id_medio_pago')}")
+                                            elif "id" in medio:
+                                                logger.info(f"Medio de Pago {idx+1}: ID {medio.get('id')}")
+                                            else:
+                                                # Mostrar el primer campo que contenga información útil
+                                                for key, value in medio.items():
+                                                    if isinstance(value, str) and len(value) > 0:
+                                                        logger.info(f"Medio de Pago {idx+1}: {key}={value}")
+                                                        break
                                         
-                                        # Mostrar información adicional del medio de pago
-                                        if "descripcion" in medio and medio.get("descripcion"):
-                                            logger.info(f"  Descripcion: {medio.get('descripcion')}")
-                                        if "codigo" in medio and medio.get("codigo"):
-                                            logger.info(f"  Codigo: {medio.get('codigo')}")
-                                        if "estado" in medio and medio.get("estado"):
-                                            logger.info(f"  Estado: {medio.get('estado')}")
-                                        if "activo" in medio and medio.get("activo") is not None:
-                                            logger.info(f"  Activo: {medio.get('activo')}")
-                                        if "tipo" in medio and medio.get("tipo"):
-                                            logger.info(f"  Tipo: {medio.get('tipo')}")
-                                        if "observaciones" in medio and medio.get("observaciones"):
-                                            logger.info(f"  Observaciones: {medio.get('observaciones')}")
-                                        if "fecha_creacion" in medio and medio.get("fecha_creacion"):
-                                            logger.info(f"  Fecha Creacion: {medio.get('fecha_creacion')}")
-                                        if "fecha_modificacion" in medio and medio.get("fecha_modificacion"):
-                                            logger.info(f"  Fecha Modificacion: {medio.get('fecha_modificacion')}")
+                                            # Mostrar información adicional del medio de pago
+                                            if "descripcion" in medio and medio.get("descripcion"):
+                                                logger.info(f"  Descripcion: {medio.get('descripcion')}")
+                                            if "codigo" in medio and medio.get("codigo"):
+                                                logger.info(f"  Codigo: {medio.get('codigo')}")
+                                            if "estado" in medio and medio.get("estado"):
+                                                logger.info(f"  Estado: {medio.get('estado')}")
+                                            if "activo" in medio and medio.get("activo") is not None:
+                                                logger.info(f"  Activo: {medio.get('activo')}")
+                                            if "tipo" in medio and medio.get("tipo"):
+                                                logger.info(f"  Tipo: {medio.get('tipo')}")
+                                            if "observaciones" in medio and medio.get("observaciones"):
+                                                logger.info(f"  Observaciones: {medio.get('observaciones')}")
+                                            if "fecha_creacion" in medio and medio.get("fecha_creacion"):
+                                                logger.info(f"  Fecha Creacion: {medio.get('fecha_creacion')}")
+                                            if "fecha_modificacion" in medio and medio.get("fecha_modificacion"):
+                                                logger.info(f"  Fecha Modificacion: {medio.get('fecha_modificacion')}")
                                     
                                     # Si hay más de 10 medios de pago, indicar cuántos más hay
                                     if cantidad_medios > 10:
@@ -129,7 +133,7 @@ def get_medios_pagos(client, logger, environment, data_module):
                                     return True  # Éxito
                                 else:
                                     response.failure("Los elementos no tienen campos reconocibles de medios de pago")
-                                    logger.warning(f"Estructura de datos no reconocida para parametros {params_a_probar}: {primer_elemento}")
+                                    logger.warning(f"Estructura de datos no reconocida para parametros {params_a_probar}: {errores}")
                                     return False
                             else:
                                 # Si no se encontraron medios de pago
@@ -153,11 +157,12 @@ def get_medios_pagos(client, logger, environment, data_module):
                                     logger.info(f"Campos disponibles: {campos_disponibles}")
                                     
                                     # Mostrar algunos medios de pago
-                                    for idx, medio in enumerate(items[:5]):
-                                        if "nombre" in medio:
-                                            logger.info(f"Medio de Pago {idx+1}: {medio.get('nombre')}")
-                                        elif "id" in medio:
-                                            logger.info(f"Medio de Pago {idx+1}: ID {medio.get('id')}")
+                                    if logger.isEnabledFor(logging.INFO):
+                                        for idx, medio in enumerate(items[:5]):
+                                            if "nombre" in medio:
+                                                logger.info(f"Medio de Pago {idx+1}: {medio.get('nombre')}")
+                                            elif "id" in medio:
+                                                logger.info(f"Medio de Pago {idx+1}: ID {medio.get('id')}")
                                     
                                     data_module.medios_pagos = response_data
                             
@@ -273,7 +278,7 @@ def get_cfiscal(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -299,46 +304,44 @@ def get_cfiscal(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                             
                             # Verificar si al menos tiene algunos campos básicos de condiciones fiscales
-                            tiene_campos_basicos = any(
-                                campo in primer_elemento 
-                                for campo in ["id_condicion_fiscal", "nombre", "id", "descripcion", "codigo"]
-                            )
+                            errores = validar("/cfiscal", response_data)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info("Consulta de condiciones fiscales exitosa")
                                 
                                 # Mostrar información de todas las condiciones fiscales encontradas
-                                for idx, condicion in enumerate(response_data):
-                                    # Mostrar información relevante según los campos disponibles
-                                    if "nombre" in condicion:
-                                        logger.info(f"Condicion Fiscal {idx+1}: {condicion.get('nombre')}")
-                                    elif "descripcion" in condicion:
-                                        logger.info(f"Condicion Fiscal {idx+1}: {condicion.get('descripcion')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in condicion.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Condicion Fiscal {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, condicion in enumerate(response_data):
+                                        # Mostrar información relevante según los campos disponibles
+                                        if "nombre" in condicion:
+                                            logger.info(f"Condicion Fiscal {idx+1}: {condicion.get('nombre')}")
+                                        elif "descripcion" in condicion:
+                                            logger.info(f"Condicion Fiscal {idx+1}: {condicion.get('descripcion')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in condicion.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Condicion Fiscal {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional de la condición fiscal
-                                    if "id_condicion_fiscal" in condicion:
-                                        logger.info(f"  ID Condicion Fiscal: {condicion.get('id_condicion_fiscal')}")
-                                    if "id" in condicion and "id_condicion_fiscal" not in condicion:
-                                        logger.info(f"  ID: {condicion.get('id')}")
-                                    if "codigo" in condicion and condicion.get("codigo"):
-                                        logger.info(f"  Codigo: {condicion.get('codigo')}")
-                                    if "descripcion" in condicion and condicion.get("descripcion") and "nombre" in condicion:
-                                        logger.info(f"  Descripcion: {condicion.get('descripcion')}")
-                                    if "estado" in condicion and condicion.get("estado"):
-                                        logger.info(f"  Estado: {condicion.get('estado')}")
-                                    if "activo" in condicion and condicion.get("activo") is not None:
-                                        logger.info(f"  Activo: {condicion.get('activo')}")
-                                    if "fecha_creacion" in condicion and condicion.get("fecha_creacion"):
-                                        logger.info(f"  Fecha Creacion: {condicion.get('fecha_creacion')}")
-                                    if "fecha_modificacion" in condicion and condicion.get("fecha_modificacion"):
-                                        logger.info(f"  Fecha Modificacion: {condicion.get('fecha_modificacion')}")
+                                        # Mostrar información adicional de la condición fiscal
+                                        if "id_condicion_fiscal" in condicion:
+                                            logger.info(f"  ID Condicion Fiscal: {condicion.get('id_condicion_fiscal')}")
+                                        if "id" in condicion and "id_condicion_fiscal" not in condicion:
+                                            logger.info(f"  ID: {condicion.get('id')}")
+                                        if "codigo" in condicion and condicion.get("codigo"):
+                                            logger.info(f"  Codigo: {condicion.get('codigo')}")
+                                        if "descripcion" in condicion and condicion.get("descripcion") and "nombre" in condicion:
+                                            logger.info(f"  Descripcion: {condicion.get('descripcion')}")
+                                        if "estado" in condicion and condicion.get("estado"):
+                                            logger.info(f"  Estado: {condicion.get('estado')}")
+                                        if "activo" in condicion and condicion.get("activo") is not None:
+                                            logger.info(f"  Activo: {condicion.get('activo')}")
+                                        if "fecha_creacion" in condicion and condicion.get("fecha_creacion"):
+                                            logger.info(f"  Fecha Creacion: {condicion.get('fecha_creacion')}")
+                                        if "fecha_modificacion" in condicion and condicion.get("fecha_modificacion"):
+                                            logger.info(f"  Fecha Modificacion: {condicion.get('fecha_modificacion')}")
                                 
                                 # Estadísticas adicionales
                                 logger.info(f"Total de condiciones fiscales encontradas: {cantidad_condiciones}")
@@ -369,7 +372,7 @@ def get_cfiscal(client, logger, environment, data_module):
                                 data_module.condiciones_fiscales = response_data
                             else:
                                 response.failure("Los elementos no tienen campos reconocibles de condiciones fiscales")
-                                logger.warning(f"Estructura de datos no reconocida: {primer_elemento}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                         else:
                             # Si no se encontraron condiciones fiscales
                             logger.warning("No se encontraron condiciones fiscales")
@@ -391,11 +394,12 @@ def get_cfiscal(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles: {campos_disponibles}")
                                 
                                 # Mostrar algunas condiciones fiscales
-                                for idx, condicion in enumerate(items):
-                                    if "nombre" in condicion:
-                                        logger.info(f"Condicion Fiscal {idx+1}: {condicion.get('nombre')}")
-                                    elif "id_condicion_fiscal" in condicion:
-                                        logger.info(f"Condicion Fiscal {idx+1}: ID {condicion.get('id_condicion_fiscal')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, condicion in enumerate(items):
+                                        if "nombre" in condicion:
+                                            logger.info(f"Condicion Fiscal {idx+1}: {condicion.get('nombre')}")
+                                        elif "id_condicion_fiscal" in condicion:
+                                            logger.info(f"Condicion Fiscal {idx+1}: ID {condicion.get('id_condicion_fiscal')}")
                                 
                                 data_module.condiciones_fiscales = response_data
                         
@@ -428,12 +432,7 @@ def get_cfiscal(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepcion durante consulta de condiciones fiscales: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/cfiscal",
-            catch_response=True,
-            name="(PARAMETRICAS) - /cfiscal [Exception]"
-        ) as response:
-            response.failure(f"Excepcion: {str(e)}")
+        report_failure(environment, client, "GET", "(PARAMETRICAS) - /cfiscal [Exception]", e)
 
 def get_fjuridica(client, logger, environment, data_module):
     """Prueba el endpoint de consultar formas jurídicas"""
@@ -461,7 +460,7 @@ def get_fjuridica(client, logger, environment, data_module):
                             logger.info(f"Respuesta recibida: {response.text[:100]}...")
                     except:
                         logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-                else:
+                elif logger.isEnabledFor(logging.INFO):
                     logger.info(f"Respuesta completa: {response.text}")
                 
                 if response.status_code == 200:  # HTTP 200 OK
@@ -490,48 +489,46 @@ def get_fjuridica(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                                 
                                 # Verificar si al menos tiene algunos campos básicos de formas jurídicas
-                                tiene_campos_basicos = any(
-                                    campo in primer_elemento 
-                                    for campo in ["id_forma_juridica", "nombre", "id", "descripcion", "codigo"]
-                                )
+                                errores = validar("/fjuridica", response_data)
                                 
-                                if tiene_campos_basicos:
+                                if not errores:
                                     response.success()
                                     logger.info(f"Consulta de formas jurídicas exitosa con parametros: {params_a_probar}")
                                     
                                     # Mostrar información de las formas jurídicas encontradas
-                                    for idx, forma in enumerate(response_data):
-                                        # Mostrar información relevante según los campos disponibles
-                                        if "nombre" in forma:
-                                            logger.info(f"Forma Jurídica {idx+1}: {forma.get('nombre')}")
-                                        elif "id_forma_juridica" in forma:
-                                            logger.info(f"Forma Jurídica {idx+1}: ID {forma.get('id_forma_juridica')}")
-                                        elif "id" in forma:
-                                            logger.info(f"Forma Jurídica {idx+1}: ID {forma.get('id')}")
-                                        else:
-                                            # Mostrar el primer campo que contenga información útil
-                                            for key, value in forma.items():
-                                                if isinstance(value, str) and len(value) > 0:
-                                                    logger.info(f"Forma Jurídica {idx+1}: {key}={value}")
-                                                    break
+                                    if logger.isEnabledFor(logging.INFO):
+                                        for idx, forma in enumerate(response_data):
+                                            # Mostrar información relevante según los campos disponibles
+                                            if "nombre" in forma:
+                                                logger.info(f"Forma Jurídica {idx+1}: {forma.get('nombre')}")
+                                            elif "id_forma_juridica" in forma:
+                                                logger.info(f"Forma Jurídica {idx+1}: ID {forma.get('id_forma_juridica')}")
+                                            elif "id" in forma:
+                                                logger.info(f"Forma Jurídica {idx+1}: ID {forma.get('id')}")
+                                            else:
+                                                # Mostrar el primer campo que contenga información útil
+                                                for key, value in forma.items():
+                                                    if isinstance(value, str) and len(value) > 0:
+                                                        logger.info(f"Forma Jurídica {idx+1}: {key}={value}")
+                                                        break
                                         
-                                        # Mostrar información adicional de la forma jurídica
-                                        if "id_forma_juridica" in forma:
-                                            logger.info(f"  ID Forma Jurídica: {forma.get('id_forma_juridica')}")
-                                        if "descripcion" in forma and forma.get("descripcion"):
-                                            logger.info(f"  Descripcion: {forma.get('descripcion')}")
-                                        if "codigo" in forma and forma.get("codigo"):
-                                            logger.info(f"  Codigo: {forma.get('codigo')}")
-                                        if "estado" in forma and forma.get("estado"):
-                                            logger.info(f"  Estado: {forma.get('estado')}")
-                                        if "activo" in forma and forma.get("activo") is not None:
-                                            logger.info(f"  Activo: {forma.get('activo')}")
-                                        if "observaciones" in forma and forma.get("observaciones"):
-                                            logger.info(f"  Observaciones: {forma.get('observaciones')}")
-                                        if "fecha_creacion" in forma and forma.get("fecha_creacion"):
-                                            logger.info(f"  Fecha Creacion: {forma.get('fecha_creacion')}")
-                                        if "fecha_modificacion" in forma and forma.get("fecha_modificacion"):
-                                            logger.info(f"  Fecha Modificacion: {forma.get('fecha_modificacion')}")
+                                            # Mostrar información adicional de la forma jurídica
+                                            if "id_forma_juridica" in forma:
+                                                logger.info(f"  ID Forma Jurídica: {forma.get('id_forma_juridica')}")
+                                            if "descripcion" in forma and forma.get("descripcion"):
+                                                logger.info(f"  Descripcion: {forma.get('descripcion')}")
+                                            if "codigo" in forma and forma.get("codigo"):
+                                                logger.info(f"  Codigo: {forma.get('codigo')}")
+                                            if "estado" in forma and forma.get("estado"):
+                                                logger.info(f"  Estado: {forma.get('estado')}")
+                                            if "activo" in forma and forma.get("activo") is not None:
+                                                logger.info(f"  Activo: {forma.get('activo')}")
+                                            if "observaciones" in forma and forma.get("observaciones"):
+                                                logger.info(f"  Observaciones: {forma.get('observaciones')}")
+                                            if "fecha_creacion" in forma and forma.get("fecha_creacion"):
+                                                logger.info(f"  Fecha Creacion: {forma.get('fecha_creacion')}")
+                                            if "fecha_modificacion" in forma and forma.get("fecha_modificacion"):
+                                                logger.info(f"  Fecha Modificacion: {forma.get('fecha_modificacion')}")
                                     
                                     # Estadísticas adicionales
                                     logger.info(f"Total de formas jurídicas encontradas: {cantidad_formas}")
@@ -563,7 +560,7 @@ def get_fjuridica(client, logger, environment, data_module):
                                     return True  # Éxito
                                 else:
                                     response.failure("Los elementos no tienen campos reconocibles de formas jurídicas")
-                                    logger.warning(f"Estructura de datos no reconocida para parametros {params_a_probar}: {primer_elemento}")
+                                    logger.warning(f"Estructura de datos no reconocida para parametros {params_a_probar}: {errores}")
                                     return False
                             else:
                                 # Si no se encontraron formas jurídicas
@@ -587,11 +584,12 @@ def get_fjuridica(client, logger, environment, data_module):
                                     logger.info(f"Campos disponibles: {campos_disponibles}")
                                     
                                     # Mostrar algunas formas jurídicas
-                                    for idx, forma in enumerate(items[:10]):
-                                        if "nombre" in forma:
-                                            logger.info(f"Forma Jurídica {idx+1}: {forma.get('nombre')}")
-                                        elif "id_forma_juridica" in forma:
-                                            logger.info(f"Forma Jurídica {idx+1}: ID {forma.get('id_forma_juridica')}")
+                                    if logger.isEnabledFor(logging.INFO):
+                                        for idx, forma in enumerate(items[:10]):
+                                            if "nombre" in forma:
+                                                logger.info(f"Forma Jurídica {idx+1}: {forma.get('nombre')}")
+                                            elif "id_forma_juridica" in forma:
+                                                logger.info(f"Forma Jurídica {idx+1}: ID {forma.get('id_forma_juridica')}")
                                     
                                     data_module.formas_juridicas = response_data
                             
@@ -692,7 +690,7 @@ def get_bancos(client, logger, environment, data_module):
                             logger.info(f"Respuesta recibida: {response.text[:100]}...")
                     except:
                         logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-                else:
+                elif logger.isEnabledFor(logging.INFO):
                     logger.info(f"Respuesta completa: {response.text}")
                 
                 if response.status_code == 200:  # HTTP 200 OK
@@ -721,54 +719,52 @@ def get_bancos(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                                 
                                 # Verificar si al menos tiene algunos campos básicos de bancos
-                                tiene_campos_basicos = any(
-                                    campo in primer_elemento 
-                                    for campo in ["p_id_banco", "p_nombre", "id_banco", "nombre", "id", "codigo"]
-                                )
+                                errores = validar("/bancos", response_data)
                                 
-                                if tiene_campos_basicos:
+                                if not errores:
                                     response.success()
                                     logger.info(f"Consulta de bancos exitosa con parametros: {params_a_probar}")
                                     
                                     # Mostrar información de los bancos encontrados (hasta 20)
-                                    for idx, banco in enumerate(response_data[:20]):
-                                        # Mostrar información relevante según los campos disponibles
-                                        if "p_nombre" in banco:
-                                            logger.info(f"Banco {idx+1}: {banco.get('p_nombre')}")
-                                        elif "nombre" in banco:
-                                            logger.info(f"Banco {idx+1}: {banco.get('nombre')}")
-                                        elif "p_id_banco" in banco:
-                                            logger.info(f"Banco {idx+1}: ID {banco.get('p_id_banco')}")
-                                        elif "id_banco" in banco:
-                                            logger.info(f"Banco {idx+1}: ID {banco.get('id_banco')}")
-                                        elif "id" in banco:
-                                            logger.info(f"Banco {idx+1}: ID {banco.get('id')}")
-                                        else:
-                                            # Mostrar el primer campo que contenga información útil
-                                            for key, value in banco.items():
-                                                if isinstance(value, str) and len(value) > 0:
-                                                    logger.info(f"Banco {idx+1}: {key}={value}")
-                                                    break
+                                    if logger.isEnabledFor(logging.INFO):
+                                        for idx, banco in enumerate(response_data[:20]):
+                                            # Mostrar información relevante según los campos disponibles
+                                            if "p_nombre" in banco:
+                                                logger.info(f"Banco {idx+1}: {banco.get('p_nombre')}")
+                                            elif "nombre" in banco:
+                                                logger.info(f"Banco {idx+1}: {banco.get('nombre')}")
+                                            elif "p_id_banco" in banco:
+                                                logger.info(f"Banco {idx+1}: ID {banco.get('p_id_banco')}")
+                                            elif "id_banco" in banco:
+                                                logger.info(f"Banco {idx+1}: ID {banco.get('id_banco')}")
+                                            elif "id" in banco:
+                                                logger.info(f"Banco {idx+1}: ID {banco.get('id')}")
+                                            else:
+                                                # Mostrar el primer campo que contenga información útil
+                                                for key, value in banco.items():
+                                                    if isinstance(value, str) and len(value) > 0:
+                                                        logger.info(f"Banco {idx+1}: {key}={value}")
+                                                        break
                                         
-                                        # Mostrar información adicional del banco
-                                        if "p_id_banco" in banco:
-                                            logger.info(f"  ID Banco: {banco.get('p_id_banco')}")
-                                        elif "id_banco" in banco and "p_id_banco" not in banco:
-                                            logger.info(f"  ID Banco: {banco.get('id_banco')}")
-                                        if "codigo" in banco and banco.get("codigo"):
-                                            logger.info(f"  Codigo: {banco.get('codigo')}")
-                                        if "codigo_bcra" in banco and banco.get("codigo_bcra"):
-                                            logger.info(f"  Codigo BCRA: {banco.get('codigo_bcra')}")
-                                        if "descripcion" in banco and banco.get("descripcion"):
-                                            logger.info(f"  Descripcion: {banco.get('descripcion')}")
-                                        if "estado" in banco and banco.get("estado"):
-                                            logger.info(f"  Estado: {banco.get('estado')}")
-                                        if "activo" in banco and banco.get("activo") is not None:
-                                            logger.info(f"  Activo: {banco.get('activo')}")
-                                        if "fecha_creacion" in banco and banco.get("fecha_creacion"):
-                                            logger.info(f"  Fecha Creacion: {banco.get('fecha_creacion')}")
-                                        if "fecha_modificacion" in banco and banco.get("fecha_modificacion"):
-                                            logger.info(f"  Fecha Modificacion: {banco.get('fecha_modificacion')}")
+                                            # Mostrar información adicional del banco
+                                            if "p_id_banco" in banco:
+                                                logger.info(f"  ID Banco: {banco.get('p_id_banco')}")
+                                            elif "id_banco" in banco and "p_id_banco" not in banco:
+                                                logger.info(f"  ID Banco: {banco.get('id_banco')}")
+                                            if "codigo" in banco and banco.get("codigo"):
+                                                logger.info(f"  Codigo: {banco.get('codigo')}")
+                                            if "codigo_bcra" in banco and banco.get("codigo_bcra"):
+                                                logger.info(f"  Codigo BCRA: {banco.get('codigo_bcra')}")
+                                            if "descripcion" in banco and banco.get("descripcion"):
+                                                logger.info(f"  Descripcion: {banco.get('descripcion')}")
+                                            if "estado" in banco and banco.get("estado"):
+                                                logger.info(f"  Estado: {banco.get('estado')}")
+                                            if "activo" in banco and banco.get("activo") is not None:
+                                                logger.info(f"  Activo: {banco.get('activo')}")
+                                            if "fecha_creacion" in banco and banco.get("fecha_creacion"):
+                                                logger.info(f"  Fecha Creacion: {banco.get('fecha_creacion')}")
+                                            if "fecha_modificacion" in banco and banco.get("fecha_modificacion"):
+                                                logger.info(f"  Fecha Modificacion: {banco.get('fecha_modificacion')}")
                                     
                                     # Si hay más de 20 bancos, indicar cuántos más hay
                                     if cantidad_bancos > 20:
@@ -806,7 +802,7 @@ def get_bancos(client, logger, environment, data_module):
                                     return True  # Éxito
                                 else:
                                     response.failure("Los elementos no tienen campos reconocibles de bancos")
-                                    logger.warning(f"Estructura de datos no reconocida para parametros {params_a_probar}: {primer_elemento}")
+                                    logger.warning(f"Estructura de datos no reconocida para parametros {params_a_probar}: {errores}")
                                     return False
                             else:
                                 # Si no se encontraron bancos
@@ -830,13 +826,14 @@ def get_bancos(client, logger, environment, data_module):
                                     logger.info(f"Campos disponibles: {campos_disponibles}")
                                     
                                     # Mostrar algunos bancos
-                                    for idx, banco in enumerate(items[:10]):
-                                        if "p_nombre" in banco:
-                                            logger.info(f"Banco {idx+1}: {banco.get('p_nombre')}")
-                                        elif "nombre" in banco:
-                                            logger.info(f"Banco {idx+1}: {banco.get('nombre')}")
-                                        elif "p_id_banco" in banco:
-                                            logger.info(f"Banco {idx+1}: ID {banco.get('p_id_banco')}")
+                                    if logger.isEnabledFor(logging.INFO):
+                                        for idx, banco in enumerate(items[:10]):
+                                            if "p_nombre" in banco:
+                                                logger.info(f"Banco {idx+1}: {banco.get('p_nombre')}")
+                                            elif "nombre" in banco:
+                                                logger.info(f"Banco {idx+1}: {banco.get('nombre')}")
+                                            elif "p_id_banco" in banco:
+                                                logger.info(f"Banco {idx+1}: ID {banco.get('p_id_banco')}")
                                     
                                     data_module.bancos = response_data
                             
@@ -934,7 +931,7 @@ def get_banco_by_id(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida para ID {id_banco}: {response.text[:200]}...")
                     except:
                         logger.info(f"Respuesta recibida (no JSON) para ID {id_banco}: {response.text[:100]}...")
-                else:
+                elif logger.isEnabledFor(logging.INFO):
                     logger.info(f"Respuesta completa para ID {id_banco}: {response.text}")
                 
                 if response.status_code == 200:  # HTTP 200 OK
@@ -954,12 +951,9 @@ def get_banco_by_id(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                             
                             # Verificar si al menos tiene algunos campos básicos de banco
-                            tiene_campos_basicos = any(
-                                campo in response_data 
-                                for campo in ["p_id_banco", "p_nombre", "id_banco", "nombre", "id", "codigo"]
-                            )
+                            errores = validar("/bancos/{id}", response_data)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info(f"Consulta de banco por ID exitosa: {id_banco}")
                                 
@@ -999,7 +993,7 @@ def get_banco_by_id(client, logger, environment, data_module):
                                 return True  # Éxito
                             else:
                                 response.failure("El objeto no tiene campos reconocibles de banco")
-                                logger.warning(f"Estructura de datos no reconocida para ID {id_banco}: {response_data}")
+                                logger.warning(f"Estructura de datos no reconocida para ID {id_banco}: {errores}")
                                 return False
                         
                         elif isinstance(response_data, list):
@@ -1080,8 +1074,7 @@ def get_banco_by_id(client, logger, environment, data_module):
             resultados_exitosos += 1
         
         # Pequeña pausa entre requests para no sobrecargar el servidor
-        import time
-        time.sleep(0.1)
+        client.pause(0.1)
     
     # Registrar el resultado final
     logger.info(f"=== RESUMEN FINAL ===")
@@ -1121,7 +1114,7 @@ def get_profesiones(client, logger, environment, data_module):
                             logger.info(f"Respuesta recibida: {response.text[:100]}...")
                     except:
                         logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-                else:
+                elif logger.isEnabledFor(logging.INFO):
                     logger.info(f"Respuesta completa: {response.text}")
                 
                 if response.status_code == 200:  # HTTP 200 OK
@@ -1150,52 +1143,50 @@ def get_profesiones(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                                 
                                 # Verificar si al menos tiene algunos campos básicos de profesiones
-                                tiene_campos_basicos = any(
-                                    campo in primer_elemento 
-                                    for campo in ["p_id_profesion", "p_nombre", "id_profesion", "nombre", "id", "codigo"]
-                                )
+                                errores = validar("/profesiones", response_data)
                                 
-                                if tiene_campos_basicos:
+                                if not errores:
                                     response.success()
                                     logger.info(f"Consulta de profesiones exitosa con parametros: {params_a_probar}")
                                     
                                     # Mostrar información de las profesiones encontradas (hasta 20)
-                                    for idx, profesion in enumerate(response_data[:20]):
-                                        # Mostrar información relevante según los campos disponibles
-                                        if "p_nombre" in profesion:
-                                            logger.info(f"Profesion {idx+1}: {profesion.get('p_nombre')}")
-                                        elif "nombre" in profesion:
-                                            logger.info(f"Profesion {idx+1}: {profesion.get('nombre')}")
-                                        elif "p_id_profesion" in profesion:
-                                            logger.info(f"Profesion {idx+1}: ID {profesion.get('p_id_profesion')}")
-                                        elif "id_profesion" in profesion:
-                                            logger.info(f"Profesion {idx+1}: ID {profesion.get('id_profesion')}")
-                                        elif "id" in profesion:
-                                            logger.info(f"Profesion {idx+1}: ID {profesion.get('id')}")
-                                        else:
-                                            # Mostrar el primer campo que contenga información útil
-                                            for key, value in profesion.items():
-                                                if isinstance(value, str) and len(value) > 0:
-                                                    logger.info(f"Profesion {idx+1}: {key}={value}")
-                                                    break
+                                    if logger.isEnabledFor(logging.INFO):
+                                        for idx, profesion in enumerate(response_data[:20]):
+                                            # Mostrar información relevante según los campos disponibles
+                                            if "p_nombre" in profesion:
+                                                logger.info(f"Profesion {idx+1}: {profesion.get('p_nombre')}")
+                                            elif "nombre" in profesion:
+                                                logger.info(f"Profesion {idx+1}: {profesion.get('nombre')}")
+                                            elif "p_id_profesion" in profesion:
+                                                logger.info(f"Profesion {idx+1}: ID {profesion.get('p_id_profesion')}")
+                                            elif "id_profesion" in profesion:
+                                                logger.info(f"Profesion {idx+1}: ID {profesion.get('id_profesion')}")
+                                            elif "id" in profesion:
+                                                logger.info(f"Profesion {idx+1}: ID {profesion.get('id')}")
+                                            else:
+                                                # Mostrar el primer campo que contenga información útil
+                                                for key, value in profesion.items():
+                                                    if isinstance(value, str) and len(value) > 0:
+                                                        logger.info(f"Profesion {idx+1}: {key}={value}")
+                                                        break
                                         
-                                        # Mostrar información adicional de la profesión
-                                        if "p_id_profesion" in profesion:
-                                            logger.info(f"  ID Profesion: {profesion.get('p_id_profesion')}")
-                                        elif "id_profesion" in profesion and "p_id_profesion" not in profesion:
-                                            logger.info(f"  ID Profesion: {profesion.get('id_profesion')}")
-                                        if "codigo" in profesion and profesion.get("codigo"):
-                                            logger.info(f"  Codigo: {profesion.get('codigo')}")
-                                        if "descripcion" in profesion and profesion.get("descripcion"):
-                                            logger.info(f"  Descripcion: {profesion.get('descripcion')}")
-                                        if "estado" in profesion and profesion.get("estado"):
-                                            logger.info(f"  Estado: {profesion.get('estado')}")
-                                        if "activo" in profesion and profesion.get("activo") is not None:
-                                            logger.info(f"  Activo: {profesion.get('activo')}")
-                                        if "fecha_creacion" in profesion and profesion.get("fecha_creacion"):
-                                            logger.info(f"  Fecha Creacion: {profesion.get('fecha_creacion')}")
-                                        if "fecha_modificacion" in profesion and profesion.get("fecha_modificacion"):
-                                            logger.info(f"  Fecha Modificacion: {profesion.get('fecha_modificacion')}")
+                                            # Mostrar información adicional de la profesión
+                                            if "p_id_profesion" in profesion:
+                                                logger.info(f"  ID Profesion: {profesion.get('p_id_profesion')}")
+                                            elif "id_profesion" in profesion and "p_id_profesion" not in profesion:
+                                                logger.info(f"  ID Profesion: {profesion.get('id_profesion')}")
+                                            if "codigo" in profesion and profesion.get("codigo"):
+                                                logger.info(f"  Codigo: {profesion.get('codigo')}")
+                                            if "descripcion" in profesion and profesion.get("descripcion"):
+                                                logger.info(f"  Descripcion: {profesion.get('descripcion')}")
+                                            if "estado" in profesion and profesion.get("estado"):
+                                                logger.info(f"  Estado: {profesion.get('estado')}")
+                                            if "activo" in profesion and profesion.get("activo") is not None:
+                                                logger.info(f"  Activo: {profesion.get('activo')}")
+                                            if "fecha_creacion" in profesion and profesion.get("fecha_creacion"):
+                                                logger.info(f"  Fecha Creacion: {profesion.get('fecha_creacion')}")
+                                            if "fecha_modificacion" in profesion and profesion.get("fecha_modificacion"):
+                                                logger.info(f"  Fecha Modificacion: {profesion.get('fecha_modificacion')}")
                                     
                                     # Si hay más de 20 profesiones, indicar cuántos más hay
                                     if cantidad_profesiones > 20:
@@ -1233,7 +1224,7 @@ def get_profesiones(client, logger, environment, data_module):
                                     return True  # Éxito
                                 else:
                                     response.failure("Los elementos no tienen campos reconocibles de profesiones")
-                                    logger.warning(f"Estructura de datos no reconocida para parametros {params_a_probar}: {primer_elemento}")
+                                    logger.warning(f"Estructura de datos no reconocida para parametros {params_a_probar}: {errores}")
                                     return False
                             else:
                                 # Si no se encontraron profesiones
@@ -1257,13 +1248,14 @@ def get_profesiones(client, logger, environment, data_module):
                                     logger.info(f"Campos disponibles: {campos_disponibles}")
                                     
                                     # Mostrar algunas profesiones
-                                    for idx, profesion in enumerate(items[:10]):
-                                        if "p_nombre" in profesion:
-                                            logger.info(f"Profesion {idx+1}: {profesion.get('p_nombre')}")
-                                        elif "nombre" in profesion:
-                                            logger.info(f"Profesion {idx+1}: {profesion.get('nombre')}")
-                                        elif "p_id_profesion" in profesion:
-                                            logger.info(f"Profesion {idx+1}: ID {profesion.get('p_id_profesion')}")
+                                    if logger.isEnabledFor(logging.INFO):
+                                        for idx, profesion in enumerate(items[:10]):
+                                            if "p_nombre" in profesion:
+                                                logger.info(f"Profesion {idx+1}: {profesion.get('p_nombre')}")
+                                            elif "nombre" in profesion:
+                                                logger.info(f"Profesion {idx+1}: {profesion.get('nombre')}")
+                                            elif "p_id_profesion" in profesion:
+                                                logger.info(f"Profesion {idx+1}: ID {profesion.get('p_id_profesion')}")
                                     
                                     data_module.profesiones = response_data
                             
@@ -1360,7 +1352,7 @@ def get_profesion_by_id(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida para ID {id_profesion}: {response.text[:200]}...")
                     except:
                         logger.info(f"Respuesta recibida (no JSON) para ID {id_profesion}: {response.text[:100]}...")
-                else:
+                elif logger.isEnabledFor(logging.INFO):
                     logger.info(f"Respuesta completa para ID {id_profesion}: {response.text}")
                 
                 if response.status_code == 200:  # HTTP 200 OK
@@ -1380,12 +1372,9 @@ def get_profesion_by_id(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                             
                             # Verificar si al menos tiene algunos campos básicos de profesión
-                            tiene_campos_basicos = any(
-                                campo in response_data 
-                                for campo in ["p_id_profesion", "p_nombre", "id_profesion", "nombre", "id", "codigo"]
-                            )
+                            errores = validar("/profesiones/{id}", response_data)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info(f"Consulta de profesion por ID exitosa: {id_profesion}")
                                 
@@ -1423,7 +1412,7 @@ def get_profesion_by_id(client, logger, environment, data_module):
                                 return True  # Éxito
                             else:
                                 response.failure("El objeto no tiene campos reconocibles de profesión")
-                                logger.warning(f"Estructura de datos no reconocida para ID {id_profesion}: {response_data}")
+                                logger.warning(f"Estructura de datos no reconocida para ID {id_profesion}: {errores}")
                                 return False
                         
                         elif isinstance(response_data, list):
@@ -1504,8 +1493,7 @@ def get_profesion_by_id(client, logger, environment, data_module):
             resultados_exitosos += 1
         
         # Pequeña pausa entre requests para no sobrecargar el servidor
-        import time
-        time.sleep(0.1)
+        client.pause(0.1)
     
     # Registrar el resultado final
     logger.info(f"=== RESUMEN FINAL ===")
@@ -1541,7 +1529,7 @@ def put_medios_pagos(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:200]}...")
                     except:
                         logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-                else:
+                elif logger.isEnabledFor(logging.INFO):
                     logger.info(f"Respuesta completa: {response.text}")
                 
                 if response.status_code in [200, 201]:  # HTTP 200 OK o 201 CREATED
@@ -1562,12 +1550,9 @@ def put_medios_pagos(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                             
                             # Verificar si al menos tiene algunos campos básicos de respuesta
-                            tiene_campos_basicos = any(
-                                campo in response_data 
-                                for campo in ["id_medio_pago", "p_nombre", "nombre", "id", "id_sistema_permisionados"]
-                            )
+                            errores = validar("/medios_pagos", response_data)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 
                                 if response.status_code == 201:
@@ -1605,7 +1590,7 @@ def put_medios_pagos(client, logger, environment, data_module):
                                 return True  # Éxito
                             else:
                                 response.failure("El objeto no tiene campos reconocibles de medio de pago")
-                                logger.warning(f"Estructura de datos no reconocida: {response_data}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                                 return False
                         else:
                             response.failure("Formato de respuesta inesperado")
@@ -1670,8 +1655,7 @@ def put_medios_pagos(client, logger, environment, data_module):
             resultados_exitosos += 1
         
         # Pequeña pausa entre requests para no sobrecargar el servidor
-        import time
-        time.sleep(0.2)
+        client.pause(0.2)
     
     # Registrar el resultado final
     logger.info(f"=== RESUMEN FINAL ===")
@@ -1710,7 +1694,7 @@ def get_dispositivos_pagos(client, logger, environment, data_module):
                             logger.info(f"Respuesta recibida: {response.text[:100]}...")
                     except:
                         logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-                else:
+                elif logger.isEnabledFor(logging.INFO):
                     logger.info(f"Respuesta completa: {response.text}")
                 
                 if response.status_code == 200:  # HTTP 200 OK
@@ -1739,50 +1723,48 @@ def get_dispositivos_pagos(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                                 
                                 # Verificar si al menos tiene algunos campos básicos de dispositivos de pago
-                                tiene_campos_basicos = any(
-                                    campo in primer_elemento 
-                                    for campo in ["id_dispositivo_pago", "nombre", "id", "descripcion", "codigo", "estado", "tipo", "activo"]
-                                )
+                                errores = validar("/dispositivos_pagos", response_data)
                                 
-                                if tiene_campos_basicos:
+                                if not errores:
                                     response.success()
                                     logger.info(f"Consulta de dispositivos de pago exitosa con parametros: {params_a_probar}")
                                     
                                     # Mostrar información de los dispositivos de pago encontrados (hasta 10)
-                                    for idx, dispositivo in enumerate(response_data[:10]):
-                                        # Mostrar información relevante según los campos disponibles
-                                        if "nombre" in dispositivo:
-                                            logger.info(f"Dispositivo de Pago {idx+1}: {dispositivo.get('nombre')}")
-                                        elif "id_dispositivo_pago" in dispositivo:
-                                            logger.info(f"Dispositivo de Pago {idx+1}: ID {dispositivo.get('id_dispositivo_pago')}")
-                                        elif "id" in dispositivo:
-                                            logger.info(f"Dispositivo de Pago {idx+1}: ID {dispositivo.get('id')}")
-                                        else:
-                                            # Mostrar el primer campo que contenga información útil
-                                            for key, value in dispositivo.items():
-                                                if isinstance(value, str) and len(value) > 0:
-                                                    logger.info(f"Dispositivo de Pago {idx+1}: {key}={value}")
-                                                    break
+                                    if logger.isEnabledFor(logging.INFO):
+                                        for idx, dispositivo in enumerate(response_data[:10]):
+                                            # Mostrar información relevante según los campos disponibles
+                                            if "nombre" in dispositivo:
+                                                logger.info(f"Dispositivo de Pago {idx+1}: {dispositivo.get('nombre')}")
+                                            elif "id_dispositivo_pago" in dispositivo:
+                                                logger.info(f"Dispositivo de Pago {idx+1}: ID {dispositivo.get('id_dispositivo_pago')}")
+                                            elif "id" in dispositivo:
+                                                logger.info(f"Dispositivo de Pago {idx+1}: ID {dispositivo.get('id')}")
+                                            else:
+                                                # Mostrar el primer campo que contenga información útil
+                                                for key, value in dispositivo.items():
+                                                    if isinstance(value, str) and len(value) > 0:
+                                                        logger.info(f"Dispositivo de Pago {idx+1}: {key}={value}")
+                                                        break
                                         
-                                        # Mostrar información adicional del dispositivo de pago
-                                        if "id_dispositivo_pago" in dispositivo:
-                                            logger.info(f"  ID Dispositivo Pago: {dispositivo.get('id_dispositivo_pago')}")
-                                        if "descripcion" in dispositivo and dispositivo.get("descripcion"):
-                                            logger.info(f"  Descripcion: {dispositivo.get('descripcion')}")
-                                        if "codigo" in dispositivo and dispositivo.get("codigo"):
-                                            logger.info(f"  Codigo: {dispositivo.get('codigo')}")
-                                        if "estado" in dispositivo and dispositivo.get("estado"):
-                                            logger.info(f"  Estado: {dispositivo.get('estado')}")
-                                        if "activo" in dispositivo and dispositivo.get("activo") is not None:
-                                            logger.info(f"  Activo: {dispositivo.get('activo')}")
-                                        if "tipo" in dispositivo and dispositivo.get("tipo"):
-                                            logger.info(f"  Tipo: {dispositivo.get('tipo')}")
-                                        if "observaciones" in dispositivo and dispositivo.get("observaciones"):
-                                            logger.info(f"  Observaciones: {dispositivo.get('observaciones')}")
-                                        if "fecha_creacion" in dispositivo and dispositivo.get("fecha_creacion"):
-                                            logger.info(f"  Fecha Creacion: {dispositivo.get('fecha_creacion')}")
-                                        if "fecha_modificacion" in dispositivo and dispositivo.get("fecha_modificacion"):
-                                            logger.info(f"  Fecha Modificacion: {dispositivo.get('fecha_modificacion')}")
+                                            # Mostrar información adicional del dispositivo de pago
+                                            if "id_dispositivo_pago" in dispositivo:
+                                                logger.info(f"  ID Dispositivo Pago: {dispositivo.get('id_dispositivo_pago')}")
+                                            if "descripcion" in dispositivo and dispositivo.get("descripcion"):
+                                                logger.info(f"  Descripcion: {dispositivo.get('descripcion')}")
+                                            if "codigo" in dispositivo and dispositivo.get("codigo"):
+                                                logger.info(f"  Codigo: {dispositivo.get('codigo')}")
+                                            if "estado" in dispositivo and dispositivo.get("estado"):
+                                                logger.info(f"  Estado: {dispositivo.get('estado')}")
+                                            if "activo" in dispositivo and dispositivo.get("activo") is not None:
+                                                logger.info(f"  Activo: {dispositivo.get('activo')}")
+                                            if "tipo" in dispositivo and dispositivo.get("tipo"):
+                                                logger.info(f"  Tipo: {dispositivo.get('tipo')}")
+                                            if "observaciones" in dispositivo and dispositivo.get("observaciones"):
+                                                logger.info(f"  Observaciones: {dispositivo.get('observaciones')}")
+                                            if "fecha_creacion" in dispositivo and dispositivo.get("fecha_creacion"):
+                                                logger.info(f"  Fecha Creacion: {dispositivo.get('fecha_creacion')}")
+                                            if "fecha_modificacion" in dispositivo and dispositivo.get("fecha_modificacion"):
+                                                logger.info(f"  Fecha Modificacion: {dispositivo.get('fecha_modificacion')}")
                                     
                                     # Si hay más de 10 dispositivos, indicar cuántos más hay
                                     if cantidad_dispositivos > 10:
@@ -1817,7 +1799,7 @@ def get_dispositivos_pagos(client, logger, environment, data_module):
                                     return True  # Éxito
                                 else:
                                     response.failure("Los elementos no tienen campos reconocibles de dispositivos de pago")
-                                    logger.warning(f"Estructura de datos no reconocida para parametros {params_a_probar}: {primer_elemento}")
+                                    logger.warning(f"Estructura de datos no reconocida para parametros {params_a_probar}: {errores}")
                                     return False
                             else:
                                 # Si no se encontraron dispositivos de pago
@@ -1841,11 +1823,12 @@ def get_dispositivos_pagos(client, logger, environment, data_module):
                                     logger.info(f"Campos disponibles: {campos_disponibles}")
                                     
                                     # Mostrar algunos dispositivos de pago
-                                    for idx, dispositivo in enumerate(items[:5]):
-                                        if "nombre" in dispositivo:
-                                            logger.info(f"Dispositivo de Pago {idx+1}: {dispositivo.get('nombre')}")
-                                        elif "id" in dispositivo:
-                                            logger.info(f"Dispositivo de Pago {idx+1}: ID {dispositivo.get('id')}")
+                                    if logger.isEnabledFor(logging.INFO):
+                                        for idx, dispositivo in enumerate(items[:5]):
+                                            if "nombre" in dispositivo:
+                                                logger.info(f"Dispositivo de Pago {idx+1}: {dispositivo.get('nombre')}")
+                                            elif "id" in dispositivo:
+                                                logger.info(f"Dispositivo de Pago {idx+1}: ID {dispositivo.get('id')}")
                                     
                                     data_module.dispositivos_pagos = response_data
                             
@@ -1946,7 +1929,7 @@ def get_actividades(client, logger, environment, data_module):
                             logger.info(f"Respuesta recibida: {response.text[:100]}...")
                     except:
                         logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-                else:
+                elif logger.isEnabledFor(logging.INFO):
                     logger.info(f"Respuesta completa: {response.text}")
                 
                 if response.status_code == 200:  # HTTP 200 OK
@@ -1976,66 +1959,63 @@ def get_actividades(client, logger, environment, data_module):
                                 
                                 # Verificar si al menos tiene algunos campos básicos de actividades
                                 # CORREGIDO: Agregamos los campos con prefijo 'p_'
-                                tiene_campos_basicos = any(
-                                    campo in primer_elemento 
-                                    for campo in ["id_actividad", "nombre", "id", "descripcion", "codigo", "estado", "activo",
-                                                "p_id_actividad", "p_nombre", "p_codigo_afip", "p_descripcion"]
-                                )
+                                errores = validar("/actividades", response_data)
                                 
-                                if tiene_campos_basicos:
+                                if not errores:
                                     response.success()
                                     logger.info(f"Consulta de actividades exitosa con parametros: {params_a_probar}")
                                     
                                     # Mostrar información de las actividades encontradas (hasta 15)
-                                    for idx, actividad in enumerate(response_data[:15]):
-                                        # Mostrar información relevante según los campos disponibles
-                                        # CORREGIDO: Agregamos soporte para campos con prefijo 'p_'
-                                        if "p_nombre" in actividad:
-                                            logger.info(f"Actividad {idx+1}: {actividad.get('p_nombre')}")
-                                        elif "nombre" in actividad:
-                                            logger.info(f"Actividad {idx+1}: {actividad.get('nombre')}")
-                                        elif "p_id_actividad" in actividad:
-                                            logger.info(f"Actividad {idx+1}: ID {actividad.get('p_id_actividad')}")
-                                        elif "id_actividad" in actividad:
-                                            logger.info(f"Actividad {idx+1}: ID {actividad.get('id_actividad')}")
-                                        elif "id" in actividad:
-                                            logger.info(f"Actividad {idx+1}: ID {actividad.get('id')}")
-                                        else:
-                                            # Mostrar el primer campo que contenga información útil
-                                            for key, value in actividad.items():
-                                                if isinstance(value, str) and len(value) > 0:
-                                                    logger.info(f"Actividad {idx+1}: {key}={value}")
-                                                    break
+                                    if logger.isEnabledFor(logging.INFO):
+                                        for idx, actividad in enumerate(response_data[:15]):
+                                            # Mostrar información relevante según los campos disponibles
+                                            # CORREGIDO: Agregamos soporte para campos con prefijo 'p_'
+                                            if "p_nombre" in actividad:
+                                                logger.info(f"Actividad {idx+1}: {actividad.get('p_nombre')}")
+                                            elif "nombre" in actividad:
+                                                logger.info(f"Actividad {idx+1}: {actividad.get('nombre')}")
+                                            elif "p_id_actividad" in actividad:
+                                                logger.info(f"Actividad {idx+1}: ID {actividad.get('p_id_actividad')}")
+                                            elif "id_actividad" in actividad:
+                                                logger.info(f"Actividad {idx+1}: ID {actividad.get('id_actividad')}")
+                                            elif "id" in actividad:
+                                                logger.info(f"Actividad {idx+1}: ID {actividad.get('id')}")
+                                            else:
+                                                # Mostrar el primer campo que contenga información útil
+                                                for key, value in actividad.items():
+                                                    if isinstance(value, str) and len(value) > 0:
+                                                        logger.info(f"Actividad {idx+1}: {key}={value}")
+                                                        break
                                         
-                                        # Mostrar información adicional de la actividad
-                                        # CORREGIDO: Agregamos soporte para campos con prefijo 'p_'
-                                        if "p_id_actividad" in actividad:
-                                            logger.info(f"  ID Actividad: {actividad.get('p_id_actividad')}")
-                                        elif "id_actividad" in actividad:
-                                            logger.info(f"  ID Actividad: {actividad.get('id_actividad')}")
+                                            # Mostrar información adicional de la actividad
+                                            # CORREGIDO: Agregamos soporte para campos con prefijo 'p_'
+                                            if "p_id_actividad" in actividad:
+                                                logger.info(f"  ID Actividad: {actividad.get('p_id_actividad')}")
+                                            elif "id_actividad" in actividad:
+                                                logger.info(f"  ID Actividad: {actividad.get('id_actividad')}")
                                         
-                                        if "p_codigo_afip" in actividad and actividad.get("p_codigo_afip"):
-                                            logger.info(f"  Codigo AFIP: {actividad.get('p_codigo_afip')}")
-                                        elif "codigo" in actividad and actividad.get("codigo"):
-                                            logger.info(f"  Codigo: {actividad.get('codigo')}")
+                                            if "p_codigo_afip" in actividad and actividad.get("p_codigo_afip"):
+                                                logger.info(f"  Codigo AFIP: {actividad.get('p_codigo_afip')}")
+                                            elif "codigo" in actividad and actividad.get("codigo"):
+                                                logger.info(f"  Codigo: {actividad.get('codigo')}")
                                         
-                                        if "p_descripcion" in actividad and actividad.get("p_descripcion"):
-                                            logger.info(f"  Descripcion: {actividad.get('p_descripcion')}")
-                                        elif "descripcion" in actividad and actividad.get("descripcion"):
-                                            logger.info(f"  Descripcion: {actividad.get('descripcion')}")
+                                            if "p_descripcion" in actividad and actividad.get("p_descripcion"):
+                                                logger.info(f"  Descripcion: {actividad.get('p_descripcion')}")
+                                            elif "descripcion" in actividad and actividad.get("descripcion"):
+                                                logger.info(f"  Descripcion: {actividad.get('descripcion')}")
                                         
-                                        if "estado" in actividad and actividad.get("estado"):
-                                            logger.info(f"  Estado: {actividad.get('estado')}")
-                                        if "activo" in actividad and actividad.get("activo") is not None:
-                                            logger.info(f"  Activo: {actividad.get('activo')}")
-                                        if "categoria" in actividad and actividad.get("categoria"):
-                                            logger.info(f"  Categoria: {actividad.get('categoria')}")
-                                        if "tipo" in actividad and actividad.get("tipo"):
-                                            logger.info(f"  Tipo: {actividad.get('tipo')}")
-                                        if "fecha_creacion" in actividad and actividad.get("fecha_creacion"):
-                                            logger.info(f"  Fecha Creacion: {actividad.get('fecha_creacion')}")
-                                        if "fecha_modificacion" in actividad and actividad.get("fecha_modificacion"):
-                                            logger.info(f"  Fecha Modificacion: {actividad.get('fecha_modificacion')}")
+                                            if "estado" in actividad and actividad.get("estado"):
+                                                logger.info(f"  Estado: {actividad.get('estado')}")
+                                            if "activo" in actividad and actividad.get("activo") is not None:
+                                                logger.info(f"  Activo: {actividad.get('activo')}")
+                                            if "categoria" in actividad and actividad.get("categoria"):
+                                                logger.info(f"  Categoria: {actividad.get('categoria')}")
+                                            if "tipo" in actividad and actividad.get("tipo"):
+                                                logger.info(f"  Tipo: {actividad.get('tipo')}")
+                                            if "fecha_creacion" in actividad and actividad.get("fecha_creacion"):
+                                                logger.info(f"  Fecha Creacion: {actividad.get('fecha_creacion')}")
+                                            if "fecha_modificacion" in actividad and actividad.get("fecha_modificacion"):
+                                                logger.info(f"  Fecha Modificacion: {actividad.get('fecha_modificacion')}")
                                     
                                     # Si hay más de 15 actividades, indicar cuántos más hay
                                     if cantidad_actividades > 15:
@@ -2070,7 +2050,7 @@ def get_actividades(client, logger, environment, data_module):
                                     return True  # Éxito
                                 else:
                                     response.failure("Los elementos no tienen campos reconocibles de actividades")
-                                    logger.warning(f"Estructura de datos no reconocida para parametros {params_a_probar}: {primer_elemento}")
+                                    logger.warning(f"Estructura de datos no reconocida para parametros {params_a_probar}: {errores}")
                                     return False
                             else:
                                 # Si no se encontraron actividades
@@ -2094,15 +2074,16 @@ def get_actividades(client, logger, environment, data_module):
                                     logger.info(f"Campos disponibles: {campos_disponibles}")
                                     
                                     # Mostrar algunas actividades
-                                    for idx, actividad in enumerate(items[:10]):
-                                        if "p_nombre" in actividad:
-                                            logger.info(f"Actividad {idx+1}: {actividad.get('p_nombre')}")
-                                        elif "nombre" in actividad:
-                                            logger.info(f"Actividad {idx+1}: {actividad.get('nombre')}")
-                                        elif "p_id_actividad" in actividad:
-                                            logger.info(f"Actividad {idx+1}: ID {actividad.get('p_id_actividad')}")
-                                        elif "id" in actividad:
-                                            logger.info(f"Actividad {idx+1}: ID {actividad.get('id')}")
+                                    if logger.isEnabledFor(logging.INFO):
+                                        for idx, actividad in enumerate(items[:10]):
+                                            if "p_nombre" in actividad:
+                                                logger.info(f"Actividad {idx+1}: {actividad.get('p_nombre')}")
+                                            elif "nombre" in actividad:
+                                                logger.info(f"Actividad {idx+1}: {actividad.get('nombre')}")
+                                            elif "p_id_actividad" in actividad:
+                                                logger.info(f"Actividad {idx+1}: ID {actividad.get('p_id_actividad')}")
+                                            elif "id" in actividad:
+                                                logger.info(f"Actividad {idx+1}: ID {actividad.get('id')}")
                                     
                                     data_module.actividades = response_data
                             
@@ -2173,8 +2154,7 @@ def get_actividades(client, logger, environment, data_module):
             resultados_exitosos += 1
         
         # Pequeña pausa entre requests para no sobrecargar el servidor
-        import time
-        time.sleep(0.1)
+        client.pause(0.1)
     
     # Registrar el resultado final
     logger.info(f"=== RESUMEN FINAL ===")
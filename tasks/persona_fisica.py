@@ -1,7 +1,11 @@
 import random
 import datetime
+import logging
 from typing import Dict, Any
 
+from locust.exception import CatchResponseError
+from utils.http import report_failure
+
 def insert_or_update_persona_fisica(client, logger, environment, data_module):
     """Prueba el endpoint de insertar o actualizar una persona física"""
     
@@ -9,14 +13,8 @@ def insert_or_update_persona_fisica(client, logger, environment, data_module):
     if not hasattr(data_module, 'body_insertar_persona_fisica'):
         logger.error("No hay datos para insertar persona física en el módulo de datos.")
         
-        # Registrar un error explícito usando catch_response
-        with client.post(
-            "/personas-fisicas", 
-            json={"error": "sin_datos"},
-            catch_response=True,
-            name="(PERSONAS FISICAS) - /personas-fisicas [Sin datos]"
-        ) as response:
-            response.failure("No hay datos definidos en body_insertar_persona_fisica")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "POST", "(PERSONAS FISICAS) - /personas-fisicas [Sin datos]", CatchResponseError("No hay datos definidos en body_insertar_persona_fisica"))
         return
     
     # Usar los datos específicos del archivo clon_persona_fisica.py
@@ -32,7 +30,8 @@ def insert_or_update_persona_fisica(client, logger, environment, data_module):
             name="(PERSONAS FISICAS) - /personas-fisicas [POST]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 201:  # HTTP 201 Created
                 try:
@@ -101,12 +100,7 @@ def insert_or_update_persona_fisica(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante inserción/actualización de persona física: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="POST",
-            name="(PERSONAS FISICAS) - /personas-fisicas/by-dni",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "POST", "(PERSONAS FISICAS) - /personas-fisicas/by-dni", e)
 
 def insert_or_update_persona_fisica_by_dni(client, logger, environment, data_module):
     """Prueba el endpoint de insertar o actualizar una persona física por DNI"""
@@ -115,14 +109,8 @@ def insert_or_update_persona_fisica_by_dni(client, logger, environment, data_mod
     if not hasattr(data_module, 'body_insertar_persona_fisica_by_dni'):
         logger.error("No hay datos para insertar persona física por DNI en el módulo de datos.")
         
-        # Registrar un error explícito usando catch_response
-        with client.post(
-            "/by-dni", 
-            json={"error": "sin_datos"},
-            catch_response=True,
-            name="(PERSONAS FISICAS) - /by-dni [Sin datos]"
-        ) as response:
-            response.failure("No hay datos definidos en body_insertar_persona_fisica_by_dni")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "POST", "(PERSONAS FISICAS) - /by-dni [Sin datos]", CatchResponseError("No hay datos definidos en body_insertar_persona_fisica_by_dni"))
         return
     
     # Usar los datos específicos del archivo de datos
@@ -138,7 +126,8 @@ def insert_or_update_persona_fisica_by_dni(client, logger, environment, data_mod
             name="(PERSONAS FISICAS) - /personas-fisicas/by-dni [POST]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 201:  # HTTP 201 Created
                 try:
@@ -207,12 +196,7 @@ def insert_or_update_persona_fisica_by_dni(client, logger, environment, data_mod
     except Exception as e:
         logger.error(f"Excepción durante inserción/actualización de persona física por DNI: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="POST",
-            name="(PERSONAS FISICAS) - /by-dni",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "POST", "(PERSONAS FISICAS) - /by-dni", e)
 
 def insert_or_update_persona_fisica_simplificada(client, logger, environment, data_module):
     """Prueba el endpoint de insertar o actualizar una persona física de forma simplificada"""
@@ -221,14 +205,8 @@ def insert_or_update_persona_fisica_simplificada(client, logger, environment, da
     if not hasattr(data_module, 'body_insertar_persona_fisica_simplificada'):
         logger.error("No hay datos para insertar persona física simplificada en el módulo de datos.")
         
-        # Registrar un error explícito usando catch_response
-        with client.put(
-            "/personas-fisicas/simplificado", 
-            json={"error": "sin_datos"},
-            catch_response=True,
-            name="(PERSONAS FISICAS) - /personas-fisicas/simplificado [Sin datos]"
-        ) as response:
-            response.failure("No hay datos definidos en body_insertar_persona_fisica_simplificada")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "PUT", "(PERSONAS FISICAS) - /personas-fisicas/simplificado [Sin datos]", CatchResponseError("No hay datos definidos en body_insertar_persona_fisica_simplificada"))
         return
     
     # Usar los datos específicos del archivo de datos
@@ -244,7 +222,8 @@ def insert_or_update_persona_fisica_simplificada(client, logger, environment, da
             name="(PERSONAS FISICAS) - /personas-fisicas/simplificado [PUT]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code in [200, 201]:  # HTTP 200 OK o 201 Created
                 try:
@@ -313,12 +292,7 @@ def insert_or_update_persona_fisica_simplificada(client, logger, environment, da
     except Exception as e:
         logger.error(f"Excepción durante inserción/actualización de persona física simplificada: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="PUT",
-            name="(PERSONAS FISICAS) - /personas-fisicas/simplificado",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "PUT", "(PERSONAS FISICAS) - /personas-fisicas/simplificado", e)
 
 
 # def insert_or_update_persona_fisica_simplificada(client, logger, environment, data_module):
@@ -524,14 +498,8 @@ def get_personas_fisicas(client, logger, environment, data_module):
     if not hasattr(data_module, 'parametros_consulta_persona_fisica') or not data_module.parametros_consulta_persona_fisica:
         logger.error("No hay parámetros para consultar persona física en el módulo de datos.")
         
-        # Registrar un error explícito usando catch_response
-        with client.get(
-            "/personas-fisicas", 
-            params={"error": "sin_datos"},
-            catch_response=True,
-            name="(PERSONAS FISICAS) - /personas-fisicas [Sin datos]"
-        ) as response:
-            response.failure("No hay parámetros definidos en parametros_consulta_persona_fisica")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "GET", "(PERSONAS FISICAS) - /personas-fisicas [Sin datos]", CatchResponseError("No hay parámetros definidos en parametros_consulta_persona_fisica"))
         return
     
     # Seleccionar un conjunto de parámetros aleatorio
@@ -578,7 +546,8 @@ def get_personas_fisicas(client, logger, environment, data_module):
             name="(PERSONAS FISICAS) - /personas-fisicas [GET]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
                 try:
@@ -652,12 +621,7 @@ def get_personas_fisicas(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de persona física: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name="(PERSONAS FISICAS) - /personas-fisicas",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", "(PERSONAS FISICAS) - /personas-fisicas", e)
 
 def insert_domicilio_persona_fisica(client, logger, environment, data_module):
     """Prueba el endpoint de insertar un domicilio para una persona física"""
@@ -666,28 +630,14 @@ def insert_domicilio_persona_fisica(client, logger, environment, data_module):
     if not hasattr(data_module, 'body_insertar_domicilio_persona_fisica'):
         logger.error("No hay datos para insertar domicilio de persona física en el módulo de datos.")
         
-        # Registrar un error explícito usando catch_response
-        with client.post(
-            "/personas-fisicas/domicilios", 
-            json={"error": "sin_datos"},
-            catch_response=True,
-            name="(PERSONAS FISICAS) - /personas-fisicas/domicilios [Sin datos]"
-        ) as response:
-            response.failure("No hay datos definidos en body_insertar_domicilio_persona_fisica")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "POST", "(PERSONAS FISICAS) - /personas-fisicas/domicilios [Sin datos]", CatchResponseError("No hay datos definidos en body_insertar_domicilio_persona_fisica"))
         return
     
-    # Verificar si tenemos un ID de persona física para usar
+    # Verificar si tenemos un ID de persona física para usar; sin él no se
+    # envía nada (la escritura depende de insert_or_update_persona_fisica)
     if not hasattr(data_module, 'id_persona_fisica') or not data_module.id_persona_fisica:
-        logger.error("No hay ID de persona física disponible para asociar el domicilio.")
-        
-        # Registrar un error explícito usando catch_response
-        with client.post(
-            "/personas-fisicas/domicilios", 
-            json={"error": "sin_id_persona_fisica"},
-            catch_response=True,
-            name="(PERSONAS FISICAS) - /personas-fisicas/domicilios [Sin ID persona física]"
-        ) as response:
-            response.failure("No hay ID de persona física disponible para asociar el domicilio")
+        logger.warning("No hay ID de persona física disponible para asociar el domicilio; se omite el request.")
         return
     
     # Crear una copia de los datos para no modificar el original
@@ -707,7 +657,8 @@ def insert_domicilio_persona_fisica(client, logger, environment, data_module):
             name="(PERSONAS FISICAS) - /personas-fisicas/domicilios [POST]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 201:  # HTTP 201 Created
                 try:
@@ -803,12 +754,7 @@ def insert_domicilio_persona_fisica(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante inserción de domicilio para persona física: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="POST",
-            name="(PERSONAS FISICAS) - /personas-fisicas/domicilios",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "POST", "(PERSONAS FISICAS) - /personas-fisicas/domicilios", e)
 
 
 def get_comunicaciones_personas(client, logger, environment, data_module):
@@ -818,14 +764,8 @@ def get_comunicaciones_personas(client, logger, environment, data_module):
     if not hasattr(data_module, 'parametros_consulta_comunicaciones') or not data_module.parametros_consulta_comunicaciones:
         logger.error("No hay parámetros para consultar comunicaciones de personas en el módulo de datos.")
         
-        # Registrar un error explícito usando catch_response
-        with client.get(
-            "/comunicaciones/personas", 
-            params={"error": "sin_datos"},
-            catch_response=True,
-            name="(PERSONAS FISICAS) - /comunicaciones/personas [Sin datos]"
-        ) as response:
-            response.failure("No hay parámetros definidos en parametros_consulta_comunicaciones")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "GET", "(PERSONAS FISICAS) - /comunicaciones/personas [Sin datos]", CatchResponseError("No hay parámetros definidos en parametros_consulta_comunicaciones"))
         return
     
     # Seleccionar un conjunto de parámetros aleatorio
@@ -842,7 +782,8 @@ def get_comunicaciones_personas(client, logger, environment, data_module):
             name="(PERSONAS FISICAS) - /comunicaciones/personas [GET]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
                 try:
@@ -921,12 +862,7 @@ def get_comunicaciones_personas(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de comunicaciones de personas: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name="(PERSONAS FISICAS) - /comunicaciones/personas",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", "(PERSONAS FISICAS) - /comunicaciones/personas", e)
 
 def insert_comunicaciones_personas(client, logger, environment, data_module):
     """Prueba el endpoint de insertar comunicaciones de personas"""
@@ -935,14 +871,8 @@ def insert_comunicaciones_personas(client, logger, environment, data_module):
     if not hasattr(data_module, 'body_insertar_comunicaciones_personas') or not data_module.body_insertar_comunicaciones_personas:
         logger.error("No hay datos para insertar comunicaciones de personas en el módulo de datos.")
         
-        # Registrar un error explícito usando catch_response
-        with client.post(
-            "/comunicaciones/personas", 
-            json={"error": "sin_datos"},
-            catch_response=True,
-            name="(PERSONAS FISICAS) - /comunicaciones/personas [Sin datos]"
-        ) as response:
-            response.failure("No hay datos definidos en body_insertar_comunicaciones_personas")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "POST", "(PERSONAS FISICAS) - /comunicaciones/personas [Sin datos]", CatchResponseError("No hay datos definidos en body_insertar_comunicaciones_personas"))
         return
     
     # Seleccionar un conjunto de datos aleatorio
@@ -958,7 +888,8 @@ def insert_comunicaciones_personas(client, logger, environment, data_module):
             name="(PERSONAS FISICAS) - /comunicaciones/personas [POST]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 201:  # HTTP 201 Created
                 try:
@@ -1028,9 +959,4 @@ def insert_comunicaciones_personas(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante inserción de comunicaciones: {str(e)}")
         # Registrar el error como una respuesta fallida
-        environment.events.request_failure.fire(
-            request_type="POST",
-            name=" (PERSONAS FISICAS) - /personas-fisicas",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "POST", " (PERSONAS FISICAS) - /personas-fisicas", e)
@@ -1,6 +1,9 @@
 import random
 import copy
 
+from locust.exception import CatchResponseError
+from utils.http import report_failure
+
 def get_persona_juridica(client, logger, environment, sample_cuits):
     """Prueba el endpoint de obtener persona jurídica por CUIT"""
 
@@ -33,12 +36,7 @@ def get_persona_juridica(client, logger, environment, sample_cuits):
     except Exception as e:
         logger.error(f"Excepción durante obtención de persona jurídica: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            f"/personas-juridicas?p_cuit={p_cuit}",
-            catch_response=True, 
-            name="(PERSONAS JURIDICAS) - /personas-juridicas [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(PERSONAS JURIDICAS) - /personas-juridicas [Exception]", e)
 
 
 def get_sedes_pj(client, logger, environment, data_module):
@@ -48,13 +46,8 @@ def get_sedes_pj(client, logger, environment, data_module):
     if not hasattr(data_module, 'p_cuit') or not data_module.p_cuit:
         logger.error("La lista de CUITs está vacía. No se puede continuar con la prueba de sedes.")
         
-        # Registrar un error explícito usando catch_response
-        with client.get(
-            "/personas-juridicas/sedes_pj", 
-            catch_response=True,
-            name="(PERSONAS JURIDICAS) - /personas-juridicas/sedes_pj [Lista vacía]"
-        ) as response:
-            response.failure("Lista de CUITs vacía para sedes")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "GET", "(PERSONAS JURIDICAS) - /personas-juridicas/sedes_pj [Lista vacía]", CatchResponseError("Lista de CUITs vacía para sedes"))
         return
     
     # Seleccionar un CUIT aleatorio
@@ -106,12 +99,7 @@ def get_sedes_pj(client, logger, environment, data_module):
                 logger.error(f"Error en consulta de sedes: {response.status_code}")
     except Exception as e:
         logger.error(f"Excepción durante obtención de sedes: {str(e)}")
-        environment.events.request_failure.fire(
-            request_type="GET",
-            name="(PERSONAS JURIDICAS) - /personas-juridicas/sedes_pj",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "GET", "(PERSONAS JURIDICAS) - /personas-juridicas/sedes_pj", e)
 
 def insert_persona_juridica(client, logger, environment, body_insertar_persona_juridica):
     """Tarea para insertar una persona jurídica"""
@@ -140,12 +128,7 @@ def insert_persona_juridica(client, logger, environment, body_insertar_persona_j
                 response.failure(f"Error: {response.status_code}")
     except Exception as e:
         logger.error(f"Excepción durante inserción de persona jurídica: {str(e)}")
-        environment.events.request_failure.fire(
-            request_type="POST",
-            name="(PERSONAS JURIDICAS) - /personas-juridicas",
-            response_time=0,
-            exception=e
-        )
+        report_failure(environment, client, "POST", "(PERSONAS JURIDICAS) - /personas-juridicas", e)
 
 def insert_domicilio_sede_pj(client, logger, environment, body_insertar_sede):
     """Tarea para insertar un domicilio para una sede de persona jurídica"""
@@ -153,12 +136,7 @@ def insert_domicilio_sede_pj(client, logger, environment, body_insertar_sede):
     # Verificar que body_insertar_sede no esté vacío
     if not body_insertar_sede:
         logger.error("body_insertar_sede está vacío")
-        with client.post(
-            "/personas-juridicas/sedes_pj",
-            catch_response=True,
-            name="(PERSONAS JURIDICAS) - /personas-juridicas/sedes_pj [Datos vacíos]"
-        ) as response:
-            response.failure("Datos de sede vacíos")
+        report_failure(environment, client, "POST", "(PERSONAS JURIDICAS) - /personas-juridicas/sedes_pj [Datos vacíos]", CatchResponseError("Datos de sede vacíos"))
         return
     
     # Manejar tanto diccionario único como lista de diccionarios
@@ -253,13 +231,7 @@ def insert_domicilio_sede_pj(client, logger, environment, body_insertar_sede):
         import traceback
         logger.error(f"Traceback completo: {traceback.format_exc()}")
         
-        environment.events.request_failure.fire(
-            request_type="POST",
-            name="(PERSONAS JURIDICAS) - /personas-juridicas/sedes_pj",
-            response_time=0,
-            response_length=0,
-            exception=e
-        )
+        report_failure(environment, client, "POST", "(PERSONAS JURIDICAS) - /personas-juridicas/sedes_pj", e)
 
 
 
@@ -340,12 +312,7 @@ def insert_domicilio_sede(client, logger, environment, body_insertar_domicilio_s
     # Verificar que body_insertar_domicilio_sede no esté vacío
     if not body_insertar_domicilio_sede:
         logger.error("body_insertar_domicilio_sede está vacío")
-        with client.post(
-            "/personas-juridicas/sedes/domicilios",
-            catch_response=True,
-            name="(PERSONAS JURIDICAS) - /personas-juridicas/sedes/domicilios [Datos vacíos]"
-        ) as response:
-            response.failure("Datos de domicilio vacíos")
+        report_failure(environment, client, "POST", "(PERSONAS JURIDICAS) - /personas-juridicas/sedes/domicilios [Datos vacíos]", CatchResponseError("Datos de domicilio vacíos"))
         return
     
     # Crear una copia profunda para evitar modificar el original
@@ -433,10 +400,4 @@ def insert_domicilio_sede(client, logger, environment, body_insertar_domicilio_s
         logger.error(f"Traceback completo: {traceback.format_exc()}")
         
         # Registrar el fallo en Locust
-        environment.events.request_failure.fire(
-            request_type="POST",
-            name="(PERSONAS JURIDICAS) - /personas-juridicas/sedes/domicilios",
-            response_time=0,
-            response_length=0,
-            exception=e
-        )
+        report_failure(environment, client, "POST", "(PERSONAS JURIDICAS) - /personas-juridicas/sedes/domicilios", e)
@@ -1,7 +1,13 @@
 import random
 import copy
+import logging
 from typing import Dict, Any
 
+from locust.exception import CatchResponseError
+from tasks.schemas import validar
+from utils import paging
+from utils.http import report_failure
+
 def insert_or_update_proveedor(client, logger, environment, data_module):
     """Prueba el endpoint de insertar o actualizar un proveedor"""
     
@@ -9,14 +15,8 @@ def insert_or_update_proveedor(client, logger, environment, data_module):
     if not hasattr(data_module, 'body_insertar_proveedor_pf') and not hasattr(data_module, 'body_insertar_proveedor_pj'):
         logger.error("No hay datos para insertar proveedores en el módulo de datos.")
         
-        # Registrar un error explícito usando catch_response
-        with client.post(
-            "/proveedores", 
-            json={"error": "sin_datos"},
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores [Sin datos]"
-        ) as response:
-            response.failure("No hay datos definidos para proveedores")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores [Sin datos]", CatchResponseError("No hay datos definidos para proveedores"))
         return
     
     # Seleccionar aleatoriamente entre persona física o jurídica
@@ -50,7 +50,8 @@ def insert_or_update_proveedor(client, logger, environment, data_module):
             name="(PROVEEDORES) - /proveedores [POST]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 201:  # HTTP 201 Created
                 try:
@@ -127,15 +128,8 @@ def insert_or_update_proveedor(client, logger, environment, data_module):
     # En la parte donde manejas la excepción:
     except Exception as e:
         logger.error(f"Excepción durante inserción/actualización de proveedor: {str(e)}")
-    
-    # Registrar el error como una respuesta fallida usando catch_response
-        with client.post(
-            "/proveedores",
-            json={"error": "exception"},
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        # Registrar el error como una respuesta fallida
+        report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores [Exception]", e)
 
 def alta_proveedor(client, logger, environment, data_module):
     """Prueba el endpoint de alta simplificada de proveedores"""
@@ -144,14 +138,8 @@ def alta_proveedor(client, logger, environment, data_module):
     if not hasattr(data_module, 'body_alta_proveedor_pf') and not hasattr(data_module, 'body_alta_proveedor_pj'):
         logger.error("No hay datos para alta de proveedores en el módulo de datos.")
         
-        # Registrar un error explícito usando catch_response
-        with client.post(
-            "/proveedores/alta", 
-            json={"error": "sin_datos"},
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores/alta [Sin datos]"
-        ) as response:
-            response.failure("No hay datos definidos para alta de proveedores")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/alta [Sin datos]", CatchResponseError("No hay datos definidos para alta de proveedores"))
         return
     
     # Seleccionar aleatoriamente entre persona física o jurídica
@@ -186,7 +174,8 @@ def alta_proveedor(client, logger, environment, data_module):
             name="(PROVEEDORES) - /proveedores/alta [POST]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 201:  # HTTP 201 Created
                 try:
@@ -265,13 +254,7 @@ def alta_proveedor(client, logger, environment, data_module):
         logger.error(f"Excepción durante alta de proveedor: {str(e)}")
         
         # Registrar el error como una respuesta fallida usando catch_response
-        with client.post(
-            "/proveedores/alta",
-            json={"error": "exception"},
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores/alta [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/alta [Exception]", e)
 
 def alta_cbu_banco_proveedor(client, logger, environment, data_module):
     """Prueba el endpoint de alta de proveedores con CBU y banco"""
@@ -280,14 +263,8 @@ def alta_cbu_banco_proveedor(client, logger, environment, data_module):
     if not hasattr(data_module, 'body_alta_cbu_banco_proveedor_pf') and not hasattr(data_module, 'body_alta_cbu_banco_proveedor_pj'):
         logger.error("No hay datos para alta de proveedores con CBU y banco en el módulo de datos.")
         
-        # Registrar un error explícito usando catch_response
-        with client.post(
-            "/proveedores/alta/cbu/banco", 
-            json={"error": "sin_datos"},
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores/alta/cbu/banco [Sin datos]"
-        ) as response:
-            response.failure("No hay datos definidos para alta de proveedores con CBU y banco")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/alta/cbu/banco [Sin datos]", CatchResponseError("No hay datos definidos para alta de proveedores con CBU y banco"))
         return
     
     # Seleccionar aleatoriamente entre persona física o jurídica
@@ -329,7 +306,8 @@ def alta_cbu_banco_proveedor(client, logger, environment, data_module):
             name="(PROVEEDORES) - /proveedores/alta/cbu/banco [POST]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 201:  # HTTP 201 Created
                 try:
@@ -416,13 +394,7 @@ def alta_cbu_banco_proveedor(client, logger, environment, data_module):
         logger.error(f"Excepción durante alta de proveedor con CBU y banco: {str(e)}")
         
         # Registrar el error como una respuesta fallida usando catch_response
-        with client.post(
-            "/proveedores/alta/cbu/banco",
-            json={"error": "exception"},
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores/alta/cbu/banco [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/alta/cbu/banco [Exception]", e)
 
 
 def get_proveedor_by_cuit_cuil(client, logger, environment, data_module):
@@ -451,13 +423,8 @@ def get_proveedor_by_cuit_cuil(client, logger, environment, data_module):
     if not lista_cuit_cuil:
         logger.error("No hay CUITs/CUILs para consultar proveedores.")
         
-        # Registrar un error explícito usando catch_response
-        with client.get(
-            "/proveedores?p_cuit_cuil=00000000000", 
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores [Sin datos]"
-        ) as response:
-            response.failure("No hay CUITs/CUILs definidos para consultar proveedores")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "GET", "(PROVEEDORES) - /proveedores [Sin datos]", CatchResponseError("No hay CUITs/CUILs definidos para consultar proveedores"))
         return
     
     logger.info(f"Ejecutando get_proveedor_by_cuit_cuil con {len(lista_cuit_cuil)} CUITs/CUILs")
@@ -491,11 +458,9 @@ def get_proveedor_by_cuit_cuil(client, logger, environment, data_module):
                         if isinstance(response_data, list) and len(response_data) > 0:
                             # Verificar que el primer elemento tenga los campos esperados
                             proveedor = response_data[0]
-                            campos_esperados = [
-                                "p_cuit_cuil", "id_proveedor", "p_tipo_proveedor"
-                            ]
+                            errores = validar("/proveedores", response_data)
                             
-                            if all(campo in proveedor for campo in campos_esperados):
+                            if not errores:
                                 response.success()
                                 logger.info(f"Consulta exitosa para CUIT/CUIL: {cuit_cuil}")
                                 logger.info(f"ID proveedor: {proveedor.get('id_proveedor')}")
@@ -504,10 +469,8 @@ def get_proveedor_by_cuit_cuil(client, logger, environment, data_module):
                                 data_module.id_proveedor_consultado = proveedor.get('id_proveedor')
                                 resultados["exitosos"] += 1
                             else:
-                                # Verificar qué campos faltan
-                                campos_faltantes = [campo for campo in campos_esperados if campo not in proveedor]
-                                logger.warning(f"Faltan campos en la respuesta para {cuit_cuil}: {campos_faltantes}")
-                                response.failure(f"Formato de respuesta incompleto: faltan {len(campos_faltantes)} campos")
+                                logger.warning(f"Errores de validación para {cuit_cuil}: {errores}")
+                                response.failure("Formato de respuesta incompleto")
                                 resultados["errores"] += 1
                         else:
                             response.failure("No se encontraron proveedores con el CUIT/CUIL proporcionado")
@@ -530,12 +493,7 @@ def get_proveedor_by_cuit_cuil(client, logger, environment, data_module):
             logger.error(f"Excepción durante consulta de proveedor {cuit_cuil}: {str(e)}")
             resultados["errores"] += 1
             # Registrar el error como una respuesta fallida
-            with client.get(
-                f"/proveedores?p_cuit_cuil={cuit_cuil}",
-                catch_response=True,
-                name=f"(PROVEEDORES) - /proveedores [Exception {cuit_cuil}]"
-            ) as response:
-                response.failure(f"Excepción: {str(e)}")
+            report_failure(environment, client, "GET", f"(PROVEEDORES) - /proveedores [Exception {cuit_cuil}]", e)
     
 
 
@@ -552,14 +510,8 @@ def buscar_personas_por_cuils_cuits(client, logger, environment, data_module):
         else:
             logger.error("No hay datos para buscar personas por CUILs/CUITs.")
             
-            # Registrar un error explícito usando catch_response
-            with client.post(
-                "/personas/busqueda-por-cuils-cuits", 
-                json={"p_cuils_cuits": []},
-                catch_response=True,
-                name="(PROVEEDORES) - /personas/busqueda-por-cuils-cuits [Sin datos]"
-            ) as response:
-                response.failure("No hay datos definidos para búsqueda por CUILs/CUITs")
+            # Registrar la falla sin enviar un request a la API
+            report_failure(environment, client, "POST", "(PROVEEDORES) - /personas/busqueda-por-cuils-cuits [Sin datos]", CatchResponseError("No hay datos definidos para búsqueda por CUILs/CUITs"))
             return
     else:
         body_busqueda = data_module.body_busqueda_por_cuils_cuits
@@ -574,7 +526,8 @@ def buscar_personas_por_cuils_cuits(client, logger, environment, data_module):
             name="(PROVEEDORES) - /personas/busqueda-por-cuils-cuits [POST]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
                 try:
@@ -595,13 +548,7 @@ def buscar_personas_por_cuils_cuits(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante búsqueda de personas por CUILs/CUITs: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.post(
-            "/personas/busqueda-por-cuils-cuits",
-            json={"error": "exception"},
-            catch_response=True,
-            name="(PROVEEDORES) - /personas/busqueda-por-cuils-cuits [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "POST", "(PROVEEDORES) - /personas/busqueda-por-cuils-cuits [Exception]", e)
 
 def get_proveedores_por_actividad(client, logger, environment, data_module):
     """Prueba el endpoint de obtener proveedores por ID de actividad AFIP"""
@@ -610,13 +557,8 @@ def get_proveedores_por_actividad(client, logger, environment, data_module):
     if not hasattr(data_module, 'lista_id_actividad_afip') or not data_module.lista_id_actividad_afip:
         logger.error("No hay IDs de actividad AFIP disponibles para la prueba.")
         
-        # Registrar un error explícito usando catch_response
-        with client.get(
-            "/proveedores/actividad?p_id_actividad=0", 
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores/actividad [Sin datos]"
-        ) as response:
-            response.failure("No hay datos para probar el endpoint")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "GET", "(PROVEEDORES) - /proveedores/actividad [Sin datos]", CatchResponseError("No hay datos para probar el endpoint"))
         return
     
     # Seleccionar un ID de actividad aleatorio de la lista
@@ -634,7 +576,8 @@ def get_proveedores_por_actividad(client, logger, environment, data_module):
             name="(PROVEEDORES) - /proveedores/actividad [GET]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
                 try:
@@ -648,13 +591,13 @@ def get_proveedores_por_actividad(client, logger, environment, data_module):
                     # Validar estructura de datos esperada
                     if isinstance(response_data, list):
                         # Verificar que los elementos de la lista contengan los campos esperados
-                        campos_esperados = ["p_id_actividad", "p_cuit_cuil", "p_apenom_razsoc"]
+                        errores = validar("/proveedores/actividad", response_data)
                         
                         if not response_data:
                             # Si la lista está vacía, es un resultado válido (no hay proveedores para esa actividad)
                             logger.info(f"No se encontraron proveedores para la actividad ID: {p_id_actividad}")
                             response.success()
-                        elif all(all(campo in item for campo in campos_esperados) for item in response_data):
+                        elif not errores:
                             response.success()
                             logger.info(f"Obtención de proveedores por actividad exitosa para ID: {p_id_actividad}")
                             logger.info(f"Cantidad de proveedores encontrados: {len(response_data)}")
@@ -664,12 +607,7 @@ def get_proveedores_por_actividad(client, logger, environment, data_module):
                                 data_module.ultimo_proveedor_actividad = response_data[0]
                                 logger.info(f"Primer proveedor encontrado: {response_data[0]['p_cuit_cuil']} - {response_data[0]['p_apenom_razsoc']}")
                         else:
-                            # Verificar qué campos faltan
-                            for item in response_data[:3]:  # Revisar solo los primeros 3 elementos para no saturar el log
-                                campos_faltantes = [campo for campo in campos_esperados if campo not in item]
-                                if campos_faltantes:
-                                    logger.warning(f"Faltan campos en el elemento: {campos_faltantes}")
-                            
+                            logger.warning(f"Errores de validación: {errores}")
                             response.failure("Formato de respuesta incompleto")
                     else:
                         response.failure("Formato de respuesta inesperado (se esperaba una lista)")
@@ -720,12 +658,7 @@ def get_proveedores_por_actividad(client, logger, environment, data_module):
         logger.error(f"Excepción durante consulta de proveedores por actividad: {str(e)}")
         
         # Registrar el error como una respuesta fallida usando catch_response
-        with client.get(
-            f"/proveedores/actividad?p_id_actividad={p_id_actividad}",
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores/actividad [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(PROVEEDORES) - /proveedores/actividad [Exception]", e)
 
 def buscar_proveedores_por_parametros(client, logger, environment, data_module):
     """Prueba el endpoint de búsqueda de proveedores por parámetros"""
@@ -734,14 +667,8 @@ def buscar_proveedores_por_parametros(client, logger, environment, data_module):
     if not hasattr(data_module, 'body_busqueda_proveedores'):
         logger.error("No hay datos para búsqueda de proveedores por parámetros en el módulo de datos.")
         
-        # Registrar un error explícito usando catch_response
-        with client.post(
-            "/proveedores/busqueda", 
-            json={"error": "sin_datos"},
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores/busqueda [Sin datos]"
-        ) as response:
-            response.failure("No hay datos definidos para búsqueda de proveedores por parámetros")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/busqueda [Sin datos]", CatchResponseError("No hay datos definidos para búsqueda de proveedores por parámetros"))
         return
     
     logger.info("llegue aca")
@@ -762,6 +689,9 @@ def buscar_proveedores_por_parametros(client, logger, environment, data_module):
             "p_page_number": 1
         }
     
+    # Página según la estrategia de paginación (utils/paging.py)
+    query_params, pagina = paging.choose_page(data_module, "/proveedores/busqueda", query_params)
+    
     # Construir la URL solo con los query parameters válidos
     url = "/proveedores/busqueda"
     query_string = "&".join([f"{k}={v}" for k, v in query_params.items()])
@@ -775,26 +705,27 @@ def buscar_proveedores_por_parametros(client, logger, environment, data_module):
             url, 
             json=body_busqueda,
             catch_response=True,
+            context={"pagina": pagina},
             name="(PROVEEDORES) - /proveedores/busqueda [POST]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
                 try:
                     # Verificar que la respuesta sea JSON válido
                     response_data = response.json()
+                    paging.update(data_module, "/proveedores/busqueda", response_data, query_params)
                     
                     # Guardar los datos completos obtenidos en el log
                     logger.info("=== DATOS COMPLETOS DE LA RESPUESTA (BÚSQUEDA DE PROVEEDORES) ===")
                     logger.info(f"Respuesta: {response_data}")
                     
                     # Validar estructura de datos esperada
-                    campos_esperados = [
-                        "page_number", "page_size", "total_items", "items"
-                    ]
+                    errores = validar("/proveedores/busqueda", response_data)
                     
-                    if all(campo in response_data for campo in campos_esperados):
+                    if not errores:
                         response.success()
                         logger.info(f"Búsqueda de proveedores exitosa")
                         logger.info(f"Total de elementos: {response_data.get('total_items')}")
@@ -811,10 +742,8 @@ def buscar_proveedores_por_parametros(client, logger, environment, data_module):
                         else:
                             logger.info("No se encontraron proveedores con los parámetros especificados")
                     else:
-                        # Verificar qué campos faltan
-                        campos_faltantes = [campo for campo in campos_esperados if campo not in response_data]
-                        logger.warning(f"Faltan campos en la respuesta: {campos_faltantes}")
-                        response.failure(f"Formato de respuesta incompleto: faltan {len(campos_faltantes)} campos")
+                        logger.warning(f"Errores de validación: {errores}")
+                        response.failure("Formato de respuesta incompleto")
                 except ValueError as e:
                     response.failure(f"Respuesta no es JSON válido: {str(e)}")
                     logger.error(f"JSON inválido en respuesta: {response.text[:200]}")
@@ -863,13 +792,7 @@ def buscar_proveedores_por_parametros(client, logger, environment, data_module):
         logger.error(f"Excepción durante búsqueda de proveedores: {str(e)}")
         
         # Registrar el error como una respuesta fallida usando catch_response
-        with client.post(
-            url,
-            json={"error": "exception"},
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores/busqueda-por-ids [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/busqueda-por-ids [Exception]", e)
 
 
 
@@ -899,7 +822,8 @@ def buscar_proveedores_por_ids(client, logger, environment, data_module):
             name="(PROVEEDORES) - /proveedores/busqueda-por-ids [POST]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
                 try:
@@ -913,16 +837,13 @@ def buscar_proveedores_por_ids(client, logger, environment, data_module):
                     # Validar estructura de datos esperada
                     if isinstance(response_data, list):
                         # Verificar que los elementos de la lista contengan los campos esperados
-                        campos_esperados = [
-                            "p_tipo_proveedor", "p_id_proveedor", "p_cuit_cuil", 
-                            "p_razsoc_apenom", "p_modalidad"
-                        ]
+                        errores = validar("/proveedores/busqueda-por-ids", response_data)
                         
                         if not response_data:
                             # Si la lista está vacía, es un resultado válido (no hay proveedores para esos IDs)
                             logger.info(f"No se encontraron proveedores para los IDs proporcionados")
                             response.success()
-                        elif all(all(campo in item for campo in campos_esperados) for item in response_data):
+                        elif not errores:
                             response.success()
                             logger.info(f"Búsqueda de proveedores por IDs exitosa")
                             logger.info(f"Cantidad de proveedores encontrados: {len(response_data)}")
@@ -932,12 +853,7 @@ def buscar_proveedores_por_ids(client, logger, environment, data_module):
                                 data_module.ultimo_proveedor_por_id = response_data[0]
                                 logger.info(f"Primer proveedor encontrado: ID {response_data[0]['p_id_proveedor']} - {response_data[0]['p_razsoc_apenom']}")
                         else:
-                            # Verificar qué campos faltan
-                            for item in response_data[:3]:  # Revisar solo los primeros 3 elementos para no saturar el log
-                                campos_faltantes = [campo for campo in campos_esperados if campo not in item]
-                                if campos_faltantes:
-                                    logger.warning(f"Faltan campos en el elemento: {campos_faltantes}")
-                            
+                            logger.warning(f"Errores de validación: {errores}")
                             response.failure("Formato de respuesta incompleto")
                     else:
                         response.failure("Formato de respuesta inesperado (se esperaba una lista)")
@@ -970,13 +886,7 @@ def buscar_proveedores_por_ids(client, logger, environment, data_module):
         logger.error(f"Excepción durante búsqueda de proveedores por IDs: {str(e)}")
         
         # Registrar el error como una respuesta fallida usando catch_response
-        with client.post(
-            "/proveedores/busqueda-por-ids",
-            json={"error": "exception"},
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores/busqueda-por-ids [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/busqueda-por-ids [Exception]", e)
 
 def buscar_proveedores_por_ids_search(client, logger, environment, data_module):
     """Prueba el endpoint de búsqueda de proveedores por IDs con parámetro de búsqueda"""
@@ -1020,7 +930,8 @@ def buscar_proveedores_por_ids_search(client, logger, environment, data_module):
             name="(PROVEEDORES) - /proveedores/busqueda-por-ids/search [POST]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
                 try:
@@ -1032,11 +943,9 @@ def buscar_proveedores_por_ids_search(client, logger, environment, data_module):
                     logger.info(f"Respuesta: {response_data}")
                     
                     # Validar estructura de datos esperada
-                    campos_esperados = [
-                        "page_number", "page_size", "total_items", "items"
-                    ]
+                    errores = validar("/proveedores/busqueda-por-ids/search", response_data)
                     
-                    if all(campo in response_data for campo in campos_esperados):
+                    if not errores:
                         response.success()
                         logger.info(f"Búsqueda de proveedores por IDs con parámetro exitosa")
                         logger.info(f"Total de elementos: {response_data.get('total_items')}")
@@ -1053,10 +962,8 @@ def buscar_proveedores_por_ids_search(client, logger, environment, data_module):
                         else:
                             logger.info("No se encontraron proveedores con los IDs y parámetro especificados")
                     else:
-                        # Verificar qué campos faltan
-                        campos_faltantes = [campo for campo in campos_esperados if campo not in response_data]
-                        logger.warning(f"Faltan campos en la respuesta: {campos_faltantes}")
-                        response.failure(f"Formato de respuesta incompleto: faltan {len(campos_faltantes)} campos")
+                        logger.warning(f"Errores de validación: {errores}")
+                        response.failure("Formato de respuesta incompleto")
                 except ValueError as e:
                     response.failure(f"Respuesta no es JSON válido: {str(e)}")
                     logger.error(f"JSON inválido en respuesta: {response.text[:200]}")
@@ -1085,13 +992,7 @@ def buscar_proveedores_por_ids_search(client, logger, environment, data_module):
         logger.error(f"Excepción durante búsqueda de proveedores por IDs con parámetro: {str(e)}")
         
         # Registrar el error como una respuesta fallida usando catch_response
-        with client.post(
-            url,
-            json={"error": "exception"},
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores/busqueda-por-ids/search [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/busqueda-por-ids/search [Exception]", e)
 
 import random
 import copy
@@ -1103,14 +1004,8 @@ def insert_cbu_proveedor(client, logger, environment, data_module):
     if not hasattr(data_module, 'body_insertar_cbu_proveedor_pf') and not hasattr(data_module, 'body_insertar_cbu_proveedor_pj'):
         logger.error("No hay datos para insertar CBU de proveedores en el módulo de datos.")
         
-        # Registrar un error explícito usando catch_response
-        with client.post(
-            "/proveedores/cbu", 
-            json={"error": "sin_datos"},
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores/cbu [Sin datos]"
-        ) as response:
-            response.failure("No hay datos definidos para CBU de proveedores")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/cbu [Sin datos]", CatchResponseError("No hay datos definidos para CBU de proveedores"))
         return
     
     # Seleccionar aleatoriamente entre persona física o jurídica
@@ -1143,7 +1038,8 @@ def insert_cbu_proveedor(client, logger, environment, data_module):
             name="(PROVEEDORES) - /proveedores/cbu [POST]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 201:  # HTTP 201 Created
                 try:
@@ -1191,13 +1087,7 @@ def insert_cbu_proveedor(client, logger, environment, data_module):
         logger.error(f"Excepción durante inserción/actualización de CBU: {str(e)}")
         
         # Registrar el error como una respuesta fallida usando catch_response
-        with client.post(
-            "/proveedores/cbu",
-            json={"error": "exception"},
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores/cbu/banco [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/cbu/banco [Exception]", e)
 
 def insert_cbu_proveedor_banco(client, logger, environment, data_module):
     """Prueba el endpoint de insertar o actualizar CBU y banco de un proveedor"""
@@ -1206,14 +1096,8 @@ def insert_cbu_proveedor_banco(client, logger, environment, data_module):
     if not hasattr(data_module, 'body_insertar_cbu_banco_proveedor_pf') and not hasattr(data_module, 'body_insertar_cbu_banco_proveedor_pj'):
         logger.error("No hay datos para insertar CBU y banco de proveedores en el módulo de datos.")
         
-        # Registrar un error explícito usando catch_response
-        with client.post(
-            "/proveedores/cbu/banco", 
-            json={"error": "sin_datos"},
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores/cbu/banco [Sin datos]"
-        ) as response:
-            response.failure("No hay datos definidos para CBU y banco de proveedores")
+        # Registrar la falla sin enviar un request a la API
+        report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/cbu/banco [Sin datos]", CatchResponseError("No hay datos definidos para CBU y banco de proveedores"))
         return
     
     # Seleccionar aleatoriamente entre persona física o jurídica
@@ -1246,7 +1130,8 @@ def insert_cbu_proveedor_banco(client, logger, environment, data_module):
             name="(PROVEEDORES) - /proveedores/cbu/banco [POST]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 201:  # HTTP 201 Created
                 try:
@@ -1299,13 +1184,7 @@ def insert_cbu_proveedor_banco(client, logger, environment, data_module):
         logger.error(f"Excepción durante inserción/actualización de CBU y banco: {str(e)}")
         
         # Registrar el error como una respuesta fallida usando catch_response
-        with client.post(
-            "/proveedores/cbu/banco",
-            json={"error": "exception"},
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores/cbu/banco [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/cbu/banco [Exception]", e)
 
 def get_contratistas_obra_publica(client, logger, environment, data_module):
     """Prueba el endpoint de obtener contratistas de obra pública"""
@@ -1319,7 +1198,8 @@ def get_contratistas_obra_publica(client, logger, environment, data_module):
             name="(PROVEEDORES) - /proveedores/contratistas-obra-publica [GET]"
         ) as response:
             # Guardar la respuesta completa en el log
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
                 try:
@@ -1364,12 +1244,7 @@ def get_contratistas_obra_publica(client, logger, environment, data_module):
         logger.error(f"Excepción durante consulta de contratistas de obra pública: {str(e)}")
         
         # Registrar el error como una respuesta fallida usando catch_response
-        with client.get(
-            "/proveedores/contratistas-obra-publica",
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores/contratistas-obra-publica [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(PROVEEDORES) - /proveedores/contratistas-obra-publica [Exception]", e)
 
 
 def buscar_proveedores_minimizado(client, logger, environment, data_module):
@@ -1381,25 +1256,13 @@ def buscar_proveedores_minimizado(client, logger, environment, data_module):
         if not hasattr(data_module, 'parametros_busqueda_minimizada_query'):
             logger.error("No hay parámetros de consulta para búsqueda minimizada en el módulo de datos.")
             
-            with client.post(
-                "/proveedores/busqueda/minimizado",
-                json={"error": "sin_datos"},
-                catch_response=True,
-                name="(PROVEEDORES) - /proveedores/busqueda/minimizado [Sin datos]"
-            ) as response:
-                response.failure("No hay parámetros de consulta definidos para búsqueda minimizada")
+            report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/busqueda/minimizado [Sin datos]", CatchResponseError("No hay parámetros de consulta definidos para búsqueda minimizada"))
             return
         
         if not hasattr(data_module, 'body_busqueda_minimizada'):
             logger.error("No hay datos de cuerpo para búsqueda minimizada en el módulo de datos.")
             
-            with client.post(
-                "/proveedores/busqueda/minimizado",
-                json={"error": "sin_datos"},
-                catch_response=True,
-                name="(PROVEEDORES) - /proveedores/busqueda/minimizado [Sin datos]"
-            ) as response:
-                response.failure("No hay datos de cuerpo definidos para búsqueda minimizada")
+            report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/busqueda/minimizado [Sin datos]", CatchResponseError("No hay datos de cuerpo definidos para búsqueda minimizada"))
             return
         
         # Usar parámetros del módulo de datos
@@ -1414,7 +1277,8 @@ def buscar_proveedores_minimizado(client, logger, environment, data_module):
             name="(PROVEEDORES) - /proveedores/busqueda/minimizado [POST]"
         ) as response:
             
-            logger.info(f"Respuesta completa: {response.text}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:
                 try:
@@ -1424,9 +1288,9 @@ def buscar_proveedores_minimizado(client, logger, environment, data_module):
                     logger.info(f"Respuesta: {data}")
                     
                     # Validar estructura de datos esperada
-                    campos_esperados = ["page_number", "page_size", "total_items", "items"]
+                    errores = validar("/proveedores/busqueda/minimizado", data)
                     
-                    if all(campo in data for campo in campos_esperados):
+                    if not errores:
                         response.success()
                         logger.info("EXITO: Proveedores minimizados consultados exitosamente")
                         logger.info(f"Total de registros: {data.get('total_items', 0)}")
@@ -1437,20 +1301,20 @@ def buscar_proveedores_minimizado(client, logger, environment, data_module):
                             logger.info(f"Cantidad de proveedores en esta pagina: {len(proveedores)}")
                             
                             # Mostrar algunos proveedores de ejemplo
-                            for i, proveedor in enumerate(proveedores[:3]):
-                                denominacion = proveedor.get('denominacion', 'N/A')
-                                cuil_cuit = proveedor.get('cuil_cuit', 'N/A')
-                                tipo_persona = proveedor.get('tipo_persona', 'N/A')
-                                logger.info(f"Proveedor {i+1}: {denominacion} - {cuil_cuit} - Tipo: {tipo_persona}")
+                            if logger.isEnabledFor(logging.INFO):
+                                for i, proveedor in enumerate(proveedores[:3]):
+                                    denominacion = proveedor.get('denominacion', 'N/A')
+                                    cuil_cuit = proveedor.get('cuil_cuit', 'N/A')
+                                    tipo_persona = proveedor.get('tipo_persona', 'N/A')
+                                    logger.info(f"Proveedor {i+1}: {denominacion} - {cuil_cuit} - Tipo: {tipo_persona}")
                             
                             if len(proveedores) > 3:
                                 logger.info(f"... y {len(proveedores) - 3} proveedores mas")
                         else:
                             logger.warning("ADVERTENCIA: No se encontraron proveedores para los parametros especificados")
                     else:
-                        campos_faltantes = [campo for campo in campos_esperados if campo not in data]
-                        logger.warning(f"Faltan campos en la respuesta: {campos_faltantes}")
-                        response.failure(f"Formato de respuesta incompleto: faltan {len(campos_faltantes)} campos")
+                        logger.warning(f"Errores de validación: {errores}")
+                        response.failure("Formato de respuesta incompleto")
                         
                 except ValueError as e:
                     response.failure(f"Respuesta no es JSON válido: {str(e)}")
@@ -1476,13 +1340,7 @@ def buscar_proveedores_minimizado(client, logger, environment, data_module):
         logger.error(f"EXCEPCION: Error al buscar proveedores minimizado: {str(e)}")
         
         # Registrar el error como una respuesta fallida usando catch_response
-        with client.post(
-            "/proveedores/busqueda/minimizado",
-            json={"error": "exception"},
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores/busqueda/minimizado [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/busqueda/minimizado [Exception]", e)
 
 def buscar_proveedores_minimizado_casos_multiples(client, logger, environment, data_module):
     """Buscar proveedores minimizado - casos múltiples"""
@@ -1493,25 +1351,13 @@ def buscar_proveedores_minimizado_casos_multiples(client, logger, environment, d
         if not hasattr(data_module, 'parametros_busqueda_minimizada_query'):
             logger.error("No hay parámetros de consulta para búsqueda minimizada casos múltiples.")
             
-            with client.post(
-                "/proveedores/busqueda/minimizado",
-                json={"error": "sin_datos"},
-                catch_response=True,
-                name="(PROVEEDORES) - /proveedores/busqueda/minimizado [Sin datos casos múltiples]"
-            ) as response:
-                response.failure("No hay parámetros de consulta para casos múltiples")
+            report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/busqueda/minimizado [Sin datos casos múltiples]", CatchResponseError("No hay parámetros de consulta para casos múltiples"))
             return
         
         if not hasattr(data_module, 'body_busqueda_minimizada_casos'):
             logger.error("No hay datos de casos múltiples para búsqueda minimizada.")
             
-            with client.post(
-                "/proveedores/busqueda/minimizado",
-                json={"error": "sin_datos"},
-                catch_response=True,
-                name="(PROVEEDORES) - /proveedores/busqueda/minimizado [Sin casos múltiples]"
-            ) as response:
-                response.failure("No hay datos de casos múltiples definidos")
+            report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/busqueda/minimizado [Sin casos múltiples]", CatchResponseError("No hay datos de casos múltiples definidos"))
             return
         
         query_params = data_module.parametros_busqueda_minimizada_query
@@ -1566,24 +1412,12 @@ def buscar_proveedores_minimizado_casos_multiples(client, logger, environment, d
             except Exception as case_e:
                 logger.error(f"EXCEPCION en caso {i}: {str(case_e)}")
                 
-                with client.post(
-                    "/proveedores/busqueda/minimizado",
-                    json={"error": "exception"},
-                    catch_response=True,
-                    name=f"(PROVEEDORES) - /proveedores/busqueda/minimizado [Exception Caso {i}]"
-                ) as response:
-                    response.failure(f"Excepción caso {i}: {str(case_e)}")
+                report_failure(environment, client, "POST", f"(PROVEEDORES) - /proveedores/busqueda/minimizado [Exception Caso {i}]", case_e)
                 
     except Exception as e:
         logger.error(f"EXCEPCION en casos multiples: {str(e)}")
         
-        with client.post(
-            "/proveedores/busqueda/minimizado",
-            json={"error": "exception"},
-            catch_response=True,
-            name="(PROVEEDORES) - /proveedores/busqueda/minimizado [Exception casos múltiples]"
-        ) as response:
-            response.failure(f"Excepción casos múltiples: {str(e)}")
+        report_failure(environment, client, "POST", "(PROVEEDORES) - /proveedores/busqueda/minimizado [Exception casos múltiples]", e)
 
 
 def buscar_proveedores_minimizado_casos_multiples(client, logger, environment, data_module):
@@ -0,0 +1,262 @@
+"""Registro declarativo de los endpoints de Base Única.
+
+Cada entrada describe una función de tasks/*.py con su dominio, su peso
+relativo dentro del dominio y si escribe datos en la API. El orden del
+registro es el orden del barrido funcional (perfil "functional").
+"""
+import re
+from collections import namedtuple
+
+from tasks.ambiente import get_espacios_verdes, get_campanas_pet, get_recoleccion_residuos_diferenciada
+from tasks.cerrojo_institucional import get_all_cpc, get_barrios_cpc, get_centros_operativos, get_centros_vecinales, get_dependencia_mas_alta, get_dependencias_directas, get_dependencias_por_parametros, get_dependencias_ruta, get_fechas_no_habiles, get_limites_administrativos, get_organigrama_completo, get_organigrama_por_dependencia, get_organigrama_por_nivel, get_organigrama_por_niveles, get_organizaciones_sociales, get_tipos_organizaciones_sociales, get_unidades_judiciales, post_dependencias_por_ids, update_dependencias_visibility
+from tasks.domicilio import get_barrios_por_localidad, get_calles_por_localidad, get_departamentos_por_provincia, get_domicilio_cpc_by_id, get_localidades_por_departamento, get_paises, get_provincias_por_pais, insert_domicilio, insert_domicilio_ampliado, insert_domicilio_geo, get_domicilio_geo, get_domicilio_by_id, insert_incidente
+from tasks.educacion import get_escuelas_municipales, get_jardines_municipales, get_parques_educativos
+from tasks.habilitacion import get_comercios, get_geriatricos_privados, get_jardines_maternales_privados
+from tasks.infraestructura import get_obra_publica, get_puntos_wifi
+from tasks.parametricas import get_actividades, get_banco_by_id, get_bancos, get_cfiscal, get_dispositivos_pagos, get_fjuridica, get_medios_pagos, get_profesion_by_id, get_profesiones, put_medios_pagos
+from tasks.persona_fisica import get_comunicaciones_personas, get_personas_fisicas, insert_comunicaciones_personas, insert_domicilio_persona_fisica, insert_or_update_persona_fisica, insert_or_update_persona_fisica_by_dni, insert_or_update_persona_fisica_simplificada
+from tasks.persona_juridica import get_persona_juridica, get_sedes_pj, insert_domicilio_sede, insert_domicilio_sede_pj, insert_persona_juridica
+from tasks.proveedor import alta_cbu_banco_proveedor, alta_proveedor, buscar_personas_por_cuils_cuits, buscar_proveedores_minimizado, buscar_proveedores_por_ids, buscar_proveedores_por_parametros, get_proveedor_by_cuit_cuil, get_proveedores_por_actividad, insert_or_update_proveedor
+from tasks.salud import get_centros_salud
+from tasks.transporte import get_centrales_agencias, get_chapas, get_chapas_por_cuil, get_ciclovias, get_condiciones, get_empresas, get_estacionamiento_bicicletas, get_estados_licencias, get_leasing, get_licencias_por_parametros, get_paradas_linea, get_permisionarios_por_parametros, get_persona_fisica_por_chapa, get_personal, get_recorridos_lineas, get_situaciones_chapas, get_tipos_servicios, get_vehiculos, get_zona_semm
+from tasks.tributario import get_deuda_inmueble, get_deuda_rodado
+from tasks.turismo import get_anfitriones_turisticos, get_guias_turisticos
+
+# Una entrada del registro. Todas las funciones reciben
+# (client, logger, environment, data_module).
+EndpointTask = namedtuple("EndpointTask", ["nombre", "dominio", "funcion", "peso", "escritura"])
+
+
+# Adaptadores para las funciones de persona jurídica, que reciben
+# directamente una lista o un body en lugar del módulo de datos
+def _get_persona_juridica(client, logger, environment, data_module):
+    get_persona_juridica(client, logger, environment, data_module.p_cuit)
+
+def _insert_persona_juridica(client, logger, environment, data_module):
+    insert_persona_juridica(client, logger, environment, data_module.body_insertar_persona_juridica)
+
+def _insert_domicilio_sede_pj(client, logger, environment, data_module):
+    insert_domicilio_sede_pj(client, logger, environment, data_module.body_insertar_sede)
+
+def _insert_domicilio_sede(client, logger, environment, data_module):
+    insert_domicilio_sede(client, logger, environment, data_module.body_insertar_domicilio_sede)
+
+
+def _endpoint(dominio, funcion, peso=1, escritura=False):
+    nombre = funcion.__name__.lstrip("_")
+    return EndpointTask(nombre, dominio, funcion, peso, escritura)
+
+
+REGISTRO = [
+    # -------PERSONA JURIDICA-----------
+    _endpoint("persona_juridica", _get_persona_juridica, peso=4),
+    _endpoint("persona_juridica", get_sedes_pj, peso=2),
+    _endpoint("persona_juridica", _insert_persona_juridica, escritura=True),
+    _endpoint("persona_juridica", _insert_domicilio_sede_pj, escritura=True),
+    _endpoint("persona_juridica", _insert_domicilio_sede, escritura=True),
+
+    # -------CERROJO(INSTITUCIONAL)-----------
+    _endpoint("cerrojo", get_centros_operativos),
+    _endpoint("cerrojo", get_dependencias_por_parametros, peso=4),
+    _endpoint("cerrojo", post_dependencias_por_ids, peso=2),  # POST de consulta, no escribe
+    _endpoint("cerrojo", update_dependencias_visibility, escritura=True),
+    _endpoint("cerrojo", get_fechas_no_habiles, peso=2),
+    _endpoint("cerrojo", get_limites_administrativos),
+    _endpoint("cerrojo", get_organigrama_completo),
+    _endpoint("cerrojo", get_dependencias_directas, peso=3),
+    _endpoint("cerrojo", get_dependencias_ruta, peso=3),
+    _endpoint("cerrojo", get_organigrama_por_nivel, peso=2),
+    _endpoint("cerrojo", get_organigrama_por_niveles, peso=2),
+    _endpoint("cerrojo", get_dependencia_mas_alta, peso=2),
+    _endpoint("cerrojo", get_organigrama_por_dependencia, peso=3),
+    _endpoint("cerrojo", get_centros_vecinales),
+    _endpoint("cerrojo", get_all_cpc),
+    _endpoint("cerrojo", get_barrios_cpc),
+    _endpoint("cerrojo", get_organizaciones_sociales),
+    _endpoint("cerrojo", get_tipos_organizaciones_sociales),
+    _endpoint("cerrojo", get_unidades_judiciales),
+
+    # --------PERSONA FISICA------------
+    _endpoint("persona_fisica", insert_or_update_persona_fisica, escritura=True),
+    # Solo con datos sintéticos: no se puede insertar dos veces el mismo DNI
+    _endpoint("persona_fisica", insert_or_update_persona_fisica_by_dni, escritura=True),
+    _endpoint("persona_fisica", insert_or_update_persona_fisica_simplificada, escritura=True),
+    _endpoint("persona_fisica", get_personas_fisicas, peso=5),
+    _endpoint("persona_fisica", insert_domicilio_persona_fisica, escritura=True),
+    _endpoint("persona_fisica", get_comunicaciones_personas, peso=3),
+    _endpoint("persona_fisica", insert_comunicaciones_personas, escritura=True),
+
+    # --------PROVEEDOR------------
+    _endpoint("proveedor", get_proveedor_by_cuit_cuil, peso=4),
+    _endpoint("proveedor", insert_or_update_proveedor, escritura=True),
+    _endpoint("proveedor", buscar_personas_por_cuils_cuits, peso=2),
+    _endpoint("proveedor", alta_proveedor, escritura=True),
+    _endpoint("proveedor", alta_cbu_banco_proveedor, escritura=True),
+    _endpoint("proveedor", get_proveedores_por_actividad, peso=2),
+    _endpoint("proveedor", buscar_proveedores_por_parametros, peso=4),
+    _endpoint("proveedor", buscar_proveedores_por_ids, peso=2),
+    _endpoint("proveedor", buscar_proveedores_minimizado, peso=3),
+
+    # --------DOMICILIO------------
+    _endpoint("domicilio", get_barrios_por_localidad, peso=4),
+    _endpoint("domicilio", get_calles_por_localidad, peso=4),
+    _endpoint("domicilio", get_paises),
+    _endpoint("domicilio", get_provincias_por_pais, peso=2),
+    _endpoint("domicilio", get_departamentos_por_provincia, peso=2),
+    _endpoint("domicilio", get_localidades_por_departamento, peso=2),
+    _endpoint("domicilio", insert_domicilio, escritura=True),
+    _endpoint("domicilio", insert_domicilio_ampliado, escritura=True),
+    _endpoint("domicilio", insert_domicilio_geo, escritura=True),
+    _endpoint("domicilio", get_domicilio_geo, peso=4),
+    _endpoint("domicilio", get_domicilio_by_id, peso=3),
+    _endpoint("domicilio", insert_incidente, escritura=True),
+    _endpoint("domicilio", get_domicilio_cpc_by_id, peso=2),
+
+    # --------AMBIENTE------------
+    _endpoint("ambiente", get_espacios_verdes),
+    _endpoint("ambiente", get_campanas_pet),
+    _endpoint("ambiente", get_recoleccion_residuos_diferenciada),
+
+    # --------EDUCACION------------
+    _endpoint("educacion", get_parques_educativos),
+    _endpoint("educacion", get_escuelas_municipales),
+    _endpoint("educacion", get_jardines_municipales),
+
+    # --------HABILITACION------------
+    _endpoint("habilitacion", get_comercios, peso=2),
+    _endpoint("habilitacion", get_geriatricos_privados),
+    _endpoint("habilitacion", get_jardines_maternales_privados),
+
+    # --------INFRAESTRUCTURA------------
+    _endpoint("infraestructura", get_puntos_wifi),
+    _endpoint("infraestructura", get_obra_publica),
+
+    # --------SALUD------------
+    _endpoint("salud", get_centros_salud),
+
+    # --------TURISMO------------
+    _endpoint("turismo", get_guias_turisticos),
+    _endpoint("turismo", get_anfitriones_turisticos),
+
+    # --------TRANSPORTE------------
+    _endpoint("transporte", get_condiciones),
+    _endpoint("transporte", get_estacionamiento_bicicletas),
+    _endpoint("transporte", get_estados_licencias),
+    _endpoint("transporte", get_situaciones_chapas),
+    _endpoint("transporte", get_tipos_servicios),
+    _endpoint("transporte", get_zona_semm),
+    _endpoint("transporte", get_chapas, peso=4),
+    _endpoint("transporte", get_leasing, peso=2),
+    _endpoint("transporte", get_centrales_agencias, peso=2),
+    _endpoint("transporte", get_persona_fisica_por_chapa, peso=3),
+    _endpoint("transporte", get_chapas_por_cuil, peso=3),
+    _endpoint("transporte", get_permisionarios_por_parametros, peso=2),
+    _endpoint("transporte", get_licencias_por_parametros, peso=2),
+    _endpoint("transporte", get_ciclovias),
+    _endpoint("transporte", get_personal),
+    _endpoint("transporte", get_empresas),
+    _endpoint("transporte", get_recorridos_lineas),
+    _endpoint("transporte", get_paradas_linea),
+    _endpoint("transporte", get_vehiculos, peso=2),
+
+    # --------PARAMETRICAS------------
+    _endpoint("parametricas", get_medios_pagos),
+    _endpoint("parametricas", get_cfiscal),
+    _endpoint("parametricas", get_fjuridica),
+    _endpoint("parametricas", get_bancos),
+    _endpoint("parametricas", get_banco_by_id, peso=2),
+    _endpoint("parametricas", get_profesiones),
+    _endpoint("parametricas", get_profesion_by_id, peso=2),
+    _endpoint("parametricas", put_medios_pagos, escritura=True),
+    _endpoint("parametricas", get_dispositivos_pagos),
+    _endpoint("parametricas", get_actividades, peso=2),
+
+    # --------TRIBUTARIO------------
+    _endpoint("tributario", get_deuda_inmueble, peso=3),
+    _endpoint("tributario", get_deuda_rodado, peso=3),
+]
+
+DOMINIOS = list(dict.fromkeys(entrada.dominio for entrada in REGISTRO))
+
+# Perfiles de mezcla: peso de cada dominio dentro de la carga. El peso
+# efectivo de un endpoint es peso_dominio * peso_endpoint. Los dominios
+# ausentes en un perfil no se ejecutan.
+MIX_PROFILES = {
+    "balanceado": {dominio: 1 for dominio in DOMINIOS},
+    # Aproximación del tráfico real: consultas de personas, domicilios y cerrojo dominan
+    "ciudadano": {
+        "persona_fisica": 5,
+        "persona_juridica": 3,
+        "domicilio": 5,
+        "cerrojo": 4,
+        "proveedor": 3,
+        "transporte": 3,
+        "tributario": 3,
+        "parametricas": 2,
+        "ambiente": 1,
+        "educacion": 1,
+        "habilitacion": 1,
+        "infraestructura": 1,
+        "salud": 1,
+        "turismo": 1,
+    },
+}
+# Un perfil por dominio para aislar la carga de un solo grupo de endpoints
+MIX_PROFILES.update({dominio: {dominio: 1} for dominio in DOMINIOS})
+
+
+# Endpoints con PaginationResponseSchema (p_page_number / p_page_size),
+# usados por el barrido de tamaños de página (utils/page_size.py)
+ENDPOINTS_PAGINADOS = [
+    "get_chapas",
+    "get_leasing",
+    "get_centrales_agencias",
+    "get_permisionarios_por_parametros",
+    "get_licencias_por_parametros",
+    "get_vehiculos",
+    "buscar_proveedores_por_parametros",
+]
+
+
+# Endpoints que necesitan un valor único por request (utils/synthetic.py)
+ENDPOINTS_SOLO_SINTETICOS = [
+    "insert_or_update_persona_fisica_by_dni",
+]
+
+
+# Escrituras que usan lo que creó una escritura anterior del mismo usuario
+# (el ID de la persona recién creada): solo tienen sentido encadenadas, en el
+# barrido funcional en orden o en los recorridos de tasks/journeys.py
+ENDPOINTS_SOLO_RECORRIDO = [
+    "insert_domicilio_persona_fisica",
+]
+
+
+def get_endpoints(solo_lectura=False, sinteticos=False, mezcla=False):
+    """Devuelve las entradas del registro en orden, opcionalmente solo las de lectura.
+
+    Los endpoints de ENDPOINTS_SOLO_SINTETICOS se incluyen solo con datos sintéticos
+    y los de ENDPOINTS_SOLO_RECORRIDO se excluyen de las mezclas (mezcla=True).
+    """
+    entradas = [entrada for entrada in REGISTRO if sinteticos or entrada.nombre not in ENDPOINTS_SOLO_SINTETICOS]
+    if mezcla:
+        entradas = [entrada for entrada in entradas if entrada.nombre not in ENDPOINTS_SOLO_RECORRIDO]
+    if solo_lectura:
+        return [entrada for entrada in entradas if not entrada.escritura]
+    return entradas
+
+
+def filter_endpoints(entradas, patron):
+    """Filtra las entradas cuyo nombre coincide con la expresión regular (grupo de rutas)"""
+    if not patron:
+        return list(entradas)
+    expresion = re.compile(patron)
+    filtradas = [entrada for entrada in entradas if expresion.search(entrada.nombre)]
+    if not filtradas:
+        raise ValueError(f"El grupo de rutas '{patron}' no coincide con ningún endpoint")
+    return filtradas
+
+
+def get_paginated_endpoints(solo_lectura=False):
+    """Devuelve las entradas del registro de los endpoints paginados"""
+    return [entrada for entrada in get_endpoints(solo_lectura) if entrada.nombre in ENDPOINTS_PAGINADOS]
@@ -1,6 +1,9 @@
 import random
+import logging
 from typing import Dict, Any
 
+from utils.http import report_failure
+
 def get_centros_salud(client, logger, environment, data_module):
     """Prueba el endpoint de obtener centros de salud de Córdoba"""
     
@@ -22,7 +25,7 @@ def get_centros_salud(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -55,38 +58,39 @@ def get_centros_salud(client, logger, environment, data_module):
                                 logger.info("Consulta de centros de salud exitosa")
                                 
                                 # Mostrar información de algunos centros (hasta 5)
-                                for idx, centro in enumerate(response_data[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "nombre" in centro:
-                                        logger.info(f"Centro de Salud {idx+1}: {centro.get('nombre')}")
-                                    elif "tipo" in centro:
-                                        logger.info(f"Centro de Salud {idx+1}: {centro.get('tipo')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in centro.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Centro de Salud {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, centro in enumerate(response_data[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "nombre" in centro:
+                                            logger.info(f"Centro de Salud {idx+1}: {centro.get('nombre')}")
+                                        elif "tipo" in centro:
+                                            logger.info(f"Centro de Salud {idx+1}: {centro.get('tipo')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in centro.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Centro de Salud {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional si está disponible
-                                    if "direccion" in centro and centro.get("direccion"):
-                                        logger.info(f"  Dirección: {centro.get('direccion')}")
-                                    if "barrio" in centro and centro.get("barrio"):
-                                        logger.info(f"  Barrio: {centro.get('barrio')}")
-                                    if "zona" in centro and centro.get("zona"):
-                                        logger.info(f"  Zona: {centro.get('zona')}")
-                                    if "telefono" in centro and centro.get("telefono"):
-                                        logger.info(f"  Teléfono: {centro.get('telefono')}")
-                                    if "email" in centro and centro.get("email"):
-                                        logger.info(f"  Email: {centro.get('email')}")
-                                    if "tipo" in centro and centro.get("tipo"):
-                                        logger.info(f"  Tipo: {centro.get('tipo')}")
-                                    if "especialidades" in centro and centro.get("especialidades"):
-                                        logger.info(f"  Especialidades: {centro.get('especialidades')}")
-                                    if "horario" in centro and centro.get("horario"):
-                                        logger.info(f"  Horario: {centro.get('horario')}")
-                                    if "latitud" in centro and centro.get("latitud"):
-                                        logger.info(f"  Coordenadas: {centro.get('latitud')}, {centro.get('longitud', 'N/A')}")
+                                        # Mostrar información adicional si está disponible
+                                        if "direccion" in centro and centro.get("direccion"):
+                                            logger.info(f"  Dirección: {centro.get('direccion')}")
+                                        if "barrio" in centro and centro.get("barrio"):
+                                            logger.info(f"  Barrio: {centro.get('barrio')}")
+                                        if "zona" in centro and centro.get("zona"):
+                                            logger.info(f"  Zona: {centro.get('zona')}")
+                                        if "telefono" in centro and centro.get("telefono"):
+                                            logger.info(f"  Teléfono: {centro.get('telefono')}")
+                                        if "email" in centro and centro.get("email"):
+                                            logger.info(f"  Email: {centro.get('email')}")
+                                        if "tipo" in centro and centro.get("tipo"):
+                                            logger.info(f"  Tipo: {centro.get('tipo')}")
+                                        if "especialidades" in centro and centro.get("especialidades"):
+                                            logger.info(f"  Especialidades: {centro.get('especialidades')}")
+                                        if "horario" in centro and centro.get("horario"):
+                                            logger.info(f"  Horario: {centro.get('horario')}")
+                                        if "latitud" in centro and centro.get("latitud"):
+                                            logger.info(f"  Coordenadas: {centro.get('latitud')}, {centro.get('longitud', 'N/A')}")
                                 
                                 # Si hay más de 5 centros, indicar cuántos más hay
                                 if cantidad_centros > 5:
@@ -119,11 +123,12 @@ def get_centros_salud(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles: {campos_disponibles}")
                                 
                                 # Mostrar algunos centros de salud
-                                for idx, centro in enumerate(items[:5]):
-                                    if "nombre" in centro:
-                                        logger.info(f"Centro de Salud {idx+1}: {centro.get('nombre')}")
-                                    elif "tipo" in centro:
-                                        logger.info(f"Centro de Salud {idx+1}: {centro.get('tipo')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, centro in enumerate(items[:5]):
+                                        if "nombre" in centro:
+                                            logger.info(f"Centro de Salud {idx+1}: {centro.get('nombre')}")
+                                        elif "tipo" in centro:
+                                            logger.info(f"Centro de Salud {idx+1}: {centro.get('tipo')}")
                                 
                                 data_module.centros_salud = response_data
                         
@@ -156,9 +161,4 @@ def get_centros_salud(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de centros de salud: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/salud/centros-salud",
-            catch_response=True,
-            name="(SALUD) - /salud/centros-salud [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(SALUD) - /salud/centros-salud [Exception]", e)
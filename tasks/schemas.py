@@ -0,0 +1,115 @@
+"""Registro de esquemas de respuesta por ruta.
+
+Un esquema por plantilla de ruta (la misma que figura en el nombre del
+request, ver utils/naming.py) con los campos obligatorios y opcionales de
+cada elemento. Los task functions validan con validar(ruta, datos); el
+motor y el muestreo están en utils/validation.py. Las rutas de consulta
+declaradas con utils/routes.py (domicilios) llevan su esquema en la
+propia declaración.
+"""
+from utils.validation import NULO, Schema, validate
+
+# Campos de una dependencia del organigrama (cerrojo institucional)
+_UNIDAD = {
+    "id_unidad": int,
+    "unidad": str,
+    "id_cerrojo": int,
+    "tipo": str,
+    "ubicacion": (str, NULO),
+    "externa": str,
+    "mesa": str,
+    "cod_mesa_entrada": (int, NULO),
+}
+
+# La unidad superior viene en null en la raíz del organigrama
+_SUPERIOR = {
+    "id_unidad_superior": (int, NULO),
+    "unidad_superior": (str, NULO),
+    "id_cerrojo_superior": (int, NULO),
+    "tipo_superior": (str, NULO),
+    "ubicacion_superior": (str, NULO),
+    "externa_superior": (str, NULO),
+    "mesa_superior": (str, NULO),
+}
+
+_DEPENDENCIA = {**_UNIDAD, **_SUPERIOR}
+
+DEPENDENCIA = Schema(required=_DEPENDENCIA)
+
+# Respuesta paginada (PaginationResponseSchema)
+PAGINA = Schema(required={"page_number": int, "page_size": int, "total_items": int, "items": list})
+
+
+def _alguno(*campos):
+    """Esquema de las rutas que solo exigen alguno de los campos conocidos"""
+    return Schema(any_of=campos)
+
+
+SCHEMAS = {
+    # Cerrojo institucional
+    "/organigrama/dependencias/niveles/{p_nivel}": Schema(required={"id_unidad": int, "unidad": str, "nivel": int}),
+    "/organigrama/dependencias/nivel/{p_nivel}": Schema(required={**_DEPENDENCIA, "nivel": int}),
+    "/organigrama/{p_id_dependencia}": DEPENDENCIA,
+    "/organigrama/": DEPENDENCIA,
+    "/organigrama/dependencias/{p_id_dependencia}": DEPENDENCIA,
+    "/organigrama/dependencias-ruta/{p_id_dependencia}": DEPENDENCIA,
+    # Las dependencias directas no siempre traen los campos de la superior
+    "/organigrama/dependencias-directas/{p_id_dependencia}": Schema(required=_UNIDAD, optional=_SUPERIOR),
+    "/dependencias": DEPENDENCIA,
+    "/dependencias/ids": Schema(required={"id_unidad": int, "unidad": str}, optional=_DEPENDENCIA),
+
+    # Transporte
+    "/condiciones": _alguno("id", "nombre", "descripcion", "codigo", "tipo", "estado", "fecha_creacion", "fecha_modificacion", "activo"),
+    "/estacionamiento-bicicletas": _alguno("id", "nombre", "ubicacion", "direccion", "capacidad", "tipo", "estado", "barrio", "zona",
+                                           "latitud", "longitud", "horario"),
+    "/estados_licencias": _alguno("id", "nombre", "descripcion", "codigo", "estado", "activo", "fecha_creacion", "fecha_modificacion"),
+    "/situaciones_chapas": _alguno("id", "nombre", "descripcion", "codigo", "tipo", "estado", "activo", "fecha_creacion", "fecha_modificacion"),
+    "/tipos_servicios": _alguno("id", "nombre", "descripcion", "codigo", "tipo", "categoria", "estado", "activo", "fecha_creacion",
+                                "fecha_modificacion"),
+    "/zona-semm": _alguno("id", "nombre", "descripcion", "codigo", "zona", "area", "coordenadas", "poligono", "latitud", "longitud",
+                          "estado", "activo"),
+    "/chapas": _alguno("id_prm_chapa", "numero_interno", "tipo_servicio", "dominio", "apellido_permisionario", "nombre_permisionario",
+                       "cuil_permisionario", "situacion_chapa"),
+    "/leasing": _alguno("id", "id_leasing", "numero_chapa", "chapa", "arrendatario", "apellido_arrendatario", "nombre_arrendatario",
+                        "dni_arrendatario", "cuil_arrendatario", "vencimiento", "fecha_inicio", "fecha_fin", "estado"),
+    "/centrales-agencias": _alguno("id", "id_central_agencia", "cuit", "nombre", "razon_social", "tipo", "estado", "direccion",
+                                   "telefono", "email", "localidad", "barrio", "fecha_alta"),
+    "/chapas/personas-fisicas": _alguno("id", "id_persona_fisica", "dni", "cuil", "apellido", "nombre", "fecha_nacimiento", "sexo",
+                                        "estado_civil", "nacionalidad"),
+    "/chapas/{cuil}": _alguno("id", "id_chapa", "numero_chapa", "numero_interno", "tipo_servicio", "estado", "situacion",
+                              "permisionario", "cuil", "dominio"),
+    "/permisionarios": _alguno("id_permisionario", "apellido_permisionario", "nombre_permisionario", "cuil_permisionario",
+                               "id_persona_fisica", "Chapas"),
+    "/licencias": _alguno("id", "id_licencia", "numero_licencia", "dni", "cuil", "apellido", "nombre", "clase", "estado",
+                          "fecha_emision", "fecha_vencimiento"),
+    "/ciclovias": _alguno("id", "id_ciclovia", "nombre", "descripcion", "barrio", "zona", "estado", "tipo", "longitud",
+                          "coordenadas", "fecha_construccion"),
+
+    # Paramétricas
+    "/medios_pagos": _alguno("id", "id_medio_pago", "nombre", "p_nombre", "descripcion", "codigo", "estado", "tipo", "activo",
+                             "id_sistema_permisionados"),
+    "/cfiscal": _alguno("id_condicion_fiscal", "nombre", "id", "descripcion", "codigo"),
+    "/fjuridica": _alguno("id_forma_juridica", "nombre", "id", "descripcion", "codigo"),
+    "/bancos": _alguno("p_id_banco", "p_nombre", "id_banco", "nombre", "id", "codigo"),
+    "/bancos/{id}": _alguno("p_id_banco", "p_nombre", "id_banco", "nombre", "id", "codigo"),
+    "/profesiones": _alguno("p_id_profesion", "p_nombre", "id_profesion", "nombre", "id", "codigo"),
+    "/profesiones/{id}": _alguno("p_id_profesion", "p_nombre", "id_profesion", "nombre", "id", "codigo"),
+    "/dispositivos_pagos": _alguno("id_dispositivo_pago", "nombre", "id", "descripcion", "codigo", "estado", "tipo", "activo"),
+    "/actividades": _alguno("id_actividad", "nombre", "id", "descripcion", "codigo", "estado", "activo",
+                            "p_id_actividad", "p_nombre", "p_codigo_afip", "p_descripcion"),
+
+    # Proveedores
+    "/proveedores": Schema(required={"p_cuit_cuil": (str, int), "id_proveedor": int, "p_tipo_proveedor": str}),
+    "/proveedores/actividad": Schema(required={"p_id_actividad": int, "p_cuit_cuil": (str, int), "p_apenom_razsoc": str}),
+    "/proveedores/busqueda": PAGINA,
+    "/proveedores/busqueda-por-ids": Schema(required={
+        "p_tipo_proveedor": str, "p_id_proveedor": int, "p_cuit_cuil": (str, int), "p_razsoc_apenom": str, "p_modalidad": (str, NULO),
+    }),
+    "/proveedores/busqueda-por-ids/search": PAGINA,
+    "/proveedores/busqueda/minimizado": PAGINA,
+}
+
+
+def validar(ruta, datos):
+    """Valida la respuesta de una ruta con su esquema; devuelve la lista de errores"""
+    return validate(SCHEMAS[ruta], datos, nombre=ruta)
@@ -1,6 +1,12 @@
 import random
+import logging
 from typing import Dict, Any
 
+from locust.exception import CatchResponseError
+from tasks.schemas import validar
+from utils import paging
+from utils.http import report_failure
+
 def get_condiciones(client, logger, environment, data_module):
     """Prueba el endpoint de consultar todas las condiciones de transporte"""
     
@@ -22,7 +28,7 @@ def get_condiciones(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -45,48 +51,46 @@ def get_condiciones(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                             
                             # Verificar si al menos tiene algunos campos básicos de condiciones
-                            tiene_campos_basicos = any(
-                                campo in primer_elemento 
-                                for campo in ["id", "nombre", "descripcion", "codigo", "tipo", "estado", "fecha_creacion", "fecha_modificacion", "activo"]
-                            )
+                            errores = validar("/condiciones", response_data)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info("Consulta de condiciones exitosa")
                                 
                                 # Mostrar información de algunas condiciones (hasta 5)
-                                for idx, condicion in enumerate(response_data[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "nombre" in condicion:
-                                        logger.info(f"Condición {idx+1}: {condicion.get('nombre')}")
-                                    elif "descripcion" in condicion:
-                                        logger.info(f"Condición {idx+1}: {condicion.get('descripcion')}")
-                                    elif "codigo" in condicion:
-                                        logger.info(f"Condición {idx+1}: Código {condicion.get('codigo')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in condicion.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Condición {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, condicion in enumerate(response_data[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "nombre" in condicion:
+                                            logger.info(f"Condición {idx+1}: {condicion.get('nombre')}")
+                                        elif "descripcion" in condicion:
+                                            logger.info(f"Condición {idx+1}: {condicion.get('descripcion')}")
+                                        elif "codigo" in condicion:
+                                            logger.info(f"Condición {idx+1}: Código {condicion.get('codigo')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in condicion.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Condición {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional si está disponible
-                                    if "id" in condicion and condicion.get("id"):
-                                        logger.info(f"  ID: {condicion.get('id')}")
-                                    if "codigo" in condicion and condicion.get("codigo"):
-                                        logger.info(f"  Código: {condicion.get('codigo')}")
-                                    if "descripcion" in condicion and condicion.get("descripcion"):
-                                        logger.info(f"  Descripción: {condicion.get('descripcion')}")
-                                    if "tipo" in condicion and condicion.get("tipo"):
-                                        logger.info(f"  Tipo: {condicion.get('tipo')}")
-                                    if "estado" in condicion and condicion.get("estado"):
-                                        logger.info(f"  Estado: {condicion.get('estado')}")
-                                    if "activo" in condicion and condicion.get("activo") is not None:
-                                        logger.info(f"  Activo: {condicion.get('activo')}")
-                                    if "fecha_creacion" in condicion and condicion.get("fecha_creacion"):
-                                        logger.info(f"  Fecha Creación: {condicion.get('fecha_creacion')}")
-                                    if "fecha_modificacion" in condicion and condicion.get("fecha_modificacion"):
-                                        logger.info(f"  Fecha Modificación: {condicion.get('fecha_modificacion')}")
+                                        # Mostrar información adicional si está disponible
+                                        if "id" in condicion and condicion.get("id"):
+                                            logger.info(f"  ID: {condicion.get('id')}")
+                                        if "codigo" in condicion and condicion.get("codigo"):
+                                            logger.info(f"  Código: {condicion.get('codigo')}")
+                                        if "descripcion" in condicion and condicion.get("descripcion"):
+                                            logger.info(f"  Descripción: {condicion.get('descripcion')}")
+                                        if "tipo" in condicion and condicion.get("tipo"):
+                                            logger.info(f"  Tipo: {condicion.get('tipo')}")
+                                        if "estado" in condicion and condicion.get("estado"):
+                                            logger.info(f"  Estado: {condicion.get('estado')}")
+                                        if "activo" in condicion and condicion.get("activo") is not None:
+                                            logger.info(f"  Activo: {condicion.get('activo')}")
+                                        if "fecha_creacion" in condicion and condicion.get("fecha_creacion"):
+                                            logger.info(f"  Fecha Creación: {condicion.get('fecha_creacion')}")
+                                        if "fecha_modificacion" in condicion and condicion.get("fecha_modificacion"):
+                                            logger.info(f"  Fecha Modificación: {condicion.get('fecha_modificacion')}")
                                 
                                 # Si hay más de 5 condiciones, indicar cuántas más hay
                                 if cantidad_condiciones > 5:
@@ -96,7 +100,7 @@ def get_condiciones(client, logger, environment, data_module):
                                 data_module.condiciones = response_data
                             else:
                                 response.failure("Los elementos no tienen campos reconocibles de condiciones")
-                                logger.warning(f"Estructura de datos no reconocida: {primer_elemento}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                         else:
                             # Si no se encontraron condiciones
                             logger.warning("No se encontraron condiciones")
@@ -119,11 +123,12 @@ def get_condiciones(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles: {campos_disponibles}")
                                 
                                 # Mostrar algunas condiciones
-                                for idx, condicion in enumerate(items[:5]):
-                                    if "nombre" in condicion:
-                                        logger.info(f"Condición {idx+1}: {condicion.get('nombre')}")
-                                    elif "descripcion" in condicion:
-                                        logger.info(f"Condición {idx+1}: {condicion.get('descripcion')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, condicion in enumerate(items[:5]):
+                                        if "nombre" in condicion:
+                                            logger.info(f"Condición {idx+1}: {condicion.get('nombre')}")
+                                        elif "descripcion" in condicion:
+                                            logger.info(f"Condición {idx+1}: {condicion.get('descripcion')}")
                                 
                                 data_module.condiciones = response_data
                         
@@ -156,12 +161,7 @@ def get_condiciones(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de condiciones: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/condiciones",
-            catch_response=True,
-            name="(TRANSPORTE) - /condiciones [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(TRANSPORTE) - /condiciones [Exception]", e)
 
 
 def get_estacionamiento_bicicletas(client, logger, environment, data_module):
@@ -185,7 +185,7 @@ def get_estacionamiento_bicicletas(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -208,50 +208,48 @@ def get_estacionamiento_bicicletas(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                             
                             # Verificar si al menos tiene algunos campos básicos de estacionamientos
-                            tiene_campos_basicos = any(
-                                campo in primer_elemento 
-                                for campo in ["id", "nombre", "ubicacion", "direccion", "capacidad", "tipo", "estado", "barrio", "zona", "latitud", "longitud", "horario"]
-                            )
+                            errores = validar("/estacionamiento-bicicletas", response_data)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info("Consulta de estacionamientos de bicicletas exitosa")
                                 
                                 # Mostrar información de algunos estacionamientos (hasta 5)
-                                for idx, estacionamiento in enumerate(response_data[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "nombre" in estacionamiento:
-                                        logger.info(f"Estacionamiento {idx+1}: {estacionamiento.get('nombre')}")
-                                    elif "ubicacion" in estacionamiento:
-                                        logger.info(f"Estacionamiento {idx+1}: {estacionamiento.get('ubicacion')}")
-                                    elif "direccion" in estacionamiento:
-                                        logger.info(f"Estacionamiento {idx+1}: {estacionamiento.get('direccion')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in estacionamiento.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Estacionamiento {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, estacionamiento in enumerate(response_data[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "nombre" in estacionamiento:
+                                            logger.info(f"Estacionamiento {idx+1}: {estacionamiento.get('nombre')}")
+                                        elif "ubicacion" in estacionamiento:
+                                            logger.info(f"Estacionamiento {idx+1}: {estacionamiento.get('ubicacion')}")
+                                        elif "direccion" in estacionamiento:
+                                            logger.info(f"Estacionamiento {idx+1}: {estacionamiento.get('direccion')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in estacionamiento.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Estacionamiento {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional si está disponible
-                                    if "id" in estacionamiento and estacionamiento.get("id"):
-                                        logger.info(f"  ID: {estacionamiento.get('id')}")
-                                    if "direccion" in estacionamiento and estacionamiento.get("direccion"):
-                                        logger.info(f"  Dirección: {estacionamiento.get('direccion')}")
-                                    if "capacidad" in estacionamiento and estacionamiento.get("capacidad"):
-                                        logger.info(f"  Capacidad: {estacionamiento.get('capacidad')}")
-                                    if "tipo" in estacionamiento and estacionamiento.get("tipo"):
-                                        logger.info(f"  Tipo: {estacionamiento.get('tipo')}")
-                                    if "estado" in estacionamiento and estacionamiento.get("estado"):
-                                        logger.info(f"  Estado: {estacionamiento.get('estado')}")
-                                    if "barrio" in estacionamiento and estacionamiento.get("barrio"):
-                                        logger.info(f"  Barrio: {estacionamiento.get('barrio')}")
-                                    if "zona" in estacionamiento and estacionamiento.get("zona"):
-                                        logger.info(f"  Zona: {estacionamiento.get('zona')}")
-                                    if "horario" in estacionamiento and estacionamiento.get("horario"):
-                                        logger.info(f"  Horario: {estacionamiento.get('horario')}")
-                                    if "latitud" in estacionamiento and estacionamiento.get("latitud"):
-                                        logger.info(f"  Coordenadas: {estacionamiento.get('latitud')}, {estacionamiento.get('longitud', 'N/A')}")
+                                        # Mostrar información adicional si está disponible
+                                        if "id" in estacionamiento and estacionamiento.get("id"):
+                                            logger.info(f"  ID: {estacionamiento.get('id')}")
+                                        if "direccion" in estacionamiento and estacionamiento.get("direccion"):
+                                            logger.info(f"  Dirección: {estacionamiento.get('direccion')}")
+                                        if "capacidad" in estacionamiento and estacionamiento.get("capacidad"):
+                                            logger.info(f"  Capacidad: {estacionamiento.get('capacidad')}")
+                                        if "tipo" in estacionamiento and estacionamiento.get("tipo"):
+                                            logger.info(f"  Tipo: {estacionamiento.get('tipo')}")
+                                        if "estado" in estacionamiento and estacionamiento.get("estado"):
+                                            logger.info(f"  Estado: {estacionamiento.get('estado')}")
+                                        if "barrio" in estacionamiento and estacionamiento.get("barrio"):
+                                            logger.info(f"  Barrio: {estacionamiento.get('barrio')}")
+                                        if "zona" in estacionamiento and estacionamiento.get("zona"):
+                                            logger.info(f"  Zona: {estacionamiento.get('zona')}")
+                                        if "horario" in estacionamiento and estacionamiento.get("horario"):
+                                            logger.info(f"  Horario: {estacionamiento.get('horario')}")
+                                        if "latitud" in estacionamiento and estacionamiento.get("latitud"):
+                                            logger.info(f"  Coordenadas: {estacionamiento.get('latitud')}, {estacionamiento.get('longitud', 'N/A')}")
                                 
                                 # Si hay más de 5 estacionamientos, indicar cuántos más hay
                                 if cantidad_estacionamientos > 5:
@@ -261,7 +259,7 @@ def get_estacionamiento_bicicletas(client, logger, environment, data_module):
                                 data_module.estacionamientos_bicicletas = response_data
                             else:
                                 response.failure("Los elementos no tienen campos reconocibles de estacionamientos")
-                                logger.warning(f"Estructura de datos no reconocida: {primer_elemento}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                         else:
                             # Si no se encontraron estacionamientos
                             logger.warning("No se encontraron estacionamientos de bicicletas")
@@ -284,11 +282,12 @@ def get_estacionamiento_bicicletas(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles: {campos_disponibles}")
                                 
                                 # Mostrar algunos estacionamientos
-                                for idx, estacionamiento in enumerate(items[:5]):
-                                    if "nombre" in estacionamiento:
-                                        logger.info(f"Estacionamiento {idx+1}: {estacionamiento.get('nombre')}")
-                                    elif "ubicacion" in estacionamiento:
-                                        logger.info(f"Estacionamiento {idx+1}: {estacionamiento.get('ubicacion')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, estacionamiento in enumerate(items[:5]):
+                                        if "nombre" in estacionamiento:
+                                            logger.info(f"Estacionamiento {idx+1}: {estacionamiento.get('nombre')}")
+                                        elif "ubicacion" in estacionamiento:
+                                            logger.info(f"Estacionamiento {idx+1}: {estacionamiento.get('ubicacion')}")
                                 
                                 data_module.estacionamientos_bicicletas = response_data
                         
@@ -321,12 +320,7 @@ def get_estacionamiento_bicicletas(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de estacionamientos de bicicletas: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/estacionamiento-bicicletas",
-            catch_response=True,
-            name="(TRANSPORTE) - /estacionamiento-bicicletas [GET]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(TRANSPORTE) - /estacionamiento-bicicletas [GET]", e)
 
 def get_estados_licencias(client, logger, environment, data_module):
     """Prueba el endpoint de consultar todos los estados de licencias"""
@@ -349,7 +343,7 @@ def get_estados_licencias(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -372,46 +366,44 @@ def get_estados_licencias(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                             
                             # Verificar si al menos tiene algunos campos básicos de estados de licencias
-                            tiene_campos_basicos = any(
-                                campo in primer_elemento 
-                                for campo in ["id", "nombre", "descripcion", "codigo", "estado", "activo", "fecha_creacion", "fecha_modificacion"]
-                            )
+                            errores = validar("/estados_licencias", response_data)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info("Consulta de estados de licencias exitosa")
                                 
                                 # Mostrar información de algunos estados (hasta 5)
-                                for idx, estado in enumerate(response_data[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "nombre" in estado:
-                                        logger.info(f"Estado de Licencia {idx+1}: {estado.get('nombre')}")
-                                    elif "descripcion" in estado:
-                                        logger.info(f"Estado de Licencia {idx+1}: {estado.get('descripcion')}")
-                                    elif "codigo" in estado:
-                                        logger.info(f"Estado de Licencia {idx+1}: Código {estado.get('codigo')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in estado.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Estado de Licencia {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, estado in enumerate(response_data[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "nombre" in estado:
+                                            logger.info(f"Estado de Licencia {idx+1}: {estado.get('nombre')}")
+                                        elif "descripcion" in estado:
+                                            logger.info(f"Estado de Licencia {idx+1}: {estado.get('descripcion')}")
+                                        elif "codigo" in estado:
+                                            logger.info(f"Estado de Licencia {idx+1}: Código {estado.get('codigo')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in estado.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Estado de Licencia {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional si está disponible
-                                    if "id" in estado and estado.get("id"):
-                                        logger.info(f"  ID: {estado.get('id')}")
-                                    if "codigo" in estado and estado.get("codigo"):
-                                        logger.info(f"  Código: {estado.get('codigo')}")
-                                    if "descripcion" in estado and estado.get("descripcion"):
-                                        logger.info(f"  Descripción: {estado.get('descripcion')}")
-                                    if "estado" in estado and estado.get("estado"):
-                                        logger.info(f"  Estado: {estado.get('estado')}")
-                                    if "activo" in estado and estado.get("activo") is not None:
-                                        logger.info(f"  Activo: {estado.get('activo')}")
-                                    if "fecha_creacion" in estado and estado.get("fecha_creacion"):
-                                        logger.info(f"  Fecha Creación: {estado.get('fecha_creacion')}")
-                                    if "fecha_modificacion" in estado and estado.get("fecha_modificacion"):
-                                        logger.info(f"  Fecha Modificación: {estado.get('fecha_modificacion')}")
+                                        # Mostrar información adicional si está disponible
+                                        if "id" in estado and estado.get("id"):
+                                            logger.info(f"  ID: {estado.get('id')}")
+                                        if "codigo" in estado and estado.get("codigo"):
+                                            logger.info(f"  Código: {estado.get('codigo')}")
+                                        if "descripcion" in estado and estado.get("descripcion"):
+                                            logger.info(f"  Descripción: {estado.get('descripcion')}")
+                                        if "estado" in estado and estado.get("estado"):
+                                            logger.info(f"  Estado: {estado.get('estado')}")
+                                        if "activo" in estado and estado.get("activo") is not None:
+                                            logger.info(f"  Activo: {estado.get('activo')}")
+                                        if "fecha_creacion" in estado and estado.get("fecha_creacion"):
+                                            logger.info(f"  Fecha Creación: {estado.get('fecha_creacion')}")
+                                        if "fecha_modificacion" in estado and estado.get("fecha_modificacion"):
+                                            logger.info(f"  Fecha Modificación: {estado.get('fecha_modificacion')}")
                                 
                                 # Si hay más de 5 estados, indicar cuántos más hay
                                 if cantidad_estados > 5:
@@ -421,7 +413,7 @@ def get_estados_licencias(client, logger, environment, data_module):
                                 data_module.estados_licencias = response_data
                             else:
                                 response.failure("Los elementos no tienen campos reconocibles de estados de licencias")
-                                logger.warning(f"Estructura de datos no reconocida: {primer_elemento}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                         else:
                             # Si no se encontraron estados de licencias
                             logger.warning("No se encontraron estados de licencias")
@@ -444,11 +436,12 @@ def get_estados_licencias(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles: {campos_disponibles}")
                                 
                                 # Mostrar algunos estados de licencias
-                                for idx, estado in enumerate(items[:5]):
-                                    if "nombre" in estado:
-                                        logger.info(f"Estado de Licencia {idx+1}: {estado.get('nombre')}")
-                                    elif "descripcion" in estado:
-                                        logger.info(f"Estado de Licencia {idx+1}: {estado.get('descripcion')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, estado in enumerate(items[:5]):
+                                        if "nombre" in estado:
+                                            logger.info(f"Estado de Licencia {idx+1}: {estado.get('nombre')}")
+                                        elif "descripcion" in estado:
+                                            logger.info(f"Estado de Licencia {idx+1}: {estado.get('descripcion')}")
                                 
                                 data_module.estados_licencias = response_data
                         
@@ -481,12 +474,7 @@ def get_estados_licencias(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de estados de licencias: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/estados_licencias",
-            catch_response=True,
-            name="(TRANSPORTE) - /estados_licencias [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(TRANSPORTE) - /estados_licencias [Exception]", e)
 
 
 def get_situaciones_chapas(client, logger, environment, data_module):
@@ -510,7 +498,7 @@ def get_situaciones_chapas(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -533,48 +521,46 @@ def get_situaciones_chapas(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                             
                             # Verificar si al menos tiene algunos campos básicos de situaciones de chapas
-                            tiene_campos_basicos = any(
-                                campo in primer_elemento 
-                                for campo in ["id", "nombre", "descripcion", "codigo", "tipo", "estado", "activo", "fecha_creacion", "fecha_modificacion"]
-                            )
+                            errores = validar("/situaciones_chapas", response_data)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info("Consulta de situaciones de chapas exitosa")
                                 
                                 # Mostrar información de algunas situaciones (hasta 5)
-                                for idx, situacion in enumerate(response_data[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "nombre" in situacion:
-                                        logger.info(f"Situación de Chapa {idx+1}: {situacion.get('nombre')}")
-                                    elif "descripcion" in situacion:
-                                        logger.info(f"Situación de Chapa {idx+1}: {situacion.get('descripcion')}")
-                                    elif "codigo" in situacion:
-                                        logger.info(f"Situación de Chapa {idx+1}: Código {situacion.get('codigo')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in situacion.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Situación de Chapa {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, situacion in enumerate(response_data[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "nombre" in situacion:
+                                            logger.info(f"Situación de Chapa {idx+1}: {situacion.get('nombre')}")
+                                        elif "descripcion" in situacion:
+                                            logger.info(f"Situación de Chapa {idx+1}: {situacion.get('descripcion')}")
+                                        elif "codigo" in situacion:
+                                            logger.info(f"Situación de Chapa {idx+1}: Código {situacion.get('codigo')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in situacion.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Situación de Chapa {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional si está disponible
-                                    if "id" in situacion and situacion.get("id"):
-                                        logger.info(f"  ID: {situacion.get('id')}")
-                                    if "codigo" in situacion and situacion.get("codigo"):
-                                        logger.info(f"  Código: {situacion.get('codigo')}")
-                                    if "descripcion" in situacion and situacion.get("descripcion"):
-                                        logger.info(f"  Descripción: {situacion.get('descripcion')}")
-                                    if "tipo" in situacion and situacion.get("tipo"):
-                                        logger.info(f"  Tipo: {situacion.get('tipo')}")
-                                    if "estado" in situacion and situacion.get("estado"):
-                                        logger.info(f"  Estado: {situacion.get('estado')}")
-                                    if "activo" in situacion and situacion.get("activo") is not None:
-                                        logger.info(f"  Activo: {situacion.get('activo')}")
-                                    if "fecha_creacion" in situacion and situacion.get("fecha_creacion"):
-                                        logger.info(f"  Fecha Creación: {situacion.get('fecha_creacion')}")
-                                    if "fecha_modificacion" in situacion and situacion.get("fecha_modificacion"):
-                                        logger.info(f"  Fecha Modificación: {situacion.get('fecha_modificacion')}")
+                                        # Mostrar información adicional si está disponible
+                                        if "id" in situacion and situacion.get("id"):
+                                            logger.info(f"  ID: {situacion.get('id')}")
+                                        if "codigo" in situacion and situacion.get("codigo"):
+                                            logger.info(f"  Código: {situacion.get('codigo')}")
+                                        if "descripcion" in situacion and situacion.get("descripcion"):
+                                            logger.info(f"  Descripción: {situacion.get('descripcion')}")
+                                        if "tipo" in situacion and situacion.get("tipo"):
+                                            logger.info(f"  Tipo: {situacion.get('tipo')}")
+                                        if "estado" in situacion and situacion.get("estado"):
+                                            logger.info(f"  Estado: {situacion.get('estado')}")
+                                        if "activo" in situacion and situacion.get("activo") is not None:
+                                            logger.info(f"  Activo: {situacion.get('activo')}")
+                                        if "fecha_creacion" in situacion and situacion.get("fecha_creacion"):
+                                            logger.info(f"  Fecha Creación: {situacion.get('fecha_creacion')}")
+                                        if "fecha_modificacion" in situacion and situacion.get("fecha_modificacion"):
+                                            logger.info(f"  Fecha Modificación: {situacion.get('fecha_modificacion')}")
                                 
                                 # Si hay más de 5 situaciones, indicar cuántas más hay
                                 if cantidad_situaciones > 5:
@@ -584,7 +570,7 @@ def get_situaciones_chapas(client, logger, environment, data_module):
                                 data_module.situaciones_chapas = response_data
                             else:
                                 response.failure("Los elementos no tienen campos reconocibles de situaciones de chapas")
-                                logger.warning(f"Estructura de datos no reconocida: {primer_elemento}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                         else:
                             # Si no se encontraron situaciones de chapas
                             logger.warning("No se encontraron situaciones de chapas")
@@ -607,11 +593,12 @@ def get_situaciones_chapas(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles: {campos_disponibles}")
                                 
                                 # Mostrar algunas situaciones de chapas
-                                for idx, situacion in enumerate(items[:5]):
-                                    if "nombre" in situacion:
-                                        logger.info(f"Situación de Chapa {idx+1}: {situacion.get('nombre')}")
-                                    elif "descripcion" in situacion:
-                                        logger.info(f"Situación de Chapa {idx+1}: {situacion.get('descripcion')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, situacion in enumerate(items[:5]):
+                                        if "nombre" in situacion:
+                                            logger.info(f"Situación de Chapa {idx+1}: {situacion.get('nombre')}")
+                                        elif "descripcion" in situacion:
+                                            logger.info(f"Situación de Chapa {idx+1}: {situacion.get('descripcion')}")
                                 
                                 data_module.situaciones_chapas = response_data
                         
@@ -644,12 +631,7 @@ def get_situaciones_chapas(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de situaciones de chapas: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/situaciones_chapas",
-            catch_response=True,
-            name="(TRANSPORTE) - /situaciones_chapas [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(TRANSPORTE) - /situaciones_chapas [Exception]", e)
 
 
 def get_tipos_servicios(client, logger, environment, data_module):
@@ -673,7 +655,7 @@ def get_tipos_servicios(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -696,50 +678,48 @@ def get_tipos_servicios(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                             
                             # Verificar si al menos tiene algunos campos básicos de tipos de servicios
-                            tiene_campos_basicos = any(
-                                campo in primer_elemento 
-                                for campo in ["id", "nombre", "descripcion", "codigo", "tipo", "categoria", "estado", "activo", "fecha_creacion", "fecha_modificacion"]
-                            )
+                            errores = validar("/tipos_servicios", response_data)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info("Consulta de tipos de servicios exitosa")
                                 
                                 # Mostrar información de algunos tipos de servicios (hasta 5)
-                                for idx, tipo_servicio in enumerate(response_data[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "nombre" in tipo_servicio:
-                                        logger.info(f"Tipo de Servicio {idx+1}: {tipo_servicio.get('nombre')}")
-                                    elif "descripcion" in tipo_servicio:
-                                        logger.info(f"Tipo de Servicio {idx+1}: {tipo_servicio.get('descripcion')}")
-                                    elif "codigo" in tipo_servicio:
-                                        logger.info(f"Tipo de Servicio {idx+1}: Código {tipo_servicio.get('codigo')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in tipo_servicio.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Tipo de Servicio {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, tipo_servicio in enumerate(response_data[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "nombre" in tipo_servicio:
+                                            logger.info(f"Tipo de Servicio {idx+1}: {tipo_servicio.get('nombre')}")
+                                        elif "descripcion" in tipo_servicio:
+                                            logger.info(f"Tipo de Servicio {idx+1}: {tipo_servicio.get('descripcion')}")
+                                        elif "codigo" in tipo_servicio:
+                                            logger.info(f"Tipo de Servicio {idx+1}: Código {tipo_servicio.get('codigo')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in tipo_servicio.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Tipo de Servicio {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional si está disponible
-                                    if "id" in tipo_servicio and tipo_servicio.get("id"):
-                                        logger.info(f"  ID: {tipo_servicio.get('id')}")
-                                    if "codigo" in tipo_servicio and tipo_servicio.get("codigo"):
-                                        logger.info(f"  Código: {tipo_servicio.get('codigo')}")
-                                    if "descripcion" in tipo_servicio and tipo_servicio.get("descripcion"):
-                                        logger.info(f"  Descripción: {tipo_servicio.get('descripcion')}")
-                                    if "tipo" in tipo_servicio and tipo_servicio.get("tipo"):
-                                        logger.info(f"  Tipo: {tipo_servicio.get('tipo')}")
-                                    if "categoria" in tipo_servicio and tipo_servicio.get("categoria"):
-                                        logger.info(f"  Categoría: {tipo_servicio.get('categoria')}")
-                                    if "estado" in tipo_servicio and tipo_servicio.get("estado"):
-                                        logger.info(f"  Estado: {tipo_servicio.get('estado')}")
-                                    if "activo" in tipo_servicio and tipo_servicio.get("activo") is not None:
-                                        logger.info(f"  Activo: {tipo_servicio.get('activo')}")
-                                    if "fecha_creacion" in tipo_servicio and tipo_servicio.get("fecha_creacion"):
-                                        logger.info(f"  Fecha Creación: {tipo_servicio.get('fecha_creacion')}")
-                                    if "fecha_modificacion" in tipo_servicio and tipo_servicio.get("fecha_modificacion"):
-                                        logger.info(f"  Fecha Modificación: {tipo_servicio.get('fecha_modificacion')}")
+                                        # Mostrar información adicional si está disponible
+                                        if "id" in tipo_servicio and tipo_servicio.get("id"):
+                                            logger.info(f"  ID: {tipo_servicio.get('id')}")
+                                        if "codigo" in tipo_servicio and tipo_servicio.get("codigo"):
+                                            logger.info(f"  Código: {tipo_servicio.get('codigo')}")
+                                        if "descripcion" in tipo_servicio and tipo_servicio.get("descripcion"):
+                                            logger.info(f"  Descripción: {tipo_servicio.get('descripcion')}")
+                                        if "tipo" in tipo_servicio and tipo_servicio.get("tipo"):
+                                            logger.info(f"  Tipo: {tipo_servicio.get('tipo')}")
+                                        if "categoria" in tipo_servicio and tipo_servicio.get("categoria"):
+                                            logger.info(f"  Categoría: {tipo_servicio.get('categoria')}")
+                                        if "estado" in tipo_servicio and tipo_servicio.get("estado"):
+                                            logger.info(f"  Estado: {tipo_servicio.get('estado')}")
+                                        if "activo" in tipo_servicio and tipo_servicio.get("activo") is not None:
+                                            logger.info(f"  Activo: {tipo_servicio.get('activo')}")
+                                        if "fecha_creacion" in tipo_servicio and tipo_servicio.get("fecha_creacion"):
+                                            logger.info(f"  Fecha Creación: {tipo_servicio.get('fecha_creacion')}")
+                                        if "fecha_modificacion" in tipo_servicio and tipo_servicio.get("fecha_modificacion"):
+                                            logger.info(f"  Fecha Modificación: {tipo_servicio.get('fecha_modificacion')}")
                                 
                                 # Si hay más de 5 tipos de servicios, indicar cuántos más hay
                                 if cantidad_tipos > 5:
@@ -749,7 +729,7 @@ def get_tipos_servicios(client, logger, environment, data_module):
                                 data_module.tipos_servicios = response_data
                             else:
                                 response.failure("Los elementos no tienen campos reconocibles de tipos de servicios")
-                                logger.warning(f"Estructura de datos no reconocida: {primer_elemento}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                         else:
                             # Si no se encontraron tipos de servicios
                             logger.warning("No se encontraron tipos de servicios")
@@ -772,11 +752,12 @@ def get_tipos_servicios(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles: {campos_disponibles}")
                                 
                                 # Mostrar algunos tipos de servicios
-                                for idx, tipo_servicio in enumerate(items[:5]):
-                                    if "nombre" in tipo_servicio:
-                                        logger.info(f"Tipo de Servicio {idx+1}: {tipo_servicio.get('nombre')}")
-                                    elif "descripcion" in tipo_servicio:
-                                        logger.info(f"Tipo de Servicio {idx+1}: {tipo_servicio.get('descripcion')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, tipo_servicio in enumerate(items[:5]):
+                                        if "nombre" in tipo_servicio:
+                                            logger.info(f"Tipo de Servicio {idx+1}: {tipo_servicio.get('nombre')}")
+                                        elif "descripcion" in tipo_servicio:
+                                            logger.info(f"Tipo de Servicio {idx+1}: {tipo_servicio.get('descripcion')}")
                                 
                                 data_module.tipos_servicios = response_data
                         
@@ -809,12 +790,7 @@ def get_tipos_servicios(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de tipos de servicios: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/tipos_servicios",
-            catch_response=True,
-            name="(TRANSPORTE) - /tipos_servicios [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(TRANSPORTE) - /tipos_servicios [Exception]", e)
 
 def get_zona_semm(client, logger, environment, data_module):
     """Prueba el endpoint de consultar mapa zona SEMM"""
@@ -837,7 +813,7 @@ def get_zona_semm(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -860,52 +836,50 @@ def get_zona_semm(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                             
                             # Verificar si al menos tiene algunos campos básicos de zonas SEMM
-                            tiene_campos_basicos = any(
-                                campo in primer_elemento 
-                                for campo in ["id", "nombre", "descripcion", "codigo", "zona", "area", "coordenadas", "poligono", "latitud", "longitud", "estado", "activo"]
-                            )
+                            errores = validar("/zona-semm", response_data)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info("Consulta de zonas SEMM exitosa")
                                 
                                 # Mostrar información de algunas zonas (hasta 5)
-                                for idx, zona in enumerate(response_data[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "nombre" in zona:
-                                        logger.info(f"Zona SEMM {idx+1}: {zona.get('nombre')}")
-                                    elif "descripcion" in zona:
-                                        logger.info(f"Zona SEMM {idx+1}: {zona.get('descripcion')}")
-                                    elif "codigo" in zona:
-                                        logger.info(f"Zona SEMM {idx+1}: Código {zona.get('codigo')}")
-                                    elif "zona" in zona:
-                                        logger.info(f"Zona SEMM {idx+1}: {zona.get('zona')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in zona.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Zona SEMM {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, zona in enumerate(response_data[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "nombre" in zona:
+                                            logger.info(f"Zona SEMM {idx+1}: {zona.get('nombre')}")
+                                        elif "descripcion" in zona:
+                                            logger.info(f"Zona SEMM {idx+1}: {zona.get('descripcion')}")
+                                        elif "codigo" in zona:
+                                            logger.info(f"Zona SEMM {idx+1}: Código {zona.get('codigo')}")
+                                        elif "zona" in zona:
+                                            logger.info(f"Zona SEMM {idx+1}: {zona.get('zona')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in zona.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Zona SEMM {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional si está disponible
-                                    if "id" in zona and zona.get("id"):
-                                        logger.info(f"  ID: {zona.get('id')}")
-                                    if "codigo" in zona and zona.get("codigo"):
-                                        logger.info(f"  Código: {zona.get('codigo')}")
-                                    if "descripcion" in zona and zona.get("descripcion"):
-                                        logger.info(f"  Descripción: {zona.get('descripcion')}")
-                                    if "area" in zona and zona.get("area"):
-                                        logger.info(f"  Área: {zona.get('area')}")
-                                    if "estado" in zona and zona.get("estado"):
-                                        logger.info(f"  Estado: {zona.get('estado')}")
-                                    if "activo" in zona and zona.get("activo") is not None:
-                                        logger.info(f"  Activo: {zona.get('activo')}")
-                                    if "latitud" in zona and zona.get("latitud"):
-                                        logger.info(f"  Coordenadas: {zona.get('latitud')}, {zona.get('longitud', 'N/A')}")
-                                    if "coordenadas" in zona and zona.get("coordenadas"):
-                                        logger.info(f"  Coordenadas: {str(zona.get('coordenadas'))[:50]}...")
-                                    if "poligono" in zona and zona.get("poligono"):
-                                        logger.info(f"  Polígono: {str(zona.get('poligono'))[:50]}...")
+                                        # Mostrar información adicional si está disponible
+                                        if "id" in zona and zona.get("id"):
+                                            logger.info(f"  ID: {zona.get('id')}")
+                                        if "codigo" in zona and zona.get("codigo"):
+                                            logger.info(f"  Código: {zona.get('codigo')}")
+                                        if "descripcion" in zona and zona.get("descripcion"):
+                                            logger.info(f"  Descripción: {zona.get('descripcion')}")
+                                        if "area" in zona and zona.get("area"):
+                                            logger.info(f"  Área: {zona.get('area')}")
+                                        if "estado" in zona and zona.get("estado"):
+                                            logger.info(f"  Estado: {zona.get('estado')}")
+                                        if "activo" in zona and zona.get("activo") is not None:
+                                            logger.info(f"  Activo: {zona.get('activo')}")
+                                        if "latitud" in zona and zona.get("latitud"):
+                                            logger.info(f"  Coordenadas: {zona.get('latitud')}, {zona.get('longitud', 'N/A')}")
+                                        if "coordenadas" in zona and zona.get("coordenadas"):
+                                            logger.info(f"  Coordenadas: {str(zona.get('coordenadas'))[:50]}...")
+                                        if "poligono" in zona and zona.get("poligono"):
+                                            logger.info(f"  Polígono: {str(zona.get('poligono'))[:50]}...")
                                 
                                 # Si hay más de 5 zonas, indicar cuántas más hay
                                 if cantidad_zonas > 5:
@@ -915,7 +889,7 @@ def get_zona_semm(client, logger, environment, data_module):
                                 data_module.zona_semm = response_data
                             else:
                                 response.failure("Los elementos no tienen campos reconocibles de zonas SEMM")
-                                logger.warning(f"Estructura de datos no reconocida: {primer_elemento}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                         else:
                             # Si no se encontraron zonas SEMM
                             logger.warning("No se encontraron zonas SEMM")
@@ -938,13 +912,14 @@ def get_zona_semm(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles: {campos_disponibles}")
                                 
                                 # Mostrar algunas zonas SEMM
-                                for idx, zona in enumerate(items[:5]):
-                                    if "nombre" in zona:
-                                        logger.info(f"Zona SEMM {idx+1}: {zona.get('nombre')}")
-                                    elif "descripcion" in zona:
-                                        logger.info(f"Zona SEMM {idx+1}: {zona.get('descripcion')}")
-                                    elif "zona" in zona:
-                                        logger.info(f"Zona SEMM {idx+1}: {zona.get('zona')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, zona in enumerate(items[:5]):
+                                        if "nombre" in zona:
+                                            logger.info(f"Zona SEMM {idx+1}: {zona.get('nombre')}")
+                                        elif "descripcion" in zona:
+                                            logger.info(f"Zona SEMM {idx+1}: {zona.get('descripcion')}")
+                                        elif "zona" in zona:
+                                            logger.info(f"Zona SEMM {idx+1}: {zona.get('zona')}")
                                 
                                 data_module.zona_semm = response_data
                         
@@ -977,12 +952,7 @@ def get_zona_semm(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de zona SEMM: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/zona-semm",
-            catch_response=True,
-            name="(TRANSPORTE) - /zona-semm [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(TRANSPORTE) - /zona-semm [Exception]", e)
 
 def get_chapas(client, logger, environment, data_module):
     """Prueba el endpoint de consultar chapas por parámetros"""
@@ -1003,11 +973,15 @@ def get_chapas(client, logger, environment, data_module):
             if value is not None:  # Solo agregar si el valor no es None
                 query_params[key] = value
     
+    # Página según la estrategia de paginación (utils/paging.py)
+    query_params, pagina = paging.choose_page(data_module, "/chapas", query_params)
+
     try:
         with client.get(
             "/chapas", 
             params=query_params if query_params else None,
             catch_response=True,
+            context={"pagina": pagina},
             name="(TRANSPORTE) - /chapas [GET]"
         ) as response:
             # Guardar la respuesta completa en el log (limitada para evitar saturación)
@@ -1022,13 +996,14 @@ def get_chapas(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
                 try:
                     # Verificar que la respuesta sea JSON válido
                     response_data = response.json()
+                    paging.update(data_module, "/chapas", response_data, query_params)
                     
                     # Guardar un resumen de los datos obtenidos en el log
                     logger.info("=== RESUMEN DE LA RESPUESTA (CHAPAS) ===")
@@ -1056,51 +1031,49 @@ def get_chapas(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                             
                             # Verificar si al menos tiene algunos campos básicos de chapas (usando los nombres reales)
-                            tiene_campos_basicos = any(
-                                campo in primer_elemento 
-                                for campo in ["id_prm_chapa", "numero_interno", "tipo_servicio", "dominio", "apellido_permisionario", "nombre_permisionario", "cuil_permisionario", "situacion_chapa"]
-                            )
+                            errores = validar("/chapas", items)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info("Consulta de chapas exitosa")
                                 
                                 # Mostrar información de algunas chapas (hasta 5)
-                                for idx, chapa in enumerate(items[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "numero_interno" in chapa:
-                                        logger.info(f"Chapa {idx+1}: Número Interno {chapa.get('numero_interno')}")
-                                    elif "id_prm_chapa" in chapa:
-                                        logger.info(f"Chapa {idx+1}: ID {chapa.get('id_prm_chapa')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in chapa.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Chapa {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, chapa in enumerate(items[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "numero_interno" in chapa:
+                                            logger.info(f"Chapa {idx+1}: Número Interno {chapa.get('numero_interno')}")
+                                        elif "id_prm_chapa" in chapa:
+                                            logger.info(f"Chapa {idx+1}: ID {chapa.get('id_prm_chapa')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in chapa.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Chapa {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional si está disponible
-                                    if "id_prm_chapa" in chapa and chapa.get("id_prm_chapa"):
-                                        logger.info(f"  ID Chapa: {chapa.get('id_prm_chapa')}")
-                                    if "tipo_servicio" in chapa and chapa.get("tipo_servicio"):
-                                        logger.info(f"  Tipo Servicio: {chapa.get('tipo_servicio')}")
-                                    if "dominio" in chapa and chapa.get("dominio"):
-                                        logger.info(f"  Dominio: {chapa.get('dominio')}")
-                                    if "situacion_chapa" in chapa and chapa.get("situacion_chapa"):
-                                        logger.info(f"  Situación: {chapa.get('situacion_chapa')}")
-                                    if "apellido_permisionario" in chapa and chapa.get("apellido_permisionario"):
-                                        nombre_completo = f"{chapa.get('apellido_permisionario')}, {chapa.get('nombre_permisionario', '')}"
-                                        logger.info(f"  Permisionario: {nombre_completo}")
-                                    if "cuil_permisionario" in chapa and chapa.get("cuil_permisionario"):
-                                        logger.info(f"  CUIL Permisionario: {chapa.get('cuil_permisionario')}")
-                                    if "central_agencia" in chapa and chapa.get("central_agencia"):
-                                        logger.info(f"  Central/Agencia: {chapa.get('central_agencia')}")
-                                    if "numero_dispositivo_pago" in chapa and chapa.get("numero_dispositivo_pago"):
-                                        logger.info(f"  Dispositivo Pago: {chapa.get('numero_dispositivo_pago')}")
-                                    if "nro_movil" in chapa and chapa.get("nro_movil"):
-                                        logger.info(f"  Número Móvil: {chapa.get('nro_movil')}")
-                                    if "cantidad_titulares" in chapa and chapa.get("cantidad_titulares"):
-                                        logger.info(f"  Cantidad Titulares: {chapa.get('cantidad_titulares')}")
+                                        # Mostrar información adicional si está disponible
+                                        if "id_prm_chapa" in chapa and chapa.get("id_prm_chapa"):
+                                            logger.info(f"  ID Chapa: {chapa.get('id_prm_chapa')}")
+                                        if "tipo_servicio" in chapa and chapa.get("tipo_servicio"):
+                                            logger.info(f"  Tipo Servicio: {chapa.get('tipo_servicio')}")
+                                        if "dominio" in chapa and chapa.get("dominio"):
+                                            logger.info(f"  Dominio: {chapa.get('dominio')}")
+                                        if "situacion_chapa" in chapa and chapa.get("situacion_chapa"):
+                                            logger.info(f"  Situación: {chapa.get('situacion_chapa')}")
+                                        if "apellido_permisionario" in chapa and chapa.get("apellido_permisionario"):
+                                            nombre_completo = f"{chapa.get('apellido_permisionario')}, {chapa.get('nombre_permisionario', '')}"
+                                            logger.info(f"  Permisionario: {nombre_completo}")
+                                        if "cuil_permisionario" in chapa and chapa.get("cuil_permisionario"):
+                                            logger.info(f"  CUIL Permisionario: {chapa.get('cuil_permisionario')}")
+                                        if "central_agencia" in chapa and chapa.get("central_agencia"):
+                                            logger.info(f"  Central/Agencia: {chapa.get('central_agencia')}")
+                                        if "numero_dispositivo_pago" in chapa and chapa.get("numero_dispositivo_pago"):
+                                            logger.info(f"  Dispositivo Pago: {chapa.get('numero_dispositivo_pago')}")
+                                        if "nro_movil" in chapa and chapa.get("nro_movil"):
+                                            logger.info(f"  Número Móvil: {chapa.get('nro_movil')}")
+                                        if "cantidad_titulares" in chapa and chapa.get("cantidad_titulares"):
+                                            logger.info(f"  Cantidad Titulares: {chapa.get('cantidad_titulares')}")
                                 
                                 # Si hay más de 5 chapas, indicar cuántas más hay
                                 if len(items) > 5:
@@ -1114,7 +1087,7 @@ def get_chapas(client, logger, environment, data_module):
                                 data_module.chapas = response_data
                             else:
                                 response.failure("Los elementos no tienen campos reconocibles de chapas")
-                                logger.warning(f"Estructura de datos no reconocida: {primer_elemento}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                         else:
                             # Si no se encontraron chapas
                             logger.warning("No se encontraron chapas en esta página")
@@ -1130,21 +1103,19 @@ def get_chapas(client, logger, environment, data_module):
                             campos_disponibles = list(primer_elemento.keys())
                             logger.info(f"Campos disponibles: {campos_disponibles}")
                             
-                            tiene_campos_basicos = any(
-                                campo in primer_elemento 
-                                for campo in ["id_prm_chapa", "numero_interno", "tipo_servicio", "dominio", "apellido_permisionario"]
-                            )
+                            errores = validar("/chapas", response_data)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info("Consulta de chapas exitosa")
                                 
                                 # Mostrar algunas chapas
-                                for idx, chapa in enumerate(response_data[:5]):
-                                    if "numero_interno" in chapa:
-                                        logger.info(f"Chapa {idx+1}: Número Interno {chapa.get('numero_interno')}")
-                                    elif "id_prm_chapa" in chapa:
-                                        logger.info(f"Chapa {idx+1}: ID {chapa.get('id_prm_chapa')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, chapa in enumerate(response_data[:5]):
+                                        if "numero_interno" in chapa:
+                                            logger.info(f"Chapa {idx+1}: Número Interno {chapa.get('numero_interno')}")
+                                        elif "id_prm_chapa" in chapa:
+                                            logger.info(f"Chapa {idx+1}: ID {chapa.get('id_prm_chapa')}")
                                 
                                 if cantidad_chapas > 5:
                                     logger.info(f"... y {cantidad_chapas - 5} chapas más")
@@ -1152,7 +1123,7 @@ def get_chapas(client, logger, environment, data_module):
                                 data_module.chapas = response_data
                             else:
                                 response.failure("Los elementos no tienen campos reconocibles de chapas")
-                                logger.warning(f"Estructura de datos no reconocida: {primer_elemento}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                         else:
                             logger.warning("No se encontraron chapas")
                             response.success()
@@ -1224,12 +1195,7 @@ def get_chapas(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de chapas: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/chapas",
-            catch_response=True,
-            name="(TRANSPORTE) - /chapas [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(TRANSPORTE) - /chapas [Exception]", e)
 
 def get_leasing(client, logger, environment, data_module):
     """Prueba el endpoint de consultar personas que están alquilando chapas"""
@@ -1250,11 +1216,15 @@ def get_leasing(client, logger, environment, data_module):
             if value is not None:  # Solo agregar si el valor no es None
                 query_params[key] = value
     
+    # Página según la estrategia de paginación (utils/paging.py)
+    query_params, pagina = paging.choose_page(data_module, "/leasing", query_params)
+
     try:
         with client.get(
             "/leasing", 
             params=query_params if query_params else None,
             catch_response=True,
+            context={"pagina": pagina},
             name="(TRANSPORTE) - /leasing [GET]"
         ) as response:
             # Guardar la respuesta completa en el log (limitada para evitar saturación)
@@ -1269,13 +1239,14 @@ def get_leasing(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
                 try:
                     # Verificar que la respuesta sea JSON válido
                     response_data = response.json()
+                    paging.update(data_module, "/leasing", response_data, query_params)
                     
                     # Guardar un resumen de los datos obtenidos en el log
                     logger.info("=== RESUMEN DE LA RESPUESTA (LEASING DE CHAPAS) ===")
@@ -1303,51 +1274,49 @@ def get_leasing(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                             
                             # Verificar si al menos tiene algunos campos básicos de leasing
-                            tiene_campos_basicos = any(
-                                campo in primer_elemento 
-                                for campo in ["id", "id_leasing", "numero_chapa", "chapa", "arrendatario", "apellido_arrendatario", "nombre_arrendatario", "dni_arrendatario", "cuil_arrendatario", "vencimiento", "fecha_inicio", "fecha_fin", "estado"]
-                            )
+                            errores = validar("/leasing", items)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info("Consulta de leasings exitosa")
                                 
                                 # Mostrar información de algunos leasings (hasta 5)
-                                for idx, leasing in enumerate(items[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "numero_chapa" in leasing:
-                                        logger.info(f"Leasing {idx+1}: Chapa {leasing.get('numero_chapa')}")
-                                    elif "chapa" in leasing:
-                                        logger.info(f"Leasing {idx+1}: Chapa {leasing.get('chapa')}")
-                                    elif "id_leasing" in leasing:
-                                        logger.info(f"Leasing {idx+1}: ID {leasing.get('id_leasing')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in leasing.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Leasing {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, leasing in enumerate(items[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "numero_chapa" in leasing:
+                                            logger.info(f"Leasing {idx+1}: Chapa {leasing.get('numero_chapa')}")
+                                        elif "chapa" in leasing:
+                                            logger.info(f"Leasing {idx+1}: Chapa {leasing.get('chapa')}")
+                                        elif "id_leasing" in leasing:
+                                            logger.info(f"Leasing {idx+1}: ID {leasing.get('id_leasing')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in leasing.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Leasing {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional si está disponible
-                                    if "id_leasing" in leasing and leasing.get("id_leasing"):
-                                        logger.info(f"  ID Leasing: {leasing.get('id_leasing')}")
-                                    if "apellido_arrendatario" in leasing and leasing.get("apellido_arrendatario"):
-                                        nombre_completo = f"{leasing.get('apellido_arrendatario')}, {leasing.get('nombre_arrendatario', '')}"
-                                        logger.info(f"  Arrendatario: {nombre_completo}")
-                                    if "dni_arrendatario" in leasing and leasing.get("dni_arrendatario"):
-                                        logger.info(f"  DNI Arrendatario: {leasing.get('dni_arrendatario')}")
-                                    if "cuil_arrendatario" in leasing and leasing.get("cuil_arrendatario"):
-                                        logger.info(f"  CUIL Arrendatario: {leasing.get('cuil_arrendatario')}")
-                                    if "vencimiento" in leasing and leasing.get("vencimiento"):
-                                        logger.info(f"  Vencimiento: {leasing.get('vencimiento')}")
-                                    if "fecha_inicio" in leasing and leasing.get("fecha_inicio"):
-                                        logger.info(f"  Fecha Inicio: {leasing.get('fecha_inicio')}")
-                                    if "fecha_fin" in leasing and leasing.get("fecha_fin"):
-                                        logger.info(f"  Fecha Fin: {leasing.get('fecha_fin')}")
-                                    if "estado" in leasing and leasing.get("estado"):
-                                        logger.info(f"  Estado: {leasing.get('estado')}")
-                                    if "tipo_servicio" in leasing and leasing.get("tipo_servicio"):
-                                        logger.info(f"  Tipo Servicio: {leasing.get('tipo_servicio')}")
+                                        # Mostrar información adicional si está disponible
+                                        if "id_leasing" in leasing and leasing.get("id_leasing"):
+                                            logger.info(f"  ID Leasing: {leasing.get('id_leasing')}")
+                                        if "apellido_arrendatario" in leasing and leasing.get("apellido_arrendatario"):
+                                            nombre_completo = f"{leasing.get('apellido_arrendatario')}, {leasing.get('nombre_arrendatario', '')}"
+                                            logger.info(f"  Arrendatario: {nombre_completo}")
+                                        if "dni_arrendatario" in leasing and leasing.get("dni_arrendatario"):
+                                            logger.info(f"  DNI Arrendatario: {leasing.get('dni_arrendatario')}")
+                                        if "cuil_arrendatario" in leasing and leasing.get("cuil_arrendatario"):
+                                            logger.info(f"  CUIL Arrendatario: {leasing.get('cuil_arrendatario')}")
+                                        if "vencimiento" in leasing and leasing.get("vencimiento"):
+                                            logger.info(f"  Vencimiento: {leasing.get('vencimiento')}")
+                                        if "fecha_inicio" in leasing and leasing.get("fecha_inicio"):
+                                            logger.info(f"  Fecha Inicio: {leasing.get('fecha_inicio')}")
+                                        if "fecha_fin" in leasing and leasing.get("fecha_fin"):
+                                            logger.info(f"  Fecha Fin: {leasing.get('fecha_fin')}")
+                                        if "estado" in leasing and leasing.get("estado"):
+                                            logger.info(f"  Estado: {leasing.get('estado')}")
+                                        if "tipo_servicio" in leasing and leasing.get("tipo_servicio"):
+                                            logger.info(f"  Tipo Servicio: {leasing.get('tipo_servicio')}")
                                 
                                 # Si hay más de 5 leasings, indicar cuántos más hay
                                 if len(items) > 5:
@@ -1361,7 +1330,7 @@ def get_leasing(client, logger, environment, data_module):
                                 data_module.leasing = response_data
                             else:
                                 response.failure("Los elementos no tienen campos reconocibles de leasing")
-                                logger.warning(f"Estructura de datos no reconocida: {primer_elemento}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                         else:
                             # Si no se encontraron leasings
                             logger.warning("No se encontraron leasings en esta página")
@@ -1377,21 +1346,19 @@ def get_leasing(client, logger, environment, data_module):
                             campos_disponibles = list(primer_elemento.keys())
                             logger.info(f"Campos disponibles: {campos_disponibles}")
                             
-                            tiene_campos_basicos = any(
-                                campo in primer_elemento 
-                                for campo in ["id", "id_leasing", "numero_chapa", "chapa", "apellido_arrendatario", "nombre_arrendatario"]
-                            )
+                            errores = validar("/leasing", response_data)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info("Consulta de leasings exitosa")
                                 
                                 # Mostrar algunos leasings
-                                for idx, leasing in enumerate(response_data[:5]):
-                                    if "numero_chapa" in leasing:
-                                        logger.info(f"Leasing {idx+1}: Chapa {leasing.get('numero_chapa')}")
-                                    elif "id_leasing" in leasing:
-                                        logger.info(f"Leasing {idx+1}: ID {leasing.get('id_leasing')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, leasing in enumerate(response_data[:5]):
+                                        if "numero_chapa" in leasing:
+                                            logger.info(f"Leasing {idx+1}: Chapa {leasing.get('numero_chapa')}")
+                                        elif "id_leasing" in leasing:
+                                            logger.info(f"Leasing {idx+1}: ID {leasing.get('id_leasing')}")
                                 
                                 if cantidad_leasings > 5:
                                     logger.info(f"... y {cantidad_leasings - 5} leasings más")
@@ -1399,7 +1366,7 @@ def get_leasing(client, logger, environment, data_module):
                                 data_module.leasing = response_data
                             else:
                                 response.failure("Los elementos no tienen campos reconocibles de leasing")
-                                logger.warning(f"Estructura de datos no reconocida: {primer_elemento}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                         else:
                             logger.warning("No se encontraron leasings")
                             response.success()
@@ -1471,12 +1438,7 @@ def get_leasing(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de leasing: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/leasing",
-            catch_response=True,
-            name="(TRANSPORTE) - /leasing [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(TRANSPORTE) - /leasing [Exception]", e)
 
 
 def get_centrales_agencias(client, logger, environment, data_module):
@@ -1498,11 +1460,15 @@ def get_centrales_agencias(client, logger, environment, data_module):
             if value is not None:  # Solo agregar si el valor no es None
                 query_params[key] = value
     
+    # Página según la estrategia de paginación (utils/paging.py)
+    query_params, pagina = paging.choose_page(data_module, "/centrales-agencias", query_params)
+
     try:
         with client.get(
             "/centrales-agencias", 
             params=query_params if query_params else None,
             catch_response=True,
+            context={"pagina": pagina},
             name="(TRANSPORTE) - /centrales-agencias [GET]"
         ) as response:
             # Guardar la respuesta completa en el log (limitada para evitar saturación)
@@ -1517,13 +1483,14 @@ def get_centrales_agencias(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
                 try:
                     # Verificar que la respuesta sea JSON válido
                     response_data = response.json()
+                    paging.update(data_module, "/centrales-agencias", response_data, query_params)
                     
                     # Guardar un resumen de los datos obtenidos en el log
                     logger.info("=== RESUMEN DE LA RESPUESTA (CENTRALES AGENCIAS) ===")
@@ -1551,54 +1518,52 @@ def get_centrales_agencias(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                             
                             # Verificar si al menos tiene algunos campos básicos de centrales/agencias
-                            tiene_campos_basicos = any(
-                                campo in primer_elemento 
-                                for campo in ["id", "id_central_agencia", "cuit", "nombre", "razon_social", "tipo", "estado", "direccion", "telefono", "email", "localidad", "barrio", "fecha_alta"]
-                            )
+                            errores = validar("/centrales-agencias", items)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info("Consulta de centrales/agencias exitosa")
                                 
                                 # Mostrar información de algunas centrales/agencias (hasta 5)
-                                for idx, agencia in enumerate(items[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "nombre" in agencia:
-                                        logger.info(f"Central/Agencia {idx+1}: {agencia.get('nombre')}")
-                                    elif "razon_social" in agencia:
-                                        logger.info(f"Central/Agencia {idx+1}: {agencia.get('razon_social')}")
-                                    elif "cuit" in agencia:
-                                        logger.info(f"Central/Agencia {idx+1}: CUIT {agencia.get('cuit')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in agencia.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Central/Agencia {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, agencia in enumerate(items[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "nombre" in agencia:
+                                            logger.info(f"Central/Agencia {idx+1}: {agencia.get('nombre')}")
+                                        elif "razon_social" in agencia:
+                                            logger.info(f"Central/Agencia {idx+1}: {agencia.get('razon_social')}")
+                                        elif "cuit" in agencia:
+                                            logger.info(f"Central/Agencia {idx+1}: CUIT {agencia.get('cuit')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in agencia.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Central/Agencia {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional si está disponible
-                                    if "id_central_agencia" in agencia and agencia.get("id_central_agencia"):
-                                        logger.info(f"  ID: {agencia.get('id_central_agencia')}")
-                                    if "cuit" in agencia and agencia.get("cuit"):
-                                        logger.info(f"  CUIT: {agencia.get('cuit')}")
-                                    if "razon_social" in agencia and agencia.get("razon_social"):
-                                        logger.info(f"  Razón Social: {agencia.get('razon_social')}")
-                                    if "tipo" in agencia and agencia.get("tipo"):
-                                        logger.info(f"  Tipo: {agencia.get('tipo')}")
-                                    if "estado" in agencia and agencia.get("estado"):
-                                        logger.info(f"  Estado: {agencia.get('estado')}")
-                                    if "direccion" in agencia and agencia.get("direccion"):
-                                        logger.info(f"  Dirección: {agencia.get('direccion')}")
-                                    if "telefono" in agencia and agencia.get("telefono"):
-                                        logger.info(f"  Teléfono: {agencia.get('telefono')}")
-                                    if "email" in agencia and agencia.get("email"):
-                                        logger.info(f"  Email: {agencia.get('email')}")
-                                    if "localidad" in agencia and agencia.get("localidad"):
-                                        logger.info(f"  Localidad: {agencia.get('localidad')}")
-                                    if "barrio" in agencia and agencia.get("barrio"):
-                                        logger.info(f"  Barrio: {agencia.get('barrio')}")
-                                    if "fecha_alta" in agencia and agencia.get("fecha_alta"):
-                                        logger.info(f"  Fecha Alta: {agencia.get('fecha_alta')}")
+                                        # Mostrar información adicional si está disponible
+                                        if "id_central_agencia" in agencia and agencia.get("id_central_agencia"):
+                                            logger.info(f"  ID: {agencia.get('id_central_agencia')}")
+                                        if "cuit" in agencia and agencia.get("cuit"):
+                                            logger.info(f"  CUIT: {agencia.get('cuit')}")
+                                        if "razon_social" in agencia and agencia.get("razon_social"):
+                                            logger.info(f"  Razón Social: {agencia.get('razon_social')}")
+                                        if "tipo" in agencia and agencia.get("tipo"):
+                                            logger.info(f"  Tipo: {agencia.get('tipo')}")
+                                        if "estado" in agencia and agencia.get("estado"):
+                                            logger.info(f"  Estado: {agencia.get('estado')}")
+                                        if "direccion" in agencia and agencia.get("direccion"):
+                                            logger.info(f"  Dirección: {agencia.get('direccion')}")
+                                        if "telefono" in agencia and agencia.get("telefono"):
+                                            logger.info(f"  Teléfono: {agencia.get('telefono')}")
+                                        if "email" in agencia and agencia.get("email"):
+                                            logger.info(f"  Email: {agencia.get('email')}")
+                                        if "localidad" in agencia and agencia.get("localidad"):
+                                            logger.info(f"  Localidad: {agencia.get('localidad')}")
+                                        if "barrio" in agencia and agencia.get("barrio"):
+                                            logger.info(f"  Barrio: {agencia.get('barrio')}")
+                                        if "fecha_alta" in agencia and agencia.get("fecha_alta"):
+                                            logger.info(f"  Fecha Alta: {agencia.get('fecha_alta')}")
                                 
                                 # Si hay más de 5 centrales/agencias, indicar cuántas más hay
                                 if len(items) > 5:
@@ -1612,7 +1577,7 @@ def get_centrales_agencias(client, logger, environment, data_module):
                                 data_module.centrales_agencias = response_data
                             else:
                                 response.failure("Los elementos no tienen campos reconocibles de centrales/agencias")
-                                logger.warning(f"Estructura de datos no reconocida: {primer_elemento}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                         else:
                             # Si no se encontraron centrales/agencias
                             logger.warning("No se encontraron centrales/agencias en esta página")
@@ -1628,21 +1593,19 @@ def get_centrales_agencias(client, logger, environment, data_module):
                             campos_disponibles = list(primer_elemento.keys())
                             logger.info(f"Campos disponibles: {campos_disponibles}")
                             
-                            tiene_campos_basicos = any(
-                                campo in primer_elemento 
-                                for campo in ["id", "id_central_agencia", "cuit", "nombre", "razon_social", "tipo"]
-                            )
+                            errores = validar("/centrales-agencias", response_data)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info("Consulta de centrales/agencias exitosa")
                                 
                                 # Mostrar algunas centrales/agencias
-                                for idx, agencia in enumerate(response_data[:5]):
-                                    if "nombre" in agencia:
-                                        logger.info(f"Central/Agencia {idx+1}: {agencia.get('nombre')}")
-                                    elif "razon_social" in agencia:
-                                        logger.info(f"Central/Agencia {idx+1}: {agencia.get('razon_social')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, agencia in enumerate(response_data[:5]):
+                                        if "nombre" in agencia:
+                                            logger.info(f"Central/Agencia {idx+1}: {agencia.get('nombre')}")
+                                        elif "razon_social" in agencia:
+                                            logger.info(f"Central/Agencia {idx+1}: {agencia.get('razon_social')}")
                                 
                                 if cantidad_agencias > 5:
                                     logger.info(f"... y {cantidad_agencias - 5} centrales/agencias más")
@@ -1650,7 +1613,7 @@ def get_centrales_agencias(client, logger, environment, data_module):
                                 data_module.centrales_agencias = response_data
                             else:
                                 response.failure("Los elementos no tienen campos reconocibles de centrales/agencias")
-                                logger.warning(f"Estructura de datos no reconocida: {primer_elemento}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                         else:
                             logger.warning("No se encontraron centrales/agencias")
                             response.success()
@@ -1722,12 +1685,7 @@ def get_centrales_agencias(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de centrales/agencias: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/centrales-agencias",
-            catch_response=True,
-            name="(TRANSPORTE) - /centrales-agencias [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(TRANSPORTE) - /centrales-agencias [Exception]", e)
 
 def get_persona_fisica_por_chapa(client, logger, environment, data_module):
     """Prueba el endpoint de consultar persona física por número de chapa"""
@@ -1773,7 +1731,7 @@ def get_persona_fisica_por_chapa(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -1798,12 +1756,9 @@ def get_persona_fisica_por_chapa(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                             
                             # Verificar si al menos tiene algunos campos básicos de persona física
-                            tiene_campos_basicos = any(
-                                campo in primer_elemento 
-                                for campo in ["id", "id_persona_fisica", "dni", "cuil", "apellido", "nombre", "fecha_nacimiento", "sexo", "estado_civil", "nacionalidad"]
-                            )
+                            errores = validar("/chapas/personas-fisicas", response_data)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info("Consulta de persona física por chapa exitosa")
                                 
@@ -1819,10 +1774,11 @@ def get_persona_fisica_por_chapa(client, logger, environment, data_module):
                                         logger.info(f"Persona Física {idx+1}: CUIL {persona.get('cuil')}")
                                     else:
                                         # Mostrar el primer campo que contenga información útil
-                                        for key, value in persona.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Persona Física {idx+1}: {key}={value}")
-                                                break
+                                        if logger.isEnabledFor(logging.INFO):
+                                            for key, value in persona.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Persona Física {idx+1}: {key}={value}")
+                                                    break
                                     
                                     # Mostrar información adicional si está disponible
                                     if "id_persona_fisica" in persona and persona.get("id_persona_fisica"):
@@ -1850,7 +1806,7 @@ def get_persona_fisica_por_chapa(client, logger, environment, data_module):
                                 data_module.persona_fisica_chapa = response_data
                             else:
                                 response.failure("Los elementos no tienen campos reconocibles de persona física")
-                                logger.warning(f"Estructura de datos no reconocida: {primer_elemento}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                         else:
                             # Si no se encontraron personas físicas
                             logger.warning("No se encontraron personas físicas para la chapa especificada")
@@ -1862,12 +1818,9 @@ def get_persona_fisica_por_chapa(client, logger, environment, data_module):
                         logger.info(f"Claves disponibles: {list(response_data.keys())}")
                         
                         # Verificar si es una persona física individual
-                        tiene_campos_persona = any(
-                            campo in response_data 
-                            for campo in ["id", "id_persona_fisica", "dni", "cuil", "apellido", "nombre"]
-                        )
+                        errores = validar("/chapas/personas-fisicas", response_data)
                         
-                        if tiene_campos_persona:
+                        if not errores:
                             logger.info("Se encontró una persona física:")
                             if "apellido" in response_data and "nombre" in response_data:
                                 nombre_completo = f"{response_data.get('apellido')}, {response_data.get('nombre')}"
@@ -1938,12 +1891,7 @@ def get_persona_fisica_por_chapa(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de persona física por chapa: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/chapas/personas-fisicas",
-            catch_response=True,
-            name="(TRANSPORTE) - /chapas/personas-fisicas [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(TRANSPORTE) - /chapas/personas-fisicas [Exception]", e)
 
 def get_chapas_por_cuil(client, logger, environment, data_module):
     """Prueba el endpoint de consultar chapas por CUIL"""
@@ -1991,7 +1939,7 @@ def get_chapas_por_cuil(client, logger, environment, data_module):
                             logger.info(f"Respuesta recibida: {response.text[:100]}...")
                     except:
                         logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-                else:
+                elif logger.isEnabledFor(logging.INFO):
                     logger.info(f"Respuesta completa para CUIL {cuil_a_probar}: {response.text}")
                 
                 if response.status_code == 200:  # HTTP 200 OK
@@ -2017,52 +1965,50 @@ def get_chapas_por_cuil(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                                 
                                 # Verificar si al menos tiene algunos campos básicos de chapas
-                                tiene_campos_basicos = any(
-                                    campo in primer_elemento 
-                                    for campo in ["id", "id_chapa", "numero_chapa", "numero_interno", "tipo_servicio", "estado", "situacion", "permisionario", "cuil", "dominio"]
-                                )
+                                errores = validar("/chapas/{cuil}", response_data)
                                 
-                                if tiene_campos_basicos:
+                                if not errores:
                                     response.success()
                                     logger.info(f"Consulta de chapas por CUIL {cuil_a_probar} exitosa")
                                     
                                     # Mostrar información de las chapas encontradas (hasta 5)
-                                    for idx, chapa in enumerate(response_data[:5]):
-                                        # Intentar mostrar información relevante según los campos disponibles
-                                        if "numero_chapa" in chapa:
-                                            logger.info(f"Chapa {idx+1}: Numero {chapa.get('numero_chapa')} (CUIL: {cuil_a_probar})")
-                                        elif "numero_interno" in chapa:
-                                            logger.info(f"Chapa {idx+1}: Numero Interno {chapa.get('numero_interno')} (CUIL: {cuil_a_probar})")
-                                        elif "id_chapa" in chapa:
-                                            logger.info(f"Chapa {idx+1}: ID {chapa.get('id_chapa')} (CUIL: {cuil_a_probar})")
-                                        else:
-                                            # Mostrar el primer campo que contenga información útil
-                                            for key, value in chapa.items():
-                                                if isinstance(value, str) and len(value) > 0:
-                                                    logger.info(f"Chapa {idx+1}: {key}={value} (CUIL: {cuil_a_probar})")
-                                                    break
+                                    if logger.isEnabledFor(logging.INFO):
+                                        for idx, chapa in enumerate(response_data[:5]):
+                                            # Intentar mostrar información relevante según los campos disponibles
+                                            if "numero_chapa" in chapa:
+                                                logger.info(f"Chapa {idx+1}: Numero {chapa.get('numero_chapa')} (CUIL: {cuil_a_probar})")
+                                            elif "numero_interno" in chapa:
+                                                logger.info(f"Chapa {idx+1}: Numero Interno {chapa.get('numero_interno')} (CUIL: {cuil_a_probar})")
+                                            elif "id_chapa" in chapa:
+                                                logger.info(f"Chapa {idx+1}: ID {chapa.get('id_chapa')} (CUIL: {cuil_a_probar})")
+                                            else:
+                                                # Mostrar el primer campo que contenga información útil
+                                                for key, value in chapa.items():
+                                                    if isinstance(value, str) and len(value) > 0:
+                                                        logger.info(f"Chapa {idx+1}: {key}={value} (CUIL: {cuil_a_probar})")
+                                                        break
                                         
-                                        # Mostrar información adicional si está disponible
-                                        if "id_chapa" in chapa and chapa.get("id_chapa"):
-                                            logger.info(f"  ID Chapa: {chapa.get('id_chapa')}")
-                                        if "tipo_servicio" in chapa and chapa.get("tipo_servicio"):
-                                            logger.info(f"  Tipo Servicio: {chapa.get('tipo_servicio')}")
-                                        if "estado" in chapa and chapa.get("estado"):
-                                            logger.info(f"  Estado: {chapa.get('estado')}")
-                                        if "situacion" in chapa and chapa.get("situacion"):
-                                            logger.info(f"  Situacion: {chapa.get('situacion')}")
-                                        if "dominio" in chapa and chapa.get("dominio"):
-                                            logger.info(f"  Dominio: {chapa.get('dominio')}")
-                                        if "permisionario" in chapa and chapa.get("permisionario"):
-                                            logger.info(f"  Permisionario: {chapa.get('permisionario')}")
-                                        if "cuil" in chapa and chapa.get("cuil"):
-                                            logger.info(f"  CUIL en respuesta: {chapa.get('cuil')}")
-                                        if "fecha_alta" in chapa and chapa.get("fecha_alta"):
-                                            logger.info(f"  Fecha Alta: {chapa.get('fecha_alta')}")
-                                        if "fecha_vencimiento" in chapa and chapa.get("fecha_vencimiento"):
-                                            logger.info(f"  Fecha Vencimiento: {chapa.get('fecha_vencimiento')}")
-                                        if "central_agencia" in chapa and chapa.get("central_agencia"):
-                                            logger.info(f"  Central/Agencia: {chapa.get('central_agencia')}")
+                                            # Mostrar información adicional si está disponible
+                                            if "id_chapa" in chapa and chapa.get("id_chapa"):
+                                                logger.info(f"  ID Chapa: {chapa.get('id_chapa')}")
+                                            if "tipo_servicio" in chapa and chapa.get("tipo_servicio"):
+                                                logger.info(f"  Tipo Servicio: {chapa.get('tipo_servicio')}")
+                                            if "estado" in chapa and chapa.get("estado"):
+                                                logger.info(f"  Estado: {chapa.get('estado')}")
+                                            if "situacion" in chapa and chapa.get("situacion"):
+                                                logger.info(f"  Situacion: {chapa.get('situacion')}")
+                                            if "dominio" in chapa and chapa.get("dominio"):
+                                                logger.info(f"  Dominio: {chapa.get('dominio')}")
+                                            if "permisionario" in chapa and chapa.get("permisionario"):
+                                                logger.info(f"  Permisionario: {chapa.get('permisionario')}")
+                                            if "cuil" in chapa and chapa.get("cuil"):
+                                                logger.info(f"  CUIL en respuesta: {chapa.get('cuil')}")
+                                            if "fecha_alta" in chapa and chapa.get("fecha_alta"):
+                                                logger.info(f"  Fecha Alta: {chapa.get('fecha_alta')}")
+                                            if "fecha_vencimiento" in chapa and chapa.get("fecha_vencimiento"):
+                                                logger.info(f"  Fecha Vencimiento: {chapa.get('fecha_vencimiento')}")
+                                            if "central_agencia" in chapa and chapa.get("central_agencia"):
+                                                logger.info(f"  Central/Agencia: {chapa.get('central_agencia')}")
                                     
                                     # Si hay más de 5 chapas, indicar cuántas más hay
                                     if cantidad_chapas > 5:
@@ -2073,7 +2019,7 @@ def get_chapas_por_cuil(client, logger, environment, data_module):
                                     return True  # Éxito
                                 else:
                                     response.failure("Los elementos no tienen campos reconocibles de chapas")
-                                    logger.warning(f"Estructura de datos no reconocida para CUIL {cuil_a_probar}: {primer_elemento}")
+                                    logger.warning(f"Estructura de datos no reconocida para CUIL {cuil_a_probar}: {errores}")
                                     return False
                             else:
                                 # Si no se encontraron chapas
@@ -2087,12 +2033,9 @@ def get_chapas_por_cuil(client, logger, environment, data_module):
                             logger.info(f"Claves disponibles: {list(response_data.keys())}")
                             
                             # Verificar si es una chapa individual
-                            tiene_campos_chapa = any(
-                                campo in response_data 
-                                for campo in ["id", "id_chapa", "numero_chapa", "numero_interno", "tipo_servicio"]
-                            )
+                            errores = validar("/chapas/{cuil}", response_data)
                             
-                            if tiene_campos_chapa:
+                            if not errores:
                                 logger.info(f"Se encontro una chapa para CUIL {cuil_a_probar}:")
                                 if "numero_chapa" in response_data:
                                     logger.info(f"  Numero Chapa: {response_data.get('numero_chapa')}")
@@ -2163,12 +2106,7 @@ def get_chapas_por_cuil(client, logger, environment, data_module):
     
     # Si llegamos aquí, ningún CUIL funcionó
     logger.error(f"Ningun CUIL funciono correctamente. CUIL principal usado: {cuil}")
-    with client.get(
-        f"/chapas/{cuil}",
-        catch_response=True,
-        name="(TRANSPORTE) - /chapas/{cuil} [Exception Final]"
-    ) as response:
-        response.failure(f"Todos los CUILs fallaron - CUIL principal: {cuil}")
+    report_failure(environment, client, "GET", "(TRANSPORTE) - /chapas/{cuil} [Exception Final]", CatchResponseError(f"Todos los CUILs fallaron - CUIL principal: {cuil}"))
 
 
 def get_permisionarios_por_parametros(client, logger, environment, data_module):
@@ -2194,6 +2132,9 @@ def get_permisionarios_por_parametros(client, logger, environment, data_module):
     # Mostrar claramente los parámetros que se van a usar
     logger.info(f"PARAMETROS ACTUALES PARA PERMISIONARIOS: {query_params}")
     
+    # Página según la estrategia de paginación (utils/paging.py)
+    query_params, pagina = paging.choose_page(data_module, "/permisionarios", query_params)
+
     try:
         logger.info(f"Enviando solicitud con parametros: {query_params}")
         logger.info(f"URL completa: /permisionarios con query params: {query_params}")
@@ -2202,6 +2143,7 @@ def get_permisionarios_por_parametros(client, logger, environment, data_module):
             "/permisionarios",
             params=query_params,
             catch_response=True,
+            context={"pagina": pagina},
             name="(TRANSPORTE) - /permisionarios [GET]"
         ) as response:
             # Guardar la respuesta completa en el log (limitada para evitar saturación)
@@ -2216,13 +2158,14 @@ def get_permisionarios_por_parametros(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
                 try:
                     # Verificar que la respuesta sea JSON válido
                     response_data = response.json()
+                    paging.update(data_module, "/permisionarios", response_data, query_params)
                     
                     # Guardar un resumen de los datos obtenidos en el log
                     logger.info("=== RESUMEN DE LA RESPUESTA (PERMISIONARIOS) ===")
@@ -2247,53 +2190,51 @@ def get_permisionarios_por_parametros(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                             
                             # Verificar si al menos tiene algunos campos básicos de permisionarios (usando nombres reales)
-                            tiene_campos_basicos = any(
-                                campo in primer_elemento 
-                                for campo in ["id_permisionario", "apellido_permisionario", "nombre_permisionario", "cuil_permisionario", "id_persona_fisica", "Chapas"]
-                            )
+                            errores = validar("/permisionarios", items)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info("Consulta de permisionarios exitosa")
                                 
                                 # Mostrar información de los permisionarios encontrados (hasta 5)
-                                for idx, permisionario in enumerate(items[:5]):
-                                    # Mostrar información usando los campos reales de la API
-                                    if "apellido_permisionario" in permisionario and "nombre_permisionario" in permisionario:
-                                        logger.info(f"Permisionario {idx+1}: {permisionario.get('apellido_permisionario')}, {permisionario.get('nombre_permisionario')}")
-                                    elif "nombre_permisionario" in permisionario:
-                                        logger.info(f"Permisionario {idx+1}: {permisionario.get('nombre_permisionario')}")
-                                    elif "id_permisionario" in permisionario:
-                                        logger.info(f"Permisionario {idx+1}: ID {permisionario.get('id_permisionario')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in permisionario.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Permisionario {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, permisionario in enumerate(items[:5]):
+                                        # Mostrar información usando los campos reales de la API
+                                        if "apellido_permisionario" in permisionario and "nombre_permisionario" in permisionario:
+                                            logger.info(f"Permisionario {idx+1}: {permisionario.get('apellido_permisionario')}, {permisionario.get('nombre_permisionario')}")
+                                        elif "nombre_permisionario" in permisionario:
+                                            logger.info(f"Permisionario {idx+1}: {permisionario.get('nombre_permisionario')}")
+                                        elif "id_permisionario" in permisionario:
+                                            logger.info(f"Permisionario {idx+1}: ID {permisionario.get('id_permisionario')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in permisionario.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Permisionario {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional usando los campos reales
-                                    if "id_permisionario" in permisionario and permisionario.get("id_permisionario"):
-                                        logger.info(f"  ID Permisionario: {permisionario.get('id_permisionario')}")
-                                    if "cuil_permisionario" in permisionario and permisionario.get("cuil_permisionario"):
-                                        logger.info(f"  CUIL: {permisionario.get('cuil_permisionario')}")
-                                    if "id_persona_fisica" in permisionario and permisionario.get("id_persona_fisica"):
-                                        logger.info(f"  ID Persona Fisica: {permisionario.get('id_persona_fisica')}")
+                                        # Mostrar información adicional usando los campos reales
+                                        if "id_permisionario" in permisionario and permisionario.get("id_permisionario"):
+                                            logger.info(f"  ID Permisionario: {permisionario.get('id_permisionario')}")
+                                        if "cuil_permisionario" in permisionario and permisionario.get("cuil_permisionario"):
+                                            logger.info(f"  CUIL: {permisionario.get('cuil_permisionario')}")
+                                        if "id_persona_fisica" in permisionario and permisionario.get("id_persona_fisica"):
+                                            logger.info(f"  ID Persona Fisica: {permisionario.get('id_persona_fisica')}")
                                     
-                                    # Mostrar información de las chapas si están disponibles
-                                    if "Chapas" in permisionario and permisionario.get("Chapas"):
-                                        chapas = permisionario.get("Chapas")
-                                        if isinstance(chapas, list) and len(chapas) > 0:
-                                            logger.info(f"  Chapas asociadas: {len(chapas)}")
-                                            for chapa_idx, chapa in enumerate(chapas[:2]):  # Mostrar hasta 2 chapas
-                                                if "numero_interno" in chapa:
-                                                    logger.info(f"    Chapa {chapa_idx+1}: Numero {chapa.get('numero_interno')}")
-                                                if "tipo_servicio" in chapa:
-                                                    logger.info(f"      Tipo: {chapa.get('tipo_servicio')}")
-                                                if "dominio" in chapa:
-                                                    logger.info(f"      Dominio: {chapa.get('dominio')}")
-                                            if len(chapas) > 2:
-                                                logger.info(f"    ... y {len(chapas) - 2} chapas mas")
+                                        # Mostrar información de las chapas si están disponibles
+                                        if "Chapas" in permisionario and permisionario.get("Chapas"):
+                                            chapas = permisionario.get("Chapas")
+                                            if isinstance(chapas, list) and len(chapas) > 0:
+                                                logger.info(f"  Chapas asociadas: {len(chapas)}")
+                                                for chapa_idx, chapa in enumerate(chapas[:2]):  # Mostrar hasta 2 chapas
+                                                    if "numero_interno" in chapa:
+                                                        logger.info(f"    Chapa {chapa_idx+1}: Numero {chapa.get('numero_interno')}")
+                                                    if "tipo_servicio" in chapa:
+                                                        logger.info(f"      Tipo: {chapa.get('tipo_servicio')}")
+                                                    if "dominio" in chapa:
+                                                        logger.info(f"      Dominio: {chapa.get('dominio')}")
+                                                if len(chapas) > 2:
+                                                    logger.info(f"    ... y {len(chapas) - 2} chapas mas")
                                 
                                 # Si hay más de 5 permisionarios, indicar cuántos más hay
                                 if len(items) > 5:
@@ -2307,7 +2248,7 @@ def get_permisionarios_por_parametros(client, logger, environment, data_module):
                                 data_module.permisionarios = response_data
                             else:
                                 response.failure("Los elementos no tienen campos reconocibles de permisionarios")
-                                logger.warning(f"Estructura de datos no reconocida: {primer_elemento}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                         else:
                             # Si no se encontraron permisionarios
                             logger.warning("No se encontraron permisionarios en esta pagina")
@@ -2324,11 +2265,12 @@ def get_permisionarios_por_parametros(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles: {campos_disponibles}")
                             
                             # Mostrar algunos permisionarios
-                            for idx, permisionario in enumerate(response_data[:5]):
-                                if "apellido_permisionario" in permisionario and "nombre_permisionario" in permisionario:
-                                    logger.info(f"Permisionario {idx+1}: {permisionario.get('apellido_permisionario')}, {permisionario.get('nombre_permisionario')}")
-                                elif "cuil_permisionario" in permisionario:
-                                    logger.info(f"Permisionario {idx+1}: CUIL {permisionario.get('cuil_permisionario')}")
+                            if logger.isEnabledFor(logging.INFO):
+                                for idx, permisionario in enumerate(response_data[:5]):
+                                    if "apellido_permisionario" in permisionario and "nombre_permisionario" in permisionario:
+                                        logger.info(f"Permisionario {idx+1}: {permisionario.get('apellido_permisionario')}, {permisionario.get('nombre_permisionario')}")
+                                    elif "cuil_permisionario" in permisionario:
+                                        logger.info(f"Permisionario {idx+1}: CUIL {permisionario.get('cuil_permisionario')}")
                             
                             if cantidad_permisionarios > 5:
                                 logger.info(f"... y {cantidad_permisionarios - 5} permisionarios mas")
@@ -2377,13 +2319,7 @@ def get_permisionarios_por_parametros(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepcion durante consulta de permisionarios: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/permisionarios",
-            params=query_params,
-            catch_response=True,
-            name="(TRANSPORTE) - /permisionarios [Exception]"
-        ) as response:
-            response.failure(f"Excepcion: {str(e)}")
+        report_failure(environment, client, "GET", "(TRANSPORTE) - /permisionarios [Exception]", e)
 
 def get_licencias_por_parametros(client, logger, environment, data_module):
     """Prueba el endpoint de consultar licencias de conducir por DNI y CUIL"""
@@ -2408,6 +2344,9 @@ def get_licencias_por_parametros(client, logger, environment, data_module):
     # Mostrar claramente los parámetros que se van a usar
     logger.info(f"PARAMETROS ACTUALES PARA LICENCIAS: {query_params}")
     
+    # Página según la estrategia de paginación (utils/paging.py)
+    query_params, pagina = paging.choose_page(data_module, "/licencias", query_params)
+
     try:
         logger.info(f"Enviando solicitud con parametros: {query_params}")
         logger.info(f"URL completa: /licencias con query params: {query_params}")
@@ -2416,6 +2355,7 @@ def get_licencias_por_parametros(client, logger, environment, data_module):
             "/licencias",
             params=query_params,
             catch_response=True,
+            context={"pagina": pagina},
             name="(TRANSPORTE) - /licencias [GET]"
         ) as response:
             # Guardar la respuesta completa en el log (limitada para evitar saturación)
@@ -2430,13 +2370,14 @@ def get_licencias_por_parametros(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
                 try:
                     # Verificar que la respuesta sea JSON válido
                     response_data = response.json()
+                    paging.update(data_module, "/licencias", response_data, query_params)
                     
                     # Guardar un resumen de los datos obtenidos en el log
                     logger.info("=== RESUMEN DE LA RESPUESTA (LICENCIAS DE CONDUCIR) ===")
@@ -2461,53 +2402,51 @@ def get_licencias_por_parametros(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                             
                             # Verificar si al menos tiene algunos campos básicos de licencias
-                            tiene_campos_basicos = any(
-                                campo in primer_elemento 
-                                for campo in ["id", "id_licencia", "numero_licencia", "dni", "cuil", "apellido", "nombre", "clase", "estado", "fecha_emision", "fecha_vencimiento"]
-                            )
+                            errores = validar("/licencias", items)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info("Consulta de licencias de conducir exitosa")
                                 
                                 # Mostrar información de las licencias encontradas (hasta 5)
-                                for idx, licencia in enumerate(items[:5]):
-                                    # Mostrar información relevante según los campos disponibles
-                                    if "numero_licencia" in licencia:
-                                        logger.info(f"Licencia {idx+1}: Numero {licencia.get('numero_licencia')}")
-                                    elif "id_licencia" in licencia:
-                                        logger.info(f"Licencia {idx+1}: ID {licencia.get('id_licencia')}")
-                                    elif "id" in licencia:
-                                        logger.info(f"Licencia {idx+1}: ID {licencia.get('id')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in licencia.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Licencia {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, licencia in enumerate(items[:5]):
+                                        # Mostrar información relevante según los campos disponibles
+                                        if "numero_licencia" in licencia:
+                                            logger.info(f"Licencia {idx+1}: Numero {licencia.get('numero_licencia')}")
+                                        elif "id_licencia" in licencia:
+                                            logger.info(f"Licencia {idx+1}: ID {licencia.get('id_licencia')}")
+                                        elif "id" in licencia:
+                                            logger.info(f"Licencia {idx+1}: ID {licencia.get('id')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in licencia.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Licencia {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional de la licencia
-                                    if "apellido" in licencia and "nombre" in licencia:
-                                        logger.info(f"  Titular: {licencia.get('apellido')}, {licencia.get('nombre')}")
-                                    elif "titular" in licencia:
-                                        logger.info(f"  Titular: {licencia.get('titular')}")
+                                        # Mostrar información adicional de la licencia
+                                        if "apellido" in licencia and "nombre" in licencia:
+                                            logger.info(f"  Titular: {licencia.get('apellido')}, {licencia.get('nombre')}")
+                                        elif "titular" in licencia:
+                                            logger.info(f"  Titular: {licencia.get('titular')}")
                                     
-                                    if "dni" in licencia and licencia.get("dni"):
-                                        logger.info(f"  DNI: {licencia.get('dni')}")
-                                    if "cuil" in licencia and licencia.get("cuil"):
-                                        logger.info(f"  CUIL: {licencia.get('cuil')}")
-                                    if "clase" in licencia and licencia.get("clase"):
-                                        logger.info(f"  Clase: {licencia.get('clase')}")
-                                    if "estado" in licencia and licencia.get("estado"):
-                                        logger.info(f"  Estado: {licencia.get('estado')}")
-                                    if "fecha_emision" in licencia and licencia.get("fecha_emision"):
-                                        logger.info(f"  Fecha Emision: {licencia.get('fecha_emision')}")
-                                    if "fecha_vencimiento" in licencia and licencia.get("fecha_vencimiento"):
-                                        logger.info(f"  Fecha Vencimiento: {licencia.get('fecha_vencimiento')}")
-                                    if "observaciones" in licencia and licencia.get("observaciones"):
-                                        logger.info(f"  Observaciones: {licencia.get('observaciones')}")
-                                    if "restricciones" in licencia and licencia.get("restricciones"):
-                                        logger.info(f"  Restricciones: {licencia.get('restricciones')}")
+                                        if "dni" in licencia and licencia.get("dni"):
+                                            logger.info(f"  DNI: {licencia.get('dni')}")
+                                        if "cuil" in licencia and licencia.get("cuil"):
+                                            logger.info(f"  CUIL: {licencia.get('cuil')}")
+                                        if "clase" in licencia and licencia.get("clase"):
+                                            logger.info(f"  Clase: {licencia.get('clase')}")
+                                        if "estado" in licencia and licencia.get("estado"):
+                                            logger.info(f"  Estado: {licencia.get('estado')}")
+                                        if "fecha_emision" in licencia and licencia.get("fecha_emision"):
+                                            logger.info(f"  Fecha Emision: {licencia.get('fecha_emision')}")
+                                        if "fecha_vencimiento" in licencia and licencia.get("fecha_vencimiento"):
+                                            logger.info(f"  Fecha Vencimiento: {licencia.get('fecha_vencimiento')}")
+                                        if "observaciones" in licencia and licencia.get("observaciones"):
+                                            logger.info(f"  Observaciones: {licencia.get('observaciones')}")
+                                        if "restricciones" in licencia and licencia.get("restricciones"):
+                                            logger.info(f"  Restricciones: {licencia.get('restricciones')}")
                                 
                                 # Si hay más de 5 licencias, indicar cuántas más hay
                                 if len(items) > 5:
@@ -2521,7 +2460,7 @@ def get_licencias_por_parametros(client, logger, environment, data_module):
                                 data_module.licencias = response_data
                             else:
                                 response.failure("Los elementos no tienen campos reconocibles de licencias")
-                                logger.warning(f"Estructura de datos no reconocida: {primer_elemento}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                         else:
                             # Si no se encontraron licencias
                             logger.warning("No se encontraron licencias en esta pagina")
@@ -2538,11 +2477,12 @@ def get_licencias_por_parametros(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles: {campos_disponibles}")
                             
                             # Mostrar algunas licencias
-                            for idx, licencia in enumerate(response_data[:5]):
-                                if "numero_licencia" in licencia:
-                                    logger.info(f"Licencia {idx+1}: Numero {licencia.get('numero_licencia')}")
-                                elif "dni" in licencia:
-                                    logger.info(f"Licencia {idx+1}: DNI {licencia.get('dni')}")
+                            if logger.isEnabledFor(logging.INFO):
+                                for idx, licencia in enumerate(response_data[:5]):
+                                    if "numero_licencia" in licencia:
+                                        logger.info(f"Licencia {idx+1}: Numero {licencia.get('numero_licencia')}")
+                                    elif "dni" in licencia:
+                                        logger.info(f"Licencia {idx+1}: DNI {licencia.get('dni')}")
                             
                             if cantidad_licencias > 5:
                                 logger.info(f"... y {cantidad_licencias - 5} licencias mas")
@@ -2591,13 +2531,7 @@ def get_licencias_por_parametros(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepcion durante consulta de licencias: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/licencias",
-            params=query_params,
-            catch_response=True,
-            name="(TRANSPORTE) - /licencias [Exception]"
-        ) as response:
-            response.failure(f"Excepcion: {str(e)}")
+        report_failure(environment, client, "GET", "(TRANSPORTE) - /licencias [Exception]", e)
 
 def get_ciclovias(client, logger, environment, data_module):
     """Prueba el endpoint de consultar ciclovías de la ciudad"""
@@ -2639,7 +2573,7 @@ def get_ciclovias(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -2668,64 +2602,62 @@ def get_ciclovias(client, logger, environment, data_module):
                             logger.info(f"Campos disponibles en la respuesta: {campos_disponibles}")
                             
                             # Verificar si al menos tiene algunos campos básicos de ciclovías
-                            tiene_campos_basicos = any(
-                                campo in primer_elemento 
-                                for campo in ["id", "id_ciclovia", "nombre", "descripcion", "barrio", "zona", "estado", "tipo", "longitud", "coordenadas", "fecha_construccion"]
-                            )
+                            errores = validar("/ciclovias", response_data)
                             
-                            if tiene_campos_basicos:
+                            if not errores:
                                 response.success()
                                 logger.info("Consulta de ciclovias exitosa")
                                 
                                 # Mostrar información de las ciclovías encontradas (hasta 5)
-                                for idx, ciclovia in enumerate(response_data[:5]):
-                                    # Mostrar información relevante según los campos disponibles
-                                    if "nombre" in ciclovia:
-                                        logger.info(f"Ciclovia {idx+1}: {ciclovia.get('nombre')}")
-                                    elif "id_ciclovia" in ciclovia:
-                                        logger.info(f"Ciclovia {idx+1}: ID {ciclovia.get('id_ciclovia')}")
-                                    elif "id" in ciclovia:
-                                        logger.info(f"Ciclovia {idx+1}: ID {ciclovia.get('id')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in ciclovia.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Ciclovia {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, ciclovia in enumerate(response_data[:5]):
+                                        # Mostrar información relevante según los campos disponibles
+                                        if "nombre" in ciclovia:
+                                            logger.info(f"Ciclovia {idx+1}: {ciclovia.get('nombre')}")
+                                        elif "id_ciclovia" in ciclovia:
+                                            logger.info(f"Ciclovia {idx+1}: ID {ciclovia.get('id_ciclovia')}")
+                                        elif "id" in ciclovia:
+                                            logger.info(f"Ciclovia {idx+1}: ID {ciclovia.get('id')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in ciclovia.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Ciclovia {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional de la ciclovía
-                                    if "descripcion" in ciclovia and ciclovia.get("descripcion"):
-                                        logger.info(f"  Descripcion: {ciclovia.get('descripcion')}")
-                                    if "barrio" in ciclovia and ciclovia.get("barrio"):
-                                        logger.info(f"  Barrio: {ciclovia.get('barrio')}")
-                                    if "zona" in ciclovia and ciclovia.get("zona"):
-                                        logger.info(f"  Zona: {ciclovia.get('zona')}")
-                                    if "estado" in ciclovia and ciclovia.get("estado"):
-                                        logger.info(f"  Estado: {ciclovia.get('estado')}")
-                                    if "tipo" in ciclovia and ciclovia.get("tipo"):
-                                        logger.info(f"  Tipo: {ciclovia.get('tipo')}")
-                                    if "longitud" in ciclovia and ciclovia.get("longitud"):
-                                        logger.info(f"  Longitud: {ciclovia.get('longitud')} metros")
-                                    if "fecha_construccion" in ciclovia and ciclovia.get("fecha_construccion"):
-                                        logger.info(f"  Fecha Construccion: {ciclovia.get('fecha_construccion')}")
-                                    if "observaciones" in ciclovia and ciclovia.get("observaciones"):
-                                        logger.info(f"  Observaciones: {ciclovia.get('observaciones')}")
+                                        # Mostrar información adicional de la ciclovía
+                                        if "descripcion" in ciclovia and ciclovia.get("descripcion"):
+                                            logger.info(f"  Descripcion: {ciclovia.get('descripcion')}")
+                                        if "barrio" in ciclovia and ciclovia.get("barrio"):
+                                            logger.info(f"  Barrio: {ciclovia.get('barrio')}")
+                                        if "zona" in ciclovia and ciclovia.get("zona"):
+                                            logger.info(f"  Zona: {ciclovia.get('zona')}")
+                                        if "estado" in ciclovia and ciclovia.get("estado"):
+                                            logger.info(f"  Estado: {ciclovia.get('estado')}")
+                                        if "tipo" in ciclovia and ciclovia.get("tipo"):
+                                            logger.info(f"  Tipo: {ciclovia.get('tipo')}")
+                                        if "longitud" in ciclovia and ciclovia.get("longitud"):
+                                            logger.info(f"  Longitud: {ciclovia.get('longitud')} metros")
+                                        if "fecha_construccion" in ciclovia and ciclovia.get("fecha_construccion"):
+                                            logger.info(f"  Fecha Construccion: {ciclovia.get('fecha_construccion')}")
+                                        if "observaciones" in ciclovia and ciclovia.get("observaciones"):
+                                            logger.info(f"  Observaciones: {ciclovia.get('observaciones')}")
                                     
-                                    # Mostrar información de coordenadas si está disponible
-                                    if "coordenadas" in ciclovia and ciclovia.get("coordenadas"):
-                                        coordenadas = ciclovia.get("coordenadas")
-                                        if isinstance(coordenadas, dict):
-                                            logger.info(f"  Coordenadas: {coordenadas}")
-                                        elif isinstance(coordenadas, str):
-                                            logger.info(f"  Coordenadas: {coordenadas}")
+                                        # Mostrar información de coordenadas si está disponible
+                                        if "coordenadas" in ciclovia and ciclovia.get("coordenadas"):
+                                            coordenadas = ciclovia.get("coordenadas")
+                                            if isinstance(coordenadas, dict):
+                                                logger.info(f"  Coordenadas: {coordenadas}")
+                                            elif isinstance(coordenadas, str):
+                                                logger.info(f"  Coordenadas: {coordenadas}")
                                     
-                                    # Mostrar información de ubicación si está disponible
-                                    if "direccion" in ciclovia and ciclovia.get("direccion"):
-                                        logger.info(f"  Direccion: {ciclovia.get('direccion')}")
-                                    if "desde" in ciclovia and ciclovia.get("desde"):
-                                        logger.info(f"  Desde: {ciclovia.get('desde')}")
-                                    if "hasta" in ciclovia and ciclovia.get("hasta"):
-                                        logger.info(f"  Hasta: {ciclovia.get('hasta')}")
+                                        # Mostrar información de ubicación si está disponible
+                                        if "direccion" in ciclovia and ciclovia.get("direccion"):
+                                            logger.info(f"  Direccion: {ciclovia.get('direccion')}")
+                                        if "desde" in ciclovia and ciclovia.get("desde"):
+                                            logger.info(f"  Desde: {ciclovia.get('desde')}")
+                                        if "hasta" in ciclovia and ciclovia.get("hasta"):
+                                            logger.info(f"  Hasta: {ciclovia.get('hasta')}")
                                 
                                 # Si hay más de 5 ciclovías, indicar cuántas más hay
                                 if cantidad_ciclovias > 5:
@@ -2754,7 +2686,7 @@ def get_ciclovias(client, logger, environment, data_module):
                                 data_module.ciclovias = response_data
                             else:
                                 response.failure("Los elementos no tienen campos reconocibles de ciclovias")
-                                logger.warning(f"Estructura de datos no reconocida: {primer_elemento}")
+                                logger.warning(f"Estructura de datos no reconocida: {errores}")
                         else:
                             # Si no se encontraron ciclovías
                             logger.warning("No se encontraron ciclovias")
@@ -2776,11 +2708,12 @@ def get_ciclovias(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles: {campos_disponibles}")
                                 
                                 # Mostrar algunas ciclovías
-                                for idx, ciclovia in enumerate(items[:5]):
-                                    if "nombre" in ciclovia:
-                                        logger.info(f"Ciclovia {idx+1}: {ciclovia.get('nombre')}")
-                                    elif "id" in ciclovia:
-                                        logger.info(f"Ciclovia {idx+1}: ID {ciclovia.get('id')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, ciclovia in enumerate(items[:5]):
+                                        if "nombre" in ciclovia:
+                                            logger.info(f"Ciclovia {idx+1}: {ciclovia.get('nombre')}")
+                                        elif "id" in ciclovia:
+                                            logger.info(f"Ciclovia {idx+1}: ID {ciclovia.get('id')}")
                                 
                                 data_module.ciclovias = response_data
                         
@@ -2817,12 +2750,7 @@ def get_ciclovias(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepcion durante consulta de ciclovias: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/ciclovias",
-            catch_response=True,
-            name="(TRANSPORTE) - /ciclovias [Exception]"
-        ) as response:
-            response.failure(f"Excepcion: {str(e)}")
+        report_failure(environment, client, "GET", "(TRANSPORTE) - /ciclovias [Exception]", e)
 
 
 def get_personal(client, logger, environment, data_module):
@@ -2880,8 +2808,9 @@ def get_empresas(client, logger, environment, data_module):
             logger.info(f" Total de empresas: {len(data) if isinstance(data, list) else 0}")
             
             if data and isinstance(data, list):
-                for i, empresa in enumerate(data[:3]):  # Mostrar solo las primeras 3
-                    logger.info(f" Empresa {i+1}: {empresa.get('razon_social', 'N/A')} - CUIT: {empresa.get('cuit', 'N/A')}")
+                if logger.isEnabledFor(logging.INFO):
+                    for i, empresa in enumerate(data[:3]):  # Mostrar solo las primeras 3
+                        logger.info(f" Empresa {i+1}: {empresa.get('razon_social', 'N/A')} - CUIT: {empresa.get('cuit', 'N/A')}")
                 if len(data) > 3:
                     logger.info(f"... y {len(data) - 3} empresas más")
             else:
@@ -2966,8 +2895,9 @@ def get_paradas_linea(client, logger, environment, data_module):
                 
                 if paradas:
                     # Mostrar algunas paradas de ejemplo
-                    for i, parada in enumerate(paradas[:3]):
-                        logger.info(f" Parada {i+1}: {parada.get('nombre_parada', 'N/A')} - Código: {parada.get('codigo', 'N/A')} - Sentido: {parada.get('sentido', 'N/A')}")
+                    if logger.isEnabledFor(logging.INFO):
+                        for i, parada in enumerate(paradas[:3]):
+                            logger.info(f" Parada {i+1}: {parada.get('nombre_parada', 'N/A')} - Código: {parada.get('codigo', 'N/A')} - Sentido: {parada.get('sentido', 'N/A')}")
                     
                     if len(paradas) > 3:
                         logger.info(f"... y {len(paradas) - 3} paradas más")
@@ -2991,17 +2921,19 @@ def get_vehiculos(client, logger, environment, data_module):
     try:
         logger.info("=== CONSULTANDO VEHÍCULOS POR EMPRESA ===")
         
-        # Usar parámetros del módulo de datos
-        params = data_module.parametros_vehiculos
+        # Usar parámetros del módulo de datos, con la página según la estrategia de paginación
+        params, pagina = paging.choose_page(data_module, "/vehiculos", data_module.parametros_vehiculos)
         
         response = client.get(
             "/vehiculos",
             params=params,
+            context={"pagina": pagina},
             name="(TRANSPORTE) - GET /vehiculos"
         )
         
         if response.status_code == 200:
             data = response.json()
+            paging.update(data_module, "/vehiculos", data, params)
             logger.info(f" Vehículos consultados exitosamente")
             logger.info(f" Total de registros: {data.get('total_items', 0)}")
             logger.info(f" Página: {data.get('page_number', 'N/A')} - Tamaño: {data.get('page_size', 'N/A')}")
@@ -3011,11 +2943,12 @@ def get_vehiculos(client, logger, environment, data_module):
                 logger.info(f" Cantidad de vehículos en esta página: {len(vehiculos)}")
                 
                 # Mostrar algunos vehículos de ejemplo
-                for i, vehiculo in enumerate(vehiculos[:3]):
-                    dominio = vehiculo.get('dominio', 'N/A')
-                    marca = vehiculo.get('marca', 'N/A')
-                    modelo = vehiculo.get('modelo', 'N/A')
-                    logger.info(f" Vehículo {i+1}: {dominio} - {marca} {modelo}")
+                if logger.isEnabledFor(logging.INFO):
+                    for i, vehiculo in enumerate(vehiculos[:3]):
+                        dominio = vehiculo.get('dominio', 'N/A')
+                        marca = vehiculo.get('marca', 'N/A')
+                        modelo = vehiculo.get('modelo', 'N/A')
+                        logger.info(f" Vehículo {i+1}: {dominio} - {marca} {modelo}")
                 
                 if len(vehiculos) > 3:
                     logger.info(f"... y {len(vehiculos) - 3} vehículos más")
@@ -1,3 +1,6 @@
+import logging
+
+
 def get_deuda_inmueble(client, logger, environment, data_module):
     """Consultar cuenta corriente municipal de un inmueble"""
     try:
@@ -33,12 +36,13 @@ def get_deuda_inmueble(client, logger, environment, data_module):
                 logger.info(f"Total de cuotas en cuenta corriente: {len(ctactes)}")
                 
                 # Mostrar algunas cuotas de ejemplo
-                for i, cuota in enumerate(ctactes[:3]):
-                    estado = cuota.get('estado', 'N/A')
-                    año = cuota.get('año', 'N/A')
-                    num_cuota = cuota.get('cuota', 'N/A')
-                    saldo = cuota.get('saldo', 'N/A')
-                    logger.info(f"Cuota {i+1}: {año}/{num_cuota} - Saldo: ${saldo} - Estado: {estado}")
+                if logger.isEnabledFor(logging.INFO):
+                    for i, cuota in enumerate(ctactes[:3]):
+                        estado = cuota.get('estado', 'N/A')
+                        año = cuota.get('año', 'N/A')
+                        num_cuota = cuota.get('cuota', 'N/A')
+                        saldo = cuota.get('saldo', 'N/A')
+                        logger.info(f"Cuota {i+1}: {año}/{num_cuota} - Saldo: ${saldo} - Estado: {estado}")
                 
                 if len(ctactes) > 3:
                     logger.info(f"... y {len(ctactes) - 3} cuotas mas")
@@ -104,12 +108,13 @@ def get_deuda_rodado(client, logger, environment, data_module):
                 logger.info(f"Total de cuotas en cuenta corriente: {len(ctactes)}")
                 
                 # Mostrar algunas cuotas de ejemplo
-                for i, cuota in enumerate(ctactes[:3]):
-                    estado = cuota.get('estado', 'N/A')
-                    año = cuota.get('año', 'N/A')
-                    num_cuota = cuota.get('cuota', 'N/A')
-                    saldo = cuota.get('saldo', 'N/A')
-                    logger.info(f"Cuota {i+1}: {año}/{num_cuota} - Saldo: ${saldo} - Estado: {estado}")
+                if logger.isEnabledFor(logging.INFO):
+                    for i, cuota in enumerate(ctactes[:3]):
+                        estado = cuota.get('estado', 'N/A')
+                        año = cuota.get('año', 'N/A')
+                        num_cuota = cuota.get('cuota', 'N/A')
+                        saldo = cuota.get('saldo', 'N/A')
+                        logger.info(f"Cuota {i+1}: {año}/{num_cuota} - Saldo: ${saldo} - Estado: {estado}")
                 
                 if len(ctactes) > 3:
                     logger.info(f"... y {len(ctactes) - 3} cuotas más")
@@ -1,6 +1,9 @@
 import random
+import logging
 from typing import Dict, Any
 
+from utils.http import report_failure
+
 def get_guias_turisticos(client, logger, environment, data_module):
     """Prueba el endpoint de consulta del registro oficial de guías turísticos habilitados en la Ciudad de Córdoba"""
     
@@ -22,7 +25,7 @@ def get_guias_turisticos(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -55,40 +58,41 @@ def get_guias_turisticos(client, logger, environment, data_module):
                                 logger.info("Consulta de guías turísticos exitosa")
                                 
                                 # Mostrar información de algunos guías (hasta 5)
-                                for idx, guia in enumerate(response_data[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "nombre" in guia and "apellido" in guia:
-                                        logger.info(f"Guía Turístico {idx+1}: {guia.get('nombre')} {guia.get('apellido')}")
-                                    elif "nombre" in guia:
-                                        logger.info(f"Guía Turístico {idx+1}: {guia.get('nombre')}")
-                                    elif "numero_registro" in guia:
-                                        logger.info(f"Guía Turístico {idx+1}: Registro N° {guia.get('numero_registro')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in guia.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Guía Turístico {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, guia in enumerate(response_data[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "nombre" in guia and "apellido" in guia:
+                                            logger.info(f"Guía Turístico {idx+1}: {guia.get('nombre')} {guia.get('apellido')}")
+                                        elif "nombre" in guia:
+                                            logger.info(f"Guía Turístico {idx+1}: {guia.get('nombre')}")
+                                        elif "numero_registro" in guia:
+                                            logger.info(f"Guía Turístico {idx+1}: Registro N° {guia.get('numero_registro')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in guia.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Guía Turístico {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional si está disponible
-                                    if "dni" in guia and guia.get("dni"):
-                                        logger.info(f"  DNI: {guia.get('dni')}")
-                                    if "numero_registro" in guia and guia.get("numero_registro"):
-                                        logger.info(f"  Número de Registro: {guia.get('numero_registro')}")
-                                    if "telefono" in guia and guia.get("telefono"):
-                                        logger.info(f"  Teléfono: {guia.get('telefono')}")
-                                    if "email" in guia and guia.get("email"):
-                                        logger.info(f"  Email: {guia.get('email')}")
-                                    if "especialidades" in guia and guia.get("especialidades"):
-                                        logger.info(f"  Especialidades: {guia.get('especialidades')}")
-                                    if "idiomas" in guia and guia.get("idiomas"):
-                                        logger.info(f"  Idiomas: {guia.get('idiomas')}")
-                                    if "estado" in guia and guia.get("estado"):
-                                        logger.info(f"  Estado: {guia.get('estado')}")
-                                    if "fecha_habilitacion" in guia and guia.get("fecha_habilitacion"):
-                                        logger.info(f"  Fecha Habilitación: {guia.get('fecha_habilitacion')}")
-                                    if "fecha_vencimiento" in guia and guia.get("fecha_vencimiento"):
-                                        logger.info(f"  Fecha Vencimiento: {guia.get('fecha_vencimiento')}")
+                                        # Mostrar información adicional si está disponible
+                                        if "dni" in guia and guia.get("dni"):
+                                            logger.info(f"  DNI: {guia.get('dni')}")
+                                        if "numero_registro" in guia and guia.get("numero_registro"):
+                                            logger.info(f"  Número de Registro: {guia.get('numero_registro')}")
+                                        if "telefono" in guia and guia.get("telefono"):
+                                            logger.info(f"  Teléfono: {guia.get('telefono')}")
+                                        if "email" in guia and guia.get("email"):
+                                            logger.info(f"  Email: {guia.get('email')}")
+                                        if "especialidades" in guia and guia.get("especialidades"):
+                                            logger.info(f"  Especialidades: {guia.get('especialidades')}")
+                                        if "idiomas" in guia and guia.get("idiomas"):
+                                            logger.info(f"  Idiomas: {guia.get('idiomas')}")
+                                        if "estado" in guia and guia.get("estado"):
+                                            logger.info(f"  Estado: {guia.get('estado')}")
+                                        if "fecha_habilitacion" in guia and guia.get("fecha_habilitacion"):
+                                            logger.info(f"  Fecha Habilitación: {guia.get('fecha_habilitacion')}")
+                                        if "fecha_vencimiento" in guia and guia.get("fecha_vencimiento"):
+                                            logger.info(f"  Fecha Vencimiento: {guia.get('fecha_vencimiento')}")
                                 
                                 # Si hay más de 5 guías, indicar cuántos más hay
                                 if cantidad_guias > 5:
@@ -121,11 +125,12 @@ def get_guias_turisticos(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles: {campos_disponibles}")
                                 
                                 # Mostrar algunos guías turísticos
-                                for idx, guia in enumerate(items[:5]):
-                                    if "nombre" in guia and "apellido" in guia:
-                                        logger.info(f"Guía Turístico {idx+1}: {guia.get('nombre')} {guia.get('apellido')}")
-                                    elif "nombre" in guia:
-                                        logger.info(f"Guía Turístico {idx+1}: {guia.get('nombre')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, guia in enumerate(items[:5]):
+                                        if "nombre" in guia and "apellido" in guia:
+                                            logger.info(f"Guía Turístico {idx+1}: {guia.get('nombre')} {guia.get('apellido')}")
+                                        elif "nombre" in guia:
+                                            logger.info(f"Guía Turístico {idx+1}: {guia.get('nombre')}")
                                 
                                 data_module.guias_turisticos = response_data
                         
@@ -158,12 +163,7 @@ def get_guias_turisticos(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de guías turísticos: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/turismo/guias-turisticos",
-            catch_response=True,
-            name="(TURISMO) - /turismo/guias-turisticos [GET]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(TURISMO) - /turismo/guias-turisticos [GET]", e)
 
 def get_anfitriones_turisticos(client, logger, environment, data_module):
     """Prueba el endpoint de obtener anfitriones turísticos de Córdoba"""
@@ -186,7 +186,7 @@ def get_anfitriones_turisticos(client, logger, environment, data_module):
                         logger.info(f"Respuesta recibida: {response.text[:100]}...")
                 except:
                     logger.info(f"Respuesta recibida (no JSON): {response.text[:100]}...")
-            else:
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(f"Respuesta completa: {response.text}")
             
             if response.status_code == 200:  # HTTP 200 OK
@@ -219,42 +219,43 @@ def get_anfitriones_turisticos(client, logger, environment, data_module):
                                 logger.info("Consulta de anfitriones turísticos exitosa")
                                 
                                 # Mostrar información de algunos anfitriones (hasta 5)
-                                for idx, anfitrion in enumerate(response_data[:5]):
-                                    # Intentar mostrar información relevante según los campos disponibles
-                                    if "nombre" in anfitrion and "apellido" in anfitrion:
-                                        logger.info(f"Anfitrión Turístico {idx+1}: {anfitrion.get('nombre')} {anfitrion.get('apellido')}")
-                                    elif "nombre" in anfitrion:
-                                        logger.info(f"Anfitrión Turístico {idx+1}: {anfitrion.get('nombre')}")
-                                    elif "numero_registro" in anfitrion:
-                                        logger.info(f"Anfitrión Turístico {idx+1}: Registro N° {anfitrion.get('numero_registro')}")
-                                    else:
-                                        # Mostrar el primer campo que contenga información útil
-                                        for key, value in anfitrion.items():
-                                            if isinstance(value, str) and len(value) > 0:
-                                                logger.info(f"Anfitrión Turístico {idx+1}: {key}={value}")
-                                                break
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, anfitrion in enumerate(response_data[:5]):
+                                        # Intentar mostrar información relevante según los campos disponibles
+                                        if "nombre" in anfitrion and "apellido" in anfitrion:
+                                            logger.info(f"Anfitrión Turístico {idx+1}: {anfitrion.get('nombre')} {anfitrion.get('apellido')}")
+                                        elif "nombre" in anfitrion:
+                                            logger.info(f"Anfitrión Turístico {idx+1}: {anfitrion.get('nombre')}")
+                                        elif "numero_registro" in anfitrion:
+                                            logger.info(f"Anfitrión Turístico {idx+1}: Registro N° {anfitrion.get('numero_registro')}")
+                                        else:
+                                            # Mostrar el primer campo que contenga información útil
+                                            for key, value in anfitrion.items():
+                                                if isinstance(value, str) and len(value) > 0:
+                                                    logger.info(f"Anfitrión Turístico {idx+1}: {key}={value}")
+                                                    break
                                     
-                                    # Mostrar información adicional si está disponible
-                                    if "dni" in anfitrion and anfitrion.get("dni"):
-                                        logger.info(f"  DNI: {anfitrion.get('dni')}")
-                                    if "numero_registro" in anfitrion and anfitrion.get("numero_registro"):
-                                        logger.info(f"  Número de Registro: {anfitrion.get('numero_registro')}")
-                                    if "telefono" in anfitrion and anfitrion.get("telefono"):
-                                        logger.info(f"  Teléfono: {anfitrion.get('telefono')}")
-                                    if "email" in anfitrion and anfitrion.get("email"):
-                                        logger.info(f"  Email: {anfitrion.get('email')}")
-                                    if "direccion" in anfitrion and anfitrion.get("direccion"):
-                                        logger.info(f"  Dirección: {anfitrion.get('direccion')}")
-                                    if "tipo_alojamiento" in anfitrion and anfitrion.get("tipo_alojamiento"):
-                                        logger.info(f"  Tipo de Alojamiento: {anfitrion.get('tipo_alojamiento')}")
-                                    if "capacidad" in anfitrion and anfitrion.get("capacidad"):
-                                        logger.info(f"  Capacidad: {anfitrion.get('capacidad')}")
-                                    if "servicios" in anfitrion and anfitrion.get("servicios"):
-                                        logger.info(f"  Servicios: {anfitrion.get('servicios')}")
-                                    if "estado" in anfitrion and anfitrion.get("estado"):
-                                        logger.info(f"  Estado: {anfitrion.get('estado')}")
-                                    if "fecha_habilitacion" in anfitrion and anfitrion.get("fecha_habilitacion"):
-                                        logger.info(f"  Fecha Habilitación: {anfitrion.get('fecha_habilitacion')}")
+                                        # Mostrar información adicional si está disponible
+                                        if "dni" in anfitrion and anfitrion.get("dni"):
+                                            logger.info(f"  DNI: {anfitrion.get('dni')}")
+                                        if "numero_registro" in anfitrion and anfitrion.get("numero_registro"):
+                                            logger.info(f"  Número de Registro: {anfitrion.get('numero_registro')}")
+                                        if "telefono" in anfitrion and anfitrion.get("telefono"):
+                                            logger.info(f"  Teléfono: {anfitrion.get('telefono')}")
+                                        if "email" in anfitrion and anfitrion.get("email"):
+                                            logger.info(f"  Email: {anfitrion.get('email')}")
+                                        if "direccion" in anfitrion and anfitrion.get("direccion"):
+                                            logger.info(f"  Dirección: {anfitrion.get('direccion')}")
+                                        if "tipo_alojamiento" in anfitrion and anfitrion.get("tipo_alojamiento"):
+                                            logger.info(f"  Tipo de Alojamiento: {anfitrion.get('tipo_alojamiento')}")
+                                        if "capacidad" in anfitrion and anfitrion.get("capacidad"):
+                                            logger.info(f"  Capacidad: {anfitrion.get('capacidad')}")
+                                        if "servicios" in anfitrion and anfitrion.get("servicios"):
+                                            logger.info(f"  Servicios: {anfitrion.get('servicios')}")
+                                        if "estado" in anfitrion and anfitrion.get("estado"):
+                                            logger.info(f"  Estado: {anfitrion.get('estado')}")
+                                        if "fecha_habilitacion" in anfitrion and anfitrion.get("fecha_habilitacion"):
+                                            logger.info(f"  Fecha Habilitación: {anfitrion.get('fecha_habilitacion')}")
                                 
                                 # Si hay más de 5 anfitriones, indicar cuántos más hay
                                 if cantidad_anfitriones > 5:
@@ -287,11 +288,12 @@ def get_anfitriones_turisticos(client, logger, environment, data_module):
                                 logger.info(f"Campos disponibles: {campos_disponibles}")
                                 
                                 # Mostrar algunos anfitriones turísticos
-                                for idx, anfitrion in enumerate(items[:5]):
-                                    if "nombre" in anfitrion and "apellido" in anfitrion:
-                                        logger.info(f"Anfitrión Turístico {idx+1}: {anfitrion.get('nombre')} {anfitrion.get('apellido')}")
-                                    elif "nombre" in anfitrion:
-                                        logger.info(f"Anfitrión Turístico {idx+1}: {anfitrion.get('nombre')}")
+                                if logger.isEnabledFor(logging.INFO):
+                                    for idx, anfitrion in enumerate(items[:5]):
+                                        if "nombre" in anfitrion and "apellido" in anfitrion:
+                                            logger.info(f"Anfitrión Turístico {idx+1}: {anfitrion.get('nombre')} {anfitrion.get('apellido')}")
+                                        elif "nombre" in anfitrion:
+                                            logger.info(f"Anfitrión Turístico {idx+1}: {anfitrion.get('nombre')}")
                                 
                                 data_module.anfitriones_turisticos = response_data
                         
@@ -324,9 +326,4 @@ def get_anfitriones_turisticos(client, logger, environment, data_module):
     except Exception as e:
         logger.error(f"Excepción durante consulta de anfitriones turísticos: {str(e)}")
         # Registrar el error como una respuesta fallida
-        with client.get(
-            "/turismo/anfitriones-turisticos",
-            catch_response=True,
-            name="(TURISMO) - /turismo/anfitriones-turisticos [Exception]"
-        ) as response:
-            response.failure(f"Excepción: {str(e)}")
+        report_failure(environment, client, "GET", "(TURISMO) - /turismo/anfitriones-turisticos [Exception]", e)
@@ -0,0 +1,93 @@
+"""Pruebas de utils/harvest.py: capacidad, muestreo de reservorio y TTL"""
+import random
+from collections import Counter
+
+from utils.harvest import HarvestPool
+
+
+class Reloj:
+    """Reloj manual para avanzar el tiempo sin esperar"""
+
+    def __init__(self):
+        self.ahora = 0.0
+
+    def __call__(self):
+        return self.ahora
+
+
+def test_capacidad_acotada():
+    pool = HarvestPool(capacity=10, ttl=0, rng=random.Random(1))
+    pool.extend(range(1000))
+    assert len(pool) == 10
+    assert all(0 <= valor < 1000 for valor in pool)
+
+
+def test_valor_repetido_no_ocupa_otro_lugar():
+    pool = HarvestPool(capacity=10, ttl=0)
+    for _ in range(5):
+        pool.offer(7)
+    pool.offer(None)
+    assert list(pool) == [7]
+
+
+def test_reservorio_uniforme():
+    # Cada uno de los 100 valores ofrecidos debería quedar con probabilidad 10/100
+    rng = random.Random(42)
+    quedaron = Counter()
+    corridas = 2000
+    for _ in range(corridas):
+        pool = HarvestPool(capacity=10, ttl=0, rng=rng)
+        pool.extend(range(100))
+        quedaron.update(pool)
+    esperado = corridas * 10 / 100
+    assert set(quedaron) == set(range(100))
+    assert all(0.6 * esperado < veces < 1.4 * esperado for veces in quedaron.values())
+
+
+def test_draw():
+    pool = HarvestPool(capacity=5, ttl=0, rng=random.Random(3))
+    assert pool.draw() is None
+    pool.extend([1, 2, 3])
+    assert {pool.draw() for _ in range(100)} == {1, 2, 3}
+
+
+def test_ttl_vence_y_vuelve_a_los_valores_iniciales():
+    reloj = Reloj()
+    pool = HarvestPool(capacity=10, ttl=10, valores=[100], clock=reloj)
+    pool.extend([1, 2])
+    assert sorted(pool) == [1, 2, 100]
+
+    reloj.ahora = 11
+    assert list(pool) == [100]
+    assert 1 not in pool
+    assert pool.draw() == 100
+
+
+def test_ttl_todo_vencido_draw_resiembra():
+    reloj = Reloj()
+    pool = HarvestPool(capacity=10, ttl=5, valores=[100], clock=reloj)
+    pool.offer(1)
+    reloj.ahora = 6
+    assert {pool.draw() for _ in range(20)} == {100}
+
+
+def test_volver_a_ofrecer_renueva_el_vencimiento():
+    reloj = Reloj()
+    pool = HarvestPool(capacity=10, ttl=10, clock=reloj)
+    pool.extend([1, 2])
+    reloj.ahora = 8
+    pool.offer(1)
+    reloj.ahora = 12
+    assert list(pool) == [1]
+    reloj.ahora = 17
+    assert list(pool) == [1]
+    reloj.ahora = 18.5
+    assert len(pool) == 0
+
+
+def test_sin_ttl_no_vence():
+    reloj = Reloj()
+    pool = HarvestPool(capacity=10, ttl=0, clock=reloj)
+    pool.offer(1)
+    reloj.ahora = 10**9
+    assert list(pool) == [1]
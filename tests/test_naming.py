@@ -0,0 +1,45 @@
+"""Pruebas de utils/naming.py: plantillas de ruta y desglose por parámetro"""
+import pytest
+
+from utils import naming
+
+
+@pytest.mark.parametrize("nombre, esperado", [
+    ("(DOMICILIO) - /localidades/1234/barrios [GET]", ("(DOMICILIO) - /localidades/{id_localidad}/barrios [GET]", "1234")),
+    ("/paises/1/provincias/22 [GET]", ("/paises/{id_pais}/provincias/{id_provincia} [GET]", "1,22")),
+    ("/chapas/20123456786 [GET]", ("/chapas/{cuil} [GET]", "20123456786")),
+    ("/segmento-desconocido/99", ("/segmento-desconocido/{id}", "99")),
+    ("/domicilios/geo [GET 55-1200]", ("/domicilios/geo [GET]", "55-1200")),
+    ("/personas-fisicas [Exception 20123456786]", ("/personas-fisicas [Exception]", "20123456786")),
+    ("/organigrama/?p_id_dependencia=5&p_nivel=2 [GET]", ("/organigrama/?p_id_dependencia&p_nivel [GET]", "5,2")),
+])
+def test_normalize_name(nombre, esperado):
+    assert naming.normalize_name(nombre) == esperado
+
+
+@pytest.mark.parametrize("nombre", ["/condiciones [GET]", "/medios_pagos [GET Lista vacía]", "Login", "JOURNEY alta"])
+def test_nombres_sin_valores_no_cambian(nombre):
+    assert naming.normalize_name(nombre) == (nombre, None)
+
+
+def test_name_for_usa_la_url_sin_nombre():
+    assert naming.name_for("/barrios/15") == ("/barrios/{id_barrio}", "15")
+    assert naming.name_for("/barrios/15", "Barrios [GET]") == ("Barrios [GET]", None)
+
+
+def test_record_parameter_acota_los_valores(monkeypatch):
+    observados = []
+    monkeypatch.setattr(naming, "ROUTE_PARAM_MAX_VALUES", 2)
+    monkeypatch.setattr(naming.metrics, "observe", lambda nombre, ms: observados.append(nombre))
+    monkeypatch.setattr(naming, "_valores_por_ruta", {})
+
+    for valor in ["1", "2", "3", "1", "4"]:
+        naming.record_parameter("/barrios/{id_barrio}", valor, 10)
+
+    assert observados == [
+        "parámetro: /barrios/{id_barrio} = 1",
+        "parámetro: /barrios/{id_barrio} = 2",
+        "parámetro: /barrios/{id_barrio} = otros",
+        "parámetro: /barrios/{id_barrio} = 1",
+        "parámetro: /barrios/{id_barrio} = otros",
+    ]
@@ -0,0 +1,78 @@
+"""Pruebas de utils/paging.py: estrategias, última página y rangos de profundidad"""
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from utils import paging
+from utils.paging import PagingState
+
+RUTA = "/proveedores/busqueda"
+
+
+@pytest.fixture(autouse=True)
+def estrategia_primera():
+    yield
+    paging.set_strategy(paging.ESTRATEGIA_PRIMERA)
+
+
+@pytest.mark.parametrize("pagina, rango", [(1, "1"), (2, "2-10"), (10, "2-10"), (11, "11-100"), (1000, "101-1000"), (1001, ">1000")])
+def test_depth_bucket(pagina, rango):
+    assert paging.depth_bucket(pagina) == rango
+
+
+def test_update_calcula_la_ultima_pagina():
+    estado = PagingState()
+    assert estado.update(RUTA, {"total_items": 95, "page_size": 10}) == 10
+    assert estado.last_page(RUTA) == 10
+    # Sin page_size en la respuesta se usa el del request
+    assert estado.update(RUTA, {"total_items": 95}, page_size=50) == 2
+    # Sin resultados sigue habiendo una página
+    assert estado.update(RUTA, {"total_items": 0, "page_size": 10}) == 1
+
+
+@pytest.mark.parametrize("respuesta", [[], {"items": []}, {"total_items": "x", "page_size": 10}, {"total_items": 5, "page_size": 0}])
+def test_update_ignora_respuestas_sin_sobre(respuesta):
+    estado = PagingState()
+    assert estado.update(RUTA, respuesta) is None
+    assert estado.last_page(RUTA) is None
+
+
+def test_sin_ultima_pagina_se_pide_la_primera():
+    estado = PagingState()
+    assert estado.next_page(RUTA, paging.ESTRATEGIA_AL_AZAR) == 1
+    assert estado.next_page(RUTA, paging.ESTRATEGIA_ULTIMA) == 1
+
+
+def test_recorrido_vuelve_a_empezar():
+    estado = PagingState()
+    estado.update(RUTA, {"total_items": 30, "page_size": 10})
+    assert [estado.next_page(RUTA, paging.ESTRATEGIA_RECORRIDO) for _ in range(7)] == [1, 2, 3, 1, 2, 3, 1]
+
+
+def test_al_azar_y_ultima():
+    estado = PagingState(rng=random.Random(5))
+    estado.update(RUTA, {"total_items": 50, "page_size": 10})
+    assert estado.next_page(RUTA, paging.ESTRATEGIA_ULTIMA) == 5
+    paginas = {estado.next_page(RUTA, paging.ESTRATEGIA_AL_AZAR) for _ in range(200)}
+    assert paginas == {1, 2, 3, 4, 5}
+
+
+def test_choose_page_no_modifica_los_params():
+    datos = SimpleNamespace()
+    params = {"p_page_number": 1, "p_page_size": 10}
+
+    assert paging.choose_page(datos, RUTA, params) == ({"p_page_number": 1, "p_page_size": 10}, 1)
+
+    paging.set_strategy(paging.ESTRATEGIA_RECORRIDO)
+    paging.state_for(datos).page_size = 100
+    elegidos, pagina = paging.choose_page(datos, RUTA, params)
+    assert (elegidos, pagina) == ({"p_page_number": 1, "p_page_size": 100}, 1)
+    assert paging.choose_page(datos, RUTA, params)[1] == 2
+    assert params == {"p_page_number": 1, "p_page_size": 10}
+
+
+def test_estado_por_usuario():
+    uno, otro = SimpleNamespace(), SimpleNamespace()
+    assert paging.state_for(uno) is paging.state_for(uno)
+    assert paging.state_for(uno) is not paging.state_for(otro)
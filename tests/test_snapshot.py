@@ -0,0 +1,96 @@
+"""Pruebas de utils/snapshot.py: huella de los .py, hash y datos congelados"""
+import copy
+import logging
+import types
+
+import msgpack
+import pytest
+
+from utils import config, snapshot
+
+logger = logging.getLogger("test_snapshot")
+
+AMBIENTE = "prueba"
+
+
+@pytest.fixture
+def datos_ambiente(tmp_path, monkeypatch):
+    """Carpeta data/ temporal con un .py de origen y un módulo combinado de datos"""
+    carpeta = tmp_path / "data" / AMBIENTE
+    carpeta.mkdir(parents=True)
+    origen = carpeta / f"{AMBIENTE}_datos.py"
+    origen.write_text("ids = [1, 2]\n")
+
+    modulo = types.ModuleType("combined_data_module")
+    modulo.ids = [1, 2, 3]
+    modulo.body = {"p_nombre": "JUAN", "p_domicilio": {"p_altura": "100"}}
+    modulo.host = "http://api-dev.local"
+
+    monkeypatch.setattr(snapshot, "DATA_DIR", str(tmp_path / "data"))
+    monkeypatch.setattr(snapshot, "SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+    monkeypatch.setattr(snapshot, "_cache", {})
+    monkeypatch.setattr(config, "import_data_for_environment", lambda ambiente, log: modulo)
+    return origen
+
+
+def test_build_y_lectura(datos_ambiente):
+    _, hash_contenido = snapshot.build(AMBIENTE, logger)
+    datos, hash_leido = snapshot._leer(AMBIENTE, snapshot.source_fingerprint(AMBIENTE))
+    assert hash_leido == hash_contenido
+    assert datos == {"ids": [1, 2, 3], "body": {"p_nombre": "JUAN", "p_domicilio": {"p_altura": "100"}}, "host": "http://api-dev.local"}
+
+
+def test_huella_cambia_con_los_archivos_de_origen(datos_ambiente):
+    snapshot.build(AMBIENTE, logger)
+    huella = snapshot.source_fingerprint(AMBIENTE)
+    assert list(huella) == [f"{AMBIENTE}/{AMBIENTE}_datos.py"]
+
+    datos_ambiente.write_text("ids = [1, 2, 3, 4]\n")
+    nueva = snapshot.source_fingerprint(AMBIENTE)
+    assert nueva != huella
+    assert snapshot._leer(AMBIENTE, nueva) is None
+
+
+def test_contenido_alterado_no_se_lee(datos_ambiente):
+    ruta, _ = snapshot.build(AMBIENTE, logger)
+    with open(ruta, "rb") as archivo:
+        encabezado = msgpack.unpackb(archivo.read())
+    encabezado["datos"] = msgpack.packb({"ids": [9]})
+    with open(ruta, "wb") as archivo:
+        archivo.write(msgpack.packb(encabezado))
+    assert snapshot._leer(AMBIENTE, snapshot.source_fingerprint(AMBIENTE)) is None
+
+
+def test_load_compila_y_recompila_si_cambian_los_origenes(datos_ambiente):
+    primero = snapshot.load(AMBIENTE, logger)
+    assert snapshot.load(AMBIENTE, logger) is primero
+
+    datos_ambiente.write_text("ids = []\n")
+    segundo = snapshot.load(AMBIENTE, logger)
+    assert segundo is not primero
+    assert segundo.hash_snapshot == primero.hash_snapshot
+
+
+def test_datos_congelados(datos_ambiente):
+    datos = snapshot.load(AMBIENTE, logger)
+    assert datos.ids == [1, 2, 3]
+    with pytest.raises(TypeError):
+        datos.ids.append(4)
+    with pytest.raises(TypeError):
+        datos.body["p_nombre"] = "ANA"
+    with pytest.raises(TypeError):
+        datos.ids = []
+    with pytest.raises(AttributeError):
+        datos.inexistente
+
+    copia = copy.deepcopy(datos.body)
+    copia["p_domicilio"]["p_altura"] = "200"
+    assert type(copia) is dict and type(copia["p_domicilio"]) is dict
+    assert datos.body["p_domicilio"]["p_altura"] == "100"
+
+
+def test_collect_rechaza_tipos_no_soportados():
+    modulo = types.ModuleType("combined_data_module")
+    modulo.valores = {"fecha": object()}
+    with pytest.raises(ValueError, match="valores"):
+        snapshot.collect(modulo)
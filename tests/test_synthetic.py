@@ -0,0 +1,87 @@
+"""Pruebas de utils/synthetic.py: dígitos verificadores y unicidad de los DNIs"""
+import pytest
+
+from utils import synthetic
+from utils.synthetic import SEXO_FEMENINO, SEXO_MASCULINO, SyntheticPool
+
+
+@pytest.mark.parametrize("cuit", ["20123456786", "27123456780", "30500010912", "33693450239"])
+def test_cuits_conocidos(cuit):
+    assert synthetic.is_valid_cuit(cuit)
+
+
+@pytest.mark.parametrize("cuit", ["20123456787", "2012345678", "20-12345678-6", "2012345678X"])
+def test_cuits_invalidos(cuit):
+    assert not synthetic.is_valid_cuit(cuit)
+
+
+def test_digito_coincide_con_check_digit():
+    for numero in range(10_000_000, 10_000_000 + 5000, 7):
+        for prefijo in (20, 23, 27, 30, 33):
+            assert synthetic._digito(prefijo, numero) == synthetic.check_digit(f"{prefijo}{numero:08d}")
+
+
+def test_cuil_usa_el_prefijo_alternativo():
+    # Con prefijo 20 el dígito de 12345600 da 10: corresponde el 23
+    assert synthetic._digito(20, 12345600) == 10
+    cuil = synthetic.cuil(12345600, SEXO_MASCULINO)
+    assert cuil == "23123456009" and synthetic.is_valid_cuit(cuil)
+
+
+def test_identidades_validas():
+    pool = SyntheticPool(tamano=500, semilla=1)
+    for _ in range(500):
+        identidad = pool.take()
+        assert identidad.sexo in (SEXO_MASCULINO[0], SEXO_FEMENINO[0])
+        assert synthetic.is_valid_cuit(identidad.cuil)
+        assert identidad.cuil[2:10] == identidad.dni
+        assert synthetic.SYNTHETIC_DNI_BASE <= int(identidad.dni) < synthetic.SYNTHETIC_DNI_BASE + synthetic.SYNTHETIC_DNI_SPAN
+
+
+def test_empresas_validas():
+    pool = SyntheticPool(tamano=10, semilla=1)
+    cuits = [pool.take_company().cuit for _ in range(300)]
+    assert all(cuit[:2] in ("30", "33") and synthetic.is_valid_cuit(cuit) for cuit in cuits)
+    assert len(set(cuits)) == len(cuits)
+
+
+def test_dnis_sin_repetir_entre_tandas():
+    # Tandas chicas para que take() genere varias veces
+    pool = SyntheticPool(tamano=100, semilla=3)
+    dnis = [pool.take().dni for _ in range(2000)]
+    assert len(set(dnis)) == len(dnis)
+
+
+def test_permutacion_completa_del_rango():
+    # Con un rango chico (coprimo con el multiplicador) todo el bloque se recorre sin repetir
+    pool = SyntheticPool(tamano=10_000, semilla=5, span=1000, max_workers=1)
+    assert pool._limite_bloque == 1000
+    numeros = [pool._numero(indice) for indice in range(1000)]
+    assert sorted(numeros) == list(range(synthetic.SYNTHETIC_DNI_BASE, synthetic.SYNTHETIC_DNI_BASE + 1000))
+    with pytest.raises(RuntimeError):
+        for _ in range(1001):
+            pool.take()
+
+
+def test_bloques_de_workers_disjuntos():
+    uno = SyntheticPool(tamano=500, semilla=9, bloque=0)
+    otro = SyntheticPool(tamano=500, semilla=9, bloque=1)
+    assert not {uno.take().dni for _ in range(500)} & {otro.take().dni for _ in range(500)}
+
+
+def test_misma_semilla_mismos_datos():
+    uno, otro = SyntheticPool(tamano=50, semilla=11), SyntheticPool(tamano=50, semilla=11)
+    assert [uno.take() for _ in range(50)] == [otro.take() for _ in range(50)]
+
+
+def test_span_no_coprimo():
+    with pytest.raises(ValueError):
+        SyntheticPool(tamano=10, semilla=1, span=synthetic._MULTIPLICADOR * 2)
+
+
+def test_persona_body_solo_completa_los_campos_de_la_plantilla():
+    identidad = SyntheticPool(tamano=1, semilla=1).take()
+    plantilla = {"p_cuil": "20000000001", "p_nombre": "X", "p_id_localidad": 5}
+    body = synthetic.persona_body(plantilla, identidad)
+    assert body == {"p_cuil": identidad.cuil, "p_nombre": identidad.nombre, "p_id_localidad": 5}
+    assert plantilla["p_cuil"] == "20000000001"
@@ -0,0 +1,40 @@
+"""Pruebas de utils/teardown.py: rutas de baja con TEARDOWN_ROUTES"""
+import pytest
+
+from utils import teardown
+from utils.teardown import RUTAS_BAJA
+
+
+def test_sin_reemplazos(monkeypatch):
+    monkeypatch.delenv("TEARDOWN_ROUTES", raising=False)
+    assert teardown.routes() == RUTAS_BAJA
+    assert teardown.routes("") == RUTAS_BAJA
+
+
+def test_reemplazo_y_desactivacion():
+    rutas = teardown.routes(" domicilio = patch /domicilios/{id}/baja ; incidente= ;")
+    assert rutas["domicilio"] == ("PATCH", "/domicilios/{id}/baja")
+    assert rutas["incidente"] is None
+    assert rutas["proveedor"] == RUTAS_BAJA["proveedor"]
+
+
+def test_tipo_nuevo():
+    assert teardown.routes("vehiculo=DELETE /vehiculos/{id}")["vehiculo"] == ("DELETE", "/vehiculos/{id}")
+
+
+def test_lee_la_variable_de_entorno(monkeypatch):
+    monkeypatch.setenv("TEARDOWN_ROUTES", "persona_fisica=")
+    assert teardown.routes()["persona_fisica"] is None
+    # Un valor explícito tiene prioridad sobre la variable
+    assert teardown.routes("")["persona_fisica"] == RUTAS_BAJA["persona_fisica"]
+
+
+@pytest.mark.parametrize("config", ["domicilio=DELETE", "domicilio=/domicilios/{id}"])
+def test_ruta_invalida(config):
+    with pytest.raises(ValueError, match="domicilio"):
+        teardown.routes(config)
+
+
+def test_no_modifica_las_rutas_por_defecto():
+    teardown.routes("domicilio=")
+    assert RUTAS_BAJA["domicilio"] == ("DELETE", "/domicilios/{id}")
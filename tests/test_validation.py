@@ -0,0 +1,76 @@
+"""Pruebas de utils/validation.py: esquemas, muestreo y tope de errores"""
+import random
+
+import pytest
+
+from utils import validation
+from utils.validation import NULO, Schema, validate
+
+ESQUEMA = Schema(required={"id": int, "nombre": str, "padre": (int, NULO)}, optional={"alias": str})
+
+
+@pytest.fixture(autouse=True)
+def modo_completo():
+    validation.set_mode(validation.MODO_COMPLETO)
+    yield
+    validation.set_mode(validation.MODO_COMPLETO)
+
+
+def test_elemento_valido():
+    assert validate(ESQUEMA, {"id": 1, "nombre": "A", "padre": None}) == []
+    assert validate(ESQUEMA, [{"id": 1, "nombre": "A", "padre": 2, "alias": "a"}]) == []
+
+
+def test_opcional_puede_faltar_o_venir_en_null():
+    assert validate(ESQUEMA, {"id": 1, "nombre": "A", "padre": None, "alias": None}) == []
+
+
+def test_errores_de_campos():
+    errores = validate(ESQUEMA, {"nombre": 3, "padre": "x", "alias": 5})
+    assert errores == [
+        "falta el campo 'id'",
+        "'nombre' debería ser str",
+        "'padre' debería ser int o null",
+        "'alias' debería ser str",
+    ]
+
+
+def test_no_objeto():
+    assert validate(ESQUEMA, ["texto"]) == ["se esperaba un objeto y se recibió str"]
+
+
+def test_any_of():
+    esquema = Schema(any_of=("id", "codigo"))
+    assert validate(esquema, [{"codigo": "X"}]) == []
+    assert validate(esquema, [{"nombre": "X"}]) == ["no tiene ninguno de los campos id, codigo"]
+
+
+def test_tope_de_errores():
+    errores = validate(ESQUEMA, [{}] * 10)
+    assert len(errores) == validation.MAX_ERRORES
+
+
+def test_modo_completo_valida_todo():
+    elementos = list(range(100))
+    assert validation.sample_items(elementos) is elementos
+
+
+def test_modo_muestreo():
+    validation.set_mode(validation.MODO_MUESTREO)
+    cabeza, al_azar = validation.VALIDATION_SAMPLE_HEAD, validation.VALIDATION_SAMPLE_RANDOM
+    elementos = list(range(100))
+
+    muestra = validation.sample_items(elementos, rng=random.Random(7))
+    assert len(muestra) == cabeza + al_azar
+    assert muestra[:cabeza] == elementos[:cabeza]
+    assert len(set(muestra)) == len(muestra)
+    assert all(cabeza <= valor < 100 for valor in muestra[cabeza:])
+
+    cortos = list(range(cabeza + al_azar))
+    assert validation.sample_items(cortos) is cortos
+
+
+def test_muestreo_detecta_error_en_la_cabeza():
+    validation.set_mode(validation.MODO_MUESTREO)
+    elementos = [{"id": "1", "nombre": "A", "padre": None}] + [{"id": 1, "nombre": "A", "padre": None}] * 50
+    assert validate(ESQUEMA, elementos) == ["'id' debería ser int"]
@@ -0,0 +1,141 @@
+"""Modelo abierto de arribos (perfil "open").
+
+Con wait_time = between(1, 3) cada usuario espera su respuesta antes de
+enviar el siguiente request: si la API se pone lenta, la carga ofrecida
+baja y la cola de latencia queda oculta (omisión coordinada). En el perfil
+"open" un generador emite arribos a una tasa fija (--arrival-rate, en
+arribos por segundo por proceso), repartidos entre los endpoints según la
+mezcla de --mix, sin importar cuánto tarden las respuestas:
+
+- poisson: intervalos exponenciales (tráfico de muchos ciudadanos independientes)
+- constant: intervalos fijos de 1/tasa (token bucket sin ráfagas)
+
+Los usuarios de Locust toman los arribos de una cola y los ejecutan; la
+cantidad de usuarios es la concurrencia máxima. Cada arribo se informa en
+las estadísticas como request_type "ARRIBO" con el tiempo medido desde el
+momento en que debía enviarse hasta que terminó el task, que incluye la
+espera en la cola si todos los usuarios están ocupados. Los arribos que no
+entran en la cola llena se informan como ARRIBO fallidos, con el tiempo
+que lleva esperando el arribo más viejo de la cola (el mínimo que habrían
+esperado), para que la sobrecarga no desaparezca de las estadísticas.
+"""
+import os
+import random
+import time
+from collections import namedtuple
+
+import gevent
+from gevent.queue import Empty, Full, Queue
+
+from utils import metrics
+
+PROCESO_POISSON = "poisson"
+PROCESO_CONSTANTE = "constant"
+PROCESOS_ARRIBO = [PROCESO_POISSON, PROCESO_CONSTANTE]
+
+# Arribos pendientes como máximo; los que no entran se informan como fallidos
+ARRIVAL_QUEUE_MAX = int(os.getenv("ARRIVAL_QUEUE_MAX", "1000"))
+
+REQUEST_TYPE_ARRIBO = "ARRIBO"
+
+# Un arribo: la entrada del registro a ejecutar y el momento (time.time) en que debía enviarse
+Arribo = namedtuple("Arribo", ["entrada", "programado"])
+
+
+class ArrivalDropped(Exception):
+    pass
+
+
+class ArrivalScheduler:
+    """Genera arribos a tasa fija según la mezcla ponderada y los encola"""
+
+    def __init__(self, schedule, rate, proceso=PROCESO_POISSON, queue_max=ARRIVAL_QUEUE_MAX, rng=random, environment=None):
+        if rate <= 0:
+            raise ValueError("La tasa de arribos debe ser mayor que cero")
+        self.schedule = schedule
+        self.environment = environment
+        self.rate = rate
+        self.proceso = proceso
+        self.rng = rng
+        self.cola = Queue(maxsize=queue_max)
+        self._greenlet = None
+
+    def target_rates(self):
+        """Arribos por segundo esperados para cada endpoint"""
+        return [(nombre, self.rate * proporcion) for nombre, proporcion in self.schedule.resumen()]
+
+    def _intervalo(self):
+        if self.proceso == PROCESO_CONSTANTE:
+            return 1.0 / self.rate
+        return self.rng.expovariate(self.rate)
+
+    def _generar(self):
+        # Los arribos se programan sobre una línea de tiempo absoluta: si el
+        # generador se atrasa, el arribo conserva su momento programado
+        programado = time.time()
+        while True:
+            programado += self._intervalo()
+            espera = programado - time.time()
+            if espera > 0:
+                gevent.sleep(espera)
+            arribo = Arribo(self.schedule.pick(self.rng), programado)
+            try:
+                self.cola.put_nowait(arribo)
+            except Full:
+                metrics.inc("abierto: arribos descartados (cola llena)")
+                self._descartar(arribo)
+
+    def _descartar(self, arribo):
+        """Informa como fallido un arribo que no entró en la cola"""
+        if self.environment is None:
+            return
+        ahora = time.time()
+        try:
+            espera = ahora - self.cola.peek(block=False).programado
+        except Empty:
+            espera = 0
+        self.environment.events.request.fire(
+            request_type=REQUEST_TYPE_ARRIBO,
+            name=arribo.entrada.nombre,
+            response_time=(ahora - arribo.programado + espera) * 1000,
+            response_length=0,
+            response=None,
+            context={},
+            exception=ArrivalDropped(f"cola de arribos llena ({self.cola.maxsize})"),
+        )
+
+    def start(self):
+        if self._greenlet is None:
+            self._greenlet = gevent.spawn(self._generar)
+
+    def stop(self):
+        if self._greenlet is not None:
+            self._greenlet.kill(block=False)
+            self._greenlet = None
+
+    def next(self, timeout=1.0):
+        """Siguiente arribo pendiente, o None si no llegó ninguno en el tiempo indicado"""
+        try:
+            return self.cola.get(timeout=timeout)
+        except Empty:
+            return None
+
+
+def run_arrival(arribo, ejecutar, environment):
+    """Ejecuta un arribo e informa su latencia desde el momento programado"""
+    inicio = time.time()
+    metrics.observe("abierto: demora de inicio", (inicio - arribo.programado) * 1000)
+    excepcion = None
+    try:
+        ejecutar(arribo.entrada)
+    except Exception as e:
+        excepcion = e
+    environment.events.request.fire(
+        request_type=REQUEST_TYPE_ARRIBO,
+        name=arribo.entrada.nombre,
+        response_time=(time.time() - arribo.programado) * 1000,
+        response_length=0,
+        response=None,
+        context={},
+        exception=excepcion,
+    )
@@ -1,6 +1,25 @@
+import base64
+import hashlib
+import json
 import os
+import time
 
-def authenticate(client, logger, credentials=None):
+import gevent
+from gevent.lock import BoundedSemaphore
+
+# Margen mínimo (segundos) para renovar el token antes de que expire
+TOKEN_REFRESH_MARGIN = int(os.getenv("TOKEN_REFRESH_MARGIN", "60"))
+# Vida útil asumida (segundos) cuando el token no es un JWT con "exp"
+TOKEN_DEFAULT_TTL = int(os.getenv("TOKEN_DEFAULT_TTL", "1800"))
+# Espera entre reintentos de una renovación fallida
+TOKEN_RETRY_DELAY = 15
+
+# Caché de tokens compartida por todos los usuarios del proceso (en modo
+# distribuido cada worker tiene la suya), indexada por ambiente y credenciales
+_token_cache = {}
+_cache_lock = BoundedSemaphore()
+
+def authenticate(client, logger, credentials=None, name=None):
     """Maneja la autenticación del usuario con el API"""
 
     # Usar credenciales pasadas como parámetro o tomar de variables de entorno
@@ -21,7 +40,7 @@ def authenticate(client, logger, credentials=None):
     logger.info(f"Iniciando autenticación para usuario: {username}")
     
     try:
-        with client.post("/login", data=login_data, catch_response=True) as response:
+        with client.post("/login", data=login_data, catch_response=True, name=name) as response:
             if response.status_code == 200:
                 try:
                     response_data = response.json()
@@ -50,3 +69,105 @@ def authenticate(client, logger, credentials=None):
     except Exception as e:
         logger.error(f"Excepción durante la autenticación: {str(e)}")
         return None
+
+
+class CachedToken:
+    """Token compartido con su expiración y el greenlet que lo renueva"""
+
+    def __init__(self, key, credentials):
+        self.key = key
+        self.credentials = credentials
+        self.token = None
+        self.expires_at = 0
+        self.obtained_at = 0
+        self.lock = BoundedSemaphore()
+        self.refresher = None
+
+    def is_valid(self, margin=0):
+        return self.token is not None and time.time() < self.expires_at - margin
+
+    def refresh_at(self):
+        """Momento en que conviene renovar: el 10% final de la vida útil del token,
+        o el margen si es mayor, pero nunca antes de la mitad de su vida útil"""
+        vida_util = max(0, self.expires_at - self.obtained_at)
+        return self.expires_at - max(vida_util * 0.1, min(TOKEN_REFRESH_MARGIN, vida_util * 0.5))
+
+
+def decode_jwt_expiry(token):
+    """Devuelve el claim "exp" (epoch) de un JWT, o None si no se puede decodificar"""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+        return float(exp) if exp is not None else None
+    except (IndexError, ValueError, TypeError, AttributeError):
+        return None
+
+
+def _cache_key(env_name, credentials):
+    username = credentials.get("username", "") if credentials else ""
+    password = credentials.get("password", "") if credentials else ""
+    # No se guarda la contraseña en la clave, solo su hash
+    return (env_name, username, hashlib.sha256(password.encode()).hexdigest())
+
+
+def _login(entry, client, logger, name=None):
+    token = authenticate(client, logger, entry.credentials, name=name)
+    if token:
+        entry.token = token
+        entry.obtained_at = time.time()
+        entry.expires_at = decode_jwt_expiry(token) or (time.time() + TOKEN_DEFAULT_TTL)
+        logger.info(f"Token vigente hasta {time.strftime('%H:%M:%S', time.localtime(entry.expires_at))}")
+    return token
+
+
+def _refresh_loop(entry, client, logger):
+    """Renueva el token en segundo plano antes de que expire"""
+    while True:
+        # Con tokens muy cortos o el reloj local adelantado, refresh_at() ya
+        # pasó: la espera mínima evita renovar en un loop contra /login
+        gevent.sleep(max(TOKEN_RETRY_DELAY, entry.refresh_at() - time.time()))
+        with entry.lock:
+            if _login(entry, client, logger, name="/login [refresh]"):
+                continue
+        logger.warning(f"No se pudo renovar el token, reintentando en {TOKEN_RETRY_DELAY}s")
+        gevent.sleep(TOKEN_RETRY_DELAY)
+
+
+def get_token(client, logger, env_name, credentials=None):
+    """Obtiene un token de la caché compartida, autenticando una sola vez.
+
+    Los usuarios concurrentes que piden el mismo token esperan al primer
+    login (single-flight) en lugar de lanzar cada uno su propio POST /login.
+    """
+    key = _cache_key(env_name, credentials)
+    with _cache_lock:
+        entry = _token_cache.get(key)
+        if entry is None:
+            entry = _token_cache[key] = CachedToken(key, credentials)
+
+    if not entry.is_valid():
+        with entry.lock:
+            # Otro usuario pudo haber autenticado mientras esperábamos el lock
+            if not entry.is_valid() and not _login(entry, client, logger):
+                return None
+
+    # También con el token en caché: al reiniciar la prueba desde la interfaz
+    # web, test_stop detuvo la renovación y el token sigue vigente
+    if entry.refresher is None or entry.refresher.dead:
+        entry.refresher = gevent.spawn(_refresh_loop, entry, client, logger)
+    return entry.token
+
+
+def current_token(env_name, credentials=None):
+    """Token vigente en la caché (sin autenticar), para refrescar encabezados"""
+    entry = _token_cache.get(_cache_key(env_name, credentials))
+    return entry.token if entry and entry.is_valid() else None
+
+
+def stop_token_refresh():
+    """Detiene las renovaciones en segundo plano (al finalizar la prueba)"""
+    for entry in list(_token_cache.values()):
+        if entry.refresher is not None:
+            entry.refresher.kill(block=False)
+            entry.refresher = None
@@ -1,16 +1,36 @@
 import os
+import sys
 import importlib
 import logging
 import glob
 import types
 from dotenv import load_dotenv
 
+from utils.logging_queue import build_queue_pipeline
+
 # Cargar variables de entorno desde .env
 load_dotenv()
 
 # Variable global para controlar si ya se configuró el logger
 _logger_configured = False
 
+# Listener del pipeline de logging asíncrono (hilo de escritura en lotes)
+_log_listener = None
+
+# Archivo de log del proceso; en modo distribuido cada worker escribe el suyo
+_log_file_name = "base_unica_test.log"
+_worker_log = False
+
+# Niveles de verbosidad del log:
+# - debug: todo, incluidos los datos completos de las respuestas
+# - full: comportamiento histórico (INFO), con los detalles por ítem
+# - load: solo advertencias y errores; descarta los volcados por request
+LOG_VERBOSITY_LEVELS = {
+    "debug": logging.DEBUG,
+    "full": logging.INFO,
+    "load": logging.WARNING,
+}
+
 # Detectar el ambiente basado en la URL de la API
 def detect_environment(host_url=None):
     # Usar el host proporcionado o, si no está disponible, usar BASE_URL del .env
@@ -18,6 +38,8 @@ def detect_environment(host_url=None):
     
     if "dev" in base_url:
         return "dev"
+    elif any(local in base_url for local in ("localhost", "127.0.0.1", "[::1]")):
+        return "dev"  # Servidor simulado (utils/mock_server.py)
     elif "stage" in base_url:
         return "stage"
     elif "clon" in base_url:
@@ -28,6 +50,18 @@ def detect_environment(host_url=None):
         return "prod"  # Por defecto
 
 def load_data_for_environment(env_name, logger):
+    """Datos del ambiente, de solo lectura, desde el snapshot precompilado (utils/snapshot.py)"""
+    from utils import snapshot
+    return snapshot.load(env_name, logger)
+
+def _import_fresh(module_name):
+    # Al recompilar el snapshot en el mismo proceso hay que releer los .py modificados
+    if module_name in sys.modules:
+        return importlib.reload(sys.modules[module_name])
+    return importlib.import_module(module_name)
+
+def import_data_for_environment(env_name, logger):
+    """Importa los módulos de data/<ambiente>/ y los combina en un módulo (compilación del snapshot)"""
     # Lista de posibles nombres de módulos para intentar cargar
     possible_modules = [
         f"data.{env_name}.{env_name}_persona_juridica_data",
@@ -54,7 +88,7 @@ def load_data_for_environment(env_name, logger):
     for module_name in possible_modules:
         try:
             logger.info(f"Intentando cargar módulo: {module_name}")
-            data_module = importlib.import_module(module_name)
+            data_module = _import_fresh(module_name)
             logger.info(f"Datos cargados correctamente desde: {module_name}")
             
             # Copiar todos los atributos del módulo cargado al módulo combinado
@@ -94,7 +128,7 @@ def load_data_for_environment(env_name, logger):
     for module_name in possible_prod_modules:
         try:
             logger.info(f"Intentando cargar módulo de producción: {module_name}")
-            data_module = importlib.import_module(module_name)
+            data_module = _import_fresh(module_name)
             logger.info("Datos de producción cargados como alternativa")
             
             # Copiar todos los atributos del módulo cargado al módulo combinado
@@ -119,6 +153,16 @@ def load_data_for_environment(env_name, logger):
     
     return combined_module
 
+# Obtener una opción de línea de comandos con respaldo en variables de entorno
+def get_option(environment, name, env_var, default=None):
+    """Lee una opción personalizada de Locust; si no hay opciones parseadas
+    (por ejemplo al usar Locust como librería) usa la variable de entorno"""
+    parsed_options = getattr(environment, "parsed_options", None)
+    value = getattr(parsed_options, name, None) if parsed_options else None
+    if value is None:
+        value = os.getenv(env_var, default)
+    return value
+
 # Obtener credenciales basadas en el entorno
 def get_credentials_for_environment(env_name):
     env_name = env_name.upper()  # Convertir a mayúsculas para coincidir con las variables de entorno
@@ -142,13 +186,29 @@ def get_credentials_for_environment(env_name):
         "password": password
     }
 
+# Log propio de un worker en modo distribuido
+def use_worker_log(worker_id):
+    """Hace que el proceso escriba en logs/base_unica_test.worker-<id>.log y
+    que al limpiar los logs solo borre ese archivo"""
+    global _log_file_name, _worker_log
+    _log_file_name = f"base_unica_test.worker-{worker_id}.log"
+    _worker_log = True
+
 # Función para limpiar logs existentes
 def clear_existing_logs():
-    """Limpia todos los archivos .log del directorio logs"""
+    """Limpia los archivos .log del directorio logs.
+
+    Un worker solo borra su propio archivo, y ningún proceso borra los
+    archivos de los workers (pueden estar escribiendo en el mismo host).
+    """
     log_dir = "logs"
     
     if os.path.exists(log_dir):
-        for archivo_log in glob.glob(f"{log_dir}/*.log"):
+        if _worker_log:
+            archivos = glob.glob(f"{log_dir}/{glob.escape(_log_file_name)}")
+        else:
+            archivos = [archivo for archivo in glob.glob(f"{log_dir}/*.log") if ".worker-" not in os.path.basename(archivo)]
+        for archivo_log in archivos:
             try:
                 os.remove(archivo_log)
                 print(f"Archivo de log eliminado: {archivo_log}")
@@ -158,6 +218,7 @@ def clear_existing_logs():
 # Función para cerrar y limpiar handlers del logger
 def close_logger_handlers():
     """Cierra todos los handlers del logger actual para liberar el archivo"""
+    global _log_listener
     logger = logging.getLogger("base_unica_test")
     
     # Cerrar y remover todos los handlers
@@ -165,8 +226,15 @@ def close_logger_handlers():
         handler.close()
         logger.removeHandler(handler)
 
+    # Escribir lo pendiente en la cola y cerrar los handlers de destino
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
 # Función para reiniciar el log para una nueva prueba
-def reset_log_for_new_test():
+def reset_log_for_new_test(verbosity=None):
     """Reinicia completamente el sistema de logging para una nueva prueba"""
     global _logger_configured
     
@@ -182,16 +250,20 @@ def reset_log_for_new_test():
     _logger_configured = False
     
     # Configurar el logger nuevamente
-    return setup_logger()
+    return setup_logger(verbosity)
 
 # Configurar el sistema de logging
-def setup_logger():
-    """Configura el logger para las pruebas"""
-    global _logger_configured
+def setup_logger(verbosity=None):
+    """Configura el logger para las pruebas.
+
+    Los registros pasan por una cola acotada y se escriben en lotes desde un
+    hilo nativo (utils/logging_queue.py), para no bloquear el loop de gevent.
+    """
+    global _logger_configured, _log_listener
     
     # Configurar directorio de logs
     log_dir = "logs"
-    log_file = f"{log_dir}/base_unica_test.log"
+    log_file = f"{log_dir}/{_log_file_name}"
     
     # Crear directorio de logs si no existe
     if not os.path.exists(log_dir):
@@ -203,32 +275,37 @@ def setup_logger():
         clear_existing_logs()
         _logger_configured = True
     
+    # Nivel según la verbosidad elegida (LOG_VERBOSITY o --log-verbosity)
+    verbosity = verbosity or os.getenv("LOG_VERBOSITY", "full")
+    level = LOG_VERBOSITY_LEVELS.get(verbosity, logging.INFO)
+
     # Configuración del logger
     logger = logging.getLogger("base_unica_test")
-    logger.setLevel(logging.INFO)
+    logger.setLevel(level)
+    # La consola ya tiene su propio handler: no duplicar en el logger raíz de Locust
+    logger.propagate = False
     
     # Limpiar los handlers existentes si los hay
-    if logger.handlers:
-        for handler in logger.handlers[:]:
-            handler.close()
-            logger.removeHandler(handler)
+    close_logger_handlers()
     
     # Handler para archivo
     file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(logging.INFO)
+    file_handler.setLevel(level)
     
     # Handler para consola
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
+    console_handler.setLevel(level)
     
     # Formato del log
     formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    # Agregar handlers al logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Los handlers de archivo y consola los usa el hilo de escritura;
+    # el logger solo encola
+    queue_handler, _log_listener = build_queue_pipeline([file_handler, console_handler])
+    logger.addHandler(queue_handler)
     
     logger.info("=== INICIO DE NUEVA SESIÓN DE PRUEBAS ===")
+    logger.info(f"Verbosidad del log: {verbosity}")
     return logger
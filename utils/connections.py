@@ -0,0 +1,169 @@
+"""Estrategias de conexión de los usuarios y tiempos por fase de cada request.
+
+Cada usuario de Locust tiene su propia sesión HTTP, que por defecto
+mantiene las conexiones abiertas (keep-alive) y reutiliza la misma conexión
+TCP/TLS durante toda la prueba: el costo del handshake TLS del gateway se
+paga una sola vez por usuario y no aparece en las mediciones. Con
+--connection-strategy (o LOCUST_CONNECTION_STRATEGY) se elige cómo se
+conectan los usuarios:
+
+- pooled: conexiones persistentes reutilizadas (comportamiento histórico),
+  hasta --pool-size conexiones por host
+- reconnect: las conexiones del usuario se cierran al empezar cada
+  iteración; el primer request de la iteración abre una conexión nueva
+  (como un cliente que vuelve después de un rato)
+- handshake: una conexión nueva por request ("Connection: close"), con su
+  handshake TLS completo
+
+Python no reanuda sesiones TLS entre conexiones de urllib3 ni de
+geventhttpclient, así que cada conexión nueva hace el handshake completo.
+Una clase de usuario puede fijar su propia estrategia con los atributos
+connection_strategy y pool_size (None usa la opción de la línea de comandos).
+
+Con el transporte requests cada request se informa en la pestaña
+"Harness" separado en fases:
+
+- "conexión: <request> [conexión]": TCP y handshake TLS (solo los requests
+  que abrieron una conexión nueva)
+- "conexión: <request> [primer byte]": envío del request y espera hasta
+  recibir los encabezados de la respuesta
+- "conexión: <request> [descarga]": el resto del tiempo de respuesta,
+  lectura del cuerpo y trabajo de requests
+
+y los contadores "conexión: nuevas" y "conexión: reutilizadas". El
+transporte fast aplica las estrategias pero no informa las fases.
+"""
+import time
+
+from locust.clients import LocustHttpAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from utils import metrics
+
+ESTRATEGIA_PERSISTENTE = "pooled"
+ESTRATEGIA_RECONEXION = "reconnect"
+ESTRATEGIA_HANDSHAKE = "handshake"
+ESTRATEGIAS = [ESTRATEGIA_PERSISTENTE, ESTRATEGIA_RECONEXION, ESTRATEGIA_HANDSHAKE]
+
+POOL_SIZE = 10
+
+
+class _TimedConnection:
+    """Mide la conexión y el primer byte de cada request de la conexión"""
+    _conexion_ms = None
+    _fin_conexion = 0.0
+    _inicio_request = 0.0
+
+    def connect(self):
+        inicio = time.perf_counter()
+        super().connect()
+        self._fin_conexion = time.perf_counter()
+        self._conexion_ms = (self._fin_conexion - inicio) * 1000
+
+    def request(self, *args, **kwargs):
+        self._inicio_request = time.perf_counter()
+        return super().request(*args, **kwargs)
+
+    def getresponse(self, *args, **kwargs):
+        response = super().getresponse(*args, **kwargs)
+        # En HTTPS la conexión se abre antes de request(); en HTTP, adentro
+        desde = max(self._inicio_request, self._fin_conexion) if self._conexion_ms is not None else self._inicio_request
+        response._harness_timing = (self._conexion_ms, (time.perf_counter() - desde) * 1000)
+        self._conexion_ms = None
+        return response
+
+
+class _TimedHTTPConnection(_TimedConnection, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnection, HTTPSConnection):
+    pass
+
+
+class _HTTPPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _HTTPSPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _HTTPPoolSinKeepAlive(_HTTPPool):
+    def _put_conn(self, conn):
+        # La conexión vuelve cerrada al pool: el próximo request abre otra
+        if conn is not None:
+            conn.close()
+        super()._put_conn(conn)
+
+
+class _HTTPSPoolSinKeepAlive(_HTTPSPool):
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn.close()
+        super()._put_conn(conn)
+
+
+class TimedAdapter(LocustHttpAdapter):
+    """Adaptador de Locust con pool acotado, tiempos por fase y keep-alive opcional"""
+
+    def __init__(self, pool_size=POOL_SIZE, keep_alive=True):
+        self.keep_alive = keep_alive
+        super().__init__(None, pool_connections=pool_size, pool_maxsize=pool_size)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        if self.keep_alive:
+            self.poolmanager.pool_classes_by_scheme = {"http": _HTTPPool, "https": _HTTPSPool}
+        else:
+            self.poolmanager.pool_classes_by_scheme = {"http": _HTTPPoolSinKeepAlive, "https": _HTTPSPoolSinKeepAlive}
+
+    def add_headers(self, request, **kwargs):
+        if not self.keep_alive:
+            request.headers["Connection"] = "close"
+
+
+def configure(client, estrategia, pool_size=POOL_SIZE):
+    """Aplica la estrategia de conexión a la sesión del usuario (requests o FastClient)"""
+    clientpool = getattr(getattr(client, "client", None), "clientpool", None)
+    if clientpool is not None:
+        # geventhttpclient: las conexiones por host del pool se crean con estos argumentos
+        clientpool.client_args["concurrency"] = pool_size
+        clientpool.close()
+        client.close_before_request = estrategia == ESTRATEGIA_HANDSHAKE
+        return
+    adapter = TimedAdapter(pool_size, keep_alive=estrategia != ESTRATEGIA_HANDSHAKE)
+    client.mount("http://", adapter)
+    client.mount("https://", adapter)
+
+
+def new_iteration(client, estrategia):
+    """Al empezar una iteración del usuario: con "reconnect" cierra sus conexiones"""
+    if estrategia != ESTRATEGIA_RECONEXION:
+        return
+    clientpool = getattr(getattr(client, "client", None), "clientpool", None)
+    if clientpool is not None:
+        clientpool.close()
+    else:
+        # Cierra los pools del adaptador; se vuelven a crear en el próximo request
+        client.close()
+
+
+def register(environment):
+    """Informa las fases de conexión, primer byte y descarga de cada request"""
+
+    @environment.events.request.add_listener
+    def on_request(name, response_time, response, exception, **kwargs):
+        tiempos = getattr(getattr(response, "raw", None), "_harness_timing", None)
+        if tiempos is None:
+            return
+        conexion_ms, primer_byte_ms = tiempos
+        if conexion_ms is None:
+            metrics.inc("conexión: reutilizadas")
+            conexion_ms = 0.0
+        else:
+            metrics.inc("conexión: nuevas")
+            metrics.observe(f"conexión: {name} [conexión]", conexion_ms)
+        metrics.observe(f"conexión: {name} [primer byte]", primer_byte_ms)
+        metrics.observe(f"conexión: {name} [descarga]", max(0.0, response_time - conexion_ms - primer_byte_ms))
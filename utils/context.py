@@ -0,0 +1,150 @@
+"""Contexto de datos aislado por usuario.
+
+Los task functions escriben resultados en el objeto de datos que reciben
+(data_module.ids_barrios, data_module.chapas, data_module.ultimo_id_domicilio,
+etc.). Si todos los usuarios comparten el módulo combinado, los resultados de
+uno pasan a ser las entradas de otro y las respuestas completas guardadas
+hacen crecer la memoria sin límite.
+
+UserDataContext se apoya sobre los datos del ambiente (solo lectura) y
+resuelve cada atributo en este orden:
+
+1. Pools acotados para los IDs cosechados de las respuestas
+   (localidades → barrios → calles, dependencias, etc.; utils/harvest.py).
+2. Valores propios del usuario (escrituras y copias de los contenedores
+   chicos del ambiente, copiados la primera vez que se usan).
+3. Bodies de escritura sintéticos, generados en cada lectura a partir de la
+   plantilla del ambiente (solo con --synthetic-data; utils/synthetic.py).
+4. Datos del ambiente.
+
+Las respuestas completas que ningún task vuelve a leer se descartan.
+"""
+import copy
+import os
+
+from utils import journal, metrics
+from utils.harvest import HARVEST_POOL_SIZE, HarvestPool
+
+# Contenedores del ambiente con hasta esta cantidad de elementos se copian
+# por usuario; los más grandes se comparten y se tratan como solo lectura
+COPY_ON_WRITE_MAX_ITEMS = int(os.getenv("COPY_ON_WRITE_MAX_ITEMS", "100"))
+
+# IDs (y nombres) cosechados de las respuestas y reutilizados por otros tasks
+POOL_FIELDS = frozenset([
+    "ids_paises", "ids_provincias", "ids_departamentos", "ids_localidades",
+    "ids_barrios", "ids_calles",
+    "nombres_paises", "nombres_provincias", "nombres_departamentos", "nombres_localidades",
+    "p_id_dependencia",
+])
+
+# Respuestas completas que los tasks guardan "para pruebas futuras" pero que
+# ningún task vuelve a leer: se descartan en lugar de retenerlas
+RESPONSE_SINKS = frozenset([
+    # Ambiente
+    "campanas_pet", "ciclovias", "espacios_verdes", "estacionamientos_bicicletas",
+    "primer_espacio_verde", "primer_registro_recoleccion", "primera_campana_pet",
+    "recoleccion_residuos_data",
+    # Domicilio
+    "ultima_consulta_geo", "ultimo_domicilio_consultado",
+    # Educación
+    "escuelas_municipales", "jardines_maternales_privados", "jardines_municipales",
+    "parques_educativos",
+    # Habilitación / Infraestructura / Salud / Turismo
+    "comercios", "obras_publicas", "puntos_wifi", "centros_operativos", "limites_administrativos",
+    "centros_salud", "geriatricos_privados", "zona_semm", "unidades_judiciales",
+    "anfitriones_turisticos", "guias_turisticos",
+    # Transporte
+    "centrales_agencias", "chapas", "chapas_por_cuil", "estados_licencias", "leasing",
+    "licencias", "permisionarios", "persona_fisica_chapa", "situaciones_chapas",
+    # Paramétricas
+    "actividades", "banco_por_id", "bancos", "condiciones", "condiciones_fiscales",
+    "dispositivos_pagos", "fechas_no_habiles", "formas_juridicas", "medios_pagos",
+    "medios_pagos_creados", "organizaciones_sociales", "profesion_por_id", "profesiones",
+    "tipo_org_social", "tipos_organizaciones_sociales", "tipos_servicios",
+    # Proveedor
+    "ultimo_proveedor_actividad", "ultimo_proveedor_buscado",
+    "ultimo_proveedor_buscado_por_ids_search", "ultimo_proveedor_por_id",
+])
+
+
+class _Sumidero:
+    """Acepta las escrituras habituales sobre una respuesta guardada y no retiene nada"""
+
+    def __setitem__(self, key, value):
+        pass
+
+    def append(self, valor):
+        pass
+
+    def extend(self, valores):
+        pass
+
+    def __len__(self):
+        return 0
+
+    def __iter__(self):
+        return iter(())
+
+
+_SUMIDERO = _Sumidero()
+
+
+class UserDataContext:
+    """Vista de los datos del ambiente propia de un usuario"""
+
+    def __init__(self, base, pool_capacity=HARVEST_POOL_SIZE, sinteticos=None):
+        object.__setattr__(self, "_base", base)
+        object.__setattr__(self, "_sinteticos", sinteticos or {})
+        object.__setattr__(self, "_propios", {})
+        object.__setattr__(self, "_pools", {})
+        object.__setattr__(self, "_pool_capacity", pool_capacity)
+
+    def _pool(self, name):
+        pool = self._pools.get(name)
+        if pool is None:
+            semilla = getattr(self._base, name, None) or ()
+            if not isinstance(semilla, (list, tuple, set)):
+                semilla = [semilla]
+            pool = self._pools[name] = HarvestPool(self._pool_capacity, valores=semilla)
+        return pool
+
+    def __getattr__(self, name):
+        # Solo se llama si el atributo no existe en la instancia
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if name in POOL_FIELDS:
+            return self._pool(name)
+        if name in self._propios:
+            return self._propios[name]
+        try:
+            valor = getattr(self._base, name)
+        except AttributeError:
+            if name in RESPONSE_SINKS:
+                return _SUMIDERO
+            raise
+        if name in self._sinteticos:
+            # Body nuevo en cada lectura, a partir de la plantilla del ambiente
+            metrics.inc("sintéticos: bodies generados")
+            return self._sinteticos[name](valor)
+        if isinstance(valor, (list, dict, set)) and len(valor) <= COPY_ON_WRITE_MAX_ITEMS:
+            # Copia propia de los contenedores chicos: los tasks pueden
+            # modificarlos sin afectar a los demás usuarios
+            valor = self._propios[name] = copy.deepcopy(valor)
+        return valor
+
+    def __setattr__(self, name, value):
+        if name in POOL_FIELDS:
+            if not isinstance(value, (list, tuple, set, HarvestPool)):
+                value = [value]
+            self._pool(name).extend(value)
+        elif name in RESPONSE_SINKS:
+            metrics.inc("contexto: respuestas descartadas")
+        else:
+            self._propios[name] = value
+            if name in journal.CAMPOS_CREADOS:
+                # IDs de registros creados, para darlos de baja al terminar (utils/teardown.py)
+                journal.record(name, value, sinteticos=bool(self._sinteticos))
+
+    def __delattr__(self, name):
+        self._propios.pop(name, None)
+        self._pools.pop(name, None)
@@ -0,0 +1,124 @@
+"""Ejecución distribuida (--master / --worker).
+
+El locustfile guarda el host, el ambiente y los datos en globales que se
+completan en test_start. En modo distribuido ese evento corre en cada
+proceso, así que cada worker resolvería el ambiente por su cuenta (con su
+propio BASE_URL) e importaría los datos de nuevo. En cambio:
+
+- el master resuelve el ambiente y carga los datos una sola vez, y envía
+  la configuración y el snapshot de los datos (utils/snapshot.py) a los
+  workers con el mensaje "harness_config", antes de los mensajes de spawn;
+  a los workers que se conectan con la prueba en curso se les envía al
+  conectarse
+- los workers usan esa configuración en su test_start; si no la
+  recibieron (master sin este locustfile) resuelven el ambiente localmente
+- cada worker escribe su propio archivo de log (utils/config.py) y no
+  borra los de otros procesos
+
+Las credenciales no viajan en el mensaje: cada host generador de carga
+las lee de su propio .env.
+"""
+import argparse
+import os
+import socket
+
+from locust.runners import MasterRunner, WorkerRunner
+
+from utils.snapshot import EnvironmentData, freeze
+
+MENSAJE_CONFIGURACION = "harness_config"
+MENSAJE_TASA_ARRIBOS = "harness_arrival_rate"
+
+# Master: la última configuración enviada; worker: la recibida
+_configuracion = None
+
+
+def worker_mode(argv):
+    """True si el proceso se inició con --worker (se lee antes de parsear las opciones)"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--worker", action="store_true", default=os.getenv("LOCUST_MODE_WORKER", "").lower() == "true")
+    opciones, _ = parser.parse_known_args(argv)
+    return opciones.worker
+
+
+def worker_id():
+    """Identificador del worker para su archivo de log: LOCUST_WORKER_ID o host-pid"""
+    return os.getenv("LOCUST_WORKER_ID") or f"{socket.gethostname()}-{os.getpid()}"
+
+
+def is_master(environment):
+    return isinstance(environment.runner, MasterRunner)
+
+
+def is_worker(environment):
+    return isinstance(environment.runner, WorkerRunner)
+
+
+def data_from_config(configuracion):
+    """Datos del ambiente (congelados) a partir de la configuración recibida del master"""
+    return EnvironmentData(freeze(configuracion["datos"]), configuracion["environment_name"], configuracion["hash"])
+
+
+def publish(environment, host, environment_name, produccion, data_module, semilla_sintetica=None):
+    """Master: envía la configuración del ambiente y los datos a todos los workers"""
+    global _configuracion
+    _configuracion = {
+        "host": host,
+        "environment_name": environment_name,
+        "produccion": produccion,
+        "semilla_sintetica": semilla_sintetica,
+        "hash": data_module.hash_snapshot,
+        "datos": data_module.to_dict(),
+    }
+    environment.runner.send_message(MENSAJE_CONFIGURACION, _configuracion)
+    return _configuracion
+
+
+def received_config():
+    """Worker: configuración recibida del master, o None"""
+    return _configuracion
+
+
+class RemoteArrivals:
+    """Tasa de arribos del perfil abierto en los workers, controlada desde el master.
+
+    La forma "knee" cambia arrivals.rate en cada escalón; en el master no hay
+    generador, así que la nueva tasa (por worker) se envía a todos los workers.
+    """
+
+    def __init__(self, environment, rate):
+        self.environment = environment
+        self._rate = rate
+
+    @property
+    def rate(self):
+        return self._rate
+
+    @rate.setter
+    def rate(self, valor):
+        self._rate = valor
+        self.environment.runner.send_message(MENSAJE_TASA_ARRIBOS, valor)
+
+
+def register(environment, logger, on_arrival_rate):
+    """Registra los mensajes entre master y workers según el rol del proceso"""
+    runner = environment.runner
+
+    if isinstance(runner, MasterRunner):
+        @environment.events.worker_connect.add_listener
+        def on_worker_connect(client_id, **kwargs):
+            # Worker que se conecta con la prueba en curso: recibe la configuración antes del spawn
+            if _configuracion is not None:
+                runner.send_message(MENSAJE_CONFIGURACION, _configuracion, client_id=client_id)
+
+    elif isinstance(runner, WorkerRunner):
+        def on_config(environment, msg, **kwargs):
+            global _configuracion
+            _configuracion = msg.data
+            logger.info(f"Configuración recibida del master: ambiente {msg.data['environment_name']}, host {msg.data['host']}, datos sha256 {msg.data['hash'][:12]}")
+
+        def on_rate(environment, msg, **kwargs):
+            on_arrival_rate(msg.data)
+
+        runner.register_message(MENSAJE_CONFIGURACION, on_config)
+        runner.register_message(MENSAJE_TASA_ARRIBOS, on_rate)
@@ -0,0 +1,140 @@
+"""Pool de valores cosechados de las respuestas.
+
+Varios tasks descubren IDs en las respuestas y los usan en llamadas
+posteriores (países → provincias → departamentos → localidades,
+dependencias del cerrojo). HarvestPool mantiene una muestra acotada de esos
+IDs:
+
+- Capacidad fija: una vez lleno, cada valor nuevo entra por muestreo de
+  reservorio (todos los valores ofrecidos tienen la misma probabilidad de
+  quedar), de modo que la memoria no crece en pruebas largas.
+- TTL: los valores vencidos salen del pool y dejan lugar a los que se
+  cosechen después; volver a ofrecer un valor renueva su vencimiento. Si
+  todo vence, el pool vuelve a los valores iniciales del ambiente.
+- Extracción aleatoria en O(1) con draw().
+
+Se comporta además como una secuencia (len, índices, slices, iteración)
+para que el código existente que usa random.choice(...) o [:5] siga
+funcionando.
+"""
+import math
+import os
+import random
+import time
+
+HARVEST_POOL_SIZE = int(os.getenv("HARVEST_POOL_SIZE", "200"))
+HARVEST_TTL = float(os.getenv("HARVEST_TTL", "600"))  # segundos; 0 desactiva el vencimiento
+
+
+class HarvestPool:
+    """Muestra acotada, con vencimiento, de los valores cosechados"""
+
+    def __init__(self, capacity=HARVEST_POOL_SIZE, ttl=HARVEST_TTL, valores=(), rng=random, clock=time.monotonic):
+        self.capacity = capacity
+        self.ttl = ttl
+        self._rng = rng
+        self._clock = clock
+        self._valores = []
+        self._vencimientos = []
+        self._posiciones = {}
+        self._ofrecidos = 0
+        self._proximo_vencimiento = math.inf
+        self._semilla = tuple(valores)
+        self._sembrar()
+
+    def _sembrar(self):
+        """Carga los valores iniciales (datos del ambiente), que no vencen"""
+        self._ofrecidos = 0
+        for valor in self._semilla:
+            self.offer(valor, permanente=True)
+
+    def offer(self, valor, permanente=False):
+        """Ofrece un valor cosechado al pool"""
+        if valor is None:
+            return
+        vencimiento = self._clock() + self.ttl if self.ttl and not permanente else math.inf
+        posicion = self._posiciones.get(valor)
+        if posicion is not None:
+            self._vencimientos[posicion] = max(self._vencimientos[posicion], vencimiento)
+            return
+
+        self._ofrecidos += 1
+        if len(self._valores) < self.capacity:
+            self._posiciones[valor] = len(self._valores)
+            self._valores.append(valor)
+            self._vencimientos.append(vencimiento)
+        else:
+            # Muestreo de reservorio: reemplaza un valor al azar con probabilidad capacity/ofrecidos
+            posicion = self._rng.randrange(self._ofrecidos)
+            if posicion >= self.capacity:
+                return
+            del self._posiciones[self._valores[posicion]]
+            self._posiciones[valor] = posicion
+            self._valores[posicion] = valor
+            self._vencimientos[posicion] = vencimiento
+        if vencimiento < self._proximo_vencimiento:
+            self._proximo_vencimiento = vencimiento
+
+    # Compatibilidad con el código que trataba los IDs como listas
+    append = offer
+
+    def extend(self, valores):
+        for valor in valores:
+            self.offer(valor)
+
+    def draw(self):
+        """Devuelve un valor vigente al azar en O(1), o None si el pool está vacío"""
+        ahora = self._clock()
+        while True:
+            if not self._valores:
+                if not self._semilla:
+                    return None
+                self._sembrar()
+            posicion = self._rng.randrange(len(self._valores))
+            if self._vencimientos[posicion] > ahora:
+                return self._valores[posicion]
+            self._remove(posicion)
+
+    def _remove(self, posicion):
+        """Quita un valor intercambiándolo con el último (O(1))"""
+        del self._posiciones[self._valores[posicion]]
+        ultimo_valor = self._valores.pop()
+        ultimo_vencimiento = self._vencimientos.pop()
+        if posicion < len(self._valores):
+            self._valores[posicion] = ultimo_valor
+            self._vencimientos[posicion] = ultimo_vencimiento
+            self._posiciones[ultimo_valor] = posicion
+
+    def _purge(self):
+        """Quita los valores vencidos; solo recorre el pool si alguno venció"""
+        ahora = self._clock()
+        if ahora < self._proximo_vencimiento:
+            return
+        posicion = 0
+        while posicion < len(self._valores):
+            if self._vencimientos[posicion] <= ahora:
+                self._remove(posicion)
+            else:
+                posicion += 1
+        self._proximo_vencimiento = min(self._vencimientos, default=math.inf)
+        if not self._valores:
+            # Pool agotado por vencimiento: el reservorio vuelve a empezar desde los valores iniciales
+            self._sembrar()
+
+    def __len__(self):
+        self._purge()
+        return len(self._valores)
+
+    def __getitem__(self, index):
+        self._purge()
+        return self._valores[index]
+
+    def __iter__(self):
+        self._purge()
+        return iter(list(self._valores))
+
+    def __contains__(self, valor):
+        return valor in self._posiciones
+
+    def __repr__(self):
+        return f"HarvestPool({len(self._valores)}/{self.capacity}, ttl={self.ttl})"
@@ -0,0 +1,177 @@
+"""Cliente HTTP que reciben los task functions.
+
+Envuelve el cliente de Locust del usuario sin cambiar su interfaz
+(get/post/put con los mismos argumentos) y centraliza lo que aplica a
+todos los requests:
+
+- Nombres de baja cardinalidad: el nombre de cada request se normaliza a
+  la plantilla de su ruta (utils/naming.py) y el valor del parámetro viaja
+  en el contexto del request para el desglose opcional.
+- Fallas por excepción: report_failure() informa el request fallido con
+  el tiempo real transcurrido, sin enviar un segundo request a la API.
+- JSON decodificado una sola vez: response.json() decodifica el cuerpo en
+  la primera llamada y devuelve el mismo resultado en las siguientes. Usa
+  orjson o msgspec si están instalados; si no, el módulo json estándar.
+  Vale para los dos transportes (utils/transport.py).
+"""
+import json
+import time
+
+from locust.clients import ResponseContextManager
+from locust.contrib.fasthttp import ResponseContextManager as FastResponseContextManager
+
+from utils import metrics
+from utils.naming import name_for
+
+try:
+    import orjson
+    _loads = orjson.loads
+    JSON_BACKEND = "orjson"
+except ImportError:
+    try:
+        import msgspec
+        _loads = msgspec.json.decode
+        JSON_BACKEND = "msgspec"
+    except ImportError:
+        _loads = json.loads
+        JSON_BACKEND = "json"
+
+_SIN_DECODIFICAR = object()
+
+
+def decode_json(content):
+    """Decodifica un cuerpo JSON; cualquier error se informa como ValueError (igual que requests)"""
+    try:
+        return _loads(content)
+    except ValueError:
+        raise
+    except Exception as e:  # msgspec.DecodeError no hereda de ValueError
+        raise ValueError(str(e)) from e
+
+
+class _JsonCache:
+    """json() que decodifica el cuerpo una sola vez"""
+
+    _json_cache = _SIN_DECODIFICAR
+    _json_error = None
+    # Tiempo de decodificación del cuerpo en ms (None si no se decodificó)
+    decode_ms = None
+
+    def json(self, **kwargs):
+        if self._json_error is not None:
+            raise self._json_error
+        if self._json_cache is _SIN_DECODIFICAR:
+            inicio = time.perf_counter()
+            try:
+                self._json_cache = decode_json(self.content or b"")
+            except ValueError as e:
+                self._json_error = e
+                raise
+            finally:
+                self.decode_ms = (time.perf_counter() - inicio) * 1000
+                metrics.observe("json: decodificación", self.decode_ms)
+        return self._json_cache
+
+
+class CachedJsonResponse(_JsonCache, ResponseContextManager):
+    """Respuesta de Locust cuyo json() decodifica el cuerpo una sola vez"""
+
+
+class FastCachedJsonResponse(_JsonCache, FastResponseContextManager):
+    """Respuesta del transporte "fast" (utils/transport.py) con la interfaz que usan los tasks"""
+
+    @property
+    def text(self):
+        # requests siempre devuelve str; geventhttpclient None si no hubo cuerpo (los tasks hacen text[:200])
+        texto = FastResponseContextManager.text.fget(self)
+        return texto if texto is not None else ""
+
+
+_CACHED_JSON = {ResponseContextManager: CachedJsonResponse, FastResponseContextManager: FastCachedJsonResponse}
+
+
+def cached_json(response):
+    """Convierte la respuesta de Locust en una CachedJsonResponse (sin copiarla)"""
+    clase = _CACHED_JSON.get(type(response))
+    if clase is not None:
+        response.__class__ = clase
+    return response
+
+
+class HarnessClient:
+    """Proxy del cliente HTTP de Locust usado por los task functions"""
+
+    def __init__(self, client):
+        self._client = client
+        # Inicio del último request del task en curso, para informar el tiempo
+        # real si falla con una excepción (None si el task no envió ninguno)
+        self.request_started = None
+        # Última respuesta recibida (barrido de tamaños de página)
+        self.last_response = None
+        # Segundos acumulados en pausas deliberadas entre requests (pause()),
+        # que los recorridos descuentan de su latencia
+        self.paused = 0.0
+
+    def run_task(self, funcion, logger, environment, data):
+        """Ejecuta un task function con este cliente, sin arrastrar el estado del task anterior"""
+        self.request_started = None
+        self.last_response = None
+        return funcion(self, logger, environment, data)
+
+    def pause(self, segundos):
+        """Pausa entre requests de un mismo task; no es tiempo de la API"""
+        inicio = time.perf_counter()
+        time.sleep(segundos)
+        self.paused += time.perf_counter() - inicio
+
+    def request(self, method, url, name=None, context=None, **kwargs):
+        nombre, parametro = name_for(url, name)
+        if parametro is not None:
+            context = {**(context or {}), "parametro": parametro}
+        self.request_started = time.perf_counter()
+        response = self._client.request(method, url, name=nombre, context=context or {}, **kwargs)
+        self.last_response = cached_json(response)
+        return self.last_response
+
+    def get(self, url, **kwargs):
+        kwargs.setdefault("allow_redirects", True)
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def __getattr__(self, name):
+        # headers, base_url, cookies, etc. del cliente original
+        return getattr(self._client, name)
+
+
+def report_failure(environment, client, request_type, name, exception):
+    """Informa como fallido un request interrumpido por una excepción.
+
+    Dispara environment.events.request con la excepción y el tiempo
+    transcurrido desde el inicio del último request del task en curso (0 si
+    el task no llegó a enviar ninguno, por ejemplo por falta de datos); no
+    vuelve a llamar a la API (antes se enviaba un segundo request real solo
+    para marcar la falla, duplicando el tráfico durante una caída).
+    """
+    inicio = getattr(client, "request_started", None)
+    response_time = (time.perf_counter() - inicio) * 1000 if inicio is not None else 0
+    nombre, parametro = name_for(name)
+    environment.events.request.fire(
+        request_type=request_type,
+        name=nombre,
+        response_time=response_time,
+        response_length=0,
+        response=None,
+        context={"parametro": parametro} if parametro is not None else {},
+        exception=exception,
+    )
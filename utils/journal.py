@@ -0,0 +1,108 @@
+"""Registro de los registros creados durante la prueba (run journal).
+
+Los tasks de escritura guardan el ID de lo que crean en el contexto del
+usuario (data_module.ultimo_id_domicilio, data_module.id_persona_fisica,
+etc.). UserDataContext (utils/context.py) avisa aquí cada vez que se
+escribe uno de los campos de CAMPOS_CREADOS y el ID se agrega a un archivo
+de solo agregado, una línea "<tipo> <id>" por registro:
+
+    logs/journal/<ambiente>-<fecha>-<proceso>.journal
+
+El archivo se abre con el primer registro (una prueba sin escrituras no
+deja archivo) y cada ID se escribe una sola vez, línea por línea: si el
+proceso se corta, los IDs creados hasta ese momento quedan en el archivo. utils/teardown.py lo usa
+para dar de baja los registros al terminar la prueba (--teardown) o
+después, desde la línea de comandos.
+
+Los tasks de persona física y de proveedor son altas o actualizaciones por
+CUIL: con los datos del ambiente actualizan registros que ya existían, así
+que esos IDs solo se registran con datos sintéticos (--synthetic-data o el
+perfil "write"), donde cada CUIL es nuevo.
+"""
+import os
+import time
+
+JOURNAL_DIR = os.getenv("RUN_JOURNAL_DIR", os.path.join("logs", "journal"))
+
+# Campo del contexto -> tipo de registro
+CAMPOS_CREADOS = {
+    "id_persona_fisica": "persona_fisica",
+    "id_persona_fisica_by_dni": "persona_fisica",
+    "id_persona_fisica_simplificada": "persona_fisica",
+    "id_domicilio_pf": "domicilio_persona_fisica",
+    "id_domicilio": "domicilio",
+    "ultimo_id_domicilio": "domicilio",
+    "ultimo_id_domicilio_ampliado": "domicilio",
+    "ultimo_id_domicilio_geo": "domicilio",
+    "ultimo_id_incidente": "incidente",
+    "id_proveedor": "proveedor",
+}
+# Tipos que los tasks crean o actualizan por CUIL: solo con datos sintéticos
+TIPOS_SOLO_SINTETICOS = frozenset(["persona_fisica", "proveedor"])
+
+# Archivo de la prueba en curso: ruta, archivo abierto e IDs ya escritos
+_ruta = None
+_archivo = None
+_encabezado = None
+_registrados = set()
+
+
+def start(ambiente, host, proceso):
+    """Prepara el registro de una prueba nueva (el archivo se crea con el primer ID)"""
+    global _ruta, _encabezado
+    stop()
+    _registrados.clear()
+    inicio = time.strftime("%Y%m%d-%H%M%S")
+    _ruta = os.path.join(JOURNAL_DIR, f"{ambiente}-{inicio}-{proceso}.journal")
+    _encabezado = f"# ambiente={ambiente} host={host} inicio={inicio}\n"
+
+
+def record(campo, valor, sinteticos=False):
+    """Registra el ID escrito en un campo de CAMPOS_CREADOS"""
+    global _archivo
+    tipo = CAMPOS_CREADOS[campo]
+    if _ruta is None or valor is None or valor == "":
+        return
+    if tipo in TIPOS_SOLO_SINTETICOS and not sinteticos:
+        return
+    clave = (tipo, str(valor))
+    if clave in _registrados:
+        return
+    _registrados.add(clave)
+    if _archivo is None:
+        os.makedirs(os.path.dirname(_ruta) or ".", exist_ok=True)
+        # Con buffer de línea: cada ID llega al archivo al escribirlo
+        _archivo = open(_ruta, "a", encoding="utf-8", buffering=1)
+        _archivo.write(_encabezado)
+    _archivo.write(f"{tipo} {valor}\n")
+
+
+def count():
+    return len(_registrados)
+
+
+def stop():
+    """Cierra el archivo de la prueba; devuelve su ruta, o None si no se registró nada"""
+    global _archivo
+    if _archivo is None:
+        return None
+    _archivo.close()
+    _archivo = None
+    return _ruta
+
+
+def read(ruta):
+    """Encabezado (dict) y entradas [(tipo, id)] de un archivo de registro"""
+    encabezado = {}
+    entradas = []
+    with open(ruta, encoding="utf-8") as archivo:
+        for linea in archivo:
+            linea = linea.strip()
+            if not linea:
+                continue
+            if linea.startswith("#"):
+                encabezado.update(par.split("=", 1) for par in linea[1:].split() if "=" in par)
+                continue
+            tipo, _, valor = linea.partition(" ")
+            entradas.append((tipo, valor))
+    return encabezado, entradas
@@ -0,0 +1,141 @@
+"""Búsqueda del punto de saturación (forma de carga "knee").
+
+La forma KneeShape (utils/shapes.py) sube la carga por escalones, de a
+usuarios o, con el perfil "open", de a arribos por segundo. Al final de
+cada escalón mide sobre las estadísticas de Locust de ese escalón (sin los
+primeros segundos de estabilización):
+
+- p95 del grupo de rutas en ejecución (--route-group / --mix)
+- proporción de fallas
+
+Si el p95 supera KNEE_P95_MS o las fallas superan KNEE_MAX_FAILURE_RATIO
+la prueba se detiene. El reporte informa el último escalón sostenible, con
+sus RPS totales y por request, en el log y en logs/knee.csv.
+
+Con el perfil "open" se evalúan los tiempos de los arribos (ARRIBO), que
+incluyen la espera desde el momento programado.
+"""
+import csv
+import os
+
+from utils.arrivals import REQUEST_TYPE_ARRIBO
+
+CSV_PATH = os.path.join("logs", "knee.csv")
+
+# Generador de arribos del perfil "open" cuya tasa controla la forma
+_arrivals = None
+
+
+def attach_arrivals(arrivals):
+    global _arrivals
+    _arrivals = arrivals
+
+
+def set_arrival_rate(tasa):
+    """Cambia la tasa del generador de arribos; False si todavía no hay generador"""
+    if _arrivals is None:
+        return False
+    _arrivals.rate = tasa
+    return True
+
+
+def _percentil(histograma, p):
+    total = sum(histograma.values())
+    if not total:
+        return 0
+    objetivo = total * p
+    acumulado = 0
+    for tiempo in sorted(histograma):
+        acumulado += histograma[tiempo]
+        if acumulado >= objetivo:
+            return tiempo
+    return max(histograma)
+
+
+def _incluir(method, arribos):
+    # En el perfil abierto el SLO se evalúa sobre los arribos; si no, sobre los requests
+    return (method == REQUEST_TYPE_ARRIBO) == arribos
+
+
+class StatsWindow:
+    """Diferencia de las estadísticas de Locust entre dos momentos"""
+
+    def __init__(self, stats, arribos=False):
+        self.arribos = arribos
+        self.inicio = self._capturar(stats)
+
+    def _capturar(self, stats):
+        # Por (nombre, método) como las entradas de Locust: el mismo nombre puede ser GET y POST
+        captura = {}
+        for (name, method), entrada in stats.entries.items():
+            if _incluir(method, self.arribos):
+                captura[(name, method)] = (entrada.num_requests, entrada.num_failures, dict(entrada.response_times))
+        return captura
+
+    def measure(self, stats, segundos):
+        """Requests, fallas, RPS y p95 por request ("<método> <nombre>") y del grupo completo desde el inicio de la ventana"""
+        fin = self._capturar(stats)
+        por_nombre = {}
+        total_hist = {}
+        total_requests = total_fallas = 0
+        for (name, method), (requests, fallas, hist) in fin.items():
+            requests0, fallas0, hist0 = self.inicio.get((name, method), (0, 0, {}))
+            delta = {t: c - hist0.get(t, 0) for t, c in hist.items() if c - hist0.get(t, 0) > 0}
+            n, f = requests - requests0, fallas - fallas0
+            if n <= 0:
+                continue
+            por_nombre[f"{method} {name}"] = {"requests": n, "fallas": f, "rps": n / segundos, "p95": _percentil(delta, 0.95)}
+            total_requests += n
+            total_fallas += f
+            for t, c in delta.items():
+                total_hist[t] = total_hist.get(t, 0) + c
+        grupo = {
+            "requests": total_requests,
+            "fallas": total_fallas,
+            "rps": total_requests / segundos if segundos > 0 else 0,
+            "p95": _percentil(total_hist, 0.95),
+            "ratio_fallas": total_fallas / total_requests if total_requests else 0,
+        }
+        return grupo, por_nombre
+
+
+def breached(grupo, p95_ms, max_failure_ratio):
+    """Motivo por el que el escalón no es sostenible, o None"""
+    if grupo["requests"] == 0:
+        return "sin requests en el escalón"
+    if grupo["p95"] > p95_ms:
+        return f"p95 {grupo['p95']:.0f} ms > {p95_ms:.0f} ms"
+    if grupo["ratio_fallas"] > max_failure_ratio:
+        return f"fallas {grupo['ratio_fallas']:.1%} > {max_failure_ratio:.1%}"
+    return None
+
+
+def report(logger, escalones, motivo, path=CSV_PATH):
+    """Informa el último escalón sostenible y escribe todos los escalones en CSV"""
+    sostenibles = [e for e in escalones if e["sostenible"]]
+    logger.warning("=== PUNTO DE SATURACIÓN ===")
+    for e in escalones:
+        g = e["grupo"]
+        logger.warning(
+            f"Escalón {e['escalon']}: {e['carga']} -> {g['rps']:.1f} RPS, p95 {g['p95']:.0f} ms, "
+            f"fallas {g['ratio_fallas']:.1%}{'' if e['sostenible'] else ' (no sostenible)'}"
+        )
+    logger.warning(f"Fin de la búsqueda: {motivo}")
+    if sostenibles:
+        ultimo = sostenibles[-1]
+        logger.warning(f"Máximo sostenible: {ultimo['grupo']['rps']:.1f} RPS con {ultimo['carga']}")
+        for nombre, datos in sorted(ultimo["por_nombre"].items(), key=lambda item: -item[1]["rps"]):
+            logger.warning(f"  {nombre}: {datos['rps']:.2f} RPS, p95 {datos['p95']:.0f} ms")
+    else:
+        logger.warning("Ningún escalón fue sostenible: reducir la carga inicial")
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(["escalon", "carga", "request", "requests", "fallas", "rps", "p95_ms", "sostenible"])
+        for e in escalones:
+            g = e["grupo"]
+            escritor.writerow([e["escalon"], e["carga"], "(grupo)", g["requests"], g["fallas"], round(g["rps"], 2), g["p95"], e["sostenible"]])
+            for nombre, datos in sorted(e["por_nombre"].items()):
+                escritor.writerow([e["escalon"], e["carga"], nombre, datos["requests"], datos["fallas"], round(datos["rps"], 2), datos["p95"], e["sostenible"]])
+    logger.warning(f"Escalones guardados en {path}")
@@ -0,0 +1,147 @@
+"""Pipeline de logging asíncrono para no bloquear el loop de gevent.
+
+Los task functions emiten muchas líneas por request. En lugar de escribir
+cada registro de forma síncrona en el archivo y la consola, el logger
+encola los registros en una cola acotada y un hilo nativo (no un greenlet)
+los formatea y los escribe en lotes. Si la cola se llena, los registros
+se descartan y se cuentan en las métricas del harness.
+"""
+import collections
+import logging
+import logging.handlers
+import os
+import queue
+
+from utils import metrics
+
+try:
+    from gevent import monkey as _monkey
+except ImportError:  # Sin gevent (uso fuera de Locust)
+    _monkey = None
+
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+LOG_BATCH_SIZE = int(os.getenv("LOG_BATCH_SIZE", "500"))
+LOG_FLUSH_INTERVAL = float(os.getenv("LOG_FLUSH_INTERVAL", "0.2"))
+
+
+def _original(module, name):
+    """Función original aunque gevent haya parcheado el módulo"""
+    if _monkey is not None:
+        return _monkey.get_original(module, name)
+    return getattr(__import__(module), name)
+
+
+class BoundedRecordQueue:
+    """Cola acotada segura entre greenlets y un hilo nativo.
+
+    collections.deque garantiza append/popleft atómicos; no se usan los
+    locks de threading porque gevent los reemplaza por locks de greenlets.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._items = collections.deque()
+
+    def put_nowait(self, record):
+        if len(self._items) >= self.maxsize:
+            raise queue.Full
+        self._items.append(record)
+
+    def get_batch(self, max_items):
+        batch = []
+        while self._items and len(batch) < max_items:
+            batch.append(self._items.popleft())
+        return batch
+
+    def __len__(self):
+        return len(self._items)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler que nunca bloquea: si la cola está llena descarta y cuenta"""
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+            metrics.inc("logging: registros encolados")
+        except queue.Full:
+            metrics.inc("logging: registros descartados")
+
+    def prepare(self, record):
+        # El formato se aplica en el hilo de escritura; solo se resuelven los
+        # argumentos para no retener referencias a objetos mutables
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener que drena la cola en lotes desde un hilo nativo.
+
+    Cada lote se formatea y se escribe con un solo write() por handler,
+    seguido de un único flush.
+    """
+
+    def __init__(self, record_queue, *handlers, batch_size=LOG_BATCH_SIZE, flush_interval=LOG_FLUSH_INTERVAL):
+        super().__init__(record_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._stopping = False
+        self._done = None
+
+    def start(self):
+        self._stopping = False
+        self._done = _original("_thread", "allocate_lock")()
+        self._done.acquire()
+        _original("_thread", "start_new_thread")(self._monitor, ())
+
+    def _monitor(self):
+        sleep = _original("time", "sleep")
+        try:
+            while True:
+                batch = self.queue.get_batch(self.batch_size)
+                if batch:
+                    self._write_batch(batch)
+                elif self._stopping:
+                    break
+                else:
+                    sleep(self.flush_interval)
+        finally:
+            self._done.release()
+
+    def _write_batch(self, batch):
+        for handler in self.handlers:
+            lineas = []
+            for record in batch:
+                if record.levelno >= handler.level:
+                    try:
+                        lineas.append(handler.format(record) + handler.terminator)
+                    except Exception:
+                        lineas.append(f"{record.levelname} - {record.msg}{handler.terminator}")
+            if not lineas:
+                continue
+            try:
+                handler.stream.write("".join(lineas))
+                handler.stream.flush()
+            except Exception:
+                pass
+
+    def stop(self):
+        """Drena lo pendiente y espera al hilo de escritura"""
+        if self._done is None:
+            return
+        self._stopping = True
+        self._done.acquire()
+        self._done.release()
+        self._done = None
+
+
+def build_queue_pipeline(handlers, maxsize=LOG_QUEUE_SIZE):
+    """Crea el QueueHandler a asociar al logger y su listener ya iniciado"""
+    record_queue = BoundedRecordQueue(maxsize)
+    queue_handler = DroppingQueueHandler(record_queue)
+    listener = BatchingQueueListener(record_queue, *handlers)
+    listener.start()
+    return queue_handler, listener
+
@@ -0,0 +1,206 @@
+"""Métricas propias del harness, separadas de las estadísticas de requests.
+
+Contadores y tiempos (con histograma para percentiles) que no corresponden
+a un request HTTP: registros de log descartados, tiempo de validación,
+etc. Se muestran en una pestaña "Harness" de la interfaz web, se agregan
+desde los workers en modo distribuido y se vuelcan al log al finalizar.
+"""
+import json
+import math
+import threading
+
+_lock = threading.Lock()
+_counters = {}
+_timers = {}
+
+HARNESS_TAB = "harness"
+
+
+def _bucket(ms):
+    """Redondea a 2 cifras significativas para el histograma (como Locust, pero
+    conservando decimales: la validación o la decodificación tardan menos de 1 ms)"""
+    if ms < 1:
+        return round(ms, 2)
+    if ms < 10:
+        return round(ms, 1)
+    if ms < 100:
+        return int(round(ms))
+    if ms < 1000:
+        return int(round(ms, -1))
+    if ms < 10000:
+        return int(round(ms, -2))
+    return int(round(ms, -3))
+
+
+def _new_timer():
+    return {"count": 0, "total": 0.0, "max": 0.0, "hist": {}}
+
+
+def inc(name, value=1):
+    """Incrementa un contador"""
+    _counters[name] = _counters.get(name, 0) + value
+
+
+def observe(name, ms):
+    """Registra una duración en milisegundos"""
+    timer = _timers.get(name)
+    if timer is None:
+        timer = _timers.setdefault(name, _new_timer())
+    timer["count"] += 1
+    timer["total"] += ms
+    if ms > timer["max"]:
+        timer["max"] = ms
+    bucket = _bucket(ms)
+    timer["hist"][bucket] = timer["hist"].get(bucket, 0) + 1
+
+
+def percentile(timer, p):
+    """Percentil aproximado a partir del histograma de un tiempo"""
+    if not timer["count"]:
+        return 0
+    objetivo = math.ceil(timer["count"] * p)
+    acumulado = 0
+    for bucket in sorted(timer["hist"], key=float):
+        acumulado += timer["hist"][bucket]
+        if acumulado >= objetivo:
+            return float(bucket)
+    return timer["max"]
+
+
+def snapshot(reset=False):
+    """Copia serializable de las métricas; con reset devuelve el delta desde el último envío"""
+    with _lock:
+        data = {
+            "counters": dict(_counters),
+            "timers": {name: {**t, "hist": dict(t["hist"])} for name, t in _timers.items()},
+        }
+        if reset:
+            _counters.clear()
+            _timers.clear()
+    return data
+
+
+def merge(data):
+    """Acumula un snapshot (por ejemplo, el delta recibido de un worker)"""
+    with _lock:
+        for name, value in data.get("counters", {}).items():
+            _counters[name] = _counters.get(name, 0) + value
+        for name, recibido in data.get("timers", {}).items():
+            timer = _timers.setdefault(name, _new_timer())
+            timer["count"] += recibido["count"]
+            timer["total"] += recibido["total"]
+            timer["max"] = max(timer["max"], recibido["max"])
+            for bucket, count in recibido["hist"].items():
+                # Las claves llegan como str después de pasar por msgpack/json
+                bucket = _bucket(float(bucket))
+                timer["hist"][bucket] = timer["hist"].get(bucket, 0) + count
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _timers.clear()
+
+
+def rows():
+    """Filas para la tabla de la interfaz web y el resumen final"""
+    data = snapshot()
+    filas = []
+    for name in sorted(data["counters"]):
+        filas.append({"name": name, "type": "contador", "count": data["counters"][name],
+                      "avg": "", "p50": "", "p95": "", "p99": "", "max": ""})
+    for name in sorted(data["timers"]):
+        timer = data["timers"][name]
+        filas.append({
+            "name": name,
+            "type": "tiempo (ms)",
+            "count": timer["count"],
+            "avg": round(timer["total"] / timer["count"], 2) if timer["count"] else 0,
+            "p50": percentile(timer, 0.50),
+            "p95": percentile(timer, 0.95),
+            "p99": percentile(timer, 0.99),
+            "max": round(timer["max"], 2),
+        })
+    return filas
+
+
+def log_summary(logger):
+    filas = rows()
+    if not filas:
+        return
+    logger.warning("=== MÉTRICAS DEL HARNESS ===")
+    for fila in filas:
+        if fila["type"] == "contador":
+            logger.warning(f"{fila['name']}: {fila['count']}")
+        else:
+            logger.warning(f"{fila['name']}: n={fila['count']} avg={fila['avg']} p50={fila['p50']} p95={fila['p95']} p99={fila['p99']} max={fila['max']}")
+
+
+def register_listeners(environment, logger=None):
+    """Conecta las métricas con los eventos de Locust y la interfaz web"""
+    from locust.runners import WorkerRunner
+
+    events = environment.events
+
+    @events.report_to_master.add_listener
+    def on_report_to_master(client_id, data, **kwargs):
+        data["harness_metrics"] = snapshot(reset=True)
+
+    @events.worker_report.add_listener
+    def on_worker_report(client_id, data, **kwargs):
+        if "harness_metrics" in data:
+            merge(data["harness_metrics"])
+
+    @events.test_start.add_listener
+    def on_test_start(environment, **kwargs):
+        if not isinstance(environment.runner, WorkerRunner):
+            reset()
+
+    @events.test_stop.add_listener
+    def on_test_stop(environment, **kwargs):
+        if logger and not isinstance(environment.runner, WorkerRunner):
+            log_summary(logger)
+
+    if environment.web_ui and not isinstance(environment.runner, WorkerRunner):
+        _register_web_ui(environment.web_ui)
+
+
+def _register_web_ui(web_ui):
+    from flask import Response, request
+
+    columnas = [("name", "Métrica"), ("type", "Tipo"), ("count", "Cantidad"), ("avg", "Promedio"),
+                ("p50", "p50"), ("p95", "p95"), ("p99", "p99"), ("max", "Máximo")]
+
+    web_ui.template_args["extendedTabs"] = [
+        *web_ui.template_args.get("extendedTabs", []),
+        {"title": "Harness", "key": HARNESS_TAB},
+    ]
+    web_ui.template_args["extendedTables"] = [
+        *web_ui.template_args.get("extendedTables", []),
+        {"key": HARNESS_TAB, "structure": [{"key": key, "title": title} for key, title in columnas]},
+    ]
+    web_ui.template_args["extendedCsvFiles"] = [
+        *web_ui.template_args.get("extendedCsvFiles", []),
+        {"href": "/harness/csv", "title": "Descargar métricas del harness (CSV)"},
+    ]
+
+    @web_ui.app.after_request
+    def extend_stats_response(response):
+        if request.path != "/stats/requests" or not response.is_json:
+            return response
+        payload = response.get_json()
+        payload["extended_stats"] = [
+            *payload.get("extended_stats", []),
+            {"key": HARNESS_TAB, "data": rows()},
+        ]
+        response.set_data(json.dumps(payload))
+        return response
+
+    @web_ui.app.route("/harness/csv")
+    def harness_csv():
+        lineas = [",".join(key for key, _ in columnas)]
+        for fila in rows():
+            lineas.append(",".join(f'"{fila[key]}"' if key == "name" else str(fila[key]) for key, _ in columnas))
+        return Response("\n".join(lineas), mimetype="text/csv",
+                        headers={"Content-disposition": "attachment; filename=harness_metrics.csv"})
+
@@ -0,0 +1,819 @@
+"""Servidor simulado de la API de Base Única, para correr la suite sin red.
+
+Implementa, con asyncio y sin dependencias externas, todas las rutas que
+llaman los tasks: /login, /organigrama/*, /dependencias, los domicilios
+(/paises ... /localidades/{id}/calles, /domicilios/*, /incidente),
+personas, proveedores, paramétricas, transporte (/chapas, /leasing,
+/permisionarios, ...), /tributario/*/ctacte y los listados de ambiente,
+educación, habilitaciones, infraestructura, salud y turismo. Sirve para
+medir el propio harness (utils/transport.py, los perfiles de carga) y
+para probarlo en CI o en una notebook:
+
+    python -m utils.mock_server --port 8080
+    DEV_USER_LOGIN=x DEV_USER_PASSWORD=x locust -f locustfile.py --host http://localhost:8080
+
+(un host local se detecta como ambiente "dev", ver utils/config.py; el
+login acepta cualquier usuario).
+
+Las respuestas tienen la forma de las reales: listas, sobres paginados
+(items, total_items, page_number, page_size, con p_page_number y
+p_page_size), objetos con listas anidadas (ctactes_dict de la cuenta
+corriente, Chapas de los permisionarios) y altas que devuelven 201 con
+los IDs nuevos. Los datos se generan al iniciar con una semilla fija, así
+que dos corridas ven los mismos datos; --scale multiplica el tamaño de los
+listados.
+
+Latencia y errores configurables, en total o por prefijo de ruta:
+
+    --latency lognormal:40,0.5             # mediana 40 ms, sigma 0.5
+    --route-latency /tributario=uniform:200,900
+    --error-rate 0.01 --error-status 500,503
+    --route-errors /proveedores/busqueda=0.05
+    --reset-rate 0.001                     # cierra la conexión sin responder
+
+Distribuciones: none, fixed:MS, uniform:MIN,MAX, normal:MEDIA,DESVIO,
+lognormal:MEDIANA,SIGMA y exponential:MEDIA. Con --processes N escuchan N
+procesos en el mismo puerto (SO_REUSEPORT), para que el servidor no sea el
+cuello de botella al medir el harness. Cada respuesta informa en el
+encabezado Server-Timing (app;dur=MS) cuánto tardó el servidor en armarla,
+sin la latencia simulada.
+"""
+import argparse
+import asyncio
+import base64
+import datetime
+import itertools
+import json
+import logging
+import math
+import multiprocessing
+import os
+import random
+import re
+import time
+from collections import namedtuple
+from functools import lru_cache
+from urllib.parse import parse_qs, urlsplit
+
+MOCK_PORT = int(os.getenv("MOCK_PORT", "8080"))
+MOCK_SEED = 1234
+TOKEN_TTL = 3600
+
+Ruta = namedtuple("Ruta", ["metodo", "plantilla", "respuesta"])
+Solicitud = namedtuple("Solicitud", ["metodo", "ruta", "params", "query", "body"])
+
+logger = logging.getLogger("base_unica_mock")
+
+# --- Generación de valores por nombre de campo ---
+
+NOMBRES = ["Juan", "María", "Carlos", "Ana", "Luis", "Laura", "Jorge", "Sofía", "Diego", "Valentina", "Martín", "Lucía"]
+APELLIDOS = ["González", "Rodríguez", "Gómez", "Fernández", "López", "Díaz", "Martínez", "Pérez", "Romero", "Sosa", "Álvarez", "Torres"]
+BARRIOS = ["Centro", "Nueva Córdoba", "Alberdi", "General Paz", "Cerro de las Rosas", "Alta Córdoba", "Güemes", "San Vicente", "Villa Belgrano", "Jardín"]
+CALLES = ["Av. Colón", "Bv. San Juan", "Av. Vélez Sarsfield", "Dean Funes", "27 de Abril", "Av. Olmos", "Rivera Indarte", "Obispo Trejo", "Av. Hipólito Yrigoyen", "Chacabuco"]
+ESTADOS = ["ACTIVO", "ACTIVO", "ACTIVO", "INACTIVO", "PENDIENTE"]
+MARCAS = [("Toyota", "Etios"), ("Chevrolet", "Onix"), ("Fiat", "Cronos"), ("Renault", "Logan"), ("Peugeot", "208"), ("Volkswagen", "Voyage")]
+FECHA_BASE = datetime.date(2015, 1, 1)
+
+
+def _cuil(rng):
+    return f"{rng.choice((20, 23, 27))}{rng.randrange(10**7, 5 * 10**7)}{rng.randrange(10)}"
+
+
+def _fecha(rng):
+    return (FECHA_BASE + datetime.timedelta(days=rng.randrange(4000))).isoformat()
+
+
+def valor(campo, i, rng):
+    """Valor verosímil para un campo según su nombre"""
+    c = campo.lower().removeprefix("p_")
+    if c.startswith("id") or c.endswith("_id"):
+        return i
+    if "cuil" in c or "cuit" in c:
+        return _cuil(rng)
+    if c == "dni" or c.startswith("dni_") or c.endswith("_dni"):
+        return str(rng.randrange(10**7, 5 * 10**7))
+    if "fecha" in c or "vencimiento" in c or c in ("desde", "hasta"):
+        return _fecha(rng)
+    if c in ("lat", "latitud"):
+        return round(-31.42 + rng.uniform(-0.08, 0.08), 6)
+    if c in ("long", "lon", "longitud"):
+        return round(-64.18 + rng.uniform(-0.08, 0.08), 6)
+    if c == "coordenadas":
+        return [round(-31.42 + rng.uniform(-0.08, 0.08), 6), round(-64.18 + rng.uniform(-0.08, 0.08), 6)]
+    if "telefono" in c:
+        return f"351{rng.randrange(10**7):07d}"
+    if "email" in c or "correo" in c:
+        return f"contacto{i}@ejemplo.com.ar"
+    if c in ("activo", "visible", "externa", "valido"):
+        return "S" if rng.random() < 0.9 else "N"
+    if any(k in c for k in ("saldo", "monto", "deuda", "importe", "presupuesto", "superficie")):
+        return round(rng.uniform(1000, 250000), 2)
+    if any(k in c for k in ("cantidad", "capacidad", "nivel", "numero", "nro", "cuota", "año", "anio", "altura")):
+        return rng.randrange(1, 5000)
+    if c in ("marca", "modelo"):
+        return rng.choice(MARCAS)[c == "modelo"]
+    if c == "sexo":
+        return rng.choice("MF")
+    if c == "dominio":
+        return f"{rng.choice('ABCDEF')}{rng.choice('ABCDEF')}{rng.randrange(100, 999)}{rng.choice('GHIJK')}{rng.choice('GHIJK')}"
+    if "apellido" in c:
+        return rng.choice(APELLIDOS)
+    if "nombre" in c or c in ("denominacion", "titular", "permisionario", "arrendatario"):
+        return f"{rng.choice(NOMBRES)} {rng.choice(APELLIDOS)}" if c != "nombre" else rng.choice(NOMBRES)
+    if "razon_social" in c or c == "razsoc_apenom" or c == "apenom_razsoc" or c == "contratista" or c == "empresa_recolectora":
+        return f"{rng.choice(APELLIDOS)} {rng.choice(('S.A.', 'S.R.L.', 'Hnos.'))}"
+    if "barrio" in c:
+        return rng.choice(BARRIOS)
+    if "calle" in c or "direccion" in c or "domicilio" in c or c == "ubicacion":
+        return f"{rng.choice(CALLES)} {rng.randrange(1, 3000)}"
+    if "estado" in c or c == "situacion":
+        return rng.choice(ESTADOS)
+    return f"{campo.replace('_', ' ').capitalize()} {i}"
+
+
+def item(campos, i, rng, **fijos):
+    datos = {campo: valor(campo, i, rng) for campo in campos}
+    datos.update(fijos)
+    return datos
+
+
+def items(campos, cantidad, semilla, **fijos):
+    rng = random.Random(f"{MOCK_SEED}-{semilla}")
+    return [item(campos, i, rng, **fijos) for i in range(1, cantidad + 1)]
+
+
+# --- Respuestas ---
+
+_escala = 1.0
+_ids = itertools.count(1)
+
+
+def _cantidad(base):
+    return max(1, int(base * _escala))
+
+
+def lista(campos, cantidad, filtro=None):
+    """GET que devuelve una lista fija, opcionalmente filtrada por un parámetro"""
+    cache = []
+
+    def responder(solicitud):
+        if not cache:
+            datos = items(campos, _cantidad(cantidad), solicitud.ruta)
+            # La lista completa se serializa una sola vez
+            cache.extend([datos, json.dumps(datos, ensure_ascii=False).encode()])
+        condicion = filtro(solicitud) if filtro else None
+        if condicion is None:
+            return 200, cache[1]
+        return 200, [d for d in cache[0] if condicion(d)]
+    return responder
+
+
+def sobre(campos, total, envoltura="pagina", **anidados):
+    """GET o POST paginado: items, total_items, page_number y page_size
+    (envoltura "total": items y total; None: solo la lista de la página)"""
+    def responder(solicitud):
+        pagina = max(1, int(_parametro(solicitud, "p_page_number", 1)))
+        tamano = max(1, min(500, int(_parametro(solicitud, "p_page_size", 20))))
+        cantidad = _cantidad(total)
+        desde = (pagina - 1) * tamano
+        rng = random.Random(f"{MOCK_SEED}-{solicitud.ruta}-{pagina}-{tamano}")
+        elementos = []
+        for i in range(desde + 1, min(cantidad, desde + tamano) + 1):
+            elemento = item(campos, i, rng)
+            for nombre, (subcampos, maximo) in anidados.items():
+                elemento[nombre] = [item(subcampos, j, rng) for j in range(1, rng.randrange(1, maximo + 1) + 1)]
+            elementos.append(elemento)
+        if envoltura is None:
+            return 200, elementos
+        if envoltura == "total":
+            return 200, {"items": elementos, "total": cantidad, "page": pagina, "size": tamano}
+        return 200, {"items": elementos, "total_items": cantidad, "page_number": pagina, "page_size": tamano}
+    return responder
+
+
+def objeto(campos, **anidados):
+    """GET de un registro por ID (el registro es siempre el mismo para el mismo ID)"""
+    def responder(solicitud):
+        clave = next(iter(solicitud.params.values()), "") or json.dumps(solicitud.query, sort_keys=True)
+        rng = random.Random(f"{MOCK_SEED}-{solicitud.ruta}-{clave}")
+        datos = item(campos, _entero(clave, 1), rng)
+        for nombre, (subcampos, minimo, maximo) in anidados.items():
+            datos[nombre] = [item(subcampos, j, rng) for j in range(1, rng.randrange(minimo, maximo + 1) + 1)]
+        return 200, datos
+    return responder
+
+
+def alta(campos_id, status=201, **extra):
+    """POST o PUT de escritura: devuelve el body con los IDs nuevos y la auditoría"""
+    def responder(solicitud):
+        body = solicitud.body if isinstance(solicitud.body, dict) else {}
+        nuevo = next(_ids)
+        ahora = datetime.datetime.now().replace(microsecond=0).isoformat()
+        datos = dict(body)
+        datos.update({campo: nuevo for campo in campos_id})
+        datos.update({"fecha_creacion": ahora, "fecha_modifica": ahora, "fecha_modificacion": ahora,
+                      "p_usuario_aplicacion": body.get("p_usuario_aplicacion", "LOCUST")})
+        for campo, funcion in extra.items():
+            datos[campo] = funcion(body, nuevo)
+        return status, datos
+    return responder
+
+
+def _parametro(solicitud, nombre, defecto=None):
+    if nombre in solicitud.query:
+        return solicitud.query[nombre]
+    if isinstance(solicitud.body, dict) and solicitud.body.get(nombre) is not None:
+        return solicitud.body[nombre]
+    return defecto
+
+
+def _entero(texto, defecto=0):
+    try:
+        return int(texto)
+    except (TypeError, ValueError):
+        return defecto
+
+
+def _filtro_query(parametro, campo):
+    """Filtro de lista por un parámetro de la query (sin el parámetro, la lista completa)"""
+    def filtro(solicitud):
+        buscado = solicitud.query.get(parametro)
+        if buscado is None:
+            return None
+        return lambda d: str(d.get(campo, "")).lower().find(str(buscado).lower()) >= 0
+    return filtro
+
+
+# --- Organigrama (cerrojo institucional) ---
+
+ID_ORGANIGRAMA = 8000
+
+
+@lru_cache(maxsize=1)
+def organigrama():
+    """Árbol de dependencias: 5 niveles, cada una con su superior"""
+    rng = random.Random(f"{MOCK_SEED}-organigrama")
+    unidades = {}
+    por_nivel = {}
+    for indice in range(1, _cantidad(1500) + 1):
+        # Los IDs cubren los de data/dev (dependencias 8182 y 9226)
+        id_unidad = ID_ORGANIGRAMA + indice
+        nivel = 1 if indice == 1 else min(5, 2 + int(math.log(indice, 6)))
+        superior = None if nivel == 1 else unidades[rng.choice(por_nivel[nivel - 1])]
+        unidad = {
+            "id_unidad": id_unidad,
+            "unidad": f"{rng.choice(('Secretaría', 'Dirección', 'Subdirección', 'Departamento', 'Área'))} {indice}",
+            "id_cerrojo": 1000 + indice,
+            "tipo": rng.choice(("SECRETARIA", "DIRECCION", "DEPARTAMENTO", "AREA")),
+            "ubicacion": f"{rng.choice(CALLES)} {rng.randrange(1, 3000)}",
+            "externa": "N",
+            "mesa": rng.choice(("S", "N")),
+            "cod_mesa_entrada": rng.randrange(100, 999),
+            "nivel": nivel,
+            "visible": "S",
+            "id_estado": 1,
+            "fecha_alta": _fecha(rng),
+            "fecha_baja": None,
+        }
+        for campo in ("id_unidad", "unidad", "id_cerrojo", "tipo", "ubicacion", "externa", "mesa"):
+            unidad[f"{campo}_superior"] = superior[campo] if superior else None
+        unidades[id_unidad] = unidad
+        por_nivel.setdefault(nivel, []).append(id_unidad)
+    return unidades
+
+
+def _dependencia(solicitud):
+    unidad = organigrama().get(_entero(solicitud.params.get("id")))
+    return unidad
+
+
+def _subarbol(solicitud):
+    raiz = _dependencia(solicitud)
+    if raiz is None:
+        return 404, {"detail": "Dependencia no encontrada"}
+    incluidas = {raiz["id_unidad"]}
+    resultado = [raiz]
+    for unidad in organigrama().values():
+        if unidad["id_unidad_superior"] in incluidas:
+            incluidas.add(unidad["id_unidad"])
+            resultado.append(unidad)
+    return 200, resultado
+
+
+def _ruta_dependencia(solicitud):
+    unidad = _dependencia(solicitud)
+    if unidad is None:
+        return 404, {"detail": "Dependencia no encontrada"}
+    camino = []
+    while unidad is not None:
+        camino.append(unidad)
+        unidad = organigrama().get(unidad["id_unidad_superior"])
+    return 200, camino
+
+
+def _dependencias_directas(solicitud):
+    id_unidad = _entero(solicitud.params.get("id"))
+    return 200, [u for u in organigrama().values() if u["id_unidad_superior"] == id_unidad]
+
+
+def _dependencia_mas_alta(solicitud):
+    unidad = _dependencia(solicitud)
+    if unidad is None:
+        return 404, {"detail": "Dependencia no encontrada"}
+    while unidad["id_unidad_superior"] is not None and unidad["nivel"] > 2:
+        unidad = organigrama()[unidad["id_unidad_superior"]]
+    return 200, unidad
+
+
+def _niveles(solicitud):
+    nivel = _entero(solicitud.params.get("nivel"))
+    return 200, [{"id_unidad": u["id_unidad"], "unidad": u["unidad"], "nivel": u["nivel"]}
+                 for u in organigrama().values() if u["nivel"] <= nivel]
+
+
+def _nivel(solicitud):
+    nivel = _entero(solicitud.params.get("nivel"))
+    return 200, [u for u in organigrama().values() if u["nivel"] == nivel]
+
+
+def _buscar_dependencias(solicitud):
+    unidades = organigrama().values()
+    if "p_id_dependencia" in solicitud.query:
+        unidades = [u for u in unidades if u["id_unidad"] == _entero(solicitud.query["p_id_dependencia"])]
+    if "p_id_cerrojo" in solicitud.query:
+        unidades = [u for u in unidades if u["id_cerrojo"] == _entero(solicitud.query["p_id_cerrojo"])]
+    if "p_nombre" in solicitud.query:
+        unidades = [u for u in unidades if solicitud.query["p_nombre"].lower() in u["unidad"].lower()]
+    return 200, list(unidades)
+
+
+def _dependencias_por_ids(solicitud):
+    ids = solicitud.body if isinstance(solicitud.body, list) else (solicitud.body or {}).get("ids", [])
+    ids = {_entero(i) for i in ids} if isinstance(ids, list) else set()
+    return 200, [u for u in organigrama().values() if u["id_unidad"] in ids] or list(organigrama().values())[:10]
+
+
+def _visibilidad(solicitud):
+    unidad = organigrama().get(_entero(solicitud.query.get("p_id_dependencia")))
+    if unidad is None:
+        return 404, {"detail": "Dependencia no encontrada"}
+    return 200, {**unidad, "visible": solicitud.query.get("p_visible", unidad["visible"]) == "S"}
+
+
+# --- Domicilios ---
+
+def _geografia(campo_id, cantidad, por_padre=True):
+    """Listado de una entidad geográfica (países, provincias, ...) por su padre"""
+    def responder(solicitud):
+        padre = _entero(next(iter(solicitud.params.values()), 0)) if por_padre else 0
+        base = padre * 1000 if padre else 0
+        rng = random.Random(f"{MOCK_SEED}-{solicitud.ruta}-{padre}")
+        datos = [{campo_id: base + i, "nombre": f"{rng.choice(CALLES if campo_id == 'id_calle' else BARRIOS)} {i}"}
+                 for i in range(1, _cantidad(cantidad) + 1)]
+        if "calle" in solicitud.query:
+            datos = [d for d in datos if solicitud.query["calle"].lower() in d["nombre"].lower()] or datos[:5]
+        return 200, datos
+    return responder
+
+
+_CAMPOS_DOMICILIO = ["p_id_domicilio", "p_id_pais", "p_id_provincia", "p_id_departamento", "p_id_localidad", "p_id_barrio",
+                     "p_barrio", "p_id_calle", "p_calle", "p_altura", "p_piso", "p_dpto", "p_torre", "p_oficina_local",
+                     "p_id_calle_perp1", "p_id_calle_perp2", "p_observaciones", "p_latitud", "p_longitud", "p_valido",
+                     "fecha_creacion", "fecha_modifica"]
+
+
+def _titular(campo_tipo, fisica, prefijo):
+    """Campos de la persona titular de un alta de proveedor, según sea física o jurídica"""
+    def id_fisica(body, nuevo):
+        return nuevo if body.get(campo_tipo) == fisica else None
+
+    def id_juridica(body, nuevo):
+        return nuevo if body.get(campo_tipo) != fisica else None
+
+    return {
+        f"{prefijo}id_persona_fisica": id_fisica,
+        f"{prefijo}id_persona_juridica": id_juridica,
+        "p_cuil_cuit": lambda body, nuevo: body.get("p_cuil_cuit") or body.get("p_cuit_cuil"),
+        "p_modalidad": lambda body, nuevo: body.get("p_modalidad", "CONTRATACION"),
+    }
+
+
+def _incidente(body, nuevo):
+    return body.get("p_id_domicilio") or nuevo
+
+
+# --- Personas ---
+
+_CAMPOS_PERSONA = ["id_persona_fisica", "cuil", "dni", "sexo", "nombre", "apellido", "fecha_nacimiento", "fecha_creacion", "fecha_modifica"]
+
+
+def _persona(campo_dni=None):
+    """Alta o actualización de persona física: los campos del body sin el prefijo p_"""
+    def responder(solicitud):
+        body = solicitud.body if isinstance(solicitud.body, dict) else {}
+        status, datos = alta(["id_persona_fisica"])(solicitud)
+        rng = random.Random(f"{MOCK_SEED}-{body.get('p_cuil') or body.get('p_dni')}")
+        for campo in _CAMPOS_PERSONA:
+            datos.setdefault(campo, body.get(f"p_{campo}") or valor(campo, datos["id_persona_fisica"], rng))
+        return status, datos
+    return responder
+
+
+def _persona_simplificada(solicitud):
+    body = solicitud.body if isinstance(solicitud.body, dict) else {}
+    status, datos = alta(["id_persona_fisica"], status=200)(solicitud)
+    rng = random.Random(f"{MOCK_SEED}-{body.get('p_cuil')}")
+    for campo in ("p_cuil", "p_dni", "p_sexo", "p_nombre", "p_apellido", "p_fecha_nacimiento"):
+        datos.setdefault(campo, valor(campo, datos["id_persona_fisica"], rng))
+    return status, datos
+
+
+def _comunicaciones(solicitud):
+    body = solicitud.body if isinstance(solicitud.body, dict) else {}
+    status, datos = alta(["id_comunicacion"])(solicitud)
+    datos.update({
+        "tipo_persona": body.get("p_tipo_persona", "PF"),
+        "telefono": body.get("p_telefono"),
+        "correo_electronico": body.get("p_correo_electronico"),
+        "cuil": body.get("p_cuil_cuit"),
+        "cuit": body.get("p_cuil_cuit"),
+        "nombre": body.get("p_nombre"),
+        "razon_social": body.get("p_nombre"),
+    })
+    return status, datos
+
+
+# --- Tributario ---
+
+def _ctacte(campos):
+    """Cuenta corriente: datos del bien y del titular con la lista de cuotas (ctactes_dict)"""
+    def responder(solicitud):
+        status, datos = objeto(campos, ctactes_dict=(["año", "cuota", "saldo", "importe_original", "recargo", "estado", "fecha_vencimiento"], 12, 120))(solicitud)
+        for cuota in datos["ctactes_dict"]:
+            cuota["año"] = 2015 + cuota["año"] % 10
+            cuota["cuota"] = 1 + cuota["cuota"] % 12
+            cuota["estado"] = random.choice(("IMPAGA", "PAGADA", "VENCIDA"))
+        datos["total_deuda"] = round(sum(c["saldo"] for c in datos["ctactes_dict"] if c["estado"] != "PAGADA"), 2)
+        return status, datos
+    return responder
+
+
+def _baja(solicitud):
+    return 200, {"detail": f"Registro {solicitud.params['id']} dado de baja"}
+
+
+def _login(solicitud):
+    """Token JWT sin firma con vencimiento (utils/auth.py lee el exp)"""
+    cabecera = base64.urlsafe_b64encode(b'{"alg":"none","typ":"JWT"}').rstrip(b"=").decode()
+    datos = base64.urlsafe_b64encode(json.dumps({"sub": "locust", "exp": int(time.time()) + TOKEN_TTL}).encode()).rstrip(b"=").decode()
+    return 200, {"access_token": f"{cabecera}.{datos}.", "token_type": "bearer"}
+
+
+_PARAMETRICA = ["id", "nombre", "descripcion", "codigo", "tipo", "estado", "activo", "fecha_creacion", "fecha_modificacion"]
+_LUGAR = ["id", "nombre", "direccion", "barrio", "cpc", "telefono", "latitud", "longitud"]
+_CHAPA = ["id_prm_chapa", "numero_interno", "tipo_servicio", "dominio", "apellido_permisionario", "nombre_permisionario",
+          "cuil_permisionario", "situacion_chapa", "nro_movil", "central_agencia", "numero_dispositivo_pago", "cantidad_titulares"]
+
+RUTAS = [
+    Ruta("POST", "/login", _login),
+
+    # Cerrojo institucional
+    Ruta("GET", "/organigrama/", lambda s: (200, list(organigrama().values()))),
+    Ruta("GET", "/organigrama/dependencias/niveles/{nivel}", _niveles),
+    Ruta("GET", "/organigrama/dependencias/nivel/{nivel}", _nivel),
+    Ruta("GET", "/organigrama/dependencias-ruta/{id}", _ruta_dependencia),
+    Ruta("GET", "/organigrama/dependencias-directas/{id}", _dependencias_directas),
+    Ruta("GET", "/organigrama/dependencias/{id}", _dependencia_mas_alta),
+    Ruta("GET", "/organigrama/{id}", _subarbol),
+    Ruta("GET", "/dependencias", _buscar_dependencias),
+    Ruta("POST", "/dependencias/ids", _dependencias_por_ids),
+    Ruta("PUT", "/dependencias/visibilidad", _visibilidad),
+    Ruta("GET", "/poblacion-y-sociedad/cpc", lista(["id_cpc", "nombre", "direccion", "telefono", "latitud", "longitud"], 16)),
+    Ruta("GET", "/poblacion-y-sociedad/cpc/barrios", lista(["id_barrio", "barrio", "id_cpc", "cpc"], 480)),
+    Ruta("GET", "/poblacion-y-sociedad/centros-vecinales", lista(["id", "nombre", "barrio", "direccion", "presidente", "telefono"], 350)),
+    Ruta("GET", "/poblacion-y-sociedad/unidades-judiciales", lista(_LUGAR + ["tipo", "descripcion"], 40)),
+    Ruta("GET", "/poblacion-y-sociedad/organizaciones-sociales", lista(
+        _LUGAR + ["email", "id_tipo_org_social", "tipo_org_social", "descripcion"], 600,
+        _filtro_query("p_id_tipo_org_social", "id_tipo_org_social"))),
+    Ruta("GET", "/poblacion-y-sociedad/tipos-organizaciones-sociales", lista(["id", "nombre"], 12)),
+    Ruta("GET", "/limites-administrativos", lista(["id", "nombre", "descripcion", "tipo"], 30)),
+    Ruta("GET", "/centros-operativos", lista(_LUGAR, 25)),
+    Ruta("GET", "/fechas-no-habiles", lista(["fecha_dia_no_habil", "tipo_dia_no_habil", "descripcion"], 40)),
+
+    # Domicilios
+    Ruta("GET", "/paises", _geografia("id_pais", 5, por_padre=False)),
+    Ruta("GET", "/paises/{id}/provincias", _geografia("id_provincia", 24)),
+    Ruta("GET", "/provincias/{id}/departamentos", _geografia("id_departamento", 26)),
+    Ruta("GET", "/departamentos/{id}/localidades", _geografia("id_localidad", 30)),
+    Ruta("GET", "/localidades/{id}/barrios", _geografia("id_barrio", 90)),
+    Ruta("GET", "/localidades/{id}/calles", _geografia("id_calle", 250)),
+    Ruta("POST", "/domicilios", alta(["p_id_domicilio"])),
+    Ruta("POST", "/domicilios/ampliado", alta(["p_id_domicilio", "id_calle_perp1", "id_calle_perp2"])),
+    Ruta("POST", "/domicilios/geo", alta(["p_id_domicilio", "p_id_cpc"], p_cpc=lambda b, n: f"CPC {n % 16}", p_zona=lambda b, n: "URBANA")),
+    Ruta("GET", "/domicilios/geo", objeto(["p_id_localidad", "p_id_barrio", "p_barrio", "p_id_calle", "p_calle", "p_altura", "p_latitud", "p_longitud"])),
+    Ruta("GET", "/domicilios/cpc/{id}", objeto(["p_id_domicilio", "p_calle", "p_n_calle", "p_altura", "p_barrio", "p_n_barrio", "p_localidad",
+                                                 "p_calle_perp1", "p_calle_perp2", "p_id_cpc", "p_cpc", "p_latitud", "p_longitud", "p_valido"])),
+    Ruta("GET", "/domicilios/{id}", objeto(_CAMPOS_DOMICILIO)),
+    Ruta("POST", "/incidente", alta(["id_incidente", "numero_incidente"], id_domicilio=_incidente,
+                                    usuario_creacion=lambda b, n: "LOCUST", usuario_modificacion=lambda b, n: "LOCUST")),
+
+    # Personas físicas y jurídicas
+    Ruta("POST", "/personas-fisicas", _persona()),
+    Ruta("POST", "/personas-fisicas/by-dni", _persona()),
+    Ruta("POST", "/by-dni", _persona()),
+    Ruta("PUT", "/personas-fisicas/simplificado", _persona_simplificada),
+    Ruta("GET", "/personas-fisicas", lista(["p_id_persona_fisica", "p_cuil", "p_dni", "p_sexo", "p_nombre", "p_apellido", "p_fecha_nacimiento"], 1)),
+    Ruta("POST", "/personas-fisicas/domicilios", alta(["id_domicilio_pf", "id_domicilio"])),
+    Ruta("GET", "/comunicaciones/personas", lista(["cuil_cuit", "tipo_persona", "apellido", "nombre", "telefono", "correo_electronico"], 3)),
+    Ruta("POST", "/comunicaciones/personas", _comunicaciones),
+    Ruta("GET", "/personas-juridicas", lista(["id_persona_juridica", "p_cuit", "p_razon_social", "p_id_forma_juridica", "fecha_creacion"], 1)),
+    Ruta("POST", "/personas-juridicas", alta(["id_persona_juridica"])),
+    Ruta("GET", "/personas-juridicas/sedes_pj", objeto(["p_cuit", "p_razon_social"], sedes=(["p_id_sede_pj", "p_nombre_sede", "p_id_domicilio"], 1, 4))),
+    Ruta("POST", "/personas-juridicas/sedes_pj", alta(["p_id_sede_pj", "id_sede_pj"])),
+    Ruta("POST", "/personas-juridicas/sedes/domicilios", alta(["p_id_domicilio"])),
+
+    # Proveedores
+    Ruta("POST", "/proveedores", alta(["id_proveedor"], **_titular("p_tipo_proveedor", "FISICA", ""))),
+    Ruta("GET", "/proveedores", lista(["p_cuit_cuil", "id_proveedor", "p_tipo_proveedor", "p_razon_social", "p_modalidad"], 1)),
+    Ruta("POST", "/proveedores/alta", alta(["p_id_proveedor"], **_titular("p_tipo_persona", "PF", "p_"))),
+    Ruta("POST", "/proveedores/alta/cbu/banco", alta(["p_id_proveedor"], **_titular("p_tipo_persona", "PF", "p_"))),
+    Ruta("POST", "/proveedores/cbu", alta(["p_id_cbu"])),
+    Ruta("POST", "/proveedores/cbu/banco", alta(["p_id_cbu"])),
+    Ruta("POST", "/personas/busqueda-por-cuils-cuits", lista(["cuil_cuit", "tipo_persona", "denominacion", "id_persona"], 10)),
+    Ruta("GET", "/proveedores/actividad", lista(["p_id_actividad", "p_cuit_cuil", "p_apenom_razsoc"], 60)),
+    Ruta("POST", "/proveedores/busqueda", sobre(["id_proveedor", "p_cuit_cuil", "p_razsoc_apenom", "p_tipo_proveedor", "p_modalidad", "p_estado"], 3500)),
+    Ruta("POST", "/proveedores/busqueda-por-ids", lista(["p_tipo_proveedor", "p_id_proveedor", "p_cuit_cuil", "p_razsoc_apenom", "p_modalidad"], 10)),
+    Ruta("POST", "/proveedores/busqueda-por-ids/search", sobre(["p_id_proveedor", "p_cuit_cuil", "p_razsoc_apenom", "p_tipo_proveedor"], 200)),
+    Ruta("POST", "/proveedores/busqueda/minimizado", sobre(["cuil_cuit", "denominacion", "tipo_persona", "id_proveedor"], 3500)),
+    Ruta("GET", "/proveedores/contratistas-obra-publica", lista(["id_proveedor", "cuit", "razon_social", "rubro", "estado"], 150)),
+
+    # Paramétricas
+    Ruta("GET", "/medios_pagos", lista(_PARAMETRICA + ["id_medio_pago", "observaciones"], 12)),
+    Ruta("PUT", "/medios_pagos", alta(["id_medio_pago", "id"], status=200, nombre=lambda b, n: b.get("p_nombre"), estado=lambda b, n: "ACTIVO")),
+    Ruta("GET", "/cfiscal", lista(_PARAMETRICA + ["id_condicion_fiscal"], 8)),
+    Ruta("GET", "/fjuridica", lista(_PARAMETRICA + ["id_forma_juridica", "observaciones"], 25)),
+    Ruta("GET", "/bancos", lista(["p_id_banco", "p_nombre", "codigo_bcra", "activo"], 80)),
+    Ruta("GET", "/bancos/{id}", objeto(["p_id_banco", "p_nombre", "codigo_bcra", "activo"])),
+    Ruta("GET", "/profesiones", lista(["p_id_profesion", "p_nombre", "codigo", "activo"], 300)),
+    Ruta("GET", "/profesiones/{id}", objeto(["p_id_profesion", "p_nombre", "codigo", "activo"])),
+    Ruta("GET", "/dispositivos_pagos", lista(_PARAMETRICA + ["id_dispositivo_pago", "observaciones"], 10)),
+    Ruta("GET", "/actividades", lista(["p_id_actividad", "p_nombre", "p_codigo_afip", "p_descripcion", "categoria"], 900)),
+
+    # Transporte
+    Ruta("GET", "/condiciones", lista(_PARAMETRICA, 6)),
+    Ruta("GET", "/estados_licencias", lista(_PARAMETRICA, 6)),
+    Ruta("GET", "/situaciones_chapas", lista(_PARAMETRICA, 8)),
+    Ruta("GET", "/tipos_servicios", lista(_PARAMETRICA + ["categoria"], 6)),
+    Ruta("GET", "/zona-semm", lista(["id", "nombre", "zona", "area", "codigo", "estado", "poligono"], 12)),
+    Ruta("GET", "/estacionamiento-bicicletas", lista(_LUGAR + ["capacidad", "tipo", "estado", "zona", "horario"], 120)),
+    Ruta("GET", "/ciclovias", lista(["id_ciclovia", "nombre", "descripcion", "barrio", "zona", "estado", "tipo", "longitud", "desde", "hasta", "fecha_construccion"], 90)),
+    Ruta("GET", "/chapas", sobre(_CHAPA, 2800)),
+    Ruta("GET", "/chapas/personas-fisicas", lista(["id_persona_fisica", "dni", "cuil", "apellido", "nombre", "fecha_nacimiento", "sexo",
+                                                   "estado_civil", "nacionalidad", "domicilio", "telefono", "email"], 2)),
+    Ruta("GET", "/chapas/{cuil}", lista(["id_chapa", "numero_chapa", "numero_interno", "tipo_servicio", "estado", "situacion",
+                                          "permisionario", "cuil", "dominio", "central_agencia", "fecha_alta", "fecha_vencimiento"], 2)),
+    Ruta("GET", "/leasing", sobre(["id_leasing", "numero_chapa", "apellido_arrendatario", "nombre_arrendatario", "dni_arrendatario",
+                                   "cuil_arrendatario", "tipo_servicio", "fecha_inicio", "fecha_fin", "vencimiento", "estado"], 600)),
+    Ruta("GET", "/centrales-agencias", sobre(["id_central_agencia", "cuit", "nombre", "razon_social", "tipo", "estado", "direccion",
+                                              "telefono", "email", "localidad", "barrio", "fecha_alta"], 140)),
+    Ruta("GET", "/permisionarios", sobre(["id_permisionario", "id_persona_fisica", "apellido_permisionario", "nombre_permisionario", "cuil_permisionario"],
+                                         2400, Chapas=(["numero_interno", "dominio", "tipo_servicio"], 3))),
+    Ruta("GET", "/licencias", sobre(["id_licencia", "numero_licencia", "dni", "cuil", "apellido", "nombre", "clase", "estado",
+                                     "fecha_emision", "fecha_vencimiento", "restricciones", "observaciones"], 5200)),
+    Ruta("GET", "/personal", sobre(["id_personal", "cuil", "apellido", "nombre", "funcion", "empresa"], 1800)),
+    Ruta("GET", "/vehiculos", sobre(["id_vehiculo", "dominio", "marca", "modelo", "modelo_anio", "numero_interno"], 1500)),
+    Ruta("GET", "/empresas", lista(["id_empresa", "cuit", "razon_social", "direccion", "telefono"], 8)),
+    Ruta("GET", "/lineas/recorrido", sobre(["id_linea", "nombre", "nombre_empresa", "sentido"], 4, envoltura=None,
+                                           paradas=(["codigo", "nombre_parada", "latitud", "longitud"], 60))),
+    Ruta("GET", "/lineas/paradas", objeto(["id_linea", "nombre_linea", "nombre_empresa", "sentido"], paradas=(["codigo", "nombre_parada", "latitud", "longitud"], 30, 80))),
+
+    # Tributario
+    Ruta("GET", "/tributario/inmuebles/ctacte", _ctacte(["id_inmueble", "superficie", "nombre", "apellido", "cuil"])),
+    Ruta("GET", "/tributario/rodados/ctacte", _ctacte(["id_rodado", "marca", "modelo", "modelo_anio", "categoria", "tipo", "nombre", "apellido", "cuil"])),
+
+    # Ambiente, educación, habilitaciones, infraestructura, salud y turismo
+    Ruta("GET", "/ambiente/espacios-verdes", lista(["id", "nombre", "tipo", "superficie", "ubicacion", "barrio", "direccion", "coordenadas",
+                                                     "descripcion", "estado", "fecha_creacion"], 700)),
+    Ruta("GET", "/ambiente/campanas-pet", lista(["id", "nombre", "tipo", "ubicacion", "direccion", "barrio", "coordenadas", "latitud", "longitud",
+                                                  "descripcion", "estado", "capacidad", "horario_atencion", "fecha_instalacion"], 250)),
+    Ruta("GET", "/ambiente/recoleccion-residuos-diferenciada", lista(
+        ["id", "barrio", "zona", "tipo_residuo", "dia_semana", "horario_inicio", "horario_fin", "frecuencia", "empresa_recolectora",
+         "telefono_contacto", "estado", "coordenadas", "latitud", "longitud", "direccion_referencia"], 400, _filtro_query("p_barrio", "barrio"))),
+    Ruta("GET", "/educacion/escuelas-municipales", lista(["id", "nombre", "establecimiento", "cue", "direccion", "barrio", "telefono", "nivel"], 40)),
+    Ruta("GET", "/educacion/jardines-municipales", lista(["id", "nombre", "establecimiento", "cue", "direccion", "barrio", "telefono"], 40)),
+    Ruta("GET", "/educacion/parques-educativos", lista(["id", "nombre", "denominacion", "direccion", "barrio", "latitud", "longitud"], 12)),
+    Ruta("GET", "/habilitaciones/comercios", sobre(["id", "nombre", "razon_social", "establecimiento", "cuit", "actividad", "direccion"], 9000, envoltura="total")),
+    Ruta("GET", "/habilitaciones/geriatricos-privados", lista(["id", "nombre", "razon_social", "cuit", "direccion", "telefono", "email", "establecimiento"], 110)),
+    Ruta("GET", "/habilitaciones/jardines-maternales-privados", lista(["id", "nombre", "razon_social", "cuit", "direccion", "telefono", "email", "establecimiento"], 160)),
+    Ruta("GET", "/infraestructura/puntos-wifi", lista(["id", "descripcion", "categoria", "cpc", "domicilio_alt", "barrio_alt", "lat", "long", "telefono"], 300)),
+    Ruta("GET", "/infraestructura/obra-publica", lista(["id", "nombre", "descripcion", "estado", "fecha_inicio", "fecha_fin", "ubicacion", "barrio",
+                                                         "zona", "tipo_obra", "presupuesto", "contratista"], 220)),
+    Ruta("GET", "/salud/centros-salud", lista(["id", "nombre", "direccion", "telefono", "email", "barrio", "zona", "tipo", "especialidades",
+                                                "horario", "latitud", "longitud"], 100)),
+    Ruta("GET", "/turismo/guias-turisticos", lista(["id", "nombre", "apellido", "dni", "numero_registro", "telefono", "email", "especialidades",
+                                                     "idiomas", "estado", "fecha_habilitacion", "fecha_vencimiento"], 180)),
+    Ruta("GET", "/turismo/anfitriones-turisticos", lista(["id", "nombre", "apellido", "dni", "numero_registro", "telefono", "email", "direccion",
+                                                           "tipo_alojamiento", "capacidad", "servicios", "estado", "fecha_habilitacion"], 260)),
+
+    # Bajas de utils/teardown.py
+    Ruta("DELETE", "/incidente/{id}", _baja),
+    Ruta("DELETE", "/personas-fisicas/domicilios/{id}", _baja),
+    Ruta("DELETE", "/proveedores/{id}", _baja),
+    Ruta("DELETE", "/domicilios/{id}", _baja),
+    Ruta("DELETE", "/personas-fisicas/{id}", _baja),
+]
+
+
+def _compilar(plantilla):
+    """Plantilla de ruta a expresión regular; las estáticas se prueban antes que las con parámetros"""
+    patron = re.sub(r"\\\{(\w+)\\\}", r"(?P<\1>[^/]+)", re.escape(plantilla))
+    return re.compile(f"^{patron}$")
+
+
+_TABLA = [(ruta.metodo, _compilar(ruta.plantilla), ruta) for ruta in sorted(RUTAS, key=lambda r: "{" in r.plantilla)]
+
+
+def resolve(metodo, ruta):
+    """Ruta de la tabla y sus parámetros, o (None, None)"""
+    for metodo_ruta, patron, entrada in _TABLA:
+        if metodo_ruta == metodo:
+            coincidencia = patron.match(ruta)
+            if coincidencia:
+                return entrada, coincidencia.groupdict()
+    return None, None
+
+
+# --- Latencia y errores ---
+
+def parse_latency(spec):
+    """Distribución de latencia 'tipo:parametros' a una función que devuelve segundos"""
+    tipo, _, argumentos = (spec or "none").partition(":")
+    valores = [float(v) for v in argumentos.split(",") if v.strip()]
+    distribuciones = {
+        "none": (0, lambda: 0.0),
+        "fixed": (1, lambda: valores[0]),
+        "uniform": (2, lambda: random.uniform(valores[0], valores[1])),
+        "normal": (2, lambda: random.gauss(valores[0], valores[1])),
+        "lognormal": (2, lambda: random.lognormvariate(math.log(valores[0]), valores[1])),
+        "exponential": (1, lambda: random.expovariate(1 / valores[0])),
+    }
+    if tipo not in distribuciones or len(valores) != distribuciones[tipo][0]:
+        raise ValueError(f"Latencia inválida: '{spec}' (none, fixed:MS, uniform:MIN,MAX, normal:MEDIA,DESVIO, lognormal:MEDIANA,SIGMA o exponential:MEDIA)")
+    muestra = distribuciones[tipo][1]
+    return lambda: max(0.0, muestra()) / 1000
+
+
+def _por_prefijo(items_, convertir):
+    """Opciones 'PREFIJO=VALOR' repetidas a una lista [(prefijo, valor)], el prefijo más largo primero"""
+    resultado = []
+    for texto in items_ or []:
+        prefijo, _, valor_ = texto.partition("=")
+        if not valor_:
+            raise ValueError(f"Se esperaba PREFIJO=VALOR: '{texto}'")
+        resultado.append((prefijo, convertir(valor_)))
+    return sorted(resultado, key=lambda par: -len(par[0]))
+
+
+def _elegir(reglas, ruta, defecto):
+    for prefijo, valor_ in reglas:
+        if ruta.startswith(prefijo):
+            return valor_
+    return defecto
+
+
+class MockServer:
+    """Servidor HTTP/1.1 con keep-alive sobre asyncio"""
+
+    def __init__(self, latency=None, route_latency=None, error_rate=0.0, error_status=(500,), route_errors=None, reset_rate=0.0):
+        self.latencia = parse_latency(latency)
+        self.latencia_por_ruta = _por_prefijo(route_latency, parse_latency)
+        self.error_rate = error_rate
+        self.error_status = list(error_status)
+        self.errores_por_ruta = _por_prefijo(route_errors, float)
+        self.reset_rate = reset_rate
+
+    async def atender(self, reader, writer):
+        try:
+            while True:
+                try:
+                    encabezado = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                lineas = encabezado.decode("latin-1").split("\r\n")
+                metodo, destino, version = lineas[0].split(" ", 2)
+                encabezados = {}
+                for linea in lineas[1:]:
+                    if ":" in linea:
+                        nombre, _, valor_ = linea.partition(":")
+                        encabezados[nombre.strip().lower()] = valor_.strip()
+                cuerpo = await reader.readexactly(int(encabezados.get("content-length", 0) or 0))
+                cerrar = encabezados.get("connection", "").lower() == "close" or version == "HTTP/1.0"
+
+                if self.reset_rate and random.random() < self.reset_rate:
+                    writer.transport.abort()
+                    return
+                partes = urlsplit(destino)
+                latencia = _elegir(self.latencia_por_ruta, partes.path, self.latencia)()
+                if latencia:
+                    await asyncio.sleep(latencia)
+                inicio = time.perf_counter()
+                status, datos = self.responder(metodo, partes, encabezados, cuerpo)
+                contenido = datos if isinstance(datos, bytes) else json.dumps(datos, ensure_ascii=False).encode()
+                # Tiempo de armado de la respuesta, sin la latencia simulada (lo usa utils/selfbench.py)
+                servidor_ms = (time.perf_counter() - inicio) * 1000
+                writer.write(
+                    f"HTTP/1.1 {status} {_TEXTO_STATUS.get(status, 'OK')}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(contenido)}\r\n"
+                    f"Server-Timing: app;dur={servidor_ms:.3f}\r\n"
+                    f"{'Connection: close' if cerrar else 'Connection: keep-alive'}\r\n\r\n".encode() + contenido
+                )
+                await writer.drain()
+                if cerrar:
+                    return
+        except ConnectionError:
+            return
+        finally:
+            writer.close()
+
+    def responder(self, metodo, partes, encabezados, cuerpo):
+        ruta = partes.path
+        entrada, params = resolve(metodo, ruta)
+        if entrada is None:
+            return 404, {"detail": f"Ruta no implementada en el servidor simulado: {metodo} {ruta}"}
+        if ruta != "/login" and not encabezados.get("authorization", "").startswith("Bearer "):
+            return 401, {"detail": "Not authenticated"}
+        tasa = _elegir(self.errores_por_ruta, ruta, self.error_rate)
+        if tasa and random.random() < tasa:
+            return random.choice(self.error_status), {"detail": "Error simulado"}
+
+        query = {clave: valores[-1] for clave, valores in parse_qs(partes.query).items()}
+        body = None
+        if cuerpo:
+            if encabezados.get("content-type", "").startswith("application/x-www-form-urlencoded"):
+                body = {clave: valores[-1] for clave, valores in parse_qs(cuerpo.decode()).items()}
+            else:
+                try:
+                    body = json.loads(cuerpo)
+                except ValueError:
+                    return 422, {"detail": [{"type": "json_invalid", "loc": ["body"], "msg": "JSON inválido"}]}
+        return entrada.respuesta(Solicitud(metodo, entrada.plantilla, params, query, body))
+
+
+_TEXTO_STATUS = {200: "OK", 201: "Created", 401: "Unauthorized", 404: "Not Found", 422: "Unprocessable Entity",
+                 500: "Internal Server Error", 502: "Bad Gateway", 503: "Service Unavailable", 504: "Gateway Timeout"}
+
+
+async def serve(host, port, servidor, reuse_port=False):
+    server = await asyncio.start_server(servidor.atender, host, port, reuse_port=reuse_port, backlog=1024)
+    async with server:
+        await server.serve_forever()
+
+
+def _proceso(opciones, indice):
+    global _escala, _ids
+    _escala = opciones.scale
+    # IDs de alta distintos en cada proceso
+    _ids = itertools.count(1 + indice * 10**8)
+    servidor = MockServer(opciones.latency, opciones.route_latency, opciones.error_rate,
+                          [int(s) for s in opciones.error_status.split(",")], opciones.route_errors, opciones.reset_rate)
+    try:
+        asyncio.run(serve(opciones.host, opciones.port, servidor, reuse_port=opciones.processes > 1))
+    except KeyboardInterrupt:
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.mock_server", description="Servidor simulado de la API de Base Única")
+    parser.add_argument("--host", default="127.0.0.1", help="Dirección en la que escucha")
+    parser.add_argument("--port", type=int, default=MOCK_PORT, help="Puerto (variable MOCK_PORT)")
+    parser.add_argument("--latency", default="none", help="Latencia de cada respuesta, p. ej. 'lognormal:40,0.5'")
+    parser.add_argument("--route-latency", action="append", help="Latencia por prefijo de ruta, PREFIJO=DISTRIBUCION (repetible)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Proporción de respuestas con error")
+    parser.add_argument("--error-status", default="500", help="Códigos de los errores inyectados, separados por comas")
+    parser.add_argument("--route-errors", action="append", help="Proporción de errores por prefijo de ruta, PREFIJO=TASA (repetible)")
+    parser.add_argument("--reset-rate", type=float, default=0.0, help="Proporción de requests en los que se corta la conexión sin responder")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplica el tamaño de los listados")
+    parser.add_argument("--processes", type=int, default=1, help="Procesos escuchando en el mismo puerto")
+    opciones = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # Validar las opciones antes de levantar los procesos
+    parse_latency(opciones.latency)
+    _por_prefijo(opciones.route_latency, parse_latency)
+    _por_prefijo(opciones.route_errors, float)
+    logger.info(f"Servidor simulado en http://{opciones.host}:{opciones.port} ({len(RUTAS)} rutas, {opciones.processes} procesos, latencia {opciones.latency})")
+    if opciones.processes <= 1:
+        _proceso(opciones, 0)
+        return
+    procesos = [multiprocessing.Process(target=_proceso, args=(opciones, i), daemon=True) for i in range(opciones.processes)]
+    for proceso in procesos:
+        proceso.start()
+    try:
+        for proceso in procesos:
+            proceso.join()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
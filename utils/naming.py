@@ -0,0 +1,127 @@
+"""Nombres de request de baja cardinalidad.
+
+Muchos tasks arman el nombre del request con el valor del parámetro
+("/localidades/1234/barrios [GET]", "/domicilios/geo [GET 55-1200]"). Con
+pools de IDs realistas eso genera miles de entradas en las estadísticas,
+cada una con su histograma. Este módulo normaliza cada nombre a la
+plantilla de su ruta ("/localidades/{id_localidad}/barrios [GET]") y separa
+los valores de los parámetros.
+
+El desglose por valor de parámetro es opcional (--param-breakdown) y
+acotado: se registra como tiempos del harness, con hasta
+ROUTE_PARAM_MAX_VALUES valores por ruta; el resto se agrupa en "otros".
+"""
+import functools
+import os
+import re
+
+from utils import metrics
+
+ROUTE_PARAM_MAX_VALUES = int(os.getenv("ROUTE_PARAM_MAX_VALUES", "20"))
+
+# Nombre del parámetro según el segmento que lo precede en la ruta
+SEGMENT_PARAMS = {
+    "paises": "id_pais",
+    "provincias": "id_provincia",
+    "departamentos": "id_departamento",
+    "localidades": "id_localidad",
+    "barrios": "id_barrio",
+    "calles": "id_calle",
+    "domicilios": "id_domicilio",
+    "organigrama": "p_id_dependencia",
+    "dependencias": "p_id_dependencia",
+    "dependencias-ruta": "p_id_dependencia",
+    "dependencias-directas": "p_id_dependencia",
+    "niveles": "p_nivel",
+    "nivel": "p_nivel",
+    "chapas": "cuil",
+    "personas-fisicas": "cuil",
+    "personas-juridicas": "cuit",
+    "proveedores": "cuit_cuil",
+    "bancos": "id",
+    "profesiones": "id",
+}
+
+# Formato habitual de los nombres: "(DOMINIO) - /ruta [ETIQUETA]"
+_NOMBRE = re.compile(r"^(?P<prefijo>\([^)]*\) - )?(?P<ruta>[^\s\[]*)(?P<resto>.*)$")
+# Un valor es un token sin espacios que contiene al menos un dígito (IDs, CUIT, "55-1200")
+_VALOR = re.compile(r"^[\w.:-]*\d[\w.:-]*$")
+# Etiqueta con un valor al final: "[GET 1234]", "[Exception 20123456789]"
+_ETIQUETA_CON_VALOR = re.compile(r"\[(?P<etiqueta>[A-Za-z]+) (?P<valor>[^\s\]]+)\]")
+
+_valores_por_ruta = {}
+_desglose_activo = False
+
+
+def _plantilla_ruta(ruta):
+    """Reemplaza los segmentos con valores por {parametro}; devuelve la plantilla y los valores"""
+    ruta, _, query = ruta.partition("?")
+    segmentos = ruta.split("/")
+    valores = []
+    for i, segmento in enumerate(segmentos):
+        if segmento and _VALOR.match(segmento):
+            anterior = segmentos[i - 1] if i > 0 else ""
+            segmentos[i] = "{" + SEGMENT_PARAMS.get(anterior, "id") + "}"
+            valores.append(segmento)
+    plantilla = "/".join(segmentos)
+    if query:
+        # Solo los nombres de los parámetros: "?p_id_dependencia=5&p_nivel=2" -> "?p_id_dependencia&p_nivel"
+        claves = []
+        for par in query.split("&"):
+            clave, igual, valor = par.partition("=")
+            claves.append(clave)
+            if igual and valor:
+                valores.append(valor)
+        plantilla += "?" + "&".join(claves)
+    return plantilla, valores
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_name(name):
+    """Devuelve (nombre de plantilla, valores de los parámetros como texto o None)"""
+    partes = _NOMBRE.match(name)
+    if not partes or not partes.group("ruta").startswith("/"):
+        return name, None
+    ruta, valores = _plantilla_ruta(partes.group("ruta"))
+    resto = partes.group("resto")
+
+    etiqueta = _ETIQUETA_CON_VALOR.search(resto)
+    if etiqueta and _VALOR.match(etiqueta.group("valor")):
+        valores.append(etiqueta.group("valor"))
+        resto = resto[:etiqueta.start()] + f"[{etiqueta.group('etiqueta')}]" + resto[etiqueta.end():]
+
+    return f"{partes.group('prefijo') or ''}{ruta}{resto}", (",".join(valores) or None)
+
+
+def name_for(url, name=None):
+    """Nombre normalizado para un request; sin nombre explícito se usa la URL (como Locust)"""
+    return normalize_name(name if name is not None else url)
+
+
+def record_parameter(name, valor, response_time):
+    """Desglose acotado del tiempo de respuesta por valor de parámetro"""
+    valores = _valores_por_ruta.setdefault(name, set())
+    if valor not in valores:
+        if len(valores) >= ROUTE_PARAM_MAX_VALUES:
+            valor = "otros"
+        else:
+            valores.add(valor)
+    metrics.observe(f"parámetro: {name} = {valor}", response_time)
+
+
+def register_breakdown(environment, enabled):
+    """Activa el desglose por parámetro a partir del contexto de cada request"""
+    global _desglose_activo
+    if str(enabled).lower() not in ("true", "1", "yes") or _desglose_activo:
+        return
+    _desglose_activo = True
+
+    @environment.events.test_start.add_listener
+    def on_test_start(**kwargs):
+        _valores_por_ruta.clear()
+
+    @environment.events.request.add_listener
+    def on_request(name, response_time, context, **kwargs):
+        valor = context.get("parametro") if context else None
+        if valor is not None:
+            record_parameter(name, valor, response_time)
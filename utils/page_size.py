@@ -0,0 +1,182 @@
+"""Barrido de tamaños de página de los endpoints paginados (perfil "page-size").
+
+Los p_page_size de los datos del ambiente son fijos (20 para chapas, 1 para
+leasing, ...) y no se sabe dónde está el punto de equilibrio entre tamaño
+del payload y cantidad de requests. El perfil "page-size" ejecuta cada
+endpoint paginado con cada tamaño de la escalera (--page-sizes) y registra,
+para cada request que envía el task (con el evento request de Locust):
+
+- bytes recibidos
+- tiempo total del request (Locust) y tiempo del servidor (hasta recibir
+  los encabezados, response.elapsed)
+- tiempo de decodificación del JSON en el cliente
+- elementos recibidos
+
+Al terminar la prueba se escribe la tabla en el log y en
+logs/page_size_sweep.csv, con el tamaño recomendado por ruta: el de más
+elementos por segundo entre los que no superan PAGE_SIZE_MAX_LATENCY_MS en
+el p95. En modo distribuido cada worker escribe su propia tabla, con su
+identificador en el nombre del archivo.
+"""
+import csv
+import os
+import statistics
+
+import gevent
+
+from utils.paging import state_for
+
+PAGE_SIZE_LADDER = os.getenv("PAGE_SIZE_LADDER", "1,10,20,50,100,200")
+PAGE_SIZE_REPETITIONS = int(os.getenv("PAGE_SIZE_REPETITIONS", "5"))
+PAGE_SIZE_MAX_LATENCY_MS = float(os.getenv("PAGE_SIZE_MAX_LATENCY_MS", "2000"))
+
+CSV_PATH = os.path.join("logs", "page_size_sweep.csv")
+
+# (request, tamaño) -> lista de muestras (bytes, total_ms, servidor_ms, decodificacion_ms, elementos)
+_muestras = {}
+# (request, tamaño) -> cantidad de requests fallidos
+_fallas = {}
+# Greenlet del usuario que ejecuta el barrido -> tamaño de página en curso
+_en_curso = {}
+
+
+def csv_path(proceso=None):
+    """Archivo de la tabla; con el identificador del worker en modo distribuido"""
+    if proceso is None:
+        return CSV_PATH
+    base, extension = os.path.splitext(CSV_PATH)
+    return f"{base}-{proceso}{extension}"
+
+
+def parse_ladder(texto):
+    """Convierte "1,10,20" en [1, 10, 20] (ordenados y sin repetidos)"""
+    return sorted({int(valor) for valor in str(texto).split(",") if valor.strip()})
+
+
+def reset():
+    _muestras.clear()
+    _fallas.clear()
+
+
+def _cantidad_elementos(response):
+    try:
+        datos = response.json()
+    except ValueError:
+        return 0
+    if isinstance(datos, dict):
+        items = datos.get("items")
+        return len(items) if isinstance(items, list) else 0
+    return len(datos) if isinstance(datos, list) else 0
+
+
+def record(name, tamano, response_time, response_length, response, exception):
+    """Registra un request del barrido con el tamaño de página usado"""
+    clave = (name, tamano)
+    if exception is not None or getattr(response, "status_code", None) != 200:
+        _fallas[clave] = _fallas.get(clave, 0) + 1
+        return
+    elementos = _cantidad_elementos(response)  # decodifica si el task no lo hizo
+    elapsed = getattr(response, "elapsed", None)
+    _muestras.setdefault(clave, []).append((
+        response_length,
+        response_time,
+        elapsed.total_seconds() * 1000 if elapsed is not None else 0,
+        getattr(response, "decode_ms", None) or 0,
+        elementos,
+    ))
+
+
+def register(environment):
+    """Registra los requests de los usuarios que están ejecutando el barrido"""
+    @environment.events.request.add_listener
+    def on_request(request_type, name, response_time, response_length, response=None, exception=None, **kwargs):
+        tamano = _en_curso.get(gevent.getcurrent())
+        if tamano is not None:
+            record(name, tamano, response_time, response_length, response, exception)
+
+
+def run_sweep(http, logger, environment, data, entradas, tamanos, repeticiones=PAGE_SIZE_REPETITIONS):
+    """Ejecuta cada endpoint paginado con cada tamaño de página de la escalera"""
+    estado = state_for(data)
+    usuario = gevent.getcurrent()
+    try:
+        for entrada in entradas:
+            for tamano in tamanos:
+                logger.info(f"Barrido de tamaño de página: {entrada.nombre} con p_page_size={tamano}")
+                estado.page_size = _en_curso[usuario] = tamano
+                for _ in range(repeticiones):
+                    http.run_task(entrada.funcion, logger, environment, data)
+    finally:
+        estado.page_size = None
+        _en_curso.pop(usuario, None)
+
+
+def _percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p))]
+
+
+def summarize():
+    """Filas de la tabla por request y tamaño de página"""
+    filas = []
+    for (nombre, tamano), muestras in sorted(_muestras.items()):
+        bytes_, total, servidor, decodificacion, elementos = zip(*muestras)
+        total_p50 = statistics.median(total)
+        decodificacion_p50 = statistics.median(decodificacion)
+        elementos_prom = statistics.mean(elementos)
+        costo_ms = total_p50 + decodificacion_p50
+        filas.append({
+            "request": nombre,
+            "page_size": tamano,
+            "n": len(muestras),
+            "fallas": _fallas.get((nombre, tamano), 0),
+            "bytes_prom": round(statistics.mean(bytes_)),
+            "elementos_prom": round(elementos_prom, 1),
+            "total_p50_ms": round(total_p50, 1),
+            "total_p95_ms": round(_percentil(total, 0.95), 1),
+            "servidor_p50_ms": round(statistics.median(servidor), 1),
+            "decodificacion_p50_ms": round(decodificacion_p50, 2),
+            "elementos_por_s": round(elementos_prom / (costo_ms / 1000), 1) if costo_ms > 0 else 0,
+        })
+    return filas
+
+
+def recommend(filas, max_latency_ms=PAGE_SIZE_MAX_LATENCY_MS):
+    """Tamaño recomendado por request: más elementos/s sin fallas y con p95 dentro del límite"""
+    recomendados = {}
+    for fila in filas:
+        if fila["fallas"] or fila["total_p95_ms"] > max_latency_ms or fila["elementos_prom"] == 0:
+            continue
+        actual = recomendados.get(fila["request"])
+        if actual is None or fila["elementos_por_s"] > actual["elementos_por_s"]:
+            recomendados[fila["request"]] = fila
+    return recomendados
+
+
+def report(logger, path=CSV_PATH):
+    """Escribe la tabla del barrido en el log y en CSV; devuelve las recomendaciones"""
+    filas = summarize()
+    if not filas:
+        return {}
+    recomendados = recommend(filas)
+
+    logger.warning("=== BARRIDO DE TAMAÑOS DE PÁGINA ===")
+    logger.warning(f"{'request':<55} {'size':>5} {'n':>4} {'bytes':>9} {'items':>7} {'p50 ms':>8} {'p95 ms':>8} {'srv ms':>8} {'dec ms':>7} {'items/s':>9}")
+    for fila in filas:
+        marca = " <- recomendado" if recomendados.get(fila["request"]) is fila else ""
+        logger.warning(
+            f"{fila['request'][:55]:<55} {fila['page_size']:>5} {fila['n']:>4} {fila['bytes_prom']:>9} "
+            f"{fila['elementos_prom']:>7} {fila['total_p50_ms']:>8} {fila['total_p95_ms']:>8} "
+            f"{fila['servidor_p50_ms']:>8} {fila['decodificacion_p50_ms']:>7} {fila['elementos_por_s']:>9}{marca}"
+        )
+    for nombre in sorted({fila["request"] for fila in filas} - set(recomendados)):
+        logger.warning(f"{nombre}: sin tamaño recomendado (fallas, sin elementos o p95 > {PAGE_SIZE_MAX_LATENCY_MS:.0f} ms)")
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=list(filas[0]) + ["recomendado"])
+        escritor.writeheader()
+        for fila in filas:
+            escritor.writerow({**fila, "recomendado": recomendados.get(fila["request"]) is fila})
+    logger.warning(f"Tabla del barrido guardada en {path}")
+    return recomendados
@@ -0,0 +1,138 @@
+"""Estrategias de paginación para los endpoints paginados.
+
+Los endpoints con PaginationResponseSchema (items, total_items, page_number,
+page_size) se consultaban siempre en la página 1, la más barata y la que
+más probablemente está en caché. Con --paging se elige la página de cada
+request según una estrategia:
+
+- first: la página indicada en los datos del ambiente (comportamiento histórico)
+- crawl: recorrido secuencial, 1, 2, 3, ... hasta la última y vuelta a empezar
+- random: una página al azar entre 1 y la última conocida
+- last: la última página conocida
+- mixed: crawl, random o last al azar en cada request
+
+La última página se calcula con total_items / page_size de la respuesta
+anterior de la misma ruta; hasta conocerla se pide la página 1. El tiempo
+de respuesta se informa por profundidad de página en la pestaña "Harness"
+("paginación: <request> [11-100]") para ver cómo degrada la paginación por
+OFFSET a medida que se avanza.
+"""
+import math
+import random
+
+from utils import metrics
+
+ESTRATEGIA_PRIMERA = "first"
+ESTRATEGIA_RECORRIDO = "crawl"
+ESTRATEGIA_AL_AZAR = "random"
+ESTRATEGIA_ULTIMA = "last"
+ESTRATEGIA_MIXTA = "mixed"
+ESTRATEGIAS = [ESTRATEGIA_PRIMERA, ESTRATEGIA_RECORRIDO, ESTRATEGIA_AL_AZAR, ESTRATEGIA_ULTIMA, ESTRATEGIA_MIXTA]
+
+# Límites superiores de los rangos de profundidad: 1, 2-10, 11-100, 101-1000, >1000
+PAGE_BUCKETS = (1, 10, 100, 1000)
+
+_estrategia = ESTRATEGIA_PRIMERA
+
+
+def set_strategy(estrategia):
+    """Define la estrategia de paginación para la prueba en curso"""
+    global _estrategia
+    _estrategia = estrategia
+
+
+def get_strategy():
+    return _estrategia
+
+
+def depth_bucket(pagina):
+    """Rango de profundidad de una página: "1", "2-10", "11-100", ..."""
+    inferior = 1
+    for superior in PAGE_BUCKETS:
+        if pagina <= superior:
+            return str(superior) if inferior == superior else f"{inferior}-{superior}"
+        inferior = superior + 1
+    return f">{PAGE_BUCKETS[-1]}"
+
+
+class PagingState:
+    """Última página conocida y posición del recorrido de cada ruta (por usuario)"""
+
+    def __init__(self, rng=random):
+        self._rng = rng
+        self._ultima = {}
+        self._cursor = {}
+        # Tamaño de página forzado (barrido de tamaños de página); None usa el de los datos
+        self.page_size = None
+
+    def last_page(self, ruta):
+        return self._ultima.get(ruta)
+
+    def next_page(self, ruta, estrategia):
+        ultima = self._ultima.get(ruta)
+        if estrategia == ESTRATEGIA_MIXTA:
+            estrategia = self._rng.choice([ESTRATEGIA_RECORRIDO, ESTRATEGIA_AL_AZAR, ESTRATEGIA_ULTIMA])
+        if estrategia == ESTRATEGIA_RECORRIDO:
+            pagina = self._cursor.get(ruta, 0) + 1
+            if ultima is not None and pagina > ultima:
+                pagina = 1
+            self._cursor[ruta] = pagina
+            return pagina
+        if ultima is None:
+            return 1
+        if estrategia == ESTRATEGIA_AL_AZAR:
+            return self._rng.randint(1, ultima)
+        return ultima
+
+    def update(self, ruta, response_data, page_size=None):
+        """Actualiza la última página con el sobre de la respuesta (total_items / page_size)"""
+        if not isinstance(response_data, dict) or "total_items" not in response_data:
+            return None
+        try:
+            total_items = int(response_data["total_items"])
+            page_size = int(response_data.get("page_size") or page_size or 0)
+        except (TypeError, ValueError):
+            return None
+        if page_size <= 0:
+            return None
+        ultima = self._ultima[ruta] = max(1, math.ceil(total_items / page_size))
+        return ultima
+
+
+def state_for(data_module):
+    """Estado de paginación del usuario, guardado en su contexto de datos"""
+    estado = getattr(data_module, "estado_paginacion", None)
+    if estado is None:
+        estado = PagingState()
+        data_module.estado_paginacion = estado
+    return estado
+
+
+def choose_page(data_module, ruta, params):
+    """Devuelve una copia de los query params con la página elegida y el número de página"""
+    params = dict(params or {})
+    estado = state_for(data_module)
+    if estado.page_size is not None:
+        params["p_page_size"] = estado.page_size
+    if _estrategia != ESTRATEGIA_PRIMERA:
+        params["p_page_number"] = estado.next_page(ruta, _estrategia)
+    return params, params.get("p_page_number", 1)
+
+
+def update(data_module, ruta, response_data, params=None):
+    """Registra la última página de la ruta a partir de una respuesta paginada"""
+    page_size = (params or {}).get("p_page_size")
+    return state_for(data_module).update(ruta, response_data, page_size)
+
+
+def register(environment, estrategia):
+    """Activa la estrategia y el registro de tiempos por profundidad de página"""
+    set_strategy(estrategia)
+    if estrategia == ESTRATEGIA_PRIMERA:
+        return
+
+    @environment.events.request.add_listener
+    def on_request(name, response_time, context, **kwargs):
+        pagina = context.get("pagina") if context else None
+        if pagina is not None:
+            metrics.observe(f"paginación: {name} [{depth_bucket(int(pagina))}]", response_time)
@@ -0,0 +1,314 @@
+"""Profiler por muestreo del generador de carga, activable durante la prueba.
+
+Cuando el generador llega al 100 % de CPU, las estadísticas de Locust no
+dicen en qué se va el tiempo. Este profiler toma muestras de la pila del
+hilo de gevent (el que ejecuta todos los usuarios) desde un hilo nativo,
+al estilo de py-spy: cada --sampling-interval ms (10 por defecto) guarda
+la pila del greenlet que está corriendo en ese momento. No instrumenta las
+funciones, así que el costo no depende de cuántas llamadas hagan los tasks.
+
+Cada muestra se atribuye al task function de tasks/*.py que la originó (la
+función del registro, tasks/registry.py) y la pila se guarda en formato
+"collapsed" (una línea "task;función;...;función N" por pila), con el task
+como raíz, listo para flamegraph.pl o speedscope. Las muestras con el loop
+de gevent esperando la red se cuentan aparte como "(gevent: en espera)".
+
+Se activa de dos formas:
+
+- --sampling-profiler (LOCUST_SAMPLING_PROFILER): muestrea desde el
+  inicio hasta el final de la prueba
+- desde la interfaz web, en cualquier momento: /profiling/start y
+  /profiling/stop (también en la pestaña de descargas), con la pestaña
+  "Profiling" con el porcentaje de CPU por task
+
+En modo distribuido el master envía el inicio y el fin a los workers, que
+al detenerse devuelven sus muestras; el master las suma. El resultado se
+descarga de /profiling/collapsed y se escribe en logs/profile.collapsed.
+"""
+import json
+import os
+import sys
+from collections import Counter
+
+from gevent import monkey
+from locust.runners import MasterRunner, WorkerRunner
+
+from utils import distributed
+
+SAMPLING_INTERVAL_MS = 10
+
+PROFILE_PATH = os.path.join("logs", "profile.collapsed")
+PROFILING_TAB = "profiling"
+
+MENSAJE_PROFILER = "harness_profiling"
+MENSAJE_MUESTRAS = "harness_profiling_samples"
+
+TASK_EN_ESPERA = "(gevent: en espera)"
+TASK_FUERA = "(fuera de los tasks)"
+
+_TASKS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tasks") + os.sep
+
+# Muestras de este proceso (las escribe el hilo del profiler)
+_muestras = Counter()
+_lock = monkey.get_original("_thread", "allocate_lock")()
+# Cada inicio cambia la generación; el hilo de una generación anterior termina
+_generacion = 0
+_activo = False
+
+# Resultado del último perfil: local o sumado de los workers en el master
+_resultado = Counter()
+_estado = {"activo": False, "intervalo_ms": SAMPLING_INTERVAL_MS, "workers_esperados": 0, "workers_recibidos": 0}
+
+# Código de cada función del registro -> nombre del endpoint
+_funciones_task = None
+# Código del task de las rutas declaradas (utils/routes.py): todas comparten
+# el mismo código, así que el endpoint sale de la ruta del frame
+_codigos_ruta = frozenset()
+# Código -> "función (archivo)" de la pila
+_etiquetas = {}
+
+
+def _tasks_por_codigo():
+    global _funciones_task, _codigos_ruta
+    if _funciones_task is None:
+        from tasks.registry import REGISTRO
+        _codigos_ruta = frozenset(entrada.funcion.__code__ for entrada in REGISTRO if hasattr(entrada.funcion, "route"))
+        _funciones_task = {
+            entrada.funcion.__code__: entrada.nombre for entrada in REGISTRO if entrada.funcion.__code__ not in _codigos_ruta
+        }
+    return _funciones_task
+
+
+def _etiqueta(codigo):
+    etiqueta = _etiquetas.get(codigo)
+    if etiqueta is None:
+        partes = codigo.co_filename.replace("\\", "/").split("/")
+        etiqueta = _etiquetas[codigo] = f"{codigo.co_name} ({'/'.join(partes[-2:])})"
+    return etiqueta
+
+
+def collapse(frame):
+    """Pila de un frame en formato collapsed, con el task al que pertenece como raíz"""
+    codigo = frame.f_code
+    if codigo.co_name == "run" and codigo.co_filename.endswith(os.path.join("gevent", "hub.py")):
+        return TASK_EN_ESPERA
+    tasks = _tasks_por_codigo()
+    task = None
+    archivo_task = None
+    pila = []
+    while frame is not None:
+        codigo = frame.f_code
+        pila.append(_etiqueta(codigo))
+        if task is None and codigo in tasks:
+            task = tasks[codigo]
+        elif task is None and codigo in _codigos_ruta:
+            task = frame.f_locals["route"].nombre
+        elif codigo.co_filename.startswith(_TASKS_DIR):
+            archivo_task = codigo.co_name
+        frame = frame.f_back
+    pila.append(task or archivo_task or TASK_FUERA)
+    return ";".join(reversed(pila))
+
+
+def _muestrear(hilo, intervalo, generacion):
+    dormir = monkey.get_original("time", "sleep")
+    while _generacion == generacion:
+        frame = sys._current_frames().get(hilo)
+        if frame is not None:
+            pila = collapse(frame)
+            with _lock:
+                _muestras[pila] += 1
+        del frame
+        dormir(intervalo)
+
+
+def start(intervalo_ms=SAMPLING_INTERVAL_MS):
+    """Empieza a muestrear el hilo de gevent de este proceso (el que llama)"""
+    global _generacion, _activo
+    _generacion += 1
+    _activo = True
+    with _lock:
+        _muestras.clear()
+    hilo = monkey.get_original("_thread", "get_ident")()
+    monkey.get_original("_thread", "start_new_thread")(_muestrear, (hilo, max(1, intervalo_ms) / 1000, _generacion))
+
+
+def stop():
+    """Detiene el muestreo y devuelve las muestras de este proceso"""
+    global _generacion, _activo
+    _generacion += 1
+    _activo = False
+    with _lock:
+        return Counter(_muestras)
+
+
+def is_active():
+    return _activo
+
+
+def current_samples():
+    """Muestras tomadas hasta ahora, sin detener el profiler"""
+    with _lock:
+        return Counter(_muestras)
+
+
+def by_task(muestras):
+    """Muestras por task, con el porcentaje sobre las muestras con CPU (sin la espera de gevent)"""
+    por_task = Counter()
+    for pila, cantidad in muestras.items():
+        por_task[pila.split(";", 1)[0]] += cantidad
+    total = sum(por_task.values())
+    ocupadas = total - por_task.get(TASK_EN_ESPERA, 0)
+    return [
+        {
+            "name": task,
+            "samples": cantidad,
+            "busy": f"{cantidad / ocupadas:.1%}" if ocupadas and task != TASK_EN_ESPERA else "",
+            "total": f"{cantidad / total:.1%}",
+        }
+        for task, cantidad in por_task.most_common()
+    ]
+
+
+def collapsed(muestras):
+    return "".join(f"{pila} {cantidad}\n" for pila, cantidad in sorted(muestras.items()))
+
+
+def write(muestras, logger, ruta=PROFILE_PATH):
+    """Escribe el perfil en formato collapsed y el resumen por task en el log"""
+    os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write(collapsed(muestras))
+    logger.warning(f"=== PROFILER: {sum(muestras.values())} muestras en {ruta} (flamegraph.pl o speedscope) ===")
+    for fila in by_task(muestras)[:15]:
+        logger.warning(f"  {fila['name']}: {fila['samples']} muestras ({fila['busy'] or '-'} de la CPU, {fila['total']} del total)")
+
+
+def start_all(environment, intervalo_ms=SAMPLING_INTERVAL_MS):
+    """Inicia el profiler en este proceso o, desde el master, en todos los workers"""
+    _resultado.clear()
+    _estado.update(activo=True, intervalo_ms=intervalo_ms, workers_esperados=0, workers_recibidos=0)
+    if isinstance(environment.runner, MasterRunner):
+        environment.runner.send_message(MENSAJE_PROFILER, {"accion": "start", "intervalo_ms": intervalo_ms})
+    else:
+        start(intervalo_ms)
+
+
+def stop_all(environment, logger):
+    """Detiene el profiler; en el master las muestras llegan después, de cada worker"""
+    if not _estado["activo"]:
+        return
+    _estado["activo"] = False
+    if isinstance(environment.runner, MasterRunner):
+        _estado["workers_esperados"] = environment.runner.worker_count
+        environment.runner.send_message(MENSAJE_PROFILER, {"accion": "stop"})
+    else:
+        _resultado.update(stop())
+        write(_resultado, logger)
+
+
+def register(environment, logger, activo=False, intervalo_ms=SAMPLING_INTERVAL_MS):
+    """Mensajes entre master y workers, inicio y fin con --sampling-profiler e interfaz web"""
+    runner = environment.runner
+    _estado["intervalo_ms"] = intervalo_ms
+
+    if isinstance(runner, WorkerRunner):
+        # El worker sigue al master: empieza y termina con sus mensajes
+        def enviar_muestras():
+            if is_active():
+                runner.send_message(MENSAJE_MUESTRAS, {"worker": distributed.worker_id(), "muestras": dict(stop())})
+
+        def on_profiler(environment, msg, **kwargs):
+            if msg.data["accion"] == "start":
+                start(msg.data["intervalo_ms"])
+                logger.info(f"Profiler iniciado por el master (cada {msg.data['intervalo_ms']} ms)")
+            else:
+                enviar_muestras()
+
+        @environment.events.test_stop.add_listener
+        def on_worker_stop(environment, **kwargs):
+            # Al terminar la prueba el mensaje de fin del master puede llegar tarde
+            enviar_muestras()
+
+        runner.register_message(MENSAJE_PROFILER, on_profiler)
+    elif isinstance(runner, MasterRunner):
+        def on_muestras(environment, msg, **kwargs):
+            _resultado.update(msg.data["muestras"])
+            _estado["workers_recibidos"] += 1
+            logger.info(f"Muestras del profiler del worker {msg.data['worker']}: {sum(msg.data['muestras'].values())}")
+            write(_resultado, logger)
+
+        runner.register_message(MENSAJE_MUESTRAS, on_muestras)
+
+    if activo and not isinstance(runner, WorkerRunner):
+        @environment.events.test_start.add_listener
+        def on_test_start(environment, **kwargs):
+            start_all(environment, intervalo_ms)
+
+        @environment.events.test_stop.add_listener
+        def on_test_stop(environment, **kwargs):
+            stop_all(environment, logger)
+
+    if environment.web_ui and not isinstance(runner, WorkerRunner):
+        _register_web_ui(environment, logger)
+
+
+def _register_web_ui(environment, logger):
+    from flask import Response, request
+
+    web_ui = environment.web_ui
+    columnas = [("name", "Task"), ("samples", "Muestras"), ("busy", "% de la CPU"), ("total", "% del total")]
+
+    web_ui.template_args["extendedTabs"] = [
+        *web_ui.template_args.get("extendedTabs", []),
+        {"title": "Profiling", "key": PROFILING_TAB},
+    ]
+    web_ui.template_args["extendedTables"] = [
+        *web_ui.template_args.get("extendedTables", []),
+        {"key": PROFILING_TAB, "structure": [{"key": key, "title": title} for key, title in columnas]},
+    ]
+    web_ui.template_args["extendedCsvFiles"] = [
+        *web_ui.template_args.get("extendedCsvFiles", []),
+        {"href": "/profiling/start", "title": "Iniciar el profiler"},
+        {"href": "/profiling/stop", "title": "Detener el profiler"},
+        {"href": "/profiling/collapsed", "title": "Descargar el perfil (collapsed stacks)"},
+    ]
+
+    def estado():
+        return {**_estado, "muestras": sum((current_samples() if _activo else _resultado).values())}
+
+    @web_ui.app.after_request
+    def extend_stats_response(response):
+        if request.path != "/stats/requests" or not response.is_json:
+            return response
+        payload = response.get_json()
+        # Durante el muestreo local la tabla se actualiza en vivo; en el master, al recibir las muestras
+        muestras = current_samples() if _activo else _resultado
+        payload["extended_stats"] = [
+            *payload.get("extended_stats", []),
+            {"key": PROFILING_TAB, "data": by_task(muestras)},
+        ]
+        response.set_data(json.dumps(payload))
+        return response
+
+    @web_ui.app.route("/profiling/start", methods=["GET", "POST"])
+    def profiling_start():
+        intervalo_ms = int(request.args.get("interval_ms", _estado["intervalo_ms"]))
+        start_all(environment, intervalo_ms)
+        logger.info(f"Profiler iniciado desde la interfaz web (cada {intervalo_ms} ms)")
+        return estado()
+
+    @web_ui.app.route("/profiling/stop", methods=["GET", "POST"])
+    def profiling_stop():
+        stop_all(environment, logger)
+        return estado()
+
+    @web_ui.app.route("/profiling/status")
+    def profiling_status():
+        return estado()
+
+    @web_ui.app.route("/profiling/collapsed")
+    def profiling_collapsed():
+        return Response(collapsed(current_samples() if _activo else _resultado), mimetype="text/plain",
+                        headers={"Content-disposition": "attachment; filename=profile.collapsed"})
+
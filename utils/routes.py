@@ -0,0 +1,211 @@
+"""Rutas declarativas de consulta.
+
+Los endpoints de consulta simples (un GET que devuelve una lista de
+objetos, o un objeto con objeto=True) comparten siempre el mismo flujo:
+elegir los parámetros, hacer el request, validar la respuesta con su
+esquema, cosechar IDs para los tasks siguientes e informar el resultado. Cada ruta se declara una sola vez con
+un Route y route_task() la convierte en un task function con la firma
+habitual (client, logger, environment, data_module).
+"""
+import logging
+import random
+from collections import namedtuple
+
+from utils.http import report_failure
+from utils.validation import validate
+
+# Una ruta de consulta:
+# - nombre: nombre del task function (el mismo que usa tasks/registry.py)
+# - dominio: prefijo del nombre del request, p. ej. "DOMICILIOS"
+# - metodo / ruta: método HTTP y plantilla de la ruta ("/paises/{id_pais}/provincias")
+# - parametros: función (data_module, logger) -> (valores de la ruta, query params o None)
+# - esquema: utils.validation.Schema de cada elemento de la lista
+# - cosechas: pares (campo del contexto, campo del elemento) con los IDs a cosechar
+# - entidad: nombre en plural para los logs ("países")
+# - vacia_es_error: una lista vacía se informa como falla
+# - interes / esperados / conocidos: atributos opcionales del módulo de datos
+#   con nombres de interés, elementos esperados y el mapeo nombre -> ID a actualizar
+# - validacion_parcial: solo se validan los primeros ELEMENTOS_VALIDACION_PARCIAL
+#   elementos; de los demás solo se cosechan los IDs que estén
+# - objeto: la respuesta es un objeto (consulta por ID) en lugar de una lista
+# - no_encontrado_es_falla: un 404 se informa como falla (si no, es un
+#   comportamiento esperado cuando la consulta lleva parámetros)
+Route = namedtuple(
+    "Route",
+    ["nombre", "dominio", "metodo", "ruta", "parametros", "esquema", "cosechas", "entidad",
+     "vacia_es_error", "interes", "esperados", "conocidos", "validacion_parcial",
+     "objeto", "no_encontrado_es_falla"],
+    defaults=(False, None, None, None, False, False, False),
+)
+
+# Cantidad de elementos de la respuesta que se muestran en el log
+ELEMENTOS_EN_LOG = 10
+
+# Elementos que deben ser válidos en las rutas con validación parcial
+ELEMENTOS_VALIDACION_PARCIAL = 5
+
+
+def draw_or_default(pool, valores_por_defecto, entidad, logger):
+    """Toma un valor del pool cosechado; si está vacío usa uno de los valores por defecto"""
+    valor = pool.draw()
+    if valor is None:
+        valor = random.choice(valores_por_defecto)
+        logger.warning(f"No se encontraron IDs de {entidad}. Usando valores predeterminados: {valores_por_defecto}")
+    return valor
+
+
+def _revisar_datos_de_referencia(route, data_module, logger, response_data):
+    campo_id = route.cosechas[0][1] if route.cosechas else None
+
+    if route.interes and hasattr(data_module, route.interes):
+        interes = getattr(data_module, route.interes)
+        encontrados = [item for item in response_data if item.get("nombre") in interes]
+        if encontrados:
+            logger.info(f"=== {route.entidad.upper()} DE INTERÉS ENCONTRADOS ===")
+            if logger.isEnabledFor(logging.INFO):
+                for item in encontrados:
+                    logger.info(f"- {item.get('nombre')} (ID: {item.get(campo_id)})")
+
+    if route.conocidos and hasattr(data_module, route.conocidos):
+        conocidos = getattr(data_module, route.conocidos)
+        for item in response_data:
+            nombre = item.get("nombre")
+            if nombre in conocidos:
+                conocidos[nombre] = item.get(campo_id)
+                logger.info(f"Conocido actualizado: {nombre} -> ID {item.get(campo_id)}")
+
+    if route.esperados and hasattr(data_module, route.esperados):
+        if logger.isEnabledFor(logging.INFO):
+            for esperado in getattr(data_module, route.esperados):
+                encontrado = any(
+                    item.get(campo_id) == esperado.get(campo_id) and item.get("nombre") == esperado.get("nombre")
+                    for item in response_data
+                )
+                if encontrado:
+                    logger.info(f"✓ Esperado encontrado: {esperado.get('nombre')}")
+                else:
+                    logger.debug(f"✗ Esperado NO encontrado: {esperado.get('nombre')}")
+
+
+def _revisar_objeto(route, response, logger, response_data, url):
+    if not isinstance(response_data, dict):
+        response.failure("Formato de respuesta inesperado (se esperaba un objeto)")
+        logger.warning(f"Formato inesperado en {route.entidad}: {response.text[:200]}")
+        return
+
+    errores = validate(route.esquema, response_data, nombre=route.ruta)
+    if errores:
+        logger.warning(f"Errores de validación: {errores}")
+        response.failure("Formato de respuesta incompleto")
+        return
+
+    response.success()
+    logger.info(f"Consulta de {route.entidad} exitosa para {url}")
+    if logger.isEnabledFor(logging.INFO):
+        for campo in (*route.esquema.required, *route.esquema.optional):
+            if response_data.get(campo) is not None:
+                logger.info(f"- {campo}: {response_data.get(campo)}")
+
+
+def run_route(route, client, logger, environment, data_module):
+    """Ejecuta una ruta de consulta y valida su respuesta"""
+    # Si no se pueden resolver los parámetros, la falla se informa con la plantilla de la ruta
+    url = route.ruta
+    try:
+        valores, params = route.parametros(data_module, logger)
+        url = route.ruta.format(**valores)
+        logger.info(f"Ejecutando {route.nombre}: {route.metodo} {url}" + (f" con parámetros {params}" if params else ""))
+
+        with client.request(
+            route.metodo,
+            url,
+            params=params,
+            catch_response=True,
+            name=f"({route.dominio}) - {url} [{route.metodo}]"
+        ) as response:
+            logger.info(f"Estado de la respuesta: {response.status_code}")
+
+            if response.status_code == 200:  # HTTP 200 OK
+                try:
+                    response_data = response.json()
+                except ValueError as e:
+                    response.failure(f"Respuesta no es JSON válido: {str(e)}")
+                    logger.error(f"JSON inválido en {route.entidad}: {response.text[:200]}")
+                    return
+
+                if route.objeto:
+                    _revisar_objeto(route, response, logger, response_data, url)
+                    return
+
+                if not isinstance(response_data, list):
+                    response.failure("Formato de respuesta inesperado (se esperaba una lista)")
+                    logger.warning(f"Formato inesperado en {route.entidad}: {response.text[:200]}")
+                    return
+
+                cantidad = len(response_data)
+                logger.info(f"Se encontraron {cantidad} {route.entidad} para {url}")
+                if cantidad == 0:
+                    if route.vacia_es_error:
+                        logger.warning(f"La lista de {route.entidad} está vacía")
+                        response.failure(f"No se encontraron {route.entidad} en la base de datos")
+                    else:
+                        logger.info(f"No se encontraron {route.entidad} para {url}")
+                        response.success()
+                    return
+
+                validados = response_data[:ELEMENTOS_VALIDACION_PARCIAL] if route.validacion_parcial else response_data
+                errores = validate(route.esquema, validados, nombre=route.ruta)
+                if errores:
+                    logger.warning(f"Errores de validación: {errores}")
+                    response.failure("Algunos elementos no tienen los campos esperados")
+                    return
+
+                response.success()
+                logger.info(f"Consulta de {route.entidad} exitosa")
+
+                campo_id = route.cosechas[0][1] if route.cosechas else None
+                if logger.isEnabledFor(logging.INFO):
+                    for idx, item in enumerate(response_data[:ELEMENTOS_EN_LOG]):
+                        logger.info(f"{idx+1}: ID={item.get(campo_id)}, Nombre={item.get('nombre')}")
+                if cantidad > ELEMENTOS_EN_LOG:
+                    logger.info(f"... y {cantidad - ELEMENTOS_EN_LOG} {route.entidad} más")
+
+                # Cosechar IDs para los tasks siguientes (sin los que falten en elementos no validados)
+                for campo_contexto, campo_item in route.cosechas:
+                    getattr(data_module, campo_contexto).extend(
+                        item[campo_item] for item in response_data if item.get(campo_item) is not None)
+
+                _revisar_datos_de_referencia(route, data_module, logger, response_data)
+            elif response.status_code == 400 and valores:
+                logger.warning(f"Parámetros inválidos: {valores}")
+                response.failure(f"Parámetros inválidos: {valores}")
+            elif response.status_code == 404 and (valores or params) and not route.no_encontrado_es_falla:
+                # Un ID sin datos puede ser un comportamiento esperado
+                logger.warning(f"No se encontraron datos para {url}")
+                response.success()
+            elif response.status_code == 401:
+                logger.error(f"Error de autenticación al obtener {route.entidad}")
+                response.failure("Error de autenticación")
+            elif response.status_code == 403:
+                logger.error(f"Error de permisos al obtener {route.entidad}")
+                response.failure("Error de permisos")
+            elif response.status_code == 500:
+                logger.error(f"Error interno del servidor al obtener {route.entidad}")
+                response.failure("Error interno del servidor")
+            else:
+                response.failure(f"Error: {response.status_code}")
+                logger.error(f"Error en consulta de {route.entidad}: {response.status_code} - {response.text}")
+    except Exception as e:
+        logger.error(f"Excepción durante obtención de {route.entidad}: {str(e)}")
+        report_failure(environment, client, route.metodo, f"({route.dominio}) - {url} [Exception]", e)
+
+
+def route_task(route):
+    """Task function con la firma habitual para una ruta declarada"""
+    def task(client, logger, environment, data_module):
+        run_route(route, client, logger, environment, data_module)
+
+    task.__name__ = task.__qualname__ = route.nombre
+    task.__doc__ = f"Prueba el endpoint {route.metodo} {route.ruta}"
+    task.route = route
+    return task
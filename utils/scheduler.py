@@ -0,0 +1,66 @@
+import argparse
+import bisect
+import itertools
+import os
+import random
+
+# Perfiles de ejecución disponibles
+PERFIL_FUNCIONAL = "functional"  # Barrido único de todos los endpoints y fin de la prueba
+PERFIL_CARGA = "load"            # Mezcla ponderada continua hasta el límite de tiempo
+PERFIL_ABIERTO = "open"          # Arribos a tasa fija (modelo abierto, utils/arrivals.py)
+PERFIL_TAMANO_PAGINA = "page-size"  # Barrido de tamaños de página de los endpoints paginados
+PERFIL_ESCRITURA = "write"       # Recorridos de escritura encadenados y lecturas de la mezcla (tasks/journeys.py)
+PERFILES_EJECUCION = [PERFIL_FUNCIONAL, PERFIL_CARGA, PERFIL_ABIERTO, PERFIL_TAMANO_PAGINA, PERFIL_ESCRITURA]
+# Perfiles que ejecutan la mezcla ponderada de endpoints
+PERFILES_CON_MEZCLA = [PERFIL_CARGA, PERFIL_ABIERTO, PERFIL_ESCRITURA]
+
+
+class WeightedSchedule:
+    """Selección ponderada de endpoints para el perfil de carga.
+
+    Se construye una sola vez por prueba y se comparte entre todos los
+    usuarios: es de solo lectura y cada selección es O(log n).
+    """
+
+    def __init__(self, entradas, mix_profile):
+        self.entradas = []
+        pesos = []
+        for entrada in entradas:
+            peso = mix_profile.get(entrada.dominio, 0) * entrada.peso
+            if peso > 0:
+                self.entradas.append(entrada)
+                pesos.append(peso)
+
+        if not self.entradas:
+            raise ValueError("El perfil de mezcla no incluye ningún endpoint ejecutable")
+
+        self.acumulados = list(itertools.accumulate(pesos))
+        self.total = self.acumulados[-1]
+
+    def pick(self, rng=random):
+        """Devuelve una entrada del registro al azar según su peso efectivo"""
+        return self.entradas[bisect.bisect_right(self.acumulados, rng.random() * self.total)]
+
+    def resumen(self):
+        """Proporción esperada de cada endpoint, útil para dejar constancia en el log"""
+        anterior = 0
+        proporciones = []
+        for entrada, acumulado in zip(self.entradas, self.acumulados):
+            proporciones.append((entrada.nombre, (acumulado - anterior) / self.total))
+            anterior = acumulado
+        return proporciones
+
+
+def selected_profile(argv):
+    """Perfil elegido con --test-profile o LOCUST_TEST_PROFILE (se lee antes de parsear las opciones)"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--test-profile", default=os.getenv("LOCUST_TEST_PROFILE", PERFIL_FUNCIONAL))
+    opciones, _ = parser.parse_known_args(argv)
+    return opciones.test_profile
+
+
+def build_schedule(entradas, mix_profiles, nombre_mix):
+    """Construye la selección ponderada para el perfil de mezcla indicado"""
+    if nombre_mix not in mix_profiles:
+        raise ValueError(f"Perfil de mezcla desconocido: {nombre_mix}. Disponibles: {', '.join(mix_profiles)}")
+    return WeightedSchedule(entradas, mix_profiles[nombre_mix])
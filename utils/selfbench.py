@@ -0,0 +1,379 @@
+"""Benchmark del propio harness: costo en el cliente de cada task function.
+
+Con la API real el tiempo de respuesta tapa lo que gasta el cliente, pero
+en una prueba de carga la CPU del generador es la que limita los RPS: un
+task que registra varios campos por ítem y agrupa la respuesta en loops
+(get_medios_pagos, por ejemplo) puede consumir más CPU en el cliente que
+el servidor en responder. Este benchmark ejecuta cada función del registro
+de tasks (tasks/registry.py) contra el servidor simulado sin latencia
+(utils/mock_server.py), en un solo proceso y sin Locust corriendo, y mide
+por request:
+
+- CPU del cliente (time.process_time: task, validación, logging, contexto
+  y la pila HTTP), también en múltiplos de un GET desnudo con el mismo
+  cliente y como sobrecosto respecto de ese GET
+- tiempo del servidor en armar la respuesta (encabezado Server-Timing del
+  servidor simulado) y la relación CPU del cliente / servidor
+- memoria asignada: pico por llamada medido con tracemalloc, en una pasada
+  aparte para no distorsionar la CPU
+- bytes de log que escribiría el archivo, con el mismo formato y nivel
+
+    python -m utils.selfbench                              # todos los endpoints
+    python -m utils.selfbench --route-group "medios_pagos|chapas" --iterations 50
+    python -m utils.selfbench --mode load --transport fast
+    python -m utils.selfbench --check                      # falla si el harness empeoró
+
+El ranking (de mayor a menor CPU por request) queda en el log y en
+logs/selfbench.csv. Cada corrida se agrega a logs/selfbench_history.csv;
+con --check se compara cada endpoint con la mediana de las últimas
+SELFBENCH_WINDOW corridas del historial con el mismo modo y transporte, y
+si la CPU (en múltiplos del GET desnudo, para que no dependa de la
+máquina), la memoria o los bytes de log por request empeoran más que
+--tolerance el comando termina con código 1 (y la corrida no se agrega al
+historial, para no correr la referencia). Con --host se mide contra otro
+servidor en lugar de levantar el simulado.
+"""
+import argparse
+import csv
+import logging
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from locust.clients import HttpSession
+from locust.contrib.fasthttp import FastHttpSession
+from locust.env import Environment
+
+from tasks.registry import filter_endpoints, get_endpoints
+from utils import connections, metrics, naming, paging, snapshot, synthetic, transport, validation
+from utils.auth import authenticate
+from utils.config import LOG_VERBOSITY_LEVELS, detect_environment, get_credentials_for_environment
+from utils.context import UserDataContext
+from utils.http import HarnessClient
+
+SELFBENCH_ITERATIONS = int(os.getenv("SELFBENCH_ITERATIONS", "20"))
+SELFBENCH_TOLERANCE = float(os.getenv("SELFBENCH_TOLERANCE", "0.25"))
+SELFBENCH_WINDOW = int(os.getenv("SELFBENCH_WINDOW", "5"))
+SELFBENCH_SEED = 1234
+
+# Llamadas medidas con tracemalloc (cada una es varias veces más lenta)
+ITERACIONES_MEMORIA = 3
+
+# Diferencias menores no cuentan como regresión aunque superen la tolerancia (ruido)
+MINIMO_CPU_RELATIVO = 0.1
+MINIMO_KB = 4.0
+MINIMO_BYTES_LOG = 32.0
+
+# Modo: verbosidad del log y validación de cada perfil de la prueba
+MODOS = {
+    "functional": ("full", validation.MODO_COMPLETO),
+    "load": ("load", validation.MODO_MUESTREO),
+}
+
+CSV_PATH = os.path.join("logs", "selfbench.csv")
+HISTORY_PATH = os.path.join("logs", "selfbench_history.csv")
+
+CAMPOS_CSV = ["endpoint", "dominio", "requests_llamada", "cpu_ms_request", "cpu_vs_get", "sobrecosto_ms_request", "servidor_ms_request",
+              "cpu_vs_servidor", "kb_pico_llamada", "bytes_log_request", "fallas"]
+CAMPOS_HISTORIAL = ["fecha", "commit", "modo", "transporte", "endpoint", "cpu_ms_request", "cpu_vs_get", "kb_pico_llamada", "bytes_log_request"]
+# Métrica del historial -> diferencia mínima para considerarla regresión. La CPU
+# se compara en múltiplos del GET desnudo de la misma corrida, que descuenta
+# la velocidad de la máquina (el historial puede venir de otros hosts de CI)
+METRICAS_CONTROLADAS = {"cpu_vs_get": MINIMO_CPU_RELATIVO, "kb_pico_llamada": MINIMO_KB, "bytes_log_request": MINIMO_BYTES_LOG}
+
+
+class _LogBytes(logging.Handler):
+    """Cuenta los bytes que el log escribiría en el archivo, con el mismo formato"""
+
+    def __init__(self, level):
+        super().__init__(level)
+        self.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        self.bytes = 0
+
+    def emit(self, record):
+        self.bytes += len(self.format(record).encode("utf-8")) + 1
+
+
+class _Requests:
+    """Requests informados por el cliente y tiempo del servidor (Server-Timing)"""
+
+    def __init__(self, environment):
+        self.cantidad = 0
+        self.fallas = 0
+        self.servidor_ms = 0.0
+        environment.events.request.add_listener(self.on_request)
+
+    def on_request(self, response=None, exception=None, **kwargs):
+        self.cantidad += 1
+        if exception is not None:
+            self.fallas += 1
+        encabezado = ""
+        try:
+            encabezado = response.headers.get("Server-Timing") or ""
+        except AttributeError:
+            pass
+        _, _, duracion = encabezado.partition("dur=")
+        if duracion:
+            self.servidor_ms += float(duracion.split(";")[0].split(",")[0])
+
+
+def _puerto_libre():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_mock(logger):
+    """Levanta utils/mock_server.py sin latencia en un puerto libre; devuelve el proceso y el host"""
+    puerto = _puerto_libre()
+    proceso = subprocess.Popen([sys.executable, "-m", "utils.mock_server", "--port", str(puerto)],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    limite = time.monotonic() + 15
+    while time.monotonic() < limite:
+        try:
+            socket.create_connection(("127.0.0.1", puerto), timeout=1).close()
+            logger.info(f"Servidor simulado en http://127.0.0.1:{puerto}")
+            return proceso, f"http://127.0.0.1:{puerto}"
+        except OSError:
+            time.sleep(0.1)
+    proceso.kill()
+    raise RuntimeError("El servidor simulado no respondió (python -m utils.mock_server)")
+
+
+def new_client(host, transporte, environment, logger, ambiente):
+    """Cliente como el de un usuario de la prueba: transporte, pool de conexiones y token"""
+    if transporte == transport.TRANSPORTE_FAST:
+        session = FastHttpSession(base_url=host, request_event=environment.events.request, user=None)
+    else:
+        session = HttpSession(base_url=host, request_event=environment.events.request, user=None)
+    client = transport.adapt(session)
+    connections.configure(client, connections.ESTRATEGIA_PERSISTENTE, connections.POOL_SIZE)
+    credenciales = get_credentials_for_environment(ambiente)
+    if not credenciales["username"]:
+        # El servidor simulado acepta cualquier usuario
+        credenciales = {"username": "selfbench", "password": "selfbench"}
+    token = authenticate(client, logger, credenciales)
+    if not token:
+        raise RuntimeError(f"No se pudo autenticar contra {host}")
+    client.headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+    return client
+
+
+def _llamar(funcion, http, *args):
+    try:
+        http.run_task(funcion, *args)
+    except Exception:
+        # Los tasks informan sus propias fallas; una excepción que se escapa también cuenta
+        return 1
+    return 0
+
+
+def measure(entrada, http, logger, environment, datos, requests_, log_bytes, iteraciones):
+    """Mide un endpoint: CPU, requests, tiempo del servidor y log por llamada; memoria en otra pasada"""
+    argumentos = (http, logger, environment, datos)
+    # Calentamiento: imports, cachés y caminos de primera vez fuera de la medición
+    _llamar(entrada.funcion, *argumentos)
+
+    cpu, cantidades, servidor, log, escapadas = [], [], [], [], 0
+    fallas_antes = requests_.fallas
+    for _ in range(iteraciones):
+        cantidad, servidor_ms, bytes_ = requests_.cantidad, requests_.servidor_ms, log_bytes.bytes
+        inicio = time.process_time()
+        escapadas += _llamar(entrada.funcion, *argumentos)
+        cpu.append((time.process_time() - inicio) * 1000)
+        cantidades.append(requests_.cantidad - cantidad)
+        servidor.append(requests_.servidor_ms - servidor_ms)
+        log.append(log_bytes.bytes - bytes_)
+    fallas = requests_.fallas - fallas_antes + escapadas
+
+    picos = []
+    tracemalloc.start()
+    try:
+        for _ in range(ITERACIONES_MEMORIA):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            _llamar(entrada.funcion, *argumentos)
+            picos.append((tracemalloc.get_traced_memory()[1] - base) / 1024)
+    finally:
+        tracemalloc.stop()
+
+    requests_llamada = statistics.mean(cantidades)
+    por_request = max(requests_llamada, 1)
+    cpu_request = statistics.median(cpu) / por_request
+    servidor_request = statistics.mean(servidor) / por_request
+    return {
+        "endpoint": entrada.nombre,
+        "dominio": entrada.dominio,
+        "requests_llamada": round(requests_llamada, 2),
+        "cpu_ms_request": round(cpu_request, 3),
+        "servidor_ms_request": round(servidor_request, 3),
+        "cpu_vs_servidor": round(cpu_request / servidor_request, 1) if servidor_request else "",
+        "kb_pico_llamada": round(statistics.median(picos), 1),
+        "bytes_log_request": round(statistics.mean(log) / por_request, 1),
+        "fallas": fallas,
+    }
+
+
+def bare_request_cpu(client, iteraciones):
+    """CPU por request de un GET sin task ni HarnessClient: el piso del transporte"""
+    client.get("/paises", name="(SELFBENCH) - /paises")
+    muestras = []
+    for _ in range(max(iteraciones, 20)):
+        inicio = time.process_time()
+        client.get("/paises", name="(SELFBENCH) - /paises")
+        muestras.append((time.process_time() - inicio) * 1000)
+    return statistics.median(muestras)
+
+
+def read_history(ruta, modo, transporte, ventana):
+    """Referencia por endpoint: mediana de las últimas corridas del historial con el mismo modo y transporte"""
+    if not os.path.exists(ruta):
+        return {}
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        filas = [fila for fila in csv.DictReader(archivo) if fila["modo"] == modo and fila["transporte"] == transporte]
+    corridas = sorted({fila["fecha"] for fila in filas})[-ventana:]
+    por_endpoint = {}
+    for fila in filas:
+        if fila["fecha"] in corridas:
+            por_endpoint.setdefault(fila["endpoint"], []).append(fila)
+    return {
+        endpoint: {metrica: statistics.median(float(fila[metrica]) for fila in filas_) for metrica in METRICAS_CONTROLADAS}
+        for endpoint, filas_ in por_endpoint.items()
+    }
+
+
+def regressions(resultados, referencia, tolerancia):
+    """Endpoints y métricas que empeoraron más que la tolerancia respecto de la referencia"""
+    encontradas = []
+    for resultado in resultados:
+        base = referencia.get(resultado["endpoint"])
+        if base is None:
+            continue
+        for metrica, minimo in METRICAS_CONTROLADAS.items():
+            actual, anterior = float(resultado[metrica]), base[metrica]
+            if actual > anterior * (1 + tolerancia) and actual - anterior > minimo:
+                encontradas.append((resultado["endpoint"], metrica, anterior, actual))
+    return encontradas
+
+
+def append_history(ruta, resultados, modo, transporte):
+    fecha = time.strftime("%Y-%m-%dT%H:%M:%S")
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=False).stdout.strip()
+    except OSError:
+        commit = ""
+    nuevo = not os.path.exists(ruta)
+    os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+    with open(ruta, "a", newline="", encoding="utf-8") as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=CAMPOS_HISTORIAL, extrasaction="ignore")
+        if nuevo:
+            escritor.writeheader()
+        for resultado in resultados:
+            escritor.writerow({**resultado, "fecha": fecha, "commit": commit, "modo": modo, "transporte": transporte})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.selfbench", description="Costo en el cliente de cada task function del harness")
+    parser.add_argument("--host", default=None, help="URL base de la API (por defecto levanta utils/mock_server.py sin latencia)")
+    parser.add_argument("--iterations", type=int, default=SELFBENCH_ITERATIONS, help="Llamadas medidas por endpoint")
+    parser.add_argument("--mode", choices=list(MODOS), default="functional", help="Verbosidad del log y validación del perfil functional o load")
+    parser.add_argument("--transport", choices=list(transport.TRANSPORTES), default=transport.TRANSPORTE_REQUESTS, help="Transporte HTTP")
+    parser.add_argument("--route-group", default="", help="Expresión regular sobre los nombres de los endpoints")
+    parser.add_argument("--read-only", action="store_true", help="Solo endpoints de lectura")
+    parser.add_argument("--check", action="store_true", help="Termina con código 1 si algún endpoint empeoró respecto del historial")
+    parser.add_argument("--tolerance", type=float, default=SELFBENCH_TOLERANCE, help="Empeoramiento relativo tolerado (0.25 = 25%%)")
+    parser.add_argument("--window", type=int, default=SELFBENCH_WINDOW, help="Corridas del historial que forman la referencia")
+    parser.add_argument("--csv", default=CSV_PATH, help="Archivo CSV con el ranking de la corrida")
+    parser.add_argument("--history", default=HISTORY_PATH, help="Historial de corridas")
+    parser.add_argument("--no-history", action="store_true", help="No agrega la corrida al historial")
+    opciones = parser.parse_args(argv if argv is not None else sys.argv[1:])
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    salida = logging.getLogger("base_unica_selfbench")
+
+    # Logger de los tasks: solo cuenta bytes, con el nivel del modo
+    verbosidad, modo_validacion = MODOS[opciones.mode]
+    log_bytes = _LogBytes(LOG_VERBOSITY_LEVELS[verbosidad])
+    logger = logging.getLogger("base_unica_test")
+    logger.handlers[:] = [log_bytes]
+    logger.setLevel(LOG_VERBOSITY_LEVELS[verbosidad])
+    logger.propagate = False
+    validation.set_mode(modo_validacion)
+
+    servidor = None
+    host = opciones.host
+    if host is None:
+        servidor, host = start_mock(salida)
+    try:
+        ambiente = detect_environment(host)
+        solo_lectura = opciones.read_only
+        if ambiente == "prod" and not solo_lectura:
+            salida.warning("Host de producción: solo endpoints de lectura")
+            solo_lectura = True
+
+        # Los mismos listeners por request que una prueba (utils/metrics.py, naming, paging, connections)
+        environment = Environment()
+        metrics.register_listeners(environment)
+        naming.register_breakdown(environment, False)
+        paging.register(environment, paging.ESTRATEGIA_PRIMERA)
+        connections.register(environment)
+        requests_ = _Requests(environment)
+
+        client = new_client(host, opciones.transport, environment, logger, ambiente)
+        datos = UserDataContext(snapshot.load(ambiente, salida), sinteticos=synthetic.generators(synthetic.SyntheticPool(semilla=SELFBENCH_SEED)))
+        http = HarnessClient(client)
+        entradas = filter_endpoints(get_endpoints(solo_lectura, sinteticos=True), opciones.route_group)
+
+        piso_ms = bare_request_cpu(client, opciones.iterations)
+        salida.info(f"{len(entradas)} endpoints, {opciones.iterations} llamadas cada uno, modo {opciones.mode}, "
+                     f"transporte {opciones.transport}; GET desnudo: {piso_ms:.3f} ms de CPU por request")
+        resultados = []
+        for entrada in entradas:
+            resultado = measure(entrada, http, logger, environment, datos, requests_, log_bytes, opciones.iterations)
+            resultado["sobrecosto_ms_request"] = round(max(0.0, resultado["cpu_ms_request"] - piso_ms), 3)
+            resultado["cpu_vs_get"] = round(resultado["cpu_ms_request"] / piso_ms, 2) if piso_ms else 0.0
+            resultados.append(resultado)
+    finally:
+        if servidor is not None:
+            servidor.terminate()
+            servidor.wait()
+
+    resultados.sort(key=lambda r: -r["cpu_ms_request"])
+    salida.info("=== COSTO DEL HARNESS POR REQUEST (mayor CPU primero) ===")
+    for r in resultados:
+        relacion = f"{r['cpu_vs_servidor']}x el servidor" if r["cpu_vs_servidor"] != "" else "sin Server-Timing"
+        salida.info(
+            f"{r['endpoint']:>45}: {r['cpu_ms_request']:7.3f} ms CPU ({r['sobrecosto_ms_request']:.3f} sobre el GET desnudo, {relacion}), "
+            f"{r['kb_pico_llamada']:8.1f} KB pico, {r['bytes_log_request']:8.0f} B de log, {r['requests_llamada']:g} requests/llamada"
+            + (f", {r['fallas']} fallas" if r["fallas"] else "")
+        )
+    os.makedirs(os.path.dirname(opciones.csv) or ".", exist_ok=True)
+    with open(opciones.csv, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=CAMPOS_CSV)
+        escritor.writeheader()
+        escritor.writerows(resultados)
+    salida.info(f"Ranking guardado en {opciones.csv}")
+
+    referencia = read_history(opciones.history, opciones.mode, opciones.transport, opciones.window)
+    encontradas = regressions(resultados, referencia, opciones.tolerance)
+    if not referencia:
+        salida.info(f"Sin corridas anteriores en {opciones.history} para modo {opciones.mode} y transporte {opciones.transport}")
+    for endpoint, metrica, anterior, actual in encontradas:
+        salida.warning(f"Regresión en {endpoint}: {metrica} {anterior:g} -> {actual:g} (+{(actual / anterior - 1) if anterior else 1:.0%})")
+    if referencia and not encontradas:
+        salida.info(f"Sin regresiones respecto de las últimas {opciones.window} corridas (tolerancia {opciones.tolerance:.0%})")
+
+    fallo = opciones.check and bool(encontradas)
+    if not opciones.no_history and not fallo:
+        append_history(opciones.history, resultados, opciones.mode, opciones.transport)
+        salida.info(f"Corrida agregada a {opciones.history}")
+    if fallo:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""Formas de carga (LoadTestShape) para pruebas de capacidad reproducibles.
+
+Se elige una con --load-shape o la variable LOCUST_LOAD_SHAPE:
+
+- step: escalones de usuarios para encontrar el punto de saturación
+- spike: carga base, un pico corto y recuperación
+- soak: rampa y carga sostenida durante horas
+- diurnal: repetición comprimida de la curva de tráfico de un día
+- knee: escalones hasta que el p95 o las fallas superan el límite (utils/knee.py)
+
+Los parámetros de cada forma dependen del ambiente detectado a partir del
+host (SHAPE_PARAMS) y se pueden ajustar con LOAD_SHAPE_PARAMS
+("steps=5,step_users=20"). En producción la cantidad de usuarios y la tasa
+de arranque se limitan a PROD_MAX_USERS y PROD_MAX_SPAWN_RATE; los
+perfiles de carga ya excluyen los endpoints de escritura en producción.
+
+La forma se lee al importar el locustfile (Locust busca las clases de
+forma antes de parsear las opciones), por eso --load-shape se toma
+directamente de la línea de comandos.
+"""
+import argparse
+import logging
+import math
+import os
+
+from locust import LoadTestShape
+from locust.runners import MasterRunner
+
+from utils import knee
+from utils.config import detect_environment
+
+PROD_MAX_USERS = int(os.getenv("PROD_MAX_USERS", "20"))
+PROD_MAX_SPAWN_RATE = float(os.getenv("PROD_MAX_SPAWN_RATE", "2"))
+
+# Fracción del pico de usuarios por hora del día (0 a 23): poco tráfico de
+# noche, picos a media mañana y al final de la tarde
+CURVA_DIARIA = [
+    0.05, 0.03, 0.02, 0.02, 0.03, 0.08, 0.20, 0.45, 0.75, 0.95, 1.00, 0.95,
+    0.80, 0.70, 0.75, 0.85, 0.90, 0.95, 0.85, 0.65, 0.45, 0.30, 0.15, 0.08,
+]
+
+# Parámetros por forma y ambiente; "default" aplica a los ambientes sin entrada propia
+SHAPE_PARAMS = {
+    "step": {
+        "default": {"step_users": 10, "step_duration": 120, "steps": 10, "spawn_rate": 5},
+        "prod": {"step_users": 2, "step_duration": 120, "steps": 5, "spawn_rate": 1},
+    },
+    "spike": {
+        "default": {"base_users": 10, "spike_users": 100, "warmup": 120, "spike_duration": 60, "recovery": 180, "spawn_rate": 50},
+        "prod": {"base_users": 2, "spike_users": 10, "warmup": 120, "spike_duration": 30, "recovery": 180, "spawn_rate": 2},
+    },
+    "soak": {
+        "default": {"users": 30, "ramp": 300, "duration": 4 * 3600},
+        "prod": {"users": 5, "ramp": 300, "duration": 3600},
+    },
+    "diurnal": {
+        # hour_duration: segundos que representan una hora del día
+        "default": {"peak_users": 50, "hour_duration": 150, "cycles": 1, "spawn_rate": 5},
+        "prod": {"peak_users": 10, "hour_duration": 150, "cycles": 1, "spawn_rate": 1},
+    },
+    "knee": {
+        # settle: segundos iniciales de cada escalón que no se miden; con el
+        # perfil "open" se sube la tasa (start_rate, step_rate) con users fijos
+        "default": {
+            "start_users": 5, "step_users": 5, "step_duration": 60, "settle": 15, "max_steps": 20, "spawn_rate": 5,
+            "p95_ms": 1000, "max_failure_ratio": 0.01, "users": 50, "start_rate": 5, "step_rate": 5,
+        },
+        "prod": {
+            "start_users": 1, "step_users": 1, "step_duration": 60, "settle": 15, "max_steps": 10, "spawn_rate": 1,
+            "p95_ms": 1000, "max_failure_ratio": 0.01, "users": 10, "start_rate": 1, "step_rate": 1,
+        },
+    },
+}
+
+
+def parse_overrides(texto):
+    """Convierte "steps=5,step_users=20" en {"steps": 5.0, "step_users": 20.0}"""
+    valores = {}
+    for par in (texto or "").split(","):
+        clave, igual, valor = par.partition("=")
+        if igual and clave.strip():
+            valores[clave.strip()] = float(valor)
+    return valores
+
+
+def shape_params(nombre, ambiente, overrides=None):
+    """Parámetros de una forma para un ambiente, con los ajustes y el límite de producción"""
+    por_ambiente = SHAPE_PARAMS[nombre]
+    parametros = dict(por_ambiente.get(ambiente, por_ambiente["default"]))
+    parametros.update(overrides or {})
+    if ambiente == "prod":
+        for clave in ("users", "step_users", "start_users", "base_users", "spike_users", "peak_users"):
+            if clave in parametros:
+                parametros[clave] = min(parametros[clave], PROD_MAX_USERS)
+        if "spawn_rate" in parametros:
+            parametros["spawn_rate"] = min(parametros["spawn_rate"], PROD_MAX_SPAWN_RATE)
+    return parametros
+
+
+class BaseShape(LoadTestShape):
+    """Forma de carga con parámetros por ambiente (resueltos en el primer tick)"""
+
+    abstract = True
+    nombre = None
+
+    def __init__(self):
+        super().__init__()
+        self.parametros = None
+
+    def params(self):
+        if self.parametros is None:
+            host = self.runner.environment.host if self.runner else None
+            ambiente = detect_environment(host)
+            self.parametros = shape_params(self.nombre, ambiente, parse_overrides(os.getenv("LOAD_SHAPE_PARAMS")))
+        return self.parametros
+
+    def tick(self):
+        return self.shape_tick(self.get_run_time(), self.params())
+
+
+class StepShape(BaseShape):
+    """Escalones de step_users usuarios cada step_duration segundos, hasta steps escalones"""
+
+    nombre = "step"
+
+    def shape_tick(self, t, p):
+        if t >= p["steps"] * p["step_duration"]:
+            return None
+        escalon = int(t // p["step_duration"]) + 1
+        return int(escalon * p["step_users"]), p["spawn_rate"]
+
+
+class SpikeShape(BaseShape):
+    """Carga base, pico de spike_users durante spike_duration segundos y recuperación"""
+
+    nombre = "spike"
+
+    def shape_tick(self, t, p):
+        if t < p["warmup"]:
+            return int(p["base_users"]), p["spawn_rate"]
+        if t < p["warmup"] + p["spike_duration"]:
+            return int(p["spike_users"]), p["spawn_rate"]
+        if t < p["warmup"] + p["spike_duration"] + p["recovery"]:
+            return int(p["base_users"]), p["spawn_rate"]
+        return None
+
+
+class SoakShape(BaseShape):
+    """Rampa lineal hasta users en ramp segundos y carga sostenida hasta duration"""
+
+    nombre = "soak"
+
+    def shape_tick(self, t, p):
+        if t >= p["duration"]:
+            return None
+        spawn_rate = max(1.0, p["users"] / p["ramp"]) if p["ramp"] > 0 else p["users"]
+        return int(p["users"]), spawn_rate
+
+
+class DiurnalShape(BaseShape):
+    """Curva de tráfico de un día (CURVA_DIARIA) comprimida: cada hora dura hour_duration segundos"""
+
+    nombre = "diurnal"
+
+    def shape_tick(self, t, p):
+        hora = int(t // p["hour_duration"])
+        if hora >= 24 * p["cycles"]:
+            return None
+        usuarios = max(1, math.ceil(CURVA_DIARIA[hora % 24] * p["peak_users"]))
+        return usuarios, p["spawn_rate"]
+
+
+class KneeShape(BaseShape):
+    """Escalones de carga hasta que el p95 o la proporción de fallas superan el límite.
+
+    Cada escalón dura step_duration segundos; se mide desde settle hasta el
+    final del escalón. Con el perfil "open" la cantidad de usuarios queda fija
+    en users y lo que sube es la tasa de arribos.
+    """
+
+    nombre = "knee"
+
+    def reset_time(self):
+        super().reset_time()
+        self._escalon = None
+        self._ventana = None
+        self._inicio_ventana = None
+        self._escalones = []
+        self._tasa_pendiente = None
+
+    def _por_tasa(self):
+        opciones = self.runner.environment.parsed_options if self.runner else None
+        return getattr(opciones, "test_profile", None) == "open"
+
+    def _carga(self, escalon, p):
+        if self._por_tasa():
+            tasa = p["start_rate"] + escalon * p["step_rate"]
+            # En modo distribuido la tasa es por worker: la carga ofrecida es la suma
+            if isinstance(self.runner, MasterRunner) and self.runner.worker_count:
+                return f"{tasa * self.runner.worker_count:g} arribos/s ({tasa:g} por worker, {self.runner.worker_count} workers)"
+            return f"{tasa:g} arribos/s"
+        return f"{int(p['start_users'] + escalon * p['step_users'])} usuarios"
+
+    def _cerrar_escalon(self, t, p):
+        """Mide el escalón que termina; devuelve el motivo de fin si no fue sostenible"""
+        if self._ventana is None:
+            return None
+        grupo, por_nombre = self._ventana.measure(self.runner.stats, t - self._inicio_ventana)
+        motivo = knee.breached(grupo, p["p95_ms"], p["max_failure_ratio"])
+        self._escalones.append({
+            "escalon": self._escalon + 1,
+            "carga": self._carga(self._escalon, p),
+            "grupo": grupo,
+            "por_nombre": por_nombre,
+            "sostenible": motivo is None,
+        })
+        return motivo
+
+    def _terminar(self, motivo):
+        knee.report(logging.getLogger("base_unica_test"), self._escalones, motivo)
+        return None
+
+    def shape_tick(self, t, p):
+        escalon = int(t // p["step_duration"])
+        if escalon != self._escalon:
+            motivo = self._cerrar_escalon(t, p)
+            if motivo:
+                return self._terminar(motivo)
+            if escalon >= p["max_steps"]:
+                return self._terminar(f"se alcanzaron los {int(p['max_steps'])} escalones sin superar el límite")
+            self._escalon = escalon
+            self._ventana = None
+            if self._por_tasa():
+                self._tasa_pendiente = p["start_rate"] + escalon * p["step_rate"]
+
+        # El generador de arribos se crea en test_start, después del primer tick
+        if self._tasa_pendiente is not None and knee.set_arrival_rate(self._tasa_pendiente):
+            self._tasa_pendiente = None
+        if self._ventana is None and t - escalon * p["step_duration"] >= p["settle"]:
+            self._ventana = knee.StatsWindow(self.runner.stats, arribos=self._por_tasa())
+            self._inicio_ventana = t
+
+        if self._por_tasa():
+            return int(p["users"]), p["spawn_rate"]
+        return int(p["start_users"] + escalon * p["step_users"]), p["spawn_rate"]
+
+
+SHAPES = {shape.nombre: shape for shape in (StepShape, SpikeShape, SoakShape, DiurnalShape, KneeShape)}
+
+
+def selected_shape(argv):
+    """Clase de la forma elegida con --load-shape o LOCUST_LOAD_SHAPE, o None"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--load-shape", default=os.getenv("LOCUST_LOAD_SHAPE"))
+    opciones, _ = parser.parse_known_args(argv)
+    if not opciones.load_shape:
+        return None
+    if opciones.load_shape not in SHAPES:
+        raise ValueError(f"Forma de carga desconocida: {opciones.load_shape}. Disponibles: {', '.join(SHAPES)}")
+    return SHAPES[opciones.load_shape]
@@ -0,0 +1,238 @@
+"""Snapshot precompilado de los datos de cada ambiente.
+
+Antes cada test_start importaba los módulos de data/<ambiente>/ (hasta 28
+candidatos, con un log por intento) y copiaba cada atributo a un módulo
+nuevo. Ahora los datos se compilan una vez en data/snapshots/<ambiente>.msgpack:
+
+- se validan (solo str, int, float, bool, None, listas y diccionarios)
+- se guardan con el hash SHA-256 del contenido, que se verifica al leerlos
+- se registran el tamaño y la fecha de los .py de origen: si alguno cambió
+  el snapshot se vuelve a compilar automáticamente
+
+En tiempo de ejecución el snapshot se lee de una vez y queda en memoria
+para las siguientes pruebas del mismo proceso (reinicios desde la interfaz
+web). Los datos se entregan congelados (FrozenList, FrozenDict): ningún
+task puede modificar los datos compartidos. copy.deepcopy devuelve una
+copia modificable, que es lo que hace UserDataContext (utils/context.py)
+con los contenedores que usa cada usuario.
+
+Compilación manual (por ejemplo en el pipeline de CI):
+
+    python -m utils.snapshot            # todos los ambientes de data/
+    python -m utils.snapshot dev stage
+"""
+import glob
+import hashlib
+import logging
+import os
+import sys
+
+import msgpack
+
+SNAPSHOT_VERSION = 1
+
+_RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(_RAIZ, "data")
+SNAPSHOT_DIR = os.getenv("DATA_SNAPSHOT_DIR", os.path.join(DATA_DIR, "snapshots"))
+
+# Ambiente -> (huella de los archivos de origen, datos congelados)
+_cache = {}
+
+
+def _solo_lectura(*args, **kwargs):
+    raise TypeError("Los datos del ambiente son de solo lectura: usar una copia (copy.deepcopy) para modificarlos")
+
+
+class FrozenList(list):
+    """Lista de los datos del ambiente que no se puede modificar"""
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _solo_lectura
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _solo_lectura
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+class FrozenDict(dict):
+    """Diccionario de los datos del ambiente que no se puede modificar"""
+
+    pop = popitem = clear = update = setdefault = _solo_lectura
+    __setitem__ = __delitem__ = __ior__ = _solo_lectura
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+def freeze(valor):
+    if isinstance(valor, dict):
+        return FrozenDict((clave, freeze(v)) for clave, v in valor.items())
+    if isinstance(valor, (list, tuple)):
+        return FrozenList(freeze(v) for v in valor)
+    return valor
+
+
+def thaw(valor):
+    """Copia modificable (listas y diccionarios comunes) de un valor congelado"""
+    if isinstance(valor, dict):
+        return {clave: thaw(v) for clave, v in valor.items()}
+    if isinstance(valor, list):
+        return [thaw(v) for v in valor]
+    return valor
+
+
+class EnvironmentData:
+    """Datos del ambiente de solo lectura, con la misma interfaz que el módulo combinado"""
+
+    def __init__(self, datos, ambiente=None, hash_contenido=None):
+        object.__setattr__(self, "_datos", datos)
+        object.__setattr__(self, "ambiente_snapshot", ambiente)
+        object.__setattr__(self, "hash_snapshot", hash_contenido)
+
+    def __getattr__(self, name):
+        if name == "_datos":
+            raise AttributeError(name)
+        try:
+            return self._datos[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        _solo_lectura()
+
+    def __delattr__(self, name):
+        _solo_lectura()
+
+    def __dir__(self):
+        return list(self._datos)
+
+    def to_dict(self):
+        return self._datos
+
+
+def snapshot_path(ambiente):
+    return os.path.join(SNAPSHOT_DIR, f"{ambiente}.msgpack")
+
+
+def source_fingerprint(ambiente):
+    """Tamaño y fecha de modificación de los .py de data/<ambiente>/ (y de data/prod/, la alternativa)"""
+    huella = {}
+    for carpeta in dict.fromkeys([ambiente, "prod"]):
+        for ruta in sorted(glob.glob(os.path.join(DATA_DIR, carpeta, "*.py"))):
+            estado = os.stat(ruta)
+            huella[os.path.relpath(ruta, DATA_DIR)] = [estado.st_size, estado.st_mtime_ns]
+    return huella
+
+
+def _validar(valor, ruta):
+    if valor is None or isinstance(valor, (str, int, float, bool)):
+        return
+    if isinstance(valor, (list, tuple)):
+        for indice, elemento in enumerate(valor):
+            _validar(elemento, f"{ruta}[{indice}]")
+        return
+    if isinstance(valor, dict):
+        for clave, elemento in valor.items():
+            if not isinstance(clave, (str, int)):
+                raise ValueError(f"Clave no soportada en {ruta}: {clave!r}")
+            _validar(elemento, f"{ruta}[{clave!r}]")
+        return
+    raise ValueError(f"Tipo no soportado en {ruta}: {type(valor).__name__}")
+
+
+def collect(data_module):
+    """Atributos de datos del módulo combinado, validados (se omiten módulos, funciones y clases)"""
+    datos = {}
+    for nombre in dir(data_module):
+        if nombre.startswith("__"):
+            continue
+        valor = getattr(data_module, nombre)
+        if callable(valor) or type(valor).__name__ == "module":
+            continue
+        _validar(valor, nombre)
+        datos[nombre] = valor
+    return datos
+
+
+def build(ambiente, logger):
+    """Importa los módulos de datos del ambiente y escribe el snapshot; devuelve su ruta y hash"""
+    from utils.config import import_data_for_environment
+
+    huella = source_fingerprint(ambiente)
+    datos = collect(import_data_for_environment(ambiente, logger))
+    contenido = msgpack.packb(datos)
+    hash_contenido = hashlib.sha256(contenido).hexdigest()
+
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    ruta = snapshot_path(ambiente)
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(msgpack.packb({
+            "version": SNAPSHOT_VERSION,
+            "ambiente": ambiente,
+            "fuentes": huella,
+            "hash": hash_contenido,
+            "datos": contenido,
+        }))
+    # Reemplazo atómico: otros procesos (workers) nunca leen un archivo a medio escribir
+    os.replace(temporal, ruta)
+    logger.info(f"Snapshot de datos de {ambiente} compilado: {ruta} ({len(datos)} atributos, sha256 {hash_contenido[:12]})")
+    return ruta, hash_contenido
+
+
+def _leer(ambiente, huella):
+    """Datos del snapshot en disco si existe, es de esta versión, coincide con los .py y su hash es válido"""
+    try:
+        with open(snapshot_path(ambiente), "rb") as archivo:
+            encabezado = msgpack.unpackb(archivo.read(), strict_map_key=False)
+    except (OSError, ValueError, msgpack.UnpackException):
+        return None
+    if encabezado.get("version") != SNAPSHOT_VERSION or encabezado.get("fuentes") != huella:
+        return None
+    contenido = encabezado["datos"]
+    if hashlib.sha256(contenido).hexdigest() != encabezado["hash"]:
+        return None
+    return msgpack.unpackb(contenido, strict_map_key=False), encabezado["hash"]
+
+
+def load(ambiente, logger):
+    """Datos congelados del ambiente: desde memoria, desde el snapshot o compilándolo"""
+    huella = source_fingerprint(ambiente)
+    en_memoria = _cache.get(ambiente)
+    if en_memoria is not None and en_memoria[0] == huella:
+        logger.info(f"Datos de {ambiente} en memoria (sha256 {en_memoria[1].hash_snapshot[:12]})")
+        return en_memoria[1]
+
+    leido = _leer(ambiente, huella)
+    if leido is None:
+        logger.info(f"Snapshot de datos de {ambiente} inexistente o desactualizado: se compila")
+        build(ambiente, logger)
+        leido = _leer(ambiente, huella)
+    if leido is None:
+        raise RuntimeError(f"No se pudo leer el snapshot de datos recién compilado: {snapshot_path(ambiente)}")
+
+    datos, hash_contenido = leido
+    entorno = EnvironmentData(freeze(datos), ambiente, hash_contenido)
+    _cache[ambiente] = (huella, entorno)
+    logger.info(f"Datos de {ambiente} cargados desde {snapshot_path(ambiente)} ({len(datos)} atributos, sha256 {hash_contenido[:12]})")
+    return entorno
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logger = logging.getLogger("base_unica_snapshot")
+    ambientes = (argv if argv is not None else sys.argv[1:]) or sorted(
+        nombre for nombre in os.listdir(DATA_DIR)
+        if nombre != os.path.basename(SNAPSHOT_DIR) and os.path.isdir(os.path.join(DATA_DIR, nombre)) and not nombre.startswith(("_", "."))
+    )
+    for ambiente in ambientes:
+        build(ambiente, logger)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""Datos sintéticos para cargas de escritura con alta cardinalidad.
+
+Los endpoints de escritura usaban siempre el mismo body (un solo CUIL, un
+solo CUIT), así que una prueba de carga de escritura terminaba actualizando
+un mismo registro y no ejercitaba los índices ni las claves únicas. Con
+--synthetic-data cada lectura de un body de escritura del contexto del
+usuario devuelve una copia de la plantilla del ambiente con datos nuevos:
+
+- personas: DNI único, sexo, CUIL con dígito verificador válido, nombre,
+  apellido y fecha de nacimiento
+- personas jurídicas: CUIT de empresa único y válido, razón social
+- proveedores (altas PF y PJ): CUIL o CUIT nuevo y, si el body lo lleva, CBU
+- domicilios: altura, piso, departamento y observaciones variables (los IDs
+  de localidad, barrio y calle de la plantilla se mantienen)
+
+Las identidades se generan por adelantado en un pool compacto (arrays de
+enteros, 9 bytes por identidad) y se arman al tomarlas. Los DNIs
+salen de una permutación del rango SYNTHETIC_DNI_BASE +
+[0, SYNTHETIC_DNI_SPAN) definida por la semilla, sin repetirse dentro de
+una prueba; en modo distribuido cada worker usa un bloque propio del
+rango. Con la misma semilla (--synthetic-seed) se repiten los mismos datos.
+"""
+import array
+import datetime
+import math
+import os
+import random
+from collections import namedtuple
+
+# Identidades pregeneradas por tanda; al agotarse se genera otra tanda
+SYNTHETIC_POOL_SIZE = int(os.getenv("SYNTHETIC_POOL_SIZE", "20000"))
+# Rango de DNIs sintéticos, por encima de los DNIs emitidos para no chocar con personas reales
+SYNTHETIC_DNI_BASE = int(os.getenv("SYNTHETIC_DNI_BASE", "70000000"))
+SYNTHETIC_DNI_SPAN = int(os.getenv("SYNTHETIC_DNI_SPAN", "10000000"))
+# Cantidad máxima de workers: el rango se divide en este número de bloques
+SYNTHETIC_MAX_WORKERS = int(os.getenv("SYNTHETIC_MAX_WORKERS", "64"))
+
+PESOS_CUIT = (5, 4, 3, 2, 7, 6, 5, 4, 3, 2)
+
+# Sexo: (código de la API, prefijo del CUIL)
+SEXO_MASCULINO = ("01", "20")
+SEXO_FEMENINO = ("02", "27")
+
+NOMBRES_MASCULINOS = (
+    "JUAN", "CARLOS", "JOSE", "LUIS", "JORGE", "MIGUEL", "DANIEL", "SANTIAGO", "MATEO", "FACUNDO",
+    "LUCAS", "MARTIN", "NICOLAS", "DIEGO", "PABLO", "GONZALO", "AGUSTIN", "TOMAS", "MARCOS", "RAMIRO",
+)
+NOMBRES_FEMENINOS = (
+    "MARIA", "ANA", "LAURA", "SOFIA", "VALENTINA", "CAMILA", "LUCIA", "FLORENCIA", "MARTINA", "JULIETA",
+    "CAROLINA", "GABRIELA", "PAULA", "SILVINA", "ROCIO", "MICAELA", "AGUSTINA", "NATALIA", "VERONICA", "CECILIA",
+)
+APELLIDOS = (
+    "GONZALEZ", "RODRIGUEZ", "GOMEZ", "FERNANDEZ", "LOPEZ", "DIAZ", "MARTINEZ", "PEREZ", "GARCIA", "SANCHEZ",
+    "ROMERO", "SOSA", "ALVAREZ", "TORRES", "RUIZ", "RAMIREZ", "FLORES", "ACOSTA", "BENITEZ", "MEDINA",
+    "SUAREZ", "HERRERA", "AGUIRRE", "PEREYRA", "GUTIERREZ", "GIMENEZ", "MOLINA", "SILVA", "CASTRO", "ROJAS",
+)
+PALABRAS_RAZON_SOCIAL = (
+    "SERVICIOS", "CONSTRUCCIONES", "DISTRIBUIDORA", "COMERCIAL", "INDUSTRIAS", "LOGISTICA", "AGRO", "TECNOLOGIA",
+    "CORDOBA", "MEDITERRANEA", "SIERRAS", "CENTRO", "LITORAL", "ANDINA", "PAMPA", "NORTE",
+)
+TIPOS_SOCIEDAD = ("S.A.", "S.R.L.", "S.A.S.")
+
+# Fechas de nacimiento: días desde FECHA_BASE (entran en un entero sin signo de 16 bits)
+FECHA_BASE = datetime.date(1940, 1, 1)
+DIAS_NACIMIENTO = (datetime.date(2005, 12, 31) - FECHA_BASE).days
+
+# Multiplicador de la permutación de DNIs (debe ser coprimo con SYNTHETIC_DNI_SPAN)
+_MULTIPLICADOR = 7_368_787
+
+Identidad = namedtuple("Identidad", ["dni", "sexo", "cuil", "nombre", "apellido", "fecha_nacimiento"])
+Empresa = namedtuple("Empresa", ["cuit", "razon_social", "nombre_fantasia"])
+
+
+def check_digit(base):
+    """Dígito verificador de un CUIL/CUIT de 10 dígitos (prefijo + número); 10 si no tiene uno válido"""
+    resto = sum(int(digito) * peso for digito, peso in zip(base, PESOS_CUIT)) % 11
+    return 0 if resto == 0 else 11 - resto
+
+
+def _digito(prefijo, numero):
+    # check_digit sin pasar por texto: pesos de los 8 dígitos del número desde el menos significativo
+    total = (prefijo // 10) * 5 + (prefijo % 10) * 4
+    for peso in (2, 3, 4, 5, 6, 7, 2, 3):
+        numero, digito = divmod(numero, 10)
+        total += digito * peso
+    resto = total % 11
+    return 0 if resto == 0 else 11 - resto
+
+
+def build_cuit(prefijo, numero, prefijo_alternativo):
+    """CUIL/CUIT válido; si el dígito da 10 se usa el prefijo alternativo (23 o 33), o None"""
+    for actual in (prefijo, prefijo_alternativo):
+        digito = _digito(int(actual), numero)
+        if digito < 10:
+            return f"{actual}{numero:08d}{digito}"
+    return None
+
+
+def cuil(dni, sexo):
+    return build_cuit(sexo[1], dni, "23")
+
+
+def cuit_empresa(numero):
+    return build_cuit("30", numero, "33")
+
+
+def is_valid_cuit(valor):
+    valor = str(valor)
+    return len(valor) == 11 and valor.isdigit() and check_digit(valor[:10]) == int(valor[10])
+
+
+class SyntheticPool:
+    """Identidades únicas pregeneradas en arrays compactos, tomadas en orden"""
+
+    def __init__(self, tamano=SYNTHETIC_POOL_SIZE, semilla=None, bloque=0, span=SYNTHETIC_DNI_SPAN, max_workers=SYNTHETIC_MAX_WORKERS):
+        if math.gcd(_MULTIPLICADOR, span) != 1:
+            raise ValueError(f"SYNTHETIC_DNI_SPAN ({span}) debe ser coprimo con {_MULTIPLICADOR}")
+        self.semilla = semilla if semilla is not None else random.randrange(2**31)
+        self.rng = random.Random(self.semilla)
+        self.tamano = tamano
+        self.span = span
+        # Bloque del rango de índices que corresponde a este proceso
+        self._limite_bloque = span // max_workers
+        self._inicio_bloque = (bloque % max_workers) * self._limite_bloque
+        self._desplazamiento = self.rng.randrange(span)
+        self._siguiente_indice = 0
+        self._dnis = array.array("I")
+        self._sexos = array.array("B")
+        self._nombres = array.array("B")
+        self._apellidos = array.array("B")
+        self._nacimientos = array.array("H")
+        self._cursor = 0
+        self._empresas = 0
+        self._generar()
+
+    def _numero(self, indice):
+        return SYNTHETIC_DNI_BASE + (_MULTIPLICADOR * (self._inicio_bloque + indice) + self._desplazamiento) % self.span
+
+    def _generar(self):
+        """Agrega tamano identidades al pool (o las que queden en el bloque)"""
+        nuevas = 0
+        while nuevas < self.tamano and self._siguiente_indice < self._limite_bloque:
+            dni = self._numero(self._siguiente_indice)
+            self._siguiente_indice += 1
+            sexo = self.rng.randrange(2)
+            if cuil(dni, SEXO_FEMENINO if sexo else SEXO_MASCULINO) is None:
+                continue
+            self._dnis.append(dni)
+            self._sexos.append(sexo)
+            self._nombres.append(self.rng.randrange(len(NOMBRES_FEMENINOS if sexo else NOMBRES_MASCULINOS)))
+            self._apellidos.append(self.rng.randrange(len(APELLIDOS)))
+            self._nacimientos.append(self.rng.randrange(DIAS_NACIMIENTO))
+            nuevas += 1
+        if not nuevas:
+            raise RuntimeError("Se agotó el rango de DNIs sintéticos de este proceso: cambiar la semilla o SYNTHETIC_DNI_BASE")
+
+    def __len__(self):
+        return len(self._dnis) - self._cursor
+
+    def take(self):
+        """Siguiente identidad sin usar"""
+        if self._cursor >= len(self._dnis):
+            self._generar()
+        i = self._cursor
+        self._cursor += 1
+        sexo = SEXO_FEMENINO if self._sexos[i] else SEXO_MASCULINO
+        nombres = NOMBRES_FEMENINOS if self._sexos[i] else NOMBRES_MASCULINOS
+        return Identidad(
+            dni=str(self._dnis[i]),
+            sexo=sexo[0],
+            cuil=cuil(self._dnis[i], sexo),
+            nombre=nombres[self._nombres[i]],
+            apellido=APELLIDOS[self._apellidos[i]],
+            fecha_nacimiento=(FECHA_BASE + datetime.timedelta(days=self._nacimientos[i])).isoformat(),
+        )
+
+    def take_company(self):
+        """Siguiente empresa sin usar (CUIT 30/33 sobre el mismo rango de números)"""
+        while True:
+            # Desde el final del bloque hacia el inicio; más allá está el bloque de otro proceso
+            if self._empresas >= self._limite_bloque:
+                raise RuntimeError("Se agotó el rango de CUITs sintéticos de este proceso: cambiar la semilla o SYNTHETIC_DNI_BASE")
+            numero = self._numero(self._limite_bloque - 1 - self._empresas)
+            self._empresas += 1
+            cuit = cuit_empresa(numero)
+            if cuit is not None:
+                break
+        palabras = self.rng.sample(PALABRAS_RAZON_SOCIAL, 2)
+        return Empresa(
+            cuit=cuit,
+            razon_social=f"{' '.join(palabras)} {self.rng.choice(TIPOS_SOCIEDAD)}",
+            nombre_fantasia=f"{palabras[0]} {numero % 1000:03d}",
+        )
+
+
+def persona_body(plantilla, identidad):
+    """Body de persona física con los campos de la plantilla completados con la identidad"""
+    body = dict(plantilla)
+    valores = {
+        "p_cuil": identidad.cuil,
+        "p_cuit_cuil": identidad.cuil,
+        "p_dni": identidad.dni,
+        "p_sexo": identidad.sexo,
+        "p_nombre": identidad.nombre,
+        "p_apellido": identidad.apellido,
+        "p_fecha_nacimiento": identidad.fecha_nacimiento,
+    }
+    body.update({campo: valor for campo, valor in valores.items() if campo in body})
+    return body
+
+
+def persona_juridica_body(plantilla, empresa):
+    body = dict(plantilla)
+    valores = {"p_cuit": empresa.cuit, "p_cuit_cuil": empresa.cuit, "p_razon_social": empresa.razon_social, "p_nombre_fantasia": empresa.nombre_fantasia}
+    body.update({campo: valor for campo, valor in valores.items() if campo in body})
+    return body
+
+
+def proveedor_body(plantilla, pool):
+    """Proveedor PF o PJ (según la plantilla) con CUIL/CUIT nuevo y, si lo lleva, CBU al azar"""
+    if "PJ" in (plantilla.get("p_tipo_persona"), plantilla.get("p_tipo_proveedor")):
+        body = persona_juridica_body(plantilla, pool.take_company())
+    else:
+        body = persona_body(plantilla, pool.take())
+    if "p_cbu" in body:
+        body["p_cbu"] = f"{pool.rng.randrange(10**22):022d}"
+    return body
+
+
+def domicilio_body(plantilla, rng):
+    """Domicilio con los IDs de la plantilla y altura, piso, departamento y observaciones variables"""
+    body = dict(plantilla)
+    valores = {
+        "p_altura": str(rng.randint(1, 9999)),
+        "p_piso": str(rng.randint(0, 30)),
+        "p_dpto": rng.choice("ABCDEFGH"),
+        "p_observaciones": f"SINTETICO {rng.randrange(10**8):08d}",
+    }
+    body.update({campo: valor for campo, valor in valores.items() if campo in body})
+    return body
+
+
+def generators(pool):
+    """Bodies de escritura del ambiente que se reemplazan por datos sintéticos.
+
+    Cada función recibe la plantilla del ambiente y devuelve un body nuevo.
+    """
+    def persona(plantilla):
+        return persona_body(plantilla, pool.take())
+
+    def personas_juridicas(plantillas):
+        # Los tasks eligen uno al azar de la lista
+        return [persona_juridica_body(random.choice(plantillas), pool.take_company())]
+
+    def domicilio(plantilla):
+        return domicilio_body(plantilla, pool.rng)
+
+    def proveedor(plantilla):
+        return proveedor_body(plantilla, pool)
+
+    return {
+        "body_insertar_persona_fisica": persona,
+        "body_insertar_persona_fisica_by_dni": persona,
+        "body_insertar_persona_fisica_simplificada": persona,
+        "body_insertar_persona_juridica": personas_juridicas,
+        "body_insertar_domicilio_comercial": domicilio,
+        "body_insertar_domicilio_ampliado": domicilio,
+        "body_insertar_domicilio_geo": domicilio,
+        "body_insertar_domicilio_persona_fisica": domicilio,
+        "body_insertar_proveedor_pf": proveedor,
+        "body_insertar_proveedor_pj": proveedor,
+        "body_alta_proveedor_pf": proveedor,
+        "body_alta_proveedor_pj": proveedor,
+        "body_alta_cbu_banco_proveedor_pf": proveedor,
+        "body_alta_cbu_banco_proveedor_pj": proveedor,
+    }
@@ -0,0 +1,175 @@
+"""Baja de los registros creados durante la prueba (utils/journal.py).
+
+Las pruebas de escritura en dev y stage dejan personas, domicilios,
+incidentes y proveedores que se acumulan y hacen crecer las mismas tablas
+que se miden. Con los archivos de registro se dan de baja en bloque, con
+una cantidad acotada de requests concurrentes, para que pruebas repetidas
+arranquen con el mismo volumen de datos:
+
+- al terminar la prueba, con --teardown: cada proceso (o cada worker) da
+  de baja lo que registró
+- después, desde la línea de comandos:
+
+    python -m utils.teardown                        # todos los archivos de logs/journal/
+    python -m utils.teardown logs/journal/dev-*.journal --concurrency 8 --dry-run
+
+Los tipos se dan de baja en el orden de ORDEN_BAJA (primero lo que depende
+de otros registros) y dentro de cada tipo en paralelo, con hasta
+TEARDOWN_CONCURRENCY requests a la vez (4 por defecto). Un 404 cuenta como
+ya dado de baja. Lo dado de baja se agrega a <archivo>.done, así que volver
+a ejecutar la baja solo reintenta lo que falló.
+
+Las rutas de baja por tipo están en RUTAS_BAJA y se pueden reemplazar con
+TEARDOWN_ROUTES, por ejemplo para desactivar en lugar de borrar:
+
+    TEARDOWN_ROUTES="domicilio=PATCH /domicilios/{id}/baja;incidente="
+
+(un tipo sin ruta no se da de baja).
+"""
+import argparse
+import glob
+import logging
+import os
+import sys
+from collections import Counter
+from urllib.parse import quote
+
+from gevent.pool import Pool
+from locust.clients import HttpSession
+from locust.event import EventHook
+
+from utils import journal
+
+TEARDOWN_CONCURRENCY = int(os.getenv("TEARDOWN_CONCURRENCY", "4"))
+
+# Primero lo que depende de otros registros
+ORDEN_BAJA = ["incidente", "domicilio_persona_fisica", "proveedor", "domicilio", "persona_fisica"]
+
+RUTAS_BAJA = {
+    "incidente": ("DELETE", "/incidente/{id}"),
+    "domicilio_persona_fisica": ("DELETE", "/personas-fisicas/domicilios/{id}"),
+    "proveedor": ("DELETE", "/proveedores/{id}"),
+    "domicilio": ("DELETE", "/domicilios/{id}"),
+    "persona_fisica": ("DELETE", "/personas-fisicas/{id}"),
+}
+
+
+def routes(config=None):
+    """Rutas de baja por tipo, con los reemplazos de TEARDOWN_ROUTES"""
+    rutas = dict(RUTAS_BAJA)
+    config = os.getenv("TEARDOWN_ROUTES", "") if config is None else config
+    for item in filter(None, (parte.strip() for parte in config.split(";"))):
+        tipo, _, valor = item.partition("=")
+        if not valor.strip():
+            rutas[tipo.strip()] = None
+            continue
+        metodo, _, ruta = valor.strip().partition(" ")
+        if not ruta:
+            raise ValueError(f"Ruta de baja inválida para {tipo}: '{valor}' (formato: METODO /ruta/{{id}})")
+        rutas[tipo.strip()] = (metodo.upper(), ruta.strip())
+    return rutas
+
+
+def pending(ruta):
+    """Encabezado y entradas del archivo de registro que todavía no se dieron de baja"""
+    encabezado, entradas = journal.read(ruta)
+    hechas = set()
+    if os.path.exists(f"{ruta}.done"):
+        _, hechas = journal.read(f"{ruta}.done")
+        hechas = set(hechas)
+    return encabezado, [entrada for entrada in entradas if entrada not in hechas]
+
+
+def new_session(host, token=None):
+    """Sesión HTTP propia: los requests de baja no se mezclan con las estadísticas de la prueba"""
+    session = HttpSession(base_url=host, request_event=EventHook(), user=None)
+    if token:
+        session.headers.update({"Authorization": f"Bearer {token}", "Content-Type": "application/json"})
+    return session
+
+
+def _baja(session, metodo, ruta, valor):
+    try:
+        response = session.request(metodo, ruta.format(id=quote(valor, safe="")), name=f"(TEARDOWN) - {ruta}")
+    except Exception as e:
+        return valor, None, str(e)
+    return valor, response.status_code, None
+
+
+def run(session, logger, ruta, concurrencia=TEARDOWN_CONCURRENCY, dry_run=False, rutas=None):
+    """Da de baja las entradas pendientes de un archivo de registro; devuelve los totales por tipo"""
+    rutas = routes() if rutas is None else rutas
+    _, entradas = pending(ruta)
+    por_tipo = {}
+    for tipo, valor in entradas:
+        por_tipo.setdefault(tipo, []).append(valor)
+
+    totales = {}
+    pool = Pool(max(1, concurrencia))
+    with open(f"{ruta}.done", "a", encoding="utf-8") as hechas:
+        for tipo in ORDEN_BAJA + sorted(set(por_tipo) - set(ORDEN_BAJA)):
+            ids = por_tipo.get(tipo)
+            if not ids:
+                continue
+            resultado = totales[tipo] = Counter()
+            if rutas.get(tipo) is None:
+                resultado["sin ruta"] = len(ids)
+                logger.warning(f"Baja de {tipo}: sin ruta configurada, {len(ids)} registros sin tocar")
+                continue
+            metodo, plantilla = rutas[tipo]
+            if dry_run:
+                resultado["pendientes"] = len(ids)
+                logger.info(f"Baja de {tipo} (simulada): {len(ids)} x {metodo} {plantilla}")
+                continue
+            for valor, status, error in pool.imap_unordered(lambda valor: _baja(session, metodo, plantilla, valor), ids):
+                if status is not None and (200 <= status < 300 or status == 404):
+                    resultado["dados de baja" if status != 404 else "inexistentes"] += 1
+                    hechas.write(f"{tipo} {valor}\n")
+                else:
+                    resultado["fallidos"] += 1
+                    logger.warning(f"Baja de {tipo} {valor} fallida: {error or f'HTTP {status}'}")
+            logger.info(f"Baja de {tipo}: {dict(resultado)}")
+    return totales
+
+
+def main(argv=None):
+    from utils.auth import authenticate
+    from utils.config import get_credentials_for_environment
+
+    parser = argparse.ArgumentParser(prog="python -m utils.teardown", description="Da de baja los registros creados durante las pruebas")
+    parser.add_argument("journals", nargs="*", help=f"Archivos de registro (por defecto todos los de {journal.JOURNAL_DIR})")
+    parser.add_argument("--host", default=None, help="URL base de la API (por defecto la del archivo de registro)")
+    parser.add_argument("--concurrency", type=int, default=TEARDOWN_CONCURRENCY, help="Requests de baja concurrentes")
+    parser.add_argument("--dry-run", action="store_true", help="Solo informa qué se daría de baja")
+    opciones = parser.parse_args(argv if argv is not None else sys.argv[1:])
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logger = logging.getLogger("base_unica_teardown")
+    rutas = routes()
+    archivos = opciones.journals or sorted(glob.glob(os.path.join(journal.JOURNAL_DIR, "*.journal")))
+    if not archivos:
+        logger.info(f"No hay archivos de registro en {journal.JOURNAL_DIR}")
+        return
+
+    sesiones = {}
+    for ruta in archivos:
+        encabezado, entradas = pending(ruta)
+        logger.info(f"{ruta}: {len(entradas)} registros pendientes de baja")
+        if not entradas:
+            continue
+        host = opciones.host or encabezado.get("host")
+        ambiente = encabezado.get("ambiente", "prod")
+        if ambiente == "prod" and not opciones.dry_run:
+            logger.error(f"{ruta}: el registro es de producción, no se da de baja")
+            continue
+        if (ambiente, host) not in sesiones:
+            session = new_session(host)
+            token = None if opciones.dry_run else authenticate(session, logger, get_credentials_for_environment(ambiente))
+            if token:
+                session.headers.update({"Authorization": f"Bearer {token}", "Content-Type": "application/json"})
+            sesiones[(ambiente, host)] = session
+        run(sesiones[(ambiente, host)], logger, ruta, opciones.concurrency, opciones.dry_run, rutas)
+
+
+if __name__ == "__main__":
+    main()
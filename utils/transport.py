@@ -0,0 +1,193 @@
+"""Transporte HTTP de los usuarios: requests (HttpUser) o geventhttpclient (FastHttpUser).
+
+Los task functions usan el cliente de Locust del usuario. Con HttpUser es
+la pila requests/urllib3, que consume mucha CPU por request y limita cada
+worker a unos cientos de RPS. Con --transport fast (o LOCUST_TRANSPORT=fast)
+los mismos tasks corren sobre FastHttpUser; FastClient adapta lo que la
+suite usa de requests y FastHttpSession no tiene:
+
+- encabezados de la sesión: on_start asigna client.headers = {...} y
+  sync_token cambia client.headers["Authorization"]; FastClient los agrega
+  a cada request
+- login por formulario: authenticate() envía data={...}; FastClient lo
+  codifica como application/x-www-form-urlencoded
+- URLs armadas a mano: varios tasks concatenan la query sin codificar
+  (f"/dependencias?p_nombre={nombre}"); requests escapa los espacios y
+  geventhttpclient rechaza la URL, así que FastClient la escapa igual
+- response.text: geventhttpclient devuelve None si no hubo cuerpo y los
+  tasks hacen response.text[:200]; la respuesta del transporte fast
+  devuelve "" (utils/http.py)
+
+La clase base del usuario se elige al iniciar, igual que la forma de carga:
+en modo distribuido los workers necesitan el mismo --transport.
+
+Comparación de RPS por núcleo de los dos transportes contra el mismo host:
+
+    python -m utils.transport --host https://api-dev.ejemplo.com --users 50 --seconds 60
+
+Ejecuta con cada transporte, en un proceso aparte, el perfil "open" con
+una tasa de arribos que satura a los usuarios (--rate, sin espera entre
+requests) y divide los requests por los segundos de CPU que consumió el
+proceso (requests por segundo de un núcleo al 100 %; incluye el arranque,
+que pesa menos cuanto más larga es la corrida). Las demás opciones se
+pasan a Locust (por ejemplo --mix o --route-group). El resultado se
+escribe en el log y en logs/transport_benchmark.csv.
+"""
+import argparse
+import csv
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlencode
+
+from locust import FastHttpUser, HttpUser
+from locust.contrib.fasthttp import FastHttpSession
+from requests.utils import requote_uri
+
+from utils.arrivals import REQUEST_TYPE_ARRIBO
+
+TRANSPORTE_REQUESTS = "requests"
+TRANSPORTE_FAST = "fast"
+TRANSPORTES = {TRANSPORTE_REQUESTS: HttpUser, TRANSPORTE_FAST: FastHttpUser}
+
+CSV_PATH = os.path.join("logs", "transport_benchmark.csv")
+
+
+def selected_transport(argv):
+    """Transporte elegido con --transport o LOCUST_TRANSPORT (se lee antes de parsear las opciones)"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--transport", default=os.getenv("LOCUST_TRANSPORT", TRANSPORTE_REQUESTS))
+    opciones, _ = parser.parse_known_args(argv)
+    if opciones.transport not in TRANSPORTES:
+        raise ValueError(f"Transporte desconocido: {opciones.transport}. Disponibles: {', '.join(TRANSPORTES)}")
+    return opciones.transport
+
+
+def user_base(transporte):
+    """Clase de usuario de Locust del transporte"""
+    return TRANSPORTES[transporte]
+
+
+class FastClient:
+    """FastHttpSession con la interfaz de la sesión de requests que usa la suite"""
+
+    # Estrategia "handshake" (utils/connections.py): una conexión nueva por request
+    close_before_request = False
+
+    def __init__(self, session):
+        self._session = session
+        # Encabezados de la sesión, agregados a cada request (como requests.Session.headers)
+        self.headers = {}
+
+    def request(self, method, url, data=None, headers=None, **kwargs):
+        encabezados = {**self.headers, **headers} if headers else dict(self.headers)
+        if isinstance(data, dict):
+            # Formulario, como requests con data={...}
+            data = urlencode(data)
+            encabezados["Content-Type"] = "application/x-www-form-urlencoded"
+        if self.close_before_request:
+            self._session.client.clientpool.close()
+            encabezados["Connection"] = "close"
+        return self._session.request(method, requote_uri(url), data=data, headers=encabezados, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def __getattr__(self, name):
+        # base_url, cookiejar, rename_request, etc. de la sesión original
+        return getattr(self._session, name)
+
+
+def adapt(client):
+    """Cliente del usuario con la interfaz de requests: la sesión de requests tal cual o FastClient"""
+    if isinstance(client, FastHttpSession):
+        return FastClient(client)
+    return client
+
+
+def _ejecutar(transporte, host, usuarios, segundos, tasa, extra, directorio, logger):
+    """Corre el perfil "open" con el transporte; devuelve requests, fallas, segundos de pared y de CPU"""
+    prefijo = os.path.join(directorio, transporte)
+    comando = [
+        sys.executable, "-m", "locust", "-f", "locustfile.py", "--headless", "--only-summary",
+        "--host", host, "-u", str(usuarios), "-r", str(usuarios), "-t", f"{segundos}s",
+        "--test-profile", "open", "--arrival-rate", str(tasa), "--transport", transporte, "--csv", prefijo, *extra,
+    ]
+    logger.info(f"Transporte {transporte}: {usuarios} usuarios durante {segundos} s")
+    antes = resource.getrusage(resource.RUSAGE_CHILDREN)
+    inicio = time.perf_counter()
+    subprocess.run(comando, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    pared = time.perf_counter() - inicio
+    despues = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = (despues.ru_utime - antes.ru_utime) + (despues.ru_stime - antes.ru_stime)
+
+    requests_ = fallas = 0
+    with open(f"{prefijo}_stats.csv", newline="", encoding="utf-8") as archivo:
+        for fila in csv.DictReader(archivo):
+            # Los ARRIBO miden la espera en la cola, no son requests
+            if fila["Name"] != "Aggregated" and fila["Type"] != REQUEST_TYPE_ARRIBO:
+                requests_ += int(fila["Request Count"])
+                fallas += int(fila["Failure Count"])
+    if requests_ == 0:
+        logger.warning(f"Transporte {transporte}: la corrida no envió requests (revisar host y credenciales del ambiente en .env)")
+    return requests_, fallas, pared, cpu
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.transport", description="RPS por núcleo de los transportes requests y fast")
+    parser.add_argument("--host", required=True, help="URL base de la API")
+    parser.add_argument("--users", type=int, default=50, help="Usuarios de cada corrida")
+    parser.add_argument("--seconds", type=int, default=60, help="Duración de cada corrida")
+    parser.add_argument("--rate", type=float, default=5000.0, help="Arribos por segundo ofrecidos (alcanza con que supere lo que el proceso puede enviar)")
+    parser.add_argument("--transports", default=",".join(TRANSPORTES), help="Transportes a comparar, separados por comas")
+    parser.add_argument("--csv", default=CSV_PATH, help="Archivo CSV de resultados")
+    opciones, extra = parser.parse_known_args(argv if argv is not None else sys.argv[1:])
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logger = logging.getLogger("base_unica_transport")
+    resultados = []
+    with tempfile.TemporaryDirectory() as directorio:
+        for transporte in opciones.transports.split(","):
+            requests_, fallas, pared, cpu = _ejecutar(transporte, opciones.host, opciones.users, opciones.seconds, opciones.rate, extra, directorio, logger)
+            resultados.append({
+                "transporte": transporte,
+                "requests": requests_,
+                "fallas": fallas,
+                "rps": round(requests_ / opciones.seconds, 1),
+                "cpu_s": round(cpu, 2),
+                "uso_cpu": round(cpu / pared, 2) if pared else 0,
+                "rps_por_nucleo": round(requests_ / cpu, 1) if cpu else 0,
+            })
+
+    logger.info("=== RPS POR NÚCLEO ===")
+    for r in resultados:
+        logger.info(
+            f"{r['transporte']:>9}: {r['requests']} requests ({r['fallas']} fallas), {r['rps']} RPS, "
+            f"{r['cpu_s']} s de CPU ({r['uso_cpu']:.0%} de un núcleo) -> {r['rps_por_nucleo']} RPS por núcleo"
+        )
+    os.makedirs(os.path.dirname(opciones.csv) or ".", exist_ok=True)
+    with open(opciones.csv, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=list(resultados[0]))
+        escritor.writeheader()
+        escritor.writerows(resultados)
+    logger.info(f"Resultados guardados en {opciones.csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Validación declarativa y muestreada de las respuestas.
+
+Cada ruta declara su esquema (campos obligatorios y opcionales con sus
+tipos) en tasks/schemas.py. En el perfil funcional se validan todos los
+elementos de una lista; en el perfil de carga solo una muestra: los
+primeros VALIDATION_SAMPLE_HEAD más VALIDATION_SAMPLE_RANDOM al azar del
+resto, para que el CPU del generador no crezca con el tamaño de la
+respuesta.
+
+El tiempo de validación se registra como métrica del harness
+("validación: <ruta>"), separado de la latencia del servidor.
+"""
+import os
+import random
+import time
+
+from utils import metrics
+
+VALIDATION_SAMPLE_HEAD = int(os.getenv("VALIDATION_SAMPLE_HEAD", "5"))
+VALIDATION_SAMPLE_RANDOM = int(os.getenv("VALIDATION_SAMPLE_RANDOM", "5"))
+
+# Modos de validación
+MODO_COMPLETO = "full"      # Todos los elementos (perfil funcional)
+MODO_MUESTREO = "sampled"   # Primeros N + k al azar (perfil de carga)
+
+# Máximo de errores informados por respuesta
+MAX_ERRORES = 5
+
+# Tipo para los campos que pueden venir en null: (int, NULO)
+NULO = type(None)
+
+_modo = MODO_COMPLETO
+
+
+def set_mode(modo):
+    """Define el modo de validación para la prueba en curso"""
+    global _modo
+    _modo = modo
+
+
+def get_mode():
+    return _modo
+
+
+def _nombre_tipo(tipo):
+    if isinstance(tipo, tuple):
+        return " o ".join(_nombre_tipo(t) for t in tipo)
+    return "null" if tipo is NULO else tipo.__name__
+
+
+class Schema:
+    """Campos obligatorios y opcionales de un elemento de la respuesta.
+
+    Los tipos se indican como en isinstance (un tipo o una tupla de tipos);
+    object acepta cualquier valor y NULO permite null en un campo
+    obligatorio. Los campos opcionales pueden faltar o venir en null. Con
+    any_of cada elemento debe tener al menos uno de esos campos (para las
+    rutas cuyo contrato solo se conoce a medias).
+    """
+
+    def __init__(self, required=None, optional=None, any_of=None):
+        self.required = dict(required or {})
+        self.optional = dict(optional or {})
+        self.any_of = tuple(any_of or ())
+
+    def check_item(self, item, errores):
+        if not isinstance(item, dict):
+            errores.append(f"se esperaba un objeto y se recibió {type(item).__name__}")
+            return
+        for campo, tipo in self.required.items():
+            if campo not in item:
+                errores.append(f"falta el campo '{campo}'")
+            elif not isinstance(item[campo], tipo):
+                errores.append(f"'{campo}' debería ser {_nombre_tipo(tipo)}")
+        for campo, tipo in self.optional.items():
+            valor = item.get(campo)
+            if valor is not None and not isinstance(valor, tipo):
+                errores.append(f"'{campo}' debería ser {_nombre_tipo(tipo)}")
+        if self.any_of and not any(campo in item for campo in self.any_of):
+            errores.append(f"no tiene ninguno de los campos {', '.join(self.any_of)}")
+
+
+def sample_items(items, rng=random):
+    """Elementos a validar según el modo: todos, o los primeros N más k al azar"""
+    if _modo == MODO_COMPLETO or len(items) <= VALIDATION_SAMPLE_HEAD + VALIDATION_SAMPLE_RANDOM:
+        return items
+    resto = range(VALIDATION_SAMPLE_HEAD, len(items))
+    return items[:VALIDATION_SAMPLE_HEAD] + [items[i] for i in rng.sample(resto, VALIDATION_SAMPLE_RANDOM)]
+
+
+def validate(schema, data, nombre="respuesta"):
+    """Valida un objeto o una lista de objetos; devuelve la lista de errores (vacía si es válida)"""
+    inicio = time.perf_counter()
+    errores = []
+    try:
+        elementos = sample_items(data) if isinstance(data, list) else [data]
+        for elemento in elementos:
+            schema.check_item(elemento, errores)
+            if len(errores) >= MAX_ERRORES:
+                break
+    finally:
+        metrics.observe(f"validación: {nombre}", (time.perf_counter() - inicio) * 1000)
+    return errores[:MAX_ERRORES]